@@ -32,6 +32,10 @@ class Modal:
         """Handle controller input"""
         return self.screen.handle_controller(ctrl)
 
+    def is_animating(self):
+        """Nothing here moves on its own; redraw only on input"""
+        return False
+
     def draw(self, surf):
         """Render the item bag modal background, border, and inner screen content to surf."""
         # Outer modal background
@@ -65,9 +69,9 @@ class ItemBagScreen:
         self.should_close = False
 
         # Fonts
-        self.font_header = pygame.font.Font(FONT_PATH, 16)
-        self.font_text = pygame.font.Font(FONT_PATH, 10)
-        self.font_small = pygame.font.Font(FONT_PATH, 8)
+        self.font_header = ui_colors.get_font(16, FONT_PATH)
+        self.font_text = ui_colors.get_font(10, FONT_PATH)
+        self.font_small = ui_colors.get_font(8, FONT_PATH)
 
         # Get save data
         self.manager = get_manager()
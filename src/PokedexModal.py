@@ -7,12 +7,15 @@ Displays a scrollable list of Pokemon with seen/caught status
 
 import json
 import os
+import threading
 
 import pygame
 
 # Import ui_colors module for dynamic theme support
 import ui_colors
 from config import FONT_PATH, POKEMON_DB_PATH, GEN3_NORMAL_DIR, SPRITES_DIR
+from sprite_atlas import image_exists, load_image
+from sprite_service import get_sprite_service
 from ui_components import Button
 
 # Constants
@@ -24,6 +27,9 @@ ITEM_HEIGHT_DEFAULT = 24
 DEFAULT_SCREEN = (640, 480)
 FADE_ALPHA = 100
 
+# Entries prescaled ahead of the selection in the scroll direction
+PREFETCH_AHEAD = 8
+
 # Game icon filenames (order matters for display)
 GAME_NAMES = ["Ruby", "Sapphire", "Emerald", "FireRed", "LeafGreen"]
 GAME_ICON_FILES = {
@@ -154,8 +160,8 @@ class PokedexModal:
         font_size = max(8, int(self.screen_h * 0.04))
         title_font_size = max(10, int(self.screen_h * 0.05))
         try:
-            self.font = pygame.font.Font(FONT_PATH, font_size)
-            self.title_font = pygame.font.Font(FONT_PATH, title_font_size)
+            self.font = ui_colors.get_font(font_size, FONT_PATH)
+            self.title_font = ui_colors.get_font(title_font_size, FONT_PATH)
         except Exception:
             self.font = pygame.font.SysFont(None, font_size)
             self.title_font = pygame.font.SysFont(None, title_font_size)
@@ -180,17 +186,19 @@ class PokedexModal:
             ">", rel_rect=(0, 0, 0, 0), callback=lambda: self.change_game(1)
         )
 
-        # Sprite caches
+        # Sprites are scaled on demand by the shared sprite service, which
+        # keeps them across openings; a warm thread fills in the rest
         self.sel_width = self.sel_height = self.small_width = self.small_height = 0
-        self.sprite_cache = [None] * self.total
-        self.sprite_cache_full = [None] * self.total
-        self.sprite_cache_small = [None] * self.total
+        self._sprite_paths = {}  # index -> path or None (existence checked once)
+        self._faded = {}  # (index, seen) -> faded copy for the prev/next slots
+        self._warmed = set()
+        self._scroll_dir = 1
 
         # Layout
         self.calculate_layout()
         self.center_left_columns_vertically()
-        self._load_and_presize_sprites()
         self._load_pokedex_data()
+        self._start_sprite_warmer()
 
         # Load pokeball icon for caught Pokemon - try multiple paths
         self.pokeball_icon = None
@@ -200,9 +208,9 @@ class PokedexModal:
             os.path.join(SPRITES_DIR, "items", "pokeball.png"),
         ]
         for ppath in pokeball_paths:
-            if os.path.exists(ppath):
+            if image_exists(ppath):
                 try:
-                    self.pokeball_icon = pygame.image.load(ppath).convert_alpha()
+                    self.pokeball_icon = load_image(ppath)
                     # Use scale (not smoothscale) for crisp pixel art
                     self.pokeball_icon = pygame.transform.scale(
                         self.pokeball_icon, (pokeball_size, pokeball_size)
@@ -243,9 +251,9 @@ class PokedexModal:
             os.path.join(SPRITES_DIR, "items", "masterball.png"),
         ]
         for mpath in masterball_paths:
-            if os.path.exists(mpath):
+            if image_exists(mpath):
                 try:
-                    self.masterball_icon = pygame.image.load(mpath).convert_alpha()
+                    self.masterball_icon = load_image(mpath)
                     # Use scale (not smoothscale) for crisp pixel art
                     self.masterball_icon = pygame.transform.scale(
                         self.masterball_icon, (pokeball_size, pokeball_size)
@@ -257,9 +265,9 @@ class PokedexModal:
 
         # Load eye icon for "seen but not caught"
         self.eye_icon = os.path.join(SPRITES_DIR, "items", "eye.png")
-        if os.path.exists(self.eye_icon):
+        if image_exists(self.eye_icon):
             try:
-                self.eye_icon = pygame.image.load(self.eye_icon).convert_alpha()
+                self.eye_icon = load_image(self.eye_icon)
                 # Use smoothscale for eye icon (looks better anti-aliased)
                 self.eye_icon = pygame.transform.smoothscale(
                     self.eye_icon, (pokeball_size, pokeball_size)
@@ -383,44 +391,93 @@ class PokedexModal:
     # -----------------------
     # Sprite management
     # -----------------------
-    def _load_and_presize_sprites(self):
-        for i, p in enumerate(self.pokemon_data):
-            poke_id = p.get("id", i + 1)
+    def _sprite_path(self, index):
+        """Gen3 sprite file for a Pokédex index, or None if it doesn't exist"""
+        if index not in self._sprite_paths:
+            poke_id = self.pokemon_data[index].get("id", index + 1)
             path = os.path.join(GEN3_NORMAL_DIR, f"{poke_id:03d}.png")
-            img = (
-                pygame.image.load(path).convert_alpha()
-                if os.path.exists(path)
-                else None
-            )
-            self.sprite_cache[i] = img
-
-            if img:
-                self.sprite_cache_full[i] = self._scale_preserve_aspect(
-                    img, self.sel_width, self.sel_height
-                )
-                self.sprite_cache_small[i] = self._scale_preserve_aspect(
-                    img, self.small_width, self.small_height
-                )
-            else:
-                self.sprite_cache_full[i] = pygame.Surface(
-                    (self.sel_width, self.sel_height), pygame.SRCALPHA
-                )
-                self.sprite_cache_small[i] = pygame.Surface(
-                    (self.small_width, self.small_height), pygame.SRCALPHA
-                )
+            self._sprite_paths[index] = path if image_exists(path) else None
+        return self._sprite_paths[index]
 
-    def _scale_preserve_aspect(self, surf_img, target_w, target_h):
-        iw, ih = surf_img.get_size()
-        if iw == 0 or ih == 0:
-            return pygame.Surface((target_w, target_h), pygame.SRCALPHA)
-        ratio = min(target_w / iw, target_h / ih)
-        return pygame.transform.smoothscale(
-            surf_img, (max(1, int(iw * ratio)), max(1, int(ih * ratio)))
+    def _scaled_sprite(self, index, size, silhouette=False, scale="zoom"):
+        """Sprite for index scaled to fit size, blacked out if silhouette"""
+        if not 0 <= index < self.total:
+            return None
+        path = self._sprite_path(index)
+        if path is None:
+            return None
+        sprites = get_sprite_service()
+        if silhouette:
+            return sprites.get_silhouette(path, size, scale=scale)
+        return sprites.get_path(path, size, scale=scale)
+
+    def _display_sprite(self, index, size):
+        """Sprite as shown in the sprite column (silhouette if not seen)"""
+        if not 0 <= index < self.total:
+            return None
+        poke_id = self.pokemon_data[index].get("id", index + 1)
+        return self._scaled_sprite(
+            index, size, silhouette=not self.is_pokemon_seen(poke_id)
         )
 
+    def _faded_sprite(self, index, size):
+        """Display sprite at FADE_ALPHA; the shared surface is never altered"""
+        if not 0 <= index < self.total:
+            return None
+        poke_id = self.pokemon_data[index].get("id", index + 1)
+        key = (index, self.is_pokemon_seen(poke_id), size)
+        faded = self._faded.get(key)
+        if faded is None:
+            sprite = self._display_sprite(index, size)
+            if sprite is None:
+                return None
+            if len(self._faded) >= 8:
+                self._faded.clear()
+            faded = sprite.copy()
+            faded.set_alpha(FADE_ALPHA)
+            self._faded[key] = faded
+        return faded
+
+    def _warm_order(self):
+        """Indices to prescale: ahead in the scroll direction first, then outward"""
+        center = self.selected_index
+        ahead = [center + self._scroll_dir * k for k in range(PREFETCH_AHEAD + 1)]
+        order = [i for i in ahead if 0 <= i < self.total]
+        for k in range(1, self.total):
+            for i in (center + self._scroll_dir * k, center - self._scroll_dir * k):
+                if 0 <= i < self.total:
+                    order.append(i)
+        return order
+
+    def _start_sprite_warmer(self):
+        """Prescale sprites on a daemon thread while the modal is open"""
+        thread = threading.Thread(target=self._warm_sprites, daemon=True)
+        thread.start()
+
+    def _warm_sprites(self):
+        sprites = get_sprite_service()
+        sel_size = (self.sel_width, self.sel_height)
+        small_size = (self.small_width, self.small_height)
+        try:
+            while self.open and sprites.has_room(0.5):
+                index = next(
+                    (i for i in self._warm_order() if i not in self._warmed), None
+                )
+                if index is None:
+                    break
+                self._warmed.add(index)
+                poke_id = self.pokemon_data[index].get("id", index + 1)
+                unseen = not self.is_pokemon_seen(poke_id)
+                self._scaled_sprite(index, sel_size, silhouette=unseen)
+                self._scaled_sprite(index, small_size, silhouette=unseen)
+        except Exception as e:
+            print(f"[PokedexModal] Sprite warm-up stopped: {e}")
+
     def get_sprite(self, index):
-        """Return the cached sprite surface for the given Pokédex index, loading it if needed."""
-        return self.sprite_cache[index] if 0 <= index < self.total else None
+        """Return the unscaled sprite surface for the given Pokédex index, loading it if needed."""
+        if not 0 <= index < self.total:
+            return None
+        return get_sprite_service().get_path(self._sprite_path(index))
 
     def _load_pokedex_data(self):
         """Load seen/owned data from save data manager or combine from all saves"""
@@ -645,6 +702,10 @@ class PokedexModal:
         # Ruby / Sapphire / Emerald
         return "Hoenn", 1, 202
 
+    def is_animating(self):
+        """Nothing here moves on its own; redraw only on input"""
+        return False
+
     def update_game_button_text(self):
         """Refresh the game filter button label to reflect the currently selected game."""
         self.game_button.text = self.get_current_game()
@@ -770,6 +831,8 @@ class PokedexModal:
     def move_selection(self, delta):
         """Move the selected Pokédex entry by delta steps and update the scroll offset."""
         self.selected_index = max(0, min(self.total - 1, self.selected_index + delta))
+        if delta:
+            self._scroll_dir = 1 if delta > 0 else -1
         self.update_scroll()
 
     def _move_to_next_seen(self):
@@ -780,6 +843,7 @@ class PokedexModal:
             poke_id = self.pokemon_data[next_idx].get("id", next_idx + 1)
             if self.is_pokemon_seen(poke_id):
                 self.selected_index = next_idx
+                self._scroll_dir = 1
                 self.update_scroll()
                 return
 
@@ -791,6 +855,7 @@ class PokedexModal:
             poke_id = self.pokemon_data[prev_idx].get("id", prev_idx + 1)
             if self.is_pokemon_seen(poke_id):
                 self.selected_index = prev_idx
+                self._scroll_dir = -1
                 self.update_scroll()
                 return
 
@@ -952,52 +1017,19 @@ class PokedexModal:
             self.selected_index + 1,
         )
 
-        def get_display_sprite(idx, cache, apply_seen_check=True):
-            """Get sprite, applying silhouette if not seen"""
-            if idx < 0 or idx >= self.total:
-                return None
-            sprite = cache[idx]
-            if sprite is None:
-                return None
+        sel_size = (self.sel_width, self.sel_height)
+        small_size = (self.small_width, self.small_height)
+        offset_y = self.sel_height // 2 + self.small_height // 2 + self.gap
 
-            # Check if this Pokemon has been seen
-            poke_id = self.pokemon_data[idx].get("id", idx + 1)
-            is_seen = self.is_pokemon_seen(poke_id)
-
-            if apply_seen_check and not is_seen:
-                # Create silhouette (all black) for unseen Pokemon
-                silhouette = sprite.copy()
-                silhouette.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MIN)
-                return silhouette
-            return sprite.copy()
-
-        if 0 <= prev_idx < self.total:
-            s_prev = get_display_sprite(prev_idx, self.sprite_cache_small)
-            if s_prev:
-                s_prev.set_alpha(FADE_ALPHA)
-                pr = s_prev.get_rect(
-                    center=(
-                        cx,
-                        cy - (self.sel_height // 2 + self.small_height // 2 + self.gap),
-                    )
-                )
-                surf.blit(s_prev, pr)
-        if 0 <= sel_idx < self.total:
-            s_sel = get_display_sprite(sel_idx, self.sprite_cache_full)
-            if s_sel:
-                sr = s_sel.get_rect(center=(cx, cy))
-                surf.blit(s_sel, sr)
-        if 0 <= next_idx < self.total:
-            s_next = get_display_sprite(next_idx, self.sprite_cache_small)
-            if s_next:
-                s_next.set_alpha(FADE_ALPHA)
-                nr = s_next.get_rect(
-                    center=(
-                        cx,
-                        cy + (self.sel_height // 2 + self.small_height // 2 + self.gap),
-                    )
-                )
-                surf.blit(s_next, nr)
+        s_prev = self._faded_sprite(prev_idx, small_size)
+        if s_prev:
+            surf.blit(s_prev, s_prev.get_rect(center=(cx, cy - offset_y)))
+        s_sel = self._display_sprite(sel_idx, sel_size)
+        if s_sel:
+            surf.blit(s_sel, s_sel.get_rect(center=(cx, cy)))
+        s_next = self._faded_sprite(next_idx, small_size)
+        if s_next:
+            surf.blit(s_next, s_next.get_rect(center=(cx, cy + offset_y)))
 
         # Right list column
         pygame.draw.rect(surf, ui_colors.COLOR_BUTTON, self.list_rect)
@@ -1091,8 +1123,7 @@ class PokedexModal:
         surf_w, surf_h = surf.get_size()
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = ui_colors.get_tile((surf_w, surf_h), (0, 0, 0, 180))
         surf.blit(overlay, (0, 0))
 
         # Detail box - fit within surface with margins
@@ -1109,17 +1140,16 @@ class PokedexModal:
         center_x = box_x + box_w // 2
 
         # ===== TOP SECTION - Sprite =====
-        sprite = self.sprite_cache_full[self.selected_index]
+        # Scale sprite relative to box size (max ~22% of box height),
+        # nearest-neighbour for crisp pixel art
+        max_sprite_size = int(box_h * 0.22)
+        sprite = self._scaled_sprite(
+            self.selected_index, (max_sprite_size, max_sprite_size), scale="zoom_pixel"
+        )
         sprite_y = box_y + int(box_h * 0.18)
         if sprite:
-            # Scale sprite relative to box size (max ~22% of box height)
-            orig_w, orig_h = sprite.get_size()
-            max_sprite_size = int(box_h * 0.22)
-            scale_factor = min(max_sprite_size / orig_w, max_sprite_size / orig_h)
-            new_w, new_h = int(orig_w * scale_factor), int(orig_h * scale_factor)
-            scaled_sprite = pygame.transform.scale(sprite, (new_w, new_h))
-            sprite_rect = scaled_sprite.get_rect(center=(center_x, sprite_y))
-            surf.blit(scaled_sprite, sprite_rect)
+            sprite_rect = sprite.get_rect(center=(center_x, sprite_y))
+            surf.blit(sprite, sprite_rect)
 
         # ===== NAME (centered below sprite) =====
         title = f"#{poke_id:03d} {poke_name}"
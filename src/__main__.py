@@ -44,6 +44,12 @@ _src_dir = os.path.dirname(os.path.abspath(__file__))
 if _src_dir not in sys.path:
     sys.path.insert(0, _src_dir)
 
+# Headless batch CLI (`python -m src summarize saves/`) - no pygame, no logging redirect
+from sinew_cli import COMMANDS as _CLI_COMMANDS, STORAGE_COMMANDS as _CLI_STORAGE
+if len(sys.argv) > 1 and sys.argv[1] in _CLI_COMMANDS + _CLI_STORAGE:
+    from sinew_cli import main as _cli_main
+    sys.exit(_cli_main(sys.argv[1:]))
+
 from sinew_logging import init_redirectors as _init_redirectors
 _init_redirectors()
 
@@ -51,6 +57,8 @@ import pygame
 from controller import get_controller
 from scaler import Scaler
 from config import FONT_PATH, IS_HANDHELD
+from dirty_regions import get_dirty_tracker
+from frame_governor import get_frame_governor
 from settings import load_sinew_settings as load_settings
 from game_screen import GameScreen
 
@@ -111,6 +119,8 @@ def run():
         screen=screen,
     )
     game_screen.precache_all(screen)
+    tracker = get_dirty_tracker()
+    governor = get_frame_governor()
 
     running = True
     while running:
@@ -137,14 +147,17 @@ def run():
                         pygame.display.init()
                     scaler._create_window()
                     controller.resume()
+                    tracker.mark()
             except pygame.error:
                 # Display was quit for external emulator, reinit when it returns
                 if not pygame.display.get_init():
                     pygame.display.init()
                 scaler._create_window()
                 controller.resume()
+                tracker.mark()
 
-        dt = clock.tick(60)
+        # Full rate while anything animates, idle rate on still menus
+        dt = clock.tick(governor.target_fps())
         events = pygame.event.get()
 
         for event in events:
@@ -169,6 +182,11 @@ def run():
         controller.update(dt)
         filtered_events = controller.filter_kb_events(events)
 
+        # Any input may change what any screen shows
+        if events or controller.has_input():
+            tracker.mark()
+            governor.note_input()
+
         if game_screen.should_close:
             running = False
             continue
@@ -180,8 +198,16 @@ def run():
         try:
             screen = scaler.get_surface()
             if screen:
-                game_screen.draw(screen)
-                scaler.blit_scaled()
+                # Only recompose and flip what changed; skip idle frames
+                tracker.resize(*screen.get_size())
+                rects = tracker.take()
+                if rects:
+                    full = tracker.is_full(rects)
+                    if not full:
+                        screen.set_clip(rects[0].unionall(rects[1:]))
+                    game_screen.draw(screen)
+                    screen.set_clip(None)
+                    scaler.blit_scaled(None if full else rects)
 
                 game_screen.dim_screen(180 if (game_screen.emulator_manager
                     and game_screen.emulator_manager.is_running) else 0)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+"""
+Achievement Benchmark
+Replays synthetic saves through the full achievement catalogue and times
+each stage of evaluation, so speed can be compared across releases.
+
+Scenarios:
+    complete  full dex, 8 badges, 6 + 420 Pokemon, every event, all games
+    fresh     a new save in every game (starter only)
+
+Stages (per iteration, over every game plus the Sinew aggregate):
+    compile    compiling every distinct hint into a predicate
+    stats      building SaveStats from each save
+    evaluate   check_achievement_unlocked over the catalogue with shared stats
+    per_call   the same without stats (SaveStats rebuilt for every check)
+    index      narrowing a re-check to achievements reading one changed field
+
+Runs headless (no pygame). Log output from the evaluators is discarded
+while stages are timed. Each run prints a summary and, with --output,
+appends one JSON line per scenario so results from several releases can be
+kept in one file.
+
+Usage:
+    python achievement_bench.py
+    python achievement_bench.py -n 50 --label v1.3.8 -o bench.jsonl
+    python achievement_bench.py --scenario complete --profile
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from achievement_profiler import get_achievement_profiler
+from achievements_data import (
+    GAME_ACHIEVEMENTS,
+    GAMES,
+    SaveStats,
+    check_achievement_unlocked,
+    compile_hint,
+    get_achievement_index,
+)
+
+SCENARIOS = ("complete", "fresh")
+
+# PC Pokemon in the "complete" scenario (the Gen 3 PC holds 420)
+PC_POKEMON = 420
+
+_EVENTS = ("eon_ticket", "aurora_ticket", "mystic_ticket", "old_sea_map")
+
+
+# ---------------------------------------------------------------------- #
+#  Synthetic saves                                                         #
+# ---------------------------------------------------------------------- #
+
+
+def _pokemon(species, level, shiny=False):
+    return {"species": species, "level": level, "shiny": shiny, "empty": False}
+
+
+def make_save(scenario, game_index=0):
+    """Parsed-save dict in the shape SaveStats reads"""
+    if scenario == "fresh":
+        return {
+            "dex_caught": 1,
+            "dex_seen": 3,
+            "badges": 0,
+            "money": 3000,
+            "playtime_hours": 0.5,
+            "party": [_pokemon(252 + game_index, 5)],
+            "pc_pokemon": [],
+            "owned_list": [252 + game_index],
+            "events_tracker": {},
+            "has_national_dex": False,
+            "has_rainbow_pass": False,
+        }
+
+    party = [_pokemon(380 + i, 100) for i in range(6)]
+    pc = [
+        _pokemon(1 + (i % 386), 5 + (i * 7 + game_index) % 96, shiny=i % 50 == 0)
+        for i in range(PC_POKEMON)
+    ]
+    return {
+        "dex_caught": 386,
+        "dex_seen": 386,
+        "badges": 8,
+        "money": 999999,
+        "playtime_hours": 250.0,
+        "party": party,
+        "pc_pokemon": pc,
+        "owned_list": list(range(1, 387)),
+        "events_tracker": {key: True for key in _EVENTS},
+        "has_national_dex": True,
+        "has_rainbow_pass": True,
+    }
+
+
+def make_aggregate(saves):
+    """Sinew aggregate over all saves (combined dex, summed counts)"""
+    owned = sorted({s for save in saves for s in save["owned_list"]})
+    aggregate = {
+        "dex_caught": len(owned),
+        "dex_seen": len(owned),
+        "badges": sum(save["badges"] for save in saves),
+        "money": sum(save["money"] for save in saves),
+        "playtime_hours": sum(save["playtime_hours"] for save in saves),
+        "party": [p for save in saves for p in save["party"]],
+        "pc_pokemon": [p for save in saves for p in save["pc_pokemon"]],
+        "owned_list": owned,
+        "events_tracker": {},
+    }
+    for save in saves:
+        aggregate["events_tracker"].update(save["events_tracker"])
+    return aggregate
+
+
+# ---------------------------------------------------------------------- #
+#  Stages                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+def _workload(scenario):
+    """[(game, achievements, save_data, all_saves)] for every game + Sinew"""
+    saves = [make_save(scenario, i) for i in range(len(GAMES))]
+    work = [
+        (game, GAME_ACHIEVEMENTS[game], save, None) for game, save in zip(GAMES, saves)
+    ]
+    work.append(("Sinew", GAME_ACHIEVEMENTS["Sinew"], make_aggregate(saves), saves))
+    return work
+
+
+def _stage_compile(work):
+    for hint in {ach.get("hint", "") for _, achs, _, _ in work for ach in achs}:
+        compile_hint(hint)
+
+
+def _stage_stats(work):
+    return [SaveStats(save, all_saves) for _, _, save, all_saves in work]
+
+
+def _stage_evaluate(work, stats_list):
+    unlocked = 0
+    for (_, achs, save, all_saves), stats in zip(work, stats_list):
+        for ach in achs:
+            if check_achievement_unlocked(ach, save, all_saves, stats=stats):
+                unlocked += 1
+    return unlocked
+
+
+def _stage_per_call(work):
+    unlocked = 0
+    for _, achs, save, all_saves in work:
+        for ach in achs:
+            if check_achievement_unlocked(ach, save, all_saves):
+                unlocked += 1
+    return unlocked
+
+
+def _stage_index(work):
+    for game, _, _, _ in work:
+        get_achievement_index(game).affected({"money"})
+
+
+def run_scenario(scenario, iterations):
+    """
+    Time every stage of one scenario.
+
+    Returns:
+        dict: JSON-ready results; stage times are milliseconds per iteration
+    """
+    work = _workload(scenario)
+    evaluations = sum(len(achs) for _, achs, _, _ in work)
+    timings = {}
+
+    def timed(name, fn, *args):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            result = fn(*args)
+        timings[name] = (time.perf_counter() - start) * 1000 / iterations
+        return result
+
+    saved_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    try:
+        timed("compile", _stage_compile, work)
+        stats_list = timed("stats", _stage_stats, work)
+        unlocked = timed("evaluate", _stage_evaluate, work, stats_list)
+        per_call_unlocked = timed("per_call", _stage_per_call, work)
+        timed("index", _stage_index, work)
+    finally:
+        sys.stdout.close()
+        sys.stdout = saved_stdout
+
+    if unlocked != per_call_unlocked:
+        print(
+            f"[AchBench] {scenario}: shared stats unlocked {unlocked},"
+            f" per-call unlocked {per_call_unlocked}",
+            file=sys.stderr,
+        )
+
+    return {
+        "scenario": scenario,
+        "iterations": iterations,
+        "achievements": evaluations,
+        "unlocked": unlocked,
+        "stages_ms": {name: round(ms, 4) for name, ms in timings.items()},
+        "evaluations_per_sec": round(evaluations / (timings["evaluate"] / 1000)),
+    }
+
+
+# ---------------------------------------------------------------------- #
+#  Driver                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="achievement_bench", description="Benchmark achievement evaluation"
+    )
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    parser.add_argument("--label", default="", help="Release label stored with results")
+    parser.add_argument("-o", "--output", help="Append JSON Lines results here")
+    parser.add_argument(
+        "--profile", action="store_true", help="Print the per-pattern profile too"
+    )
+    return parser
+
+
+def main(argv=None):
+    """Run the benchmark; returns a process exit code"""
+    args = build_arg_parser().parse_args(argv)
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+
+    profiler = get_achievement_profiler()
+    results = []
+    for scenario in scenarios:
+        # Timings are taken without the profiler; a profiled pass follows
+        profiler.enabled = False
+        result = run_scenario(scenario, max(1, args.iterations))
+        result.update(
+            {
+                "label": args.label,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "time": int(time.time()),
+            }
+        )
+        results.append(result)
+
+        stages = "  ".join(f"{k}={v:.3f}ms" for k, v in result["stages_ms"].items())
+        print(
+            f"[AchBench] {scenario}: {result['achievements']} achievements,"
+            f" {result['unlocked']} unlocked, {result['evaluations_per_sec']:,} evals/s"
+        )
+        print(f"[AchBench]   {stages}")
+
+        if args.profile:
+            profiler.reset()
+            profiler.enabled = True
+            work = _workload(scenario)
+            _stage_evaluate(work, _stage_stats(work))
+            profiler.enabled = False
+            print(profiler.report())
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+        print(f"[AchBench] Appended {len(results)} result(s) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
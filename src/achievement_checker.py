@@ -7,10 +7,13 @@ GameScreen inherits AchievementCheckerMixin to get
 all achievement-related methods without bloating main.py.
 """
 
+import json
 import os
+import struct
 import time
 
-from config import SAVE_PATHS
+from achievement_worker import AchievementWorker
+from config import ACH_AGGREGATE_CACHE_PATH, SAVE_PATHS
 
 
 # =============================================================================
@@ -48,6 +51,245 @@ def is_pokemon_shiny(pokemon):
     return (tid ^ sid ^ pid_low ^ pid_high) < 8
 
 
+# =============================================================================
+# Persisted Sinew aggregate cache
+# =============================================================================
+
+# Bump when the contribution dict built by parse_game_contribution changes shape
+AGGREGATE_CACHE_VERSION = 1
+
+# Contribution fields stored as sets in memory and sorted lists on disk
+_CONTRIBUTION_SET_FIELDS = ("owned_set", "eeveelutions")
+
+STARTER_LINES = [
+    {1, 2, 3},        # Bulbasaur line
+    {4, 5, 6},        # Charmander line
+    {7, 8, 9},        # Squirtle line
+    {252, 253, 254},  # Treecko line
+    {255, 256, 257},  # Torchic line
+    {258, 259, 260},  # Mudkip line
+]
+EEVEELUTION_SPECIES = {133, 134, 135, 136, 196, 197}
+
+
+def save_fingerprint(sav_path):
+    """
+    Cheap change detector for a save file: size, mtime and the save index
+    of both slots (read from the first section footer of each).
+
+    Returns:
+        list or None: [size, mtime_ns, index_a, index_b], None if unreadable
+    """
+    try:
+        st = os.stat(sav_path)
+        indexes = []
+        with open(sav_path, "rb") as f:
+            for offset in (0x0FFC, 0xEFFC):
+                f.seek(offset)
+                raw = f.read(4)
+                indexes.append(struct.unpack("<I", raw)[0] if len(raw) == 4 else 0)
+        return [st.st_size, st.st_mtime_ns] + indexes
+    except OSError:
+        return None
+
+
+def load_aggregate_cache():
+    """
+    Load persisted per-game contributions.
+
+    Returns:
+        tuple: ({game: contribution}, {game: {"path": str, "fingerprint": list}})
+    """
+    contributions, fingerprints = {}, {}
+    try:
+        with open(ACH_AGGREGATE_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != AGGREGATE_CACHE_VERSION:
+            return contributions, fingerprints
+        for game_name, record in data.get("games", {}).items():
+            contribution = dict(record["contribution"])
+            for field in _CONTRIBUTION_SET_FIELDS:
+                contribution[field] = set(contribution.get(field, []))
+            contributions[game_name] = contribution
+            fingerprints[game_name] = {
+                "path": record.get("path"),
+                "fingerprint": record.get("fingerprint"),
+            }
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[Achievements] Ignoring unreadable aggregate cache: {e}")
+        return {}, {}
+    return contributions, fingerprints
+
+
+def save_aggregate_cache(contributions, fingerprints):
+    """Persist per-game contributions with their save fingerprints (atomic)"""
+    games = {}
+    for game_name, contribution in contributions.items():
+        stamp = fingerprints.get(game_name)
+        if not stamp:
+            continue
+        record = dict(contribution)
+        for field in _CONTRIBUTION_SET_FIELDS:
+            record[field] = sorted(record.get(field, ()))
+        games[game_name] = {
+            "path": stamp["path"],
+            "fingerprint": stamp["fingerprint"],
+            "contribution": record,
+        }
+    tmp_path = ACH_AGGREGATE_CACHE_PATH + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(ACH_AGGREGATE_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": AGGREGATE_CACHE_VERSION, "games": games},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, ACH_AGGREGATE_CACHE_PATH)
+    except Exception as e:
+        print(f"[Achievements] Could not save aggregate cache: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def parse_game_contribution(game_name, sav_path):
+    """
+    Parse one save file into its Sinew aggregate contribution.
+
+    Reads nothing but the save, so it is safe on the achievement worker.
+
+    Returns:
+        dict or None if the save could not be loaded
+    """
+    from save_data_manager import SaveDataManager
+    actual_path = sav_path
+    if not actual_path or not os.path.exists(actual_path):
+        print(f"[Achievements] No save found at {sav_path} for {game_name}")
+        return None
+    print(f"[Achievements] Found save for {game_name} at {actual_path}")
+
+    # Private parse: the shared save cache belongs to the main thread
+    manager = SaveDataManager()
+    if not manager.load_save(actual_path, game_hint=game_name, use_cache=False):
+        print(f"[Achievements] Failed to load {game_name} for Sinew aggregate")
+        return None
+
+    badges = manager.get_badge_count() if hasattr(manager, "get_badge_count") else 0
+    party = manager.get_party() if hasattr(manager, "get_party") else []
+    active_party = [p for p in party if p and not p.get("empty")]
+
+    pc_pokemon = []
+    pc_count_raw = 0
+    try:
+        pc_count_raw = manager.get_pc_pokemon_count() if hasattr(manager,
+            "get_pc_pokemon_count") else 0
+        for box_num in range(1, 15):
+            if hasattr(manager, "get_box"):
+                box = manager.get_box(box_num)
+                if box:
+                    pc_pokemon.extend(p for p in box if p and not p.get("empty"))
+    except Exception:
+        pass
+
+    all_pokemon = active_party + pc_pokemon
+    level100 = sum(1 for p in all_pokemon if p.get("level", 0) >= 100)
+    level50plus = sum(1 for p in all_pokemon if p.get("level", 0) >= 50)
+    shiny_count = sum(1 for p in all_pokemon if is_pokemon_shiny(p))
+    eeveelutions = {p.get("species") for p in all_pokemon if p.get(
+        "species") in EEVEELUTION_SPECIES}
+
+    dex_caught = 0
+    owned_set = set()
+    try:
+        dex_data = manager.get_pokedex_count() if hasattr(manager,
+            "get_pokedex_count") else {"caught": 0}
+        dex_caught = dex_data.get("caught", 0)
+        if hasattr(manager, "get_pokedex_data"):
+            owned_set = set(manager.get_pokedex_data().get("owned_list", []))
+    except Exception:
+        pass
+
+    money = 0
+    try:
+        money = manager.get_money() if hasattr(manager, "get_money") else 0
+    except Exception:
+        pass
+
+    playtime_hours = 0.0
+    try:
+        pt = manager.get_play_time() if hasattr(manager, "get_play_time") else {}
+        playtime_hours = (pt.get("hours", 0) or 0) + ((pt.get("minutes", 0) or 0) / 60.0)
+    except Exception:
+        pass
+
+    is_frlg = game_name in ["FireRed", "LeafGreen"]
+    regional_size = 151 if is_frlg else 202
+
+    print(
+        f"[Achievements] Sinew cache: {game_name} -"
+        f" {badges} badges, {dex_caught} dex, {len(all_pokemon)} pokemon"
+    )
+
+    return {
+        "badges": badges,
+        "dex_caught": dex_caught,
+        "money": money,
+        "playtime_hours": playtime_hours,
+        "games_with_badges": 1 if badges > 0 else 0,
+        "games_with_4plus_badges": 1 if badges >= 4 else 0,
+        "games_with_champion": 1 if badges >= 8 else 0,
+        "games_with_full_party": 1 if len(active_party) >= 6 else 0,
+        "games_with_full_dex": 1 if dex_caught >= regional_size else 0,
+        "owned_set": owned_set,
+        "pc_count": pc_count_raw,
+        "shiny_count": shiny_count,
+        "level100": level100,
+        "level50plus": level50plus,
+        "eeveelutions": eeveelutions,
+    }
+
+
+def collect_aggregate_updates(game_saves, fingerprints, cached_games):
+    """
+    Parse the saves whose contribution is missing or out of date.
+
+    Works only on the snapshots it is given, so the achievement worker can
+    run it while the main thread keeps using the live cache.
+
+    Args:
+        game_saves: {game_name: sav_path}
+        fingerprints: {game_name: stamp} the cached contributions were built from
+        cached_games: Names of games that already have a contribution
+
+    Returns:
+        dict: {game_name: (contribution, stamp)} for every re-parsed save
+    """
+    updates = {}
+    for game_name, sav_path in game_saves.items():
+        if not sav_path or not os.path.exists(sav_path):
+            # sav path from self.games is authoritative (may be external).
+            # Only fall back to config SAVE_PATHS when self.games has no
+            # entry at all — never silently override an external path.
+            if not sav_path:
+                sav_path = SAVE_PATHS.get(game_name, "")
+            if not sav_path or not os.path.exists(sav_path):
+                continue
+
+        fingerprint = save_fingerprint(sav_path)
+        stamp = {"path": sav_path, "fingerprint": fingerprint}
+        not_cached = (game_name not in cached_games)
+        changed = (fingerprints.get(game_name) != stamp)
+
+        if not_cached or changed:
+            contribution = parse_game_contribution(game_name, sav_path)
+            if contribution is not None:
+                updates[game_name] = (contribution, stamp)
+        # else: save unchanged since its contribution was built
+    return updates
+
+
 # =============================================================================
 # Mixin class
 # =============================================================================
@@ -59,7 +301,7 @@ class AchievementCheckerMixin:
     Requires the host class to have:
         self._achievement_manager
         self._achievement_notification
-        self._sinew_game_data_cache
+        self._sinew_game_data_cache / self._sinew_game_fingerprints
         self.games  (dict of game_name -> game_data)
         self.game_names  (list)
         self.current_game  (int index)
@@ -67,12 +309,14 @@ class AchievementCheckerMixin:
         self.settings
         get_current_game_name()
         _load_current_save()
+        _force_reload_current_save() / _adopt_reloaded_save()
     """
 
     def _init_achievement_system(self):
         """Initialize the achievement notification system"""
         self._achievement_notification = None
         self._achievement_manager = None
+        self._achievement_worker = None
 
         if init_achievement_system:
             try:
@@ -81,12 +325,44 @@ class AchievementCheckerMixin:
                 )
                 print("[GameScreen] Achievement system initialized")
 
-                # Cache for Sinew aggregate: {game_name: contribution_dict}
-                # Only the game that just changed is re-parsed; others use cached values.
-                self._sinew_game_data_cache = {}
+                # Return-from-emulator checks run here; unlock notifications
+                # raised on the worker are handed back through its inbox
+                self._achievement_worker = AchievementWorker()
+                if self._achievement_notification:
+                    self._achievement_manager.set_notification_callback(
+                        self._achievement_worker.call_on_main(
+                            self._achievement_notification.queue_achievement
+                        )
+                    )
+
+                # Cache for Sinew aggregate: {game_name: contribution_dict}, persisted
+                # across sessions with each save's fingerprint. Only saves whose
+                # fingerprint changed are re-parsed; others use cached values.
+                self._sinew_game_data_cache, self._sinew_game_fingerprints = (
+                    load_aggregate_cache()
+                )
+                if self._sinew_game_data_cache:
+                    print(
+                        f"[Achievements] Loaded aggregate cache for"
+                        f" {len(self._sinew_game_data_cache)} games"
+                    )
             except Exception as e:
                 print(f"[GameScreen] Could not initialize achievements: {e}")
 
+            # Reward and Echo Pokemon are generated ahead of claims
+            try:
+                from reward_factory import get_reward_factory
+
+                get_reward_factory().prefill()
+            except Exception as e:
+                print(f"[GameScreen] Could not prefill reward Pokemon: {e}")
+
+    def _flush_achievement_progress(self, wait=False):
+        """Persist pending achievement progress (screen transitions, launch, exit)"""
+        manager = getattr(self, "_achievement_manager", None)
+        if manager:
+            manager.flush(wait=wait)
+
     def _check_all_achievements_on_startup(self):
         """Check achievements on startup - only parses the current (last active) game.
         Other games are handled lazily by _check_sinew_achievements_aggregate which
@@ -112,6 +388,7 @@ class AchievementCheckerMixin:
                     try:
                         from save_data_manager import SaveDataManager
                         from achievements_data import (
+                            SaveStats,
                             check_achievement_unlocked,
                             get_achievements_for,
                         )
@@ -205,40 +482,34 @@ class AchievementCheckerMixin:
                                 print(f"[Achievements] Startup {current_game_name} has legendaries: {found_legendaries}")  # pylint: disable=line-too-long  # noqa: E501
 
                             # Update per-game tracking
-                            self._achievement_manager.set_current_game(current_game_name)
-                            self._achievement_manager.update_tracking("dex_count",
-                                ach_save_data["dex_caught"])
-                            self._achievement_manager.update_tracking("dex_seen",
-                                ach_save_data["dex_seen"])
-                            self._achievement_manager.update_tracking("badges",
-                                ach_save_data["badges"])
-                            self._achievement_manager.update_tracking("money",
-                                ach_save_data["money"])
-                            self._achievement_manager.update_tracking("playtime_hours",
-                                playtime_hours)
-                            self._achievement_manager.update_tracking("party_size", party_count)
-                            self._achievement_manager.update_tracking("pc_pokemon", pc_count)
-                            self._achievement_manager.update_tracking("total_pokemon",
-                                pc_count + party_count)
-                            self._achievement_manager.update_tracking("any_pokemon_level",
-                                max_level)
-                            self._achievement_manager.update_tracking("pokemon_over_30",
-                                pokemon_over_30)
-                            self._achievement_manager.update_tracking("pokemon_over_50",
-                                pokemon_over_50)
-                            self._achievement_manager.update_tracking("pokemon_over_70",
-                                pokemon_over_70)
-                            self._achievement_manager.update_tracking("pokemon_at_100",
-                                pokemon_at_100)
-                            self._achievement_manager.update_tracking("shiny_count", shiny_count)
-                            self._achievement_manager.update_tracking("owned_set", set(owned_list))
+                            tracking = {
+                                "dex_count": ach_save_data["dex_caught"],
+                                "dex_seen": ach_save_data["dex_seen"],
+                                "badges": ach_save_data["badges"],
+                                "money": ach_save_data["money"],
+                                "playtime_hours": playtime_hours,
+                                "party_size": party_count,
+                                "pc_pokemon": pc_count,
+                                "total_pokemon": pc_count + party_count,
+                                "any_pokemon_level": max_level,
+                                "pokemon_over_30": pokemon_over_30,
+                                "pokemon_over_50": pokemon_over_50,
+                                "pokemon_over_70": pokemon_over_70,
+                                "pokemon_at_100": pokemon_at_100,
+                                "shiny_count": shiny_count,
+                                "owned_set": set(owned_list),
+                            }
+                            for key, value in tracking.items():
+                                self._achievement_manager.update_tracking(key, value, current_game_name)
 
                             unlocked_count = 0
+                            stats = SaveStats(ach_save_data)
                             for ach in game_achievements:
                                 if ach.get("game") != current_game_name:
                                     continue
                                 if not self._achievement_manager.is_unlocked(ach["id"]):
-                                    if check_achievement_unlocked(ach, ach_save_data):
+                                    if check_achievement_unlocked(ach, ach_save_data,
+                                            stats=stats):
                                         self._achievement_manager.progress[ach["id"]] = {
                                             "unlocked": True,
                                             "unlocked_at": time.time(),
@@ -255,6 +526,7 @@ class AchievementCheckerMixin:
                                         unlocked_count += 1
 
                             if unlocked_count > 0:
+                                self._achievement_manager._invalidate_counts()
                                 print(f"[Achievements] Startup: {current_game_name} - {unlocked_count} achievements unlocked")  # pylint: disable=line-too-long  # noqa: E501
 
                     except Exception as e:
@@ -292,360 +564,391 @@ class AchievementCheckerMixin:
             import traceback
             traceback.print_exc()
 
-    def _check_achievements_for_current_game(self):
-        """Check achievements based on current game's save data"""
+    def _queue_return_achievement_check(self):
+        """
+        Reload the current save and re-check achievements on the worker.
+
+        Used when returning from the emulator: the menu is interactive right
+        away and unlock notifications arrive once the check has finished.
+        Falls back to the synchronous path if the worker is unavailable.
+        """
+        worker = getattr(self, "_achievement_worker", None)
+        if not self._achievement_manager or worker is None:
+            self._force_reload_current_save()
+            self._check_achievements_for_current_game()
+            return
+
+        # Snapshot everything the job needs; it must not read live UI state
+        game_name = self.get_current_game_name()
+        sav_path = self.games.get(game_name, {}).get("sav") if game_name else None
+        game_saves = {
+            name: data.get("sav") for name, data in self.games.items() if name != "Sinew"
+        }
+        fingerprints = dict(getattr(self, "_sinew_game_fingerprints", {}))
+        cached_games = set(getattr(self, "_sinew_game_data_cache", {}))
+        worker.submit(
+            "return check",
+            self._run_return_achievement_check,
+            game_name,
+            sav_path,
+            game_saves,
+            fingerprints,
+            cached_games,
+        )
+
+    def _run_return_achievement_check(
+        self, game_name, sav_path, game_saves, fingerprints, cached_games
+    ):
+        """
+        Worker job: parse the saves fresh and post the results to the UI.
+
+        Only the parsing happens here, into private parsers. Tracking
+        updates, unlocks and the shared save cache are handled by
+        _apply_return_achievement_check() on the main thread, the only
+        thread that touches the AchievementManager, Sinew storage and
+        save_data_manager's cache. If the current save can't be read, the
+        Sinew aggregate is still updated.
+        """
+        game_data = None
+        parser = None
+        has_save = bool(sav_path) and os.path.exists(sav_path)
+        if game_name and game_name != "Sinew" and has_save:
+            from save_data_manager import SaveDataManager
+
+            manager = SaveDataManager()
+            if manager.load_save(sav_path, game_hint=game_name, use_cache=False):
+                parser = manager.parser
+                game_data = self._collect_game_achievement_data(game_name, manager)
+
+        updates = collect_aggregate_updates(game_saves, fingerprints, cached_games)
+        self._achievement_worker.post(
+            self._apply_return_achievement_check,
+            game_name,
+            sav_path,
+            game_saves,
+            parser,
+            game_data,
+            updates,
+        )
+
+    def _apply_return_achievement_check(
+        self, game_name, sav_path, game_saves, parser, game_data, updates
+    ):
+        """Main-thread half of the return check: adopt the save, then unlock"""
+        if game_data is None:
+            self._check_sinew_achievements_aggregate(game_name, game_saves, updates)
+            return
+        self._adopt_reloaded_save(game_name, sav_path, parser)
+        try:
+            self._apply_game_achievement_data(game_name, game_data, game_saves, updates)
+        except Exception as e:
+            print(f"[Achievements] Error checking achievements: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _drain_achievement_worker(self):
+        """Deliver results posted by the achievement worker (once per frame)"""
+        worker = getattr(self, "_achievement_worker", None)
+        if worker is not None:
+            worker.drain()
+
+    def _check_achievements_for_current_game(self, game_name=None, manager=None, game_saves=None):
+        """
+        Check achievements based on current game's save data (main thread).
+
+        Args:
+            game_name: Game to check (defaults to the current game)
+            manager: SaveDataManager holding that game's save (defaults to the
+                shared one)
+            game_saves: {game_name: sav_path} snapshot for the Sinew aggregate
+        """
         if not self._achievement_manager:
             print("[Achievements] Manager not initialized, skipping achievement check")
             return
 
         try:
             # Get current game name
-            game_name = self.get_current_game_name()
+            game_name = game_name or self.get_current_game_name()
             if not game_name or game_name == "Sinew":
                 # Even on Sinew screen, check Sinew achievements with aggregate data
-                self._check_sinew_achievements_aggregate()
+                self._check_sinew_achievements_aggregate(game_name, game_saves)
                 return
 
             # Get save data from manager
-            from save_data_manager import get_manager
-            manager = get_manager()
+            if manager is None:
+                from save_data_manager import get_manager
+                manager = get_manager()
             if not manager or not manager.loaded:
                 return
 
-            # Build achievement-compatible save data dict from manager
-            pokedex_data = (
-                manager.get_pokedex_count()
-                if hasattr(manager, "get_pokedex_count")
-                else {"caught": 0, "seen": 0}
-            )
-
-            # Get party Pokemon
-            party = manager.get_party() if hasattr(manager, "get_party") else []
-
-            # Get PC Pokemon (all boxes) - use get_box for properly enriched data
-            pc_pokemon = []
-            try:
-                for box_num in range(1, 15):
-                    if hasattr(manager, "get_box"):
-                        box = manager.get_box(box_num)
-                        if box:
-                            for p in box:
-                                if p and not p.get("empty"):
-                                    pc_pokemon.append(p)
-                print(
-                    f"[Achievements] {game_name} PC Pokemon: {len(pc_pokemon)} from 14 boxes"
-                )
-                if pc_pokemon:
-                    first = pc_pokemon[0]
-                    print(
-                        f"[Achievements] First PC Pokemon keys: {list(first.keys()) if isinstance(
-                            first, dict) else type(first)}"
-                    )
-            except Exception as e:
-                print(f"[Achievements] Error getting PC Pokemon: {e}")
-                import traceback
-                traceback.print_exc()
+            game_data = self._collect_game_achievement_data(game_name, manager)
+            self._apply_game_achievement_data(game_name, game_data, game_saves)
 
-            # Get owned list from pokedex
-            owned_list = []
-            try:
-                if hasattr(manager, "get_pokedex_data"):
-                    pokedex = manager.get_pokedex_data()
-                    owned_list = pokedex.get("owned_list", [])
-                    print(
-                        f"[Achievements] {game_name} owned_list: {len(owned_list)} species"
-                    )
-            except Exception as e:
-                print(f"[Achievements] Error getting owned_list: {e}")
-
-            ach_save_data = {
-                "dex_caught": pokedex_data.get("caught", 0),
-                "dex_seen": pokedex_data.get("seen", 0),
-                "badges": (
-                    manager.get_badge_count()
-                    if hasattr(manager, "get_badge_count")
-                    else 0
-                ),
-                "money": manager.get_money() if hasattr(manager, "get_money") else 0,
-                "party": party,
-                "pc_pokemon": pc_pokemon,
-                "owned_list": owned_list,
-            }
+        except Exception as e:
+            print(f"[Achievements] Error checking achievements: {e}")
+            import traceback
+            traceback.print_exc()
 
-            # Add raw_data for FRLG Sevii achievement checking
-            if (
-                hasattr(manager, "parser")
-                and manager.parser
-                and hasattr(manager.parser, "data")
-            ):
-                ach_save_data["raw_data"] = manager.parser.data
+    def _collect_game_achievement_data(self, game_name, manager):
+        """
+        Read everything the per-game check needs from a loaded save.
 
-                game_name = self.get_current_game_name()
-                if game_name in ("FireRed", "LeafGreen"):
-                    try:
-                        from save_writer import has_national_dex as check_nat_dex
-                        from save_writer import has_rainbow_pass as check_rainbow
+        Touches only manager, so the worker can run it on a private
+        SaveDataManager.
 
-                        ach_save_data["has_national_dex"] = check_nat_dex(
-                            manager.parser.data, "FRLG", game_name
-                        )
-                        ach_save_data["has_rainbow_pass"] = check_rainbow(
-                            manager.parser.data, "FRLG"
-                        )
-                        print(
-                            f"[Achievements] {game_name} Sevii prereqs: nat_dex={ach_save_data['has_national_dex']}, rainbow_pass={ach_save_data['has_rainbow_pass']}"  # pylint: disable=line-too-long  # noqa: E501
-                        )
-                    except Exception as e:
-                        print(f"[Achievements] Error checking FRLG Sevii prereqs: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        ach_save_data["has_national_dex"] = False
-                        ach_save_data["has_rainbow_pass"] = False
-
-            # Get playtime if available
-            if hasattr(manager, "get_play_time"):
-                try:
-                    playtime = manager.get_play_time()
-                    hours = playtime.get("hours", 0) or 0
-                    minutes = playtime.get("minutes", 0) or 0
-                    ach_save_data["playtime_hours"] = hours + (minutes / 60.0)
-                except Exception:
-                    ach_save_data["playtime_hours"] = 0
-            elif hasattr(manager, "parser") and manager.parser:
-                try:
-                    hours = getattr(manager.parser, "play_hours", 0) or 0
-                    minutes = getattr(manager.parser, "play_minutes", 0) or 0
-                    ach_save_data["playtime_hours"] = hours + (minutes / 60.0)
-                except Exception:
-                    ach_save_data["playtime_hours"] = 0
-
-            playtime_h = ach_save_data.get("playtime_hours", 0)
-            pc_count = len(pc_pokemon)
-            party_count = len([p for p in party if p and not p.get("empty")])
-
-            max_level = 0
-            pokemon_over_30 = 0
-            pokemon_over_50 = 0
-            pokemon_over_70 = 0
-            pokemon_at_100 = 0
-            shiny_count = 0
-
-            all_pokemon = [p for p in party + pc_pokemon if p and not p.get("empty")]
-            total_pokemon = len(all_pokemon)
-
-            for p in all_pokemon:
-                level = p.get("level", 0)
-                if level > max_level:
-                    max_level = level
-                if level >= 30:
-                    pokemon_over_30 += 1
-                if level >= 50:
-                    pokemon_over_50 += 1
-                if level >= 70:
-                    pokemon_over_70 += 1
-                if level >= 100:
-                    pokemon_at_100 += 1
-                if is_pokemon_shiny(p):
-                    shiny_count += 1
+        Returns:
+            tuple: (ach_save_data dict, {tracking key: value})
+        """
+        # Build achievement-compatible save data dict from manager
+        pokedex_data = (
+            manager.get_pokedex_count()
+            if hasattr(manager, "get_pokedex_count")
+            else {"caught": 0, "seen": 0}
+        )
 
-            print(
-                f"[Achievements] Checking {game_name}:"
-                f" badges={ach_save_data['badges']},"
-                f" dex={ach_save_data['dex_caught']}, money={ach_save_data['money']},"
-                f" party={party_count}, pc={pc_count},"
-                f" playtime={playtime_h:.1f}h, owned={len(owned_list)} species"
-            )
+        # Get party Pokemon
+        party = manager.get_party() if hasattr(manager, "get_party") else []
 
-            legendaries = [144, 145, 146, 150, 151, 377, 378, 379, 380, 381, 382, 383, 384, 385,
-                386]
-            found_legendaries = [s for s in legendaries if s in owned_list]
-            if found_legendaries:
-                print(
-                    f"[Achievements] {game_name} has legendaries in owned_list: {found_legendaries}"
-                )
+        # Get PC Pokemon (all boxes) - use get_box for properly enriched data
+        pc_pokemon = []
+        try:
+            for box_num in range(1, 15):
+                if hasattr(manager, "get_box"):
+                    box = manager.get_box(box_num)
+                    if box:
+                        for p in box:
+                            if p and not p.get("empty"):
+                                pc_pokemon.append(p)
             print(
-                f"[Achievements] {game_name} Pokemon: total={total_pokemon},"
-                f" max_lv={max_level}, lv50+={pokemon_over_50},"
-                f" lv100={pokemon_at_100}, shiny={shiny_count}"
+                f"[Achievements] {game_name} PC Pokemon: {len(pc_pokemon)} from 14 boxes"
             )
-
-            self._achievement_manager.set_current_game(game_name)
-            self._achievement_manager.update_tracking("dex_count", ach_save_data["dex_caught"])
-            self._achievement_manager.update_tracking("dex_seen", ach_save_data["dex_seen"])
-            self._achievement_manager.update_tracking("badges", ach_save_data["badges"])
-            self._achievement_manager.update_tracking("money", ach_save_data["money"])
-            self._achievement_manager.update_tracking("playtime_hours", playtime_h)
-            self._achievement_manager.update_tracking("party_size", party_count)
-            self._achievement_manager.update_tracking("pc_pokemon", pc_count)
-            self._achievement_manager.update_tracking("total_pokemon", total_pokemon)
-            self._achievement_manager.update_tracking("any_pokemon_level", max_level)
-            self._achievement_manager.update_tracking("pokemon_over_30", pokemon_over_30)
-            self._achievement_manager.update_tracking("pokemon_over_50", pokemon_over_50)
-            self._achievement_manager.update_tracking("pokemon_over_70", pokemon_over_70)
-            self._achievement_manager.update_tracking("pokemon_at_100", pokemon_at_100)
-            self._achievement_manager.update_tracking("shiny_count", shiny_count)
-            self._achievement_manager.update_tracking("owned_set", set(owned_list))
-
-            newly_unlocked = self._achievement_manager.check_and_unlock(ach_save_data, game_name)
-
-            force_unlocked = self._achievement_manager.force_check_by_tracking(game_name)
-            if force_unlocked:
-                newly_unlocked.extend(force_unlocked)
-
-            if newly_unlocked:
+            if pc_pokemon:
+                first = pc_pokemon[0]
                 print(
-                    f"[Achievements] Unlocked {len(newly_unlocked)} achievements for {game_name}!"
+                    f"[Achievements] First PC Pokemon keys: {list(first.keys()) if isinstance(
+                        first, dict) else type(first)}"
                 )
-
-            self._check_sinew_achievements_aggregate()
-
         except Exception as e:
-            print(f"[Achievements] Error checking achievements: {e}")
+            print(f"[Achievements] Error getting PC Pokemon: {e}")
             import traceback
             traceback.print_exc()
 
-    def _check_sinew_achievements_aggregate(self):
-        """Check Sinew achievements based on aggregate data from all saves.
+        # Get owned list from pokedex
+        owned_list = []
+        try:
+            if hasattr(manager, "get_pokedex_data"):
+                pokedex = manager.get_pokedex_data()
+                owned_list = pokedex.get("owned_list", [])
+                print(
+                    f"[Achievements] {game_name} owned_list: {len(owned_list)} species"
+                )
+        except Exception as e:
+            print(f"[Achievements] Error getting owned_list: {e}")
+
+        ach_save_data = {
+            "dex_caught": pokedex_data.get("caught", 0),
+            "dex_seen": pokedex_data.get("seen", 0),
+            "badges": (
+                manager.get_badge_count()
+                if hasattr(manager, "get_badge_count")
+                else 0
+            ),
+            "money": manager.get_money() if hasattr(manager, "get_money") else 0,
+            "party": party,
+            "pc_pokemon": pc_pokemon,
+            "owned_list": owned_list,
+        }
 
-        PERFORMANCE: Uses self._sinew_game_data_cache to avoid re-parsing every
-        save on every call.  Only the currently active game is re-parsed from disk;
-        all other games use their cached contribution from the last time they were
-        the active game (or from startup).
-        """
-        if not self._achievement_manager:
-            return
+        # Add raw_data for FRLG Sevii achievement checking
+        if (
+            hasattr(manager, "parser")
+            and manager.parser
+            and hasattr(manager.parser, "data")
+        ):
+            ach_save_data["raw_data"] = manager.parser.data
 
-        if not hasattr(self, "_sinew_game_data_cache"):
-            self._sinew_game_data_cache = {}
+            if game_name in ("FireRed", "LeafGreen"):
+                try:
+                    from save_writer import has_national_dex as check_nat_dex
+                    from save_writer import has_rainbow_pass as check_rainbow
 
-        STARTER_LINES = [
-            {1, 2, 3},        # Bulbasaur line
-            {4, 5, 6},        # Charmander line
-            {7, 8, 9},        # Squirtle line
-            {252, 253, 254},  # Treecko line
-            {255, 256, 257},  # Torchic line
-            {258, 259, 260},  # Mudkip line
-        ]
-        EEVEELUTION_SPECIES = {133, 134, 135, 136, 196, 197}
+                    ach_save_data["has_national_dex"] = check_nat_dex(
+                        manager.parser.data, "FRLG", game_name
+                    )
+                    ach_save_data["has_rainbow_pass"] = check_rainbow(
+                        manager.parser.data, "FRLG"
+                    )
+                    print(
+                        f"[Achievements] {game_name} Sevii prereqs: nat_dex={ach_save_data['has_national_dex']}, rainbow_pass={ach_save_data['has_rainbow_pass']}"  # pylint: disable=line-too-long  # noqa: E501
+                    )
+                except Exception as e:
+                    print(f"[Achievements] Error checking FRLG Sevii prereqs: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    ach_save_data["has_national_dex"] = False
+                    ach_save_data["has_rainbow_pass"] = False
+
+        # Get playtime if available
+        if hasattr(manager, "get_play_time"):
+            try:
+                playtime = manager.get_play_time()
+                hours = playtime.get("hours", 0) or 0
+                minutes = playtime.get("minutes", 0) or 0
+                ach_save_data["playtime_hours"] = hours + (minutes / 60.0)
+            except Exception:
+                ach_save_data["playtime_hours"] = 0
+        elif hasattr(manager, "parser") and manager.parser:
+            try:
+                hours = getattr(manager.parser, "play_hours", 0) or 0
+                minutes = getattr(manager.parser, "play_minutes", 0) or 0
+                ach_save_data["playtime_hours"] = hours + (minutes / 60.0)
+            except Exception:
+                ach_save_data["playtime_hours"] = 0
+
+        playtime_h = ach_save_data.get("playtime_hours", 0)
+        pc_count = len(pc_pokemon)
+        party_count = len([p for p in party if p and not p.get("empty")])
+
+        max_level = 0
+        pokemon_over_30 = 0
+        pokemon_over_50 = 0
+        pokemon_over_70 = 0
+        pokemon_at_100 = 0
+        shiny_count = 0
+
+        all_pokemon = [p for p in party + pc_pokemon if p and not p.get("empty")]
+        total_pokemon = len(all_pokemon)
+
+        for p in all_pokemon:
+            level = p.get("level", 0)
+            if level > max_level:
+                max_level = level
+            if level >= 30:
+                pokemon_over_30 += 1
+            if level >= 50:
+                pokemon_over_50 += 1
+            if level >= 70:
+                pokemon_over_70 += 1
+            if level >= 100:
+                pokemon_at_100 += 1
+            if is_pokemon_shiny(p):
+                shiny_count += 1
+
+        print(
+            f"[Achievements] Checking {game_name}:"
+            f" badges={ach_save_data['badges']},"
+            f" dex={ach_save_data['dex_caught']}, money={ach_save_data['money']},"
+            f" party={party_count}, pc={pc_count},"
+            f" playtime={playtime_h:.1f}h, owned={len(owned_list)} species"
+        )
 
-        current_game_name = (
-            self.game_names[self.current_game]
-            if self.game_names and self.current_game < len(self.game_names)
-            else None
+        legendaries = [144, 145, 146, 150, 151, 377, 378, 379, 380, 381, 382, 383, 384, 385,
+            386]
+        found_legendaries = [s for s in legendaries if s in owned_list]
+        if found_legendaries:
+            print(
+                f"[Achievements] {game_name} has legendaries in owned_list: {found_legendaries}"
+            )
+        print(
+            f"[Achievements] {game_name} Pokemon: total={total_pokemon},"
+            f" max_lv={max_level}, lv50+={pokemon_over_50},"
+            f" lv100={pokemon_at_100}, shiny={shiny_count}"
         )
 
-        def _parse_game_for_cache(game_name, sav_path):
-            """Parse one save file and return a contribution dict for the cache."""
-            from save_data_manager import SaveDataManager
-            actual_path = sav_path
-            if not actual_path or not os.path.exists(actual_path):
-                print(f"[Achievements] No save found at {sav_path} for {game_name}")
-                return None
-            print(f"[Achievements] Found save for {game_name} at {actual_path}")
+        tracking = {
+            "dex_count": ach_save_data["dex_caught"],
+            "dex_seen": ach_save_data["dex_seen"],
+            "badges": ach_save_data["badges"],
+            "money": ach_save_data["money"],
+            "playtime_hours": playtime_h,
+            "party_size": party_count,
+            "pc_pokemon": pc_count,
+            "total_pokemon": total_pokemon,
+            "any_pokemon_level": max_level,
+            "pokemon_over_30": pokemon_over_30,
+            "pokemon_over_50": pokemon_over_50,
+            "pokemon_over_70": pokemon_over_70,
+            "pokemon_at_100": pokemon_at_100,
+            "shiny_count": shiny_count,
+            "owned_set": set(owned_list),
+        }
+        return ach_save_data, tracking
 
-            manager = SaveDataManager()
-            if not manager.load_save(actual_path, game_hint=game_name):
-                print(f"[Achievements] Failed to load {game_name} for Sinew aggregate")
-                return None
+    def _apply_game_achievement_data(self, game_name, game_data, game_saves=None, updates=None):
+        """
+        Update tracking for game_name and unlock what it earned (main thread).
 
-            badges = manager.get_badge_count() if hasattr(manager, "get_badge_count") else 0
-            party = manager.get_party() if hasattr(manager, "get_party") else []
-            active_party = [p for p in party if p and not p.get("empty")]
+        Args:
+            game_data: (ach_save_data, tracking) from _collect_game_achievement_data()
+            game_saves, updates: Passed on to _check_sinew_achievements_aggregate()
+        """
+        ach_save_data, tracking = game_data
+        for key, value in tracking.items():
+            self._achievement_manager.update_tracking(key, value, game_name)
 
-            pc_pokemon = []
-            pc_count_raw = 0
-            try:
-                pc_count_raw = manager.get_pc_pokemon_count() if hasattr(manager,
-                    "get_pc_pokemon_count") else 0
-                for box_num in range(1, 15):
-                    if hasattr(manager, "get_box"):
-                        box = manager.get_box(box_num)
-                        if box:
-                            pc_pokemon.extend(p for p in box if p and not p.get("empty"))
-            except Exception:
-                pass
+        newly_unlocked = self._achievement_manager.check_and_unlock(ach_save_data, game_name)
 
-            all_pokemon = active_party + pc_pokemon
-            level100 = sum(1 for p in all_pokemon if p.get("level", 0) >= 100)
-            level50plus = sum(1 for p in all_pokemon if p.get("level", 0) >= 50)
-            shiny_count = sum(1 for p in all_pokemon if is_pokemon_shiny(p))
-            eeveelutions = {p.get("species") for p in all_pokemon if p.get(
-                "species") in EEVEELUTION_SPECIES}
+        force_unlocked = self._achievement_manager.force_check_by_tracking(game_name)
+        if force_unlocked:
+            newly_unlocked.extend(force_unlocked)
 
-            dex_caught = 0
-            owned_set = set()
-            try:
-                dex_data = manager.get_pokedex_count() if hasattr(manager,
-                    "get_pokedex_count") else {"caught": 0}
-                dex_caught = dex_data.get("caught", 0)
-                if hasattr(manager, "get_pokedex_data"):
-                    owned_set = set(manager.get_pokedex_data().get("owned_list", []))
-            except Exception:
-                pass
+        if newly_unlocked:
+            print(
+                f"[Achievements] Unlocked {len(newly_unlocked)} achievements for {game_name}!"
+            )
 
-            money = 0
-            try:
-                money = manager.get_money() if hasattr(manager, "get_money") else 0
-            except Exception:
-                pass
+        self._check_sinew_achievements_aggregate(game_name, game_saves, updates)
 
-            playtime_hours = 0.0
-            try:
-                pt = manager.get_play_time() if hasattr(manager, "get_play_time") else {}
-                playtime_hours = (pt.get("hours", 0) or 0) + ((pt.get("minutes", 0) or 0) / 60.0)
-            except Exception:
-                pass
+    def _check_sinew_achievements_aggregate(
+        self, current_game_name=None, game_saves=None, updates=None
+    ):
+        """Check Sinew achievements based on aggregate data from all saves.
 
-            is_frlg = game_name in ["FireRed", "LeafGreen"]
-            regional_size = 151 if is_frlg else 202
+        PERFORMANCE: Uses self._sinew_game_data_cache to avoid re-parsing every
+        save on every call.  A save is only re-parsed when its fingerprint (size,
+        mtime, save index) differs from the one its cached contribution was built
+        from; the cache is persisted, so an unchanged save is never re-parsed,
+        even across restarts.
+
+        current_game_name / game_saves ({game_name: sav_path}) default to the
+        live GameScreen state. updates ({game_name: (contribution, stamp)})
+        are contributions the worker already parsed with
+        collect_aggregate_updates(); without them changed saves are parsed
+        here. Main thread only: this updates the manager and the cache.
+        """
+        if not self._achievement_manager:
+            return
 
-            print(
-                f"[Achievements] Sinew cache: {game_name} -"
-                f" {badges} badges, {dex_caught} dex, {len(all_pokemon)} pokemon"
+        if not hasattr(self, "_sinew_game_data_cache"):
+            self._sinew_game_data_cache = {}
+        if not hasattr(self, "_sinew_game_fingerprints"):
+            self._sinew_game_fingerprints = {}
+
+        if current_game_name is None:
+            current_game_name = (
+                self.game_names[self.current_game]
+                if self.game_names and self.current_game < len(self.game_names)
+                else None
             )
-
-            return {
-                "badges": badges,
-                "dex_caught": dex_caught,
-                "money": money,
-                "playtime_hours": playtime_hours,
-                "games_with_badges": 1 if badges > 0 else 0,
-                "games_with_4plus_badges": 1 if badges >= 4 else 0,
-                "games_with_champion": 1 if badges >= 8 else 0,
-                "games_with_full_party": 1 if len(active_party) >= 6 else 0,
-                "games_with_full_dex": 1 if dex_caught >= regional_size else 0,
-                "owned_set": owned_set,
-                "pc_count": pc_count_raw,
-                "shiny_count": shiny_count,
-                "level100": level100,
-                "level50plus": level50plus,
-                "eeveelutions": eeveelutions,
+        if game_saves is None:
+            game_saves = {
+                name: data.get("sav") for name, data in self.games.items() if name != "Sinew"
             }
 
         try:
-            # Update cache: re-parse current game, use cache for all others
-            for game_name, game_data in self.games.items():
-                if game_name == "Sinew":
-                    continue
-                sav_path = game_data.get("sav")
-                if not sav_path or not os.path.exists(sav_path):
-                    # sav path from self.games is authoritative (may be external).
-                    # Only fall back to config SAVE_PATHS when self.games has no
-                    # entry at all — never silently override an external path.
-                    if not sav_path:
-                        from config import SAVE_PATHS
-                        sav_path = SAVE_PATHS.get(game_name, "")
-                    if not sav_path or not os.path.exists(sav_path):
-                        continue
-
-                is_current = (game_name == current_game_name)
-                not_cached = (game_name not in self._sinew_game_data_cache)
-
-                if is_current or not_cached:
-                    contribution = _parse_game_for_cache(game_name, sav_path)
-                    if contribution is not None:
-                        self._sinew_game_data_cache[game_name] = contribution
-                # else: silently use existing cached values
+            # Update cache: re-parse only saves whose fingerprint changed
+            if updates is None:
+                updates = collect_aggregate_updates(
+                    game_saves,
+                    self._sinew_game_fingerprints,
+                    set(self._sinew_game_data_cache),
+                )
+            for game_name, (contribution, stamp) in updates.items():
+                self._sinew_game_data_cache[game_name] = contribution
+                self._sinew_game_fingerprints[game_name] = stamp
+
+            if updates:
+                save_aggregate_cache(self._sinew_game_data_cache, self._sinew_game_fingerprints)
 
             # Aggregate from cache
             total_badges = 0
@@ -689,28 +992,27 @@ class AchievementCheckerMixin:
 
                 if sinew_storage and sinew_storage.is_loaded():
                     sinew_pokemon_count = 0
-                    for box_num in range(1, 21):  # 20 boxes
-                        box_data = sinew_storage.get_box(box_num)
-                        if box_data:
-                            for pokemon in box_data:
-                                if pokemon and not pokemon.get("empty"):
-                                    sinew_pokemon_count += 1
-                                    level = pokemon.get("level", 0)
-                                    species = pokemon.get("species", 0)
-
-                                    if level >= 100:
-                                        total_level100 += 1
-                                    if level >= 50:
-                                        total_level50plus += 1
-
-                                    if is_pokemon_shiny(pokemon):
-                                        total_shiny_pokemon += 1
-                                        print(f"[Achievements] Found shiny in Sinew: species {species} in box {box_num}")  # pylint: disable=line-too-long  # noqa: E501
-                                    if species:
-                                        combined_pokedex.add(species)
-
-                                    if species in EEVEELUTION_SPECIES:
-                                        owned_eeveelutions.add(species)
+                    # Streams box files one at a time, skipping empty boxes
+                    for box_num, _slot, pokemon in sinew_storage.iter_pokemon():
+                        if pokemon.get("empty"):
+                            continue
+                        sinew_pokemon_count += 1
+                        level = pokemon.get("level", 0)
+                        species = pokemon.get("species", 0)
+
+                        if level >= 100:
+                            total_level100 += 1
+                        if level >= 50:
+                            total_level50plus += 1
+
+                        if is_pokemon_shiny(pokemon):
+                            total_shiny_pokemon += 1
+                            print(f"[Achievements] Found shiny in Sinew: species {species} in box {box_num}")  # pylint: disable=line-too-long  # noqa: E501
+                        if species:
+                            combined_pokedex.add(species)
+
+                        if species in EEVEELUTION_SPECIES:
+                            owned_eeveelutions.add(species)
 
                     total_pc_pokemon += sinew_pokemon_count
             except Exception as e:
@@ -756,29 +1058,29 @@ class AchievementCheckerMixin:
             if found_legendaries:
                 print(f"[Achievements] Legendaries in combined_pokedex: {found_legendaries}")
 
-            # Update tracking for Sinew achievements - SET CURRENT GAME TO SINEW
-            self._achievement_manager.set_current_game("Sinew")
-            self._achievement_manager.update_tracking("global_badges", total_badges)
-            self._achievement_manager.update_tracking("global_dex_count", total_dex_caught)
-            self._achievement_manager.update_tracking("combined_pokedex", len(combined_pokedex))
-            self._achievement_manager.update_tracking("combined_pokedex_set", combined_pokedex)
-            self._achievement_manager.update_tracking("global_money", total_money)
-            self._achievement_manager.update_tracking("global_playtime", total_playtime)
-            self._achievement_manager.update_tracking("global_champions", games_with_champion)
-            self._achievement_manager.update_tracking("games_with_badges", games_with_badges)
-            self._achievement_manager.update_tracking("games_with_4plus_badges",
-                games_with_4plus_badges)
-            self._achievement_manager.update_tracking("games_with_full_dex", games_with_full_dex)
-            self._achievement_manager.update_tracking("global_pc_pokemon", total_pc_pokemon)
-            self._achievement_manager.update_tracking("global_shiny_pokemon", total_shiny_pokemon)
-            self._achievement_manager.update_tracking("global_level100_pokemon", total_level100)
-            self._achievement_manager.update_tracking("global_level50plus_pokemon",
-                total_level50plus)
-            self._achievement_manager.update_tracking("global_full_parties", games_with_full_party)
-            self._achievement_manager.update_tracking("global_starters", starter_lines_owned)
-            self._achievement_manager.update_tracking("global_eeveelutions",
-                len(owned_eeveelutions))
-            self._achievement_manager.update_tracking("dev_mode_activated", dev_mode_activated)
+            # Update tracking for Sinew achievements
+            sinew_tracking = {
+                "global_badges": total_badges,
+                "global_dex_count": total_dex_caught,
+                "combined_pokedex": len(combined_pokedex),
+                "combined_pokedex_set": combined_pokedex,
+                "global_money": total_money,
+                "global_playtime": total_playtime,
+                "global_champions": games_with_champion,
+                "games_with_badges": games_with_badges,
+                "games_with_4plus_badges": games_with_4plus_badges,
+                "games_with_full_dex": games_with_full_dex,
+                "global_pc_pokemon": total_pc_pokemon,
+                "global_shiny_pokemon": total_shiny_pokemon,
+                "global_level100_pokemon": total_level100,
+                "global_level50plus_pokemon": total_level50plus,
+                "global_full_parties": games_with_full_party,
+                "global_starters": starter_lines_owned,
+                "global_eeveelutions": len(owned_eeveelutions),
+                "dev_mode_activated": dev_mode_activated,
+            }
+            for key, value in sinew_tracking.items():
+                self._achievement_manager.update_tracking(key, value, "Sinew")
 
             # Check Sinew progression achievements
             from achievements_data import get_achievements_for
@@ -1053,20 +1355,9 @@ class AchievementCheckerMixin:
             if not sinew_storage or not sinew_storage.is_loaded():
                 return
 
+            # Both counters are maintained incrementally by SinewStorage
             total_pokemon = sinew_storage.get_total_pokemon_count()
-            total_shinies = 0
-
-            for box_num in range(1, 21):  # 20 boxes
-                box_data = sinew_storage.get_box(box_num)
-                if box_data:
-                    for poke in box_data:
-                        if poke and not poke.get("empty"):
-                            if is_pokemon_shiny(poke):
-                                total_shinies += 1
-                                print(
-                                    f"[Achievements] Sinew storage shiny: species {poke.get(
-                                        'species', 0)} in box {box_num}"
-                                )
+            total_shinies = sinew_storage.get_total_shiny_count()
 
             transfer_count = self._achievement_manager.get_stat("sinew_transfers", 0)
             evolution_count = self._achievement_manager.get_stat("sinew_evolutions", 0)
@@ -1077,11 +1368,10 @@ class AchievementCheckerMixin:
                 f" {transfer_count} transfers, {evolution_count} evolutions"
             )
 
-            self._achievement_manager.set_current_game("Sinew")
-            self._achievement_manager.update_tracking("sinew_pokemon", total_pokemon)
-            self._achievement_manager.update_tracking("shiny_count", total_shinies)
-            self._achievement_manager.update_tracking("sinew_transfers", transfer_count)
-            self._achievement_manager.update_tracking("sinew_evolutions", evolution_count)
+            self._achievement_manager.update_tracking("sinew_pokemon", total_pokemon, "Sinew")
+            self._achievement_manager.update_tracking("shiny_count", total_shinies, "Sinew")
+            self._achievement_manager.update_tracking("sinew_transfers", transfer_count, "Sinew")
+            self._achievement_manager.update_tracking("sinew_evolutions", evolution_count, "Sinew")
 
             self._achievement_manager.check_sinew_achievements(
                 sinew_storage_count=total_pokemon,
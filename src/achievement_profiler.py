@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+Achievement Profiler
+Records where achievement evaluation time goes.
+
+When enabled, every evaluated achievement is timed and counted per
+achievement, per category and per hint pattern (the hint with its numbers
+replaced by N, so "money >= 10000" and "money >= 50000" share a row), and
+the manager entry points (check_and_unlock, revalidate_achievements, ...)
+are timed as sections. Disabled, the hooks cost one attribute check.
+
+Usage:
+    profiler = get_achievement_profiler()
+    profiler.enabled = True
+    ...
+    print(profiler.report())
+    profiler.dump()    # data/achievement_profile.txt + .json
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+
+from config import DATA_DIR
+
+PROFILE_PATH = os.path.join(DATA_DIR, "achievement_profile")
+
+_NUMBER = re.compile(r"\d+")
+
+
+def hint_pattern(hint):
+    """Hint with its numbers replaced by N"""
+    return _NUMBER.sub("N", hint) or "(none)"
+
+
+class AchievementProfiler:
+    """Per-achievement, per-category, per-pattern and per-section timings"""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self._lock:
+            # name -> [calls, total seconds, max seconds]
+            self.achievements = {}
+            self.categories = {}
+            self.patterns = {}
+            self.sections = {}
+            self.started = time.time()
+
+    @staticmethod
+    def _add(table, key, elapsed):
+        entry = table.get(key)
+        if entry is None:
+            table[key] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+
+    def record_achievement(self, ach, elapsed, source="check"):
+        """
+        Record one evaluation of ach.
+
+        Args:
+            ach: Achievement dict
+            elapsed: Seconds spent evaluating it
+            source: Which evaluator ran ("check", "revalidate", "sinew")
+        """
+        with self._lock:
+            self._add(self.achievements, ach.get("id", "?"), elapsed)
+            self._add(self.categories, ach.get("category", "?"), elapsed)
+            self._add(
+                self.patterns, f"{source}: {hint_pattern(ach.get('hint', ''))}", elapsed
+            )
+
+    def record_section(self, name, elapsed):
+        """Record one call of an entry point"""
+        with self._lock:
+            self._add(self.sections, name, elapsed)
+
+    # ------------------------------------------------------------------ #
+    #  Reporting                                                           #
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _rows(table):
+        """Table rows sorted by total time, slowest first"""
+        return sorted(
+            (
+                {
+                    "name": key,
+                    "calls": calls,
+                    "total_ms": round(total * 1000, 3),
+                    "avg_us": round(total / calls * 1e6, 2),
+                    "max_us": round(peak * 1e6, 2),
+                }
+                for key, (calls, total, peak) in table.items()
+            ),
+            key=lambda row: row["total_ms"],
+            reverse=True,
+        )
+
+    def to_dict(self):
+        """Everything recorded, as JSON-ready rows"""
+        with self._lock:
+            return {
+                "since": self.started,
+                "sections": self._rows(self.sections),
+                "categories": self._rows(self.categories),
+                "patterns": self._rows(self.patterns),
+                "achievements": self._rows(self.achievements),
+            }
+
+    def report(self, top=15):
+        """Text report of the slowest entries in each table"""
+        data = self.to_dict()
+        lines = [
+            f"Achievement profile ({time.time() - data['since']:.0f}s of recording)"
+        ]
+        for title in ("sections", "categories", "patterns", "achievements"):
+            rows = data[title]
+            lines.append("")
+            lines.append(f"{title.capitalize()} ({len(rows)})")
+            lines.append(f"  {'total ms':>10} {'calls':>8} {'avg us':>10} {'max us':>10}  name")
+            for row in rows[:top]:
+                lines.append(
+                    f"  {row['total_ms']:>10.3f} {row['calls']:>8}"
+                    f" {row['avg_us']:>10.2f} {row['max_us']:>10.2f}  {row['name']}"
+                )
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        """
+        Write the text report and the full JSON data.
+
+        Args:
+            path: Base path without extension (defaults to PROFILE_PATH)
+
+        Returns:
+            str: Path of the text report
+        """
+        path = path or PROFILE_PATH
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with open(path + ".json", "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        with open(path + ".txt", "w", encoding="utf-8") as f:
+            f.write(self.report(top=50))
+            f.write("\n")
+        print(f"[AchProfiler] Wrote profile to {path}.txt")
+        return path + ".txt"
+
+
+_profiler = AchievementProfiler()
+
+
+def get_achievement_profiler():
+    """Get the process-wide AchievementProfiler"""
+    return _profiler
+
+
+def profiled(name):
+    """Decorator timing each call of a function as section name"""
+
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _profiler.record_section(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorate
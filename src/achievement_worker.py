@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Achievement Worker
+Runs save re-parsing and achievement evaluation off the UI thread.
+
+Jobs are plain callables run one at a time, in submission order, on a
+daemon thread. Jobs only parse; anything that touches shared state
+(notifications, AchievementManager tracking and unlocks, Sinew storage,
+swapping the shared SaveDataManager onto a freshly parsed save) is posted
+back to a thread-safe inbox and run by drain() on the main thread once
+per frame.
+
+Usage:
+    worker = AchievementWorker()
+    worker.submit("return check", check_fn, game_name, sav_path)
+
+    # every frame, on the main thread
+    worker.drain()
+"""
+
+import queue
+import threading
+
+
+class AchievementWorker:
+    """Single background thread with a job queue and a main-thread inbox"""
+
+    # Main-thread callbacks run per drain() call, so a burst of unlocks
+    # never stalls a frame
+    MAX_DRAIN = 32
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._inbox = queue.Queue()
+        self._thread = None
+        self._busy = False
+
+    def submit(self, name, fn, *args):
+        """
+        Queue fn(*args) to run on the worker thread.
+
+        Args:
+            name: Label used in log output
+            fn: Callable; its inputs should be snapshots, not live UI state
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._jobs.put((name, fn, args))
+
+    def post(self, fn, *args):
+        """Queue fn(*args) to run on the main thread at the next drain()"""
+        self._inbox.put((fn, args))
+
+    def call_on_main(self, fn):
+        """
+        Wrap fn so it runs immediately on the main thread and is posted to
+        the inbox when called from any other thread.
+        """
+
+        def wrapper(*args):
+            if threading.current_thread() is threading.main_thread():
+                fn(*args)
+            else:
+                self.post(fn, *args)
+
+        return wrapper
+
+    def drain(self):
+        """Run callbacks posted by the worker (call from the main thread)"""
+        for _ in range(self.MAX_DRAIN):
+            try:
+                fn, args = self._inbox.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[AchWorker] Main-thread callback failed: {e}")
+
+    def is_busy(self):
+        """True while a job is running or waiting"""
+        return self._busy or not self._jobs.empty()
+
+    def _run(self):
+        while True:
+            name, fn, args = self._jobs.get()
+            self._busy = True
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"[AchWorker] Job '{name}' failed: {e}")
+                import traceback
+
+                traceback.print_exc()
+            finally:
+                self._busy = False
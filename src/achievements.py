@@ -8,11 +8,13 @@ Manages achievement tracking, unlocking, rewards, and display.
 import json
 import math
 import os
+import threading
 import time
 
 import pygame
 
 import ui_colors
+from achievement_profiler import get_achievement_profiler, profiled
 from config import ACH_SAVE_PATH, FONT_PATH, SETTINGS_FILE, SPRITES_DIR
 from controller import get_controller
 
@@ -63,9 +65,9 @@ class AchievementNotification:
 
         # Fonts
         try:
-            self.font_title = pygame.font.Font(FONT_PATH, 12)
-            self.font_text = pygame.font.Font(FONT_PATH, 9)
-            self.font_sinew = pygame.font.Font(FONT_PATH, 24)
+            self.font_title = ui_colors.get_font(12, FONT_PATH)
+            self.font_text = ui_colors.get_font(9, FONT_PATH)
+            self.font_sinew = ui_colors.get_font(24, FONT_PATH)
         except Exception:
             self.font_title = pygame.font.SysFont(None, 18)
             self.font_text = pygame.font.SysFont(None, 14)
@@ -268,8 +270,16 @@ class AchievementManager:
     """
     Manages achievement state across all games.
     Handles loading, saving, checking conditions, and granting rewards.
+
+    _save_progress() only marks progress dirty; a background writer collects
+    changes for SAVE_DEBOUNCE seconds and writes them in one atomic
+    (temp file + rename) compact write. flush() writes sooner, e.g. when a
+    screen closes, and flush(wait=True) writes synchronously before exit.
     """
 
+    SAVE_DEBOUNCE = 2.0  # Seconds of changes collected into one write
+    SAVE_FORMAT = 2  # Packed progress entries, compact separators
+
     def __init__(self):
         self.progress = (
             {}
@@ -286,6 +296,31 @@ class AchievementManager:
         )  # List of species IDs claimed from Altering Cave slot machine
         self.current_game = None  # Currently active game for tracking
         self.notification_callback = None  # Callback to trigger notifications
+
+        # Dirty tracking: every changed key gets the next change number, and
+        # each check records the change number it has seen up to, so a check
+        # only revisits achievements whose keys changed since its last run.
+        self._change_counter = 0
+        self._key_changes = {}  # {game: {key: change number}}
+        self._check_marks = {}  # {(check_name, game): change number}
+        self._stats_snapshots = {}  # {game: SaveStats.snapshot()} for check_and_unlock
+        self._unlocked_since_revalidate = set()
+        self._tracking_indexes = {}  # {game: AchievementIndex by tracking key}
+
+        # Counters shown by the achievements screen, kept up to date on
+        # unlock/claim and rebuilt after resets or reloads
+        self._counts = None  # {game: [unlocked, points]}
+        self._totals = None  # {game: achievement count}
+        self._unclaimed_count = None
+        self._state_version = 0
+
+        # Background persistence
+        self._progress_dirty = False
+        self._save_requested = threading.Event()
+        self._flush_requested = threading.Event()
+        self._write_lock = threading.Lock()
+        self._writer_thread = None
+        self._unlock_lock = threading.Lock()
         self._load_progress()
 
     def set_notification_callback(self, callback):
@@ -302,7 +337,10 @@ class AchievementManager:
         game = game_name or self.current_game or "global"
         if game not in self.tracking:
             self.tracking[game] = {}
-        self.tracking[game][key] = value
+        game_tracking = self.tracking[game]
+        if key not in game_tracking or game_tracking[key] != value:
+            self._mark_dirty(game, key)
+        game_tracking[key] = value
 
     def update_high_water_mark(self, key, value, game_name=None):
         """
@@ -318,6 +356,7 @@ class AchievementManager:
         current_max = self.high_water_marks[game].get(key, 0)
         if value > current_max:
             self.high_water_marks[game][key] = value
+            self._mark_dirty(game, key)
             self._save_progress()  # Persist the new high water mark
             return value
         return current_max
@@ -336,6 +375,99 @@ class AchievementManager:
         """Get all tracking values for a specific game"""
         return self.tracking.get(game_name, {})
 
+    # ==========================================================================
+    # DIRTY TRACKING
+    # ==========================================================================
+
+    def _mark_dirty(self, game, key):
+        """Record that a tracking key / high water mark changed for a game"""
+        self._change_counter += 1
+        self._key_changes.setdefault(game, {})[key] = self._change_counter
+
+    def _dirty_keys(self, check_name, game):
+        """
+        Tracking keys changed since check_name last ran for game.
+
+        Returns None if the check has not run yet (or was invalidated), which
+        means every achievement must be evaluated.
+        """
+        seen = self._check_marks.get((check_name, game))
+        if seen is None:
+            return None
+        # Sinew reads its own tracking, falling back to "global"
+        sources = ("Sinew", "global") if game == "Sinew" else (game,)
+        dirty = set()
+        for source in sources:
+            for key, change in self._key_changes.get(source, {}).items():
+                if change > seen:
+                    dirty.add(key)
+        return dirty
+
+    def _mark_checked(self, check_name, game):
+        self._check_marks[(check_name, game)] = self._change_counter
+
+    def _invalidate_checks(self):
+        """
+        Forget what has been checked so the next checks are full passes.
+        Called whenever achievements are reset, revoked or reloaded.
+        """
+        self._check_marks.clear()
+        self._stats_snapshots.clear()
+        self._invalidate_counts()
+
+    def _invalidate_counts(self):
+        """Drop the cached counters; they are rebuilt on next use"""
+        self._counts = None
+        self._unclaimed_count = None
+        self._state_version += 1
+
+    def get_state_version(self):
+        """
+        Token that changes whenever unlocks, claims or tracking values change.
+        Screens compare it to decide whether cached rows are still valid.
+        """
+        return (self._state_version, self._change_counter)
+
+    def _get_counts(self):
+        """{game: [unlocked, points]} for every game plus Sinew"""
+        if self._counts is None:
+            from achievements_data import GAMES, get_achievements_for
+
+            counts = {}
+            for game in GAMES + ["Sinew"]:
+                unlocked = points = 0
+                for a in get_achievements_for(game):
+                    if self.is_unlocked(a["id"]):
+                        unlocked += 1
+                        points += a.get("points", 0)
+                counts[game] = [unlocked, points]
+            self._counts = counts
+        return self._counts
+
+    @staticmethod
+    def _tracking_dependencies(hint, game):
+        """Tracking keys read for a hint by force_check_by_tracking / revalidate"""
+        keys = []
+        if ">=" in hint:
+            keys.append(hint.split(">=")[0].strip())
+        if "== True" in hint:
+            keys.append(hint.split("==")[0].strip())
+        if "owns_" in hint:
+            keys.append("combined_pokedex_set" if game == "Sinew" else "owned_set")
+        return tuple(keys)
+
+    def _get_tracking_index(self, game):
+        """AchievementIndex of a game's achievements keyed by tracking key"""
+        from achievements_data import AchievementIndex, get_achievements_for
+
+        index = self._tracking_indexes.get(game)
+        if index is None:
+            index = self._tracking_indexes[game] = AchievementIndex(
+                get_achievements_for(game),
+                lambda hint: self._tracking_dependencies(hint, game),
+            )
+        return index
+
     # ==========================================================================
     # ALTERING CAVE ECHOES FEATURE
     # ==========================================================================
@@ -403,12 +535,16 @@ class AchievementManager:
         """Check if all 7 Altering Cave Pokemon have been claimed."""
         return len(self.altering_cave_claimed) >= 7
 
+    @profiled("force_check_by_tracking")
     def force_check_by_tracking(self, game_name=None):
         """
-        Force check all achievements based on current tracking values.
+        Force check achievements based on current tracking values.
         This catches achievements where tracking shows completion but unlock wasn't triggered.
+
+        Only achievements whose tracking keys changed since the last call for
+        a game are evaluated; the first call per game checks them all.
         """
-        from achievements_data import GAMES, get_achievements_for
+        from achievements_data import GAMES
 
         if game_name:
             games_to_check = [game_name]
@@ -420,9 +556,11 @@ class AchievementManager:
             games_to_check = [g for g in (GAMES + ["Sinew"]) if g in self.tracking]
 
         newly_unlocked = []
+        profiler = get_achievement_profiler()
 
         for game in games_to_check:
-            achievements = get_achievements_for(game)
+            dirty = self._dirty_keys("force_check", game)
+            achievements = self._get_tracking_index(game).affected(dirty)
 
             # Get the correct tracking data for this game
             if game == "Sinew":
@@ -439,6 +577,7 @@ class AchievementManager:
                 if self.is_unlocked(ach["id"]):
                     continue
 
+                start = time.perf_counter() if profiler.enabled else 0
                 hint = ach.get("hint", "")
                 unlocked = False
 
@@ -551,10 +690,17 @@ class AchievementManager:
                             f" {ach['name']} (Legendary Birds in {game})"
                         )
 
+                if profiler.enabled:
+                    profiler.record_achievement(
+                        ach, time.perf_counter() - start, "force_check"
+                    )
+
                 if unlocked:
                     if self.unlock(ach["id"], ach):
                         newly_unlocked.append(ach["id"])
 
+            self._mark_checked("force_check", game)
+
         return newly_unlocked
 
     def debug_stuck_achievements(self):
@@ -783,13 +929,47 @@ class AchievementManager:
 
         return None
 
+    @staticmethod
+    def _pack_progress(progress):
+        """
+        Compact on-disk form of progress: unlocked entries become
+        [unlocked_at, reward_claimed]; anything else is kept as a dict.
+        """
+        packed = {}
+        for ach_id, entry in progress.items():
+            if entry.keys() == {"unlocked", "unlocked_at", "reward_claimed"} and entry[
+                "unlocked"
+            ]:
+                packed[ach_id] = [entry["unlocked_at"], entry["reward_claimed"]]
+            else:
+                packed[ach_id] = entry
+        return packed
+
+    @staticmethod
+    def _unpack_progress(packed):
+        """Inverse of _pack_progress (plain dict entries pass through)"""
+        progress = {}
+        for ach_id, entry in packed.items():
+            if isinstance(entry, list):
+                progress[ach_id] = {
+                    "unlocked": True,
+                    "unlocked_at": entry[0],
+                    "reward_claimed": bool(entry[1]),
+                }
+            else:
+                progress[ach_id] = entry
+        return progress
+
     def _load_progress(self):
-        """Load achievement progress from file"""
+        """Load achievement progress from file (compact or legacy indented)"""
+        # The file is the source of truth now; drop any write still pending
+        with self._write_lock:
+            self._progress_dirty = False
         try:
             if os.path.exists(ACH_SAVE_PATH):
                 with open(ACH_SAVE_PATH, "r") as f:
                     data = json.load(f)
-                    self.progress = data.get("progress", {})
+                    self.progress = self._unpack_progress(data.get("progress", {}))
                     self.stats = data.get("stats", {})
                     self.high_water_marks = data.get("high_water_marks", {})
                     self.altering_cave_claimed = data.get("altering_cave_claimed", [])
@@ -807,26 +987,77 @@ class AchievementManager:
             self.stats = {}
             self.high_water_marks = {}
             self.altering_cave_claimed = []
+        self._invalidate_checks()
 
     def _save_progress(self):
-        """Save achievement progress to file"""
-        try:
-            os.makedirs(os.path.dirname(ACH_SAVE_PATH), exist_ok=True)
-            with open(ACH_SAVE_PATH, "w") as f:
-                json.dump(
-                    {
-                        "progress": self.progress,
-                        "stats": self.stats,
-                        "high_water_marks": getattr(self, "high_water_marks", {}),
-                        "altering_cave_claimed": getattr(
-                            self, "altering_cave_claimed", []
-                        ),
-                    },
-                    f,
-                    indent=2,
-                )
-        except Exception as e:
-            print(f"[Achievements] Could not save progress: {e}")
+        """Mark progress dirty; the background writer persists it shortly"""
+        self._progress_dirty = True
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True
+            )
+            self._writer_thread.start()
+        self._save_requested.set()
+
+    def flush(self, wait=False):
+        """
+        Write pending progress now instead of after the debounce delay.
+
+        Args:
+            wait: Write on the calling thread and return once it is on disk
+                (use before exit, when the daemon writer may be killed)
+        """
+        if not self._progress_dirty:
+            return
+        if wait:
+            self._write_progress()
+        else:
+            self._flush_requested.set()
+            self._save_requested.set()
+
+    def _writer_loop(self):
+        """Background writer: collect a burst of changes, then write once"""
+        while True:
+            self._save_requested.wait()
+            self._save_requested.clear()
+            # Cut the debounce short if flush() is called meanwhile
+            if self._flush_requested.wait(self.SAVE_DEBOUNCE):
+                self._flush_requested.clear()
+            self._write_progress()
+
+    def _progress_snapshot(self):
+        """Copy of the persisted state, safe to serialise off the UI thread"""
+        return {
+            "format": self.SAVE_FORMAT,
+            "progress": self._pack_progress(
+                {k: dict(v) for k, v in dict(self.progress).items()}
+            ),
+            "stats": dict(self.stats),
+            "high_water_marks": {
+                game: dict(marks)
+                for game, marks in dict(getattr(self, "high_water_marks", {})).items()
+            },
+            "altering_cave_claimed": list(getattr(self, "altering_cave_claimed", [])),
+        }
+
+    def _write_progress(self):
+        """Write progress to file via a temp file and rename"""
+        with self._write_lock:
+            if not self._progress_dirty:
+                return
+            self._progress_dirty = False
+            tmp_path = ACH_SAVE_PATH + ".tmp"
+            try:
+                data = json.dumps(self._progress_snapshot(), separators=(",", ":"))
+                os.makedirs(os.path.dirname(ACH_SAVE_PATH), exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, ACH_SAVE_PATH)
+            except Exception as e:
+                self._progress_dirty = True
+                print(f"[Achievements] Could not save progress: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
 
     def is_unlocked(self, achievement_id):
         """Check if an achievement is unlocked"""
@@ -834,22 +1065,39 @@ class AchievementManager:
 
     def unlock(self, achievement_id, achievement_data=None):
         """Unlock an achievement and optionally trigger notification"""
-        if achievement_id not in self.progress:
-            self.progress[achievement_id] = {}
-
-        if not self.progress[achievement_id].get("unlocked"):
+        # Checks also run on the achievement worker thread
+        with self._unlock_lock:
+            if self.progress.get(achievement_id, {}).get("unlocked"):
+                return False
+            self.progress.setdefault(achievement_id, {})
             self.progress[achievement_id]["unlocked"] = True
             self.progress[achievement_id]["unlocked_at"] = time.time()
             self.progress[achievement_id]["reward_claimed"] = False
-            self._save_progress()
-            print(f"[Achievements] *** UNLOCKED: {achievement_id} ***")
+            self._unlocked_since_revalidate.add(achievement_id)
+            self._count_unlock(achievement_id)
+        self._save_progress()
+        print(f"[Achievements] *** UNLOCKED: {achievement_id} ***")
 
-            # Trigger notification if callback set and we have achievement data
-            if self.notification_callback and achievement_data:
-                self.notification_callback(achievement_data)
+        # Trigger notification if callback set and we have achievement data
+        if self.notification_callback and achievement_data:
+            self.notification_callback(achievement_data)
 
-            return True
-        return False
+        return True
+
+    def _count_unlock(self, achievement_id):
+        """Add a fresh unlock to the cached counters"""
+        if self._counts is not None:
+            from achievements_data import get_achievement_by_id
+
+            ach = get_achievement_by_id(achievement_id)
+            counts = self._counts.get(ach.get("game")) if ach else None
+            if counts is not None:
+                counts[0] += 1
+                counts[1] += ach.get("points", 0)
+            elif ach:
+                self._counts = None
+        self._unclaimed_count = None
+        self._state_version += 1
 
     def unlock_achievement(self, achievement_data):
         """
@@ -883,6 +1131,11 @@ class AchievementManager:
 
     def get_unclaimed_rewards_count(self):
         """Count achievements that are unlocked, have rewards, and should be shown for claiming"""
+        if self._unclaimed_count is None:
+            self._unclaimed_count = self._count_unclaimed_rewards()
+        return self._unclaimed_count
+
+    def _count_unclaimed_rewards(self):
         from achievements_data import (
             ACHIEVEMENT_REWARDS,
             GAME_PREFIX,
@@ -983,6 +1236,8 @@ class AchievementManager:
 
             # Mark as claimed
             self.progress[achievement_id]["reward_claimed"] = True
+            self._unclaimed_count = None
+            self._state_version += 1
             self._save_progress()
 
             return True, " ".join(messages)
@@ -1072,14 +1327,14 @@ class AchievementManager:
         """
         Deliver a Pokemon reward by generating it dynamically.
         UPDATED: Uses pokemon_generator instead of .pks files.
+        Copies come from the reward factory's ready queue when available.
         Returns: (success: bool, message: str)
         """
         try:
-            # Import the generator
-            from pokemon_generator import generate_achievement_pokemon
+            from reward_factory import get_reward_factory
 
-            # Generate the Pokemon
-            result = generate_achievement_pokemon(achievement_id)
+            # Take a pre-generated copy of the Pokemon
+            result = get_reward_factory().take_achievement(achievement_id)
             if result is None:
                 print(
                     f"[Achievements] No recipe found for achievement: {achievement_id}"
@@ -1101,32 +1356,20 @@ class AchievementManager:
                 if not sinew or not sinew.is_loaded():
                     return False, "Sinew Storage not available"
 
-                # Find first empty slot
-                for box_num in range(1, 21):  # 20 boxes
-                    box = sinew.get_box(box_num)
-                    if box:
-                        for slot_idx, slot in enumerate(box):
-                            # Check if slot is truly empty
-                            is_empty = (
-                                slot is None
-                                or slot.get("empty", False)
-                                or slot.get("species", 0) == 0
-                            )
-
-                            if is_empty:
-                                # Store the Pokemon
-                                pokemon_dict["raw_bytes"] = pokemon_bytes
-                                pokemon_dict["empty"] = False
-                                pokemon_dict["is_reward"] = True
-                                success = sinew.set_pokemon_at(
-                                    box_num, slot_idx, pokemon_dict
-                                )
-                                if success:
-                                    print(
-                                        f"[Achievements] {species_name}"
-                                        f" delivered to Box {box_num}, Slot {slot_idx + 1}"
-                                    )
-                                    return True, f"Stored in Box {box_num}"
+                # Find first empty slot (full boxes are skipped by count)
+                location = sinew.find_first_empty_slot()
+                if location:
+                    box_num, slot_idx = location
+                    pokemon_dict["raw_bytes"] = pokemon_bytes
+                    pokemon_dict["empty"] = False
+                    pokemon_dict["is_reward"] = True
+                    success = sinew.set_pokemon_at(box_num, slot_idx, pokemon_dict)
+                    if success:
+                        print(
+                            f"[Achievements] {species_name}"
+                            f" delivered to Box {box_num}, Slot {slot_idx + 1}"
+                        )
+                        return True, f"Stored in Box {box_num}"
 
                 return False, "No empty slot in Sinew Storage"
 
@@ -1552,6 +1795,7 @@ class AchievementManager:
                     self.tracking["Sinew"]["altering_cave_echoes"] = 0
                 print("[Achievements] Also reset Altering Cave progress (0/7)")
 
+            self._invalidate_checks()
             self._save_progress()
             print(f"[Achievements] Reset: {achievement_id}")
             return True
@@ -1592,6 +1836,7 @@ class AchievementManager:
         except Exception:
             pass
 
+        self._invalidate_checks()
         self._save_progress()
         print(
             f"[Achievements] Altering Cave progress reset (0/7),"
@@ -1626,6 +1871,7 @@ class AchievementManager:
         self.altering_cave_claimed = []
         self.high_water_marks = {}
         self.tracking = {}
+        self._invalidate_checks()
 
         # Save fresh empty state
         self._save_progress()
@@ -1645,6 +1891,7 @@ class AchievementManager:
         self.altering_cave_claimed = []  # Also reset Altering Cave progress
         self.high_water_marks = {}  # Also reset high water marks
         self.tracking = {}  # Also reset all tracking data
+        self._invalidate_checks()
         print(
             f"[Achievements] reset_all - AFTER clearing:"
             f" altering_cave_claimed={self.altering_cave_claimed}"
@@ -1676,16 +1923,22 @@ class AchievementManager:
                 self.tracking["Sinew"]["altering_cave_echoes"] = 0
             print("[Achievements] Also reset Altering Cave progress (0/7)")
 
+        self._invalidate_checks()
         self._save_progress()
         print(f"[Achievements] Reset {reset_count} achievements for {game_name}")
         return reset_count
 
+    @profiled("revalidate_achievements")
     def revalidate_achievements(self, sinew_data_loaded=True):
         """
-        Re-validate all unlocked achievements against current tracking data.
+        Re-validate unlocked achievements against current tracking data.
         Un-unlocks any achievements that were incorrectly unlocked.
         Returns list of achievement IDs that were revoked.
 
+        After a full pass over a game with tracking data, later calls only
+        re-validate achievements whose tracking keys changed, plus any
+        unlocked since the previous call.
+
         Args:
             sinew_data_loaded: If False, skip revocation for Sinew aggregate
                 achievements because no save data was available to build the
@@ -1695,11 +1948,13 @@ class AchievementManager:
         from achievements_data import GAMES, get_achievements_for
 
         revoked = []
+        recently_unlocked = self._unlocked_since_revalidate
+        self._unlocked_since_revalidate = set()
+        profiler = get_achievement_profiler()
 
-        print("[Achievements] Re-validating all unlocked achievements...")
+        print("[Achievements] Re-validating unlocked achievements...")
 
         for game in GAMES + ["Sinew"]:
-            achievements = get_achievements_for(game)
 
             # Get the correct tracking data for this game
             if game == "Sinew":
@@ -1724,10 +1979,27 @@ class AchievementManager:
             else:
                 game_has_tracking = game in self.tracking
 
+            # Without tracking nothing can be marked as validated, so keep
+            # doing full passes until the game's tracking data shows up
+            dirty = self._dirty_keys("revalidate", game) if game_has_tracking else None
+            if dirty is None:
+                achievements = get_achievements_for(game)
+            else:
+                achievements = self._get_tracking_index(game).affected(dirty)
+                affected_ids = {ach["id"] for ach in achievements}
+                achievements += [
+                    ach
+                    for ach in get_achievements_for(game)
+                    if ach["id"] in recently_unlocked and ach["id"] not in affected_ids
+                ]
+            if game_has_tracking:
+                self._mark_checked("revalidate", game)
+
             for ach in achievements:
                 if not self.is_unlocked(ach["id"]):
                     continue
 
+                start = time.perf_counter() if profiler.enabled else 0
                 hint = ach.get("hint", "")
                 should_be_unlocked = False
 
@@ -1846,6 +2118,11 @@ class AchievementManager:
                     # Unknown hint type, keep the achievement
                     should_be_unlocked = True
 
+                if profiler.enabled:
+                    profiler.record_achievement(
+                        ach, time.perf_counter() - start, "revalidate"
+                    )
+
                 if not should_be_unlocked:
                     print(
                         f"[Achievements] REVOKING: {ach['name']} ({game}) - hint: {hint}"
@@ -1854,6 +2131,7 @@ class AchievementManager:
                     revoked.append(ach["id"])
 
         if revoked:
+            self._invalidate_checks()
             self._save_progress()
             print(
                 f"[Achievements] Revoked {len(revoked)} incorrectly unlocked achievements"
@@ -1877,10 +2155,15 @@ class AchievementManager:
         self.stats[stat_name] = self.stats.get(stat_name, 0) + amount
         self._save_progress()
 
+    @profiled("check_and_unlock")
     def check_and_unlock(self, save_data, game_name, sinew_data=None):
         """
         Check all relevant achievements against save data and unlock any that are earned.
 
+        Only achievements reading a SaveStats field that changed since the
+        previous call for the same game are evaluated (all of them the first
+        time), so a save where only money moved checks just the money ones.
+
         Args:
             save_data: Parsed save data dict
             game_name: Name of the game (Ruby, Sapphire, etc.)
@@ -1889,7 +2172,11 @@ class AchievementManager:
         Returns:
             List of newly unlocked achievement IDs
         """
-        from achievements_data import check_achievement_unlocked, get_achievements_for
+        from achievements_data import (
+            SaveStats,
+            check_achievement_unlocked,
+            get_achievement_index,
+        )
 
         # Debug output
         dex = save_data.get("dex_caught", 0)
@@ -1914,6 +2201,9 @@ class AchievementManager:
         save_data_for_check = dict(save_data)
         save_data_for_check["money"] = money_hwm
 
+        # One pass over the save; every compiled hint is checked against it
+        stats = SaveStats(save_data_for_check)
+
         print(f"[Achievements] check_and_unlock for {game_name}:")
         print(
             f"[Achievements]   dex_caught={dex}, money={money} (hwm={money_hwm}), badges={badges}"
@@ -1925,15 +2215,22 @@ class AchievementManager:
 
         newly_unlocked = []
 
-        # Check game-specific achievements
-        game_achievements = get_achievements_for(game_name)
+        # Check game-specific achievements that depend on a changed field
+        changed = stats.changed_fields(self._stats_snapshots.get(game_name))
+        self._stats_snapshots[game_name] = stats.snapshot()
+        game_achievements = get_achievement_index(game_name).affected(changed)
+        if changed is not None:
+            print(
+                f"[Achievements]   Changed since last check:"
+                f" {', '.join(sorted(changed)) or 'nothing'}"
+            )
         checked_count = 0
         already_unlocked = 0
 
         for ach in game_achievements:
             if not self.is_unlocked(ach["id"]):
                 checked_count += 1
-                result = check_achievement_unlocked(ach, save_data_for_check)
+                result = check_achievement_unlocked(ach, save_data_for_check, stats=stats)
                 # Debug: show checks for key achievements
                 hint = ach.get("hint", "")
                 if "pc_pokemon" in hint or "money >=" in hint or "dex_count >=" in hint:
@@ -1959,16 +2256,25 @@ class AchievementManager:
         # achievement checks caused Emerald/FireRed achievements to fire incorrectly
         # because Sinew achievements share the same hint keys (dex_count, badges, etc.)
         if sinew_data:
-            sinew_achievements = get_achievements_for("Sinew")
             # Build aggregate save data for Sinew checks
             all_saves = sinew_data.get("all_saves", [])
             sinew_save_data = sinew_data.get(
                 "aggregate", {}
             )  # Use aggregate, not per-game data
             if sinew_save_data:  # Only check if we have proper aggregate data
+                sinew_stats = SaveStats(sinew_save_data, all_saves)
+                sinew_changed = sinew_stats.changed_fields(
+                    self._stats_snapshots.get("Sinew")
+                )
+                self._stats_snapshots["Sinew"] = sinew_stats.snapshot()
+                sinew_achievements = get_achievement_index("Sinew").affected(
+                    sinew_changed
+                )
                 for ach in sinew_achievements:
                     if not self.is_unlocked(ach["id"]):
-                        if check_achievement_unlocked(ach, sinew_save_data, all_saves):
+                        if check_achievement_unlocked(
+                            ach, sinew_save_data, all_saves, stats=sinew_stats
+                        ):
                             if self.unlock(ach["id"], ach):
                                 newly_unlocked.append(ach["id"])
 
@@ -1976,44 +2282,31 @@ class AchievementManager:
 
     def get_unlocked_count(self, game_name=None):
         """Get count of unlocked achievements for a game or all"""
-        from achievements_data import GAMES, get_achievements_for
-
+        counts = self._get_counts()
         if game_name:
-            achievements = get_achievements_for(game_name)
-        else:
-            achievements = []
-            for game in GAMES + ["Sinew"]:
-                achievements.extend(get_achievements_for(game))
-
-        return sum(1 for a in achievements if self.is_unlocked(a["id"]))
+            return counts.get(game_name, [0, 0])[0]
+        return sum(c[0] for c in counts.values())
 
     def get_total_count(self, game_name=None):
         """Get total achievement count for a game or all"""
-        from achievements_data import GAMES, get_achievements_for
+        if self._totals is None:
+            from achievements_data import GAMES, get_achievements_for
 
+            self._totals = {
+                game: len(get_achievements_for(game)) for game in GAMES + ["Sinew"]
+            }
         if game_name:
-            return len(get_achievements_for(game_name))
-        else:
-            total = 0
-            for game in GAMES + ["Sinew"]:
-                total += len(get_achievements_for(game))
-            return total
+            return self._totals.get(game_name, 0)
+        return sum(self._totals.values())
 
     def get_points(self, game_name=None):
         """Get total points earned"""
-        from achievements_data import GAMES, get_achievements_for
-
+        counts = self._get_counts()
         if game_name:
-            achievements = get_achievements_for(game_name)
-        else:
-            achievements = []
-            for game in GAMES + ["Sinew"]:
-                achievements.extend(get_achievements_for(game))
-
-        return sum(
-            a.get("points", 0) for a in achievements if self.is_unlocked(a["id"])
-        )
+            return counts.get(game_name, [0, 0])[1]
+        return sum(c[1] for c in counts.values())
 
+    @profiled("check_sinew_achievements")
     def check_sinew_achievements(
         self,
         sinew_storage_count=None,
@@ -2044,11 +2337,13 @@ class AchievementManager:
 
         newly_unlocked = []
         sinew_achievements = get_achievements_for("Sinew")
+        profiler = get_achievement_profiler()
 
         for ach in sinew_achievements:
             if self.is_unlocked(ach["id"]):
                 continue
 
+            start = time.perf_counter() if profiler.enabled else 0
             hint = ach.get("hint", "")
             unlocked = False
 
@@ -2099,6 +2394,9 @@ class AchievementManager:
                 except Exception:
                     pass
 
+            if profiler.enabled:
+                profiler.record_achievement(ach, time.perf_counter() - start, "sinew")
+
             if unlocked:
                 if self.unlock(ach["id"], ach):
                     newly_unlocked.append(ach["id"])
@@ -2182,6 +2480,9 @@ class AchievementsScreen:
         "Sinew": "trophy.png",
     }
 
+    # Pre-rendered rows kept before the cache is dropped and refilled
+    ROW_CACHE_SIZE = 48
+
     def __init__(self, width, height, game_filter=None, get_current_game_callback=None):
         from achievements_data import GAMES
 
@@ -2199,10 +2500,10 @@ class AchievementsScreen:
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 16)
-            self.font_text = pygame.font.Font(FONT_PATH, 11)
-            self.font_small = pygame.font.Font(FONT_PATH, 9)
-            self.font_sinew = pygame.font.Font(FONT_PATH, 16)
+            self.font_header = ui_colors.get_font(16, FONT_PATH)
+            self.font_text = ui_colors.get_font(11, FONT_PATH)
+            self.font_small = ui_colors.get_font(9, FONT_PATH)
+            self.font_sinew = ui_colors.get_font(16, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 22)
             self.font_text = pygame.font.SysFont(None, 16)
@@ -2217,6 +2518,16 @@ class AchievementsScreen:
         self.selected_tab = 0
         self.tab_focus = True  # True = navigating tabs, False = navigating achievements
 
+        # Render caches: row state is resolved once per manager state
+        # version, and pre-rendered rows/header are reused until their
+        # state, the selection or the theme changes
+        self._row_info = {}  # {achievement id: row state tuple}
+        self._row_info_version = None
+        self._row_surfaces = {}  # {(id, state, selected, theme): Surface}
+        self._header_key = None
+        self._header_surf = None
+        self._static_surfs = None  # Hint line and scroll arrows
+
         # Load achievements for current tab
         self._load_achievements()
 
@@ -2277,17 +2588,7 @@ class AchievementsScreen:
         # 3. Locked achievements - by completion percentage (highest first)
         def sort_key(a):
             ach_id = a["id"]
-            is_unlocked = self.manager.is_unlocked(ach_id)
-            has_reward = self.manager.has_reward(ach_id)
-            reward_claimed = self.manager.is_reward_claimed(ach_id)
-            # Only show as unclaimed if should_show_reward returns True
-            # (skips theme-only rewards that are already unlocked)
-            should_show = (
-                self.manager.should_show_reward(ach_id) if has_reward else False
-            )
-            has_unclaimed_gift = (
-                is_unlocked and has_reward and not reward_claimed and should_show
-            )
+            is_unlocked, _, has_unclaimed_gift, progress, _ = self._get_row_info(a)
 
             if has_unclaimed_gift:
                 # Priority 0: unclaimed gifts at very top
@@ -2303,7 +2604,6 @@ class AchievementsScreen:
                 return (1, -unlock_time)
             else:
                 # Priority 2: locked, sorted by completion percentage (highest first)
-                progress = self.manager.get_achievement_progress(a)
                 if progress:
                     percentage = progress[2]  # (current, required, percentage)
                 else:
@@ -2439,46 +2739,249 @@ class AchievementsScreen:
                     else:
                         self.visible = False
 
-    def draw(self, surf, font):
-        """Render the full achievements screen including tabs, list, progress bars, and detail popup."""
-        # Background
-        surf.fill(ui_colors.COLOR_BG)
-        pygame.draw.rect(
-            surf, ui_colors.COLOR_BORDER, (0, 0, self.width, self.height), 2
+    @staticmethod
+    def _theme_key():
+        """Colors baked into cached surfaces; a theme change re-renders them"""
+        return (
+            ui_colors.COLOR_BG,
+            ui_colors.COLOR_TEXT,
+            ui_colors.COLOR_BORDER,
+            ui_colors.COLOR_HIGHLIGHT,
+        )
+
+    def _get_row_info(self, achievement):
+        """
+        Row state for an achievement:
+        (is_unlocked, reward_claimed, has_unclaimed_gift, progress, reward_name)
+
+        Resolved once per manager state version, so reward and progress
+        lookups don't run every frame.
+        """
+        version = self.manager.get_state_version()
+        if version != self._row_info_version:
+            self._row_info.clear()
+            self._row_info_version = version
+
+        ach_id = achievement["id"]
+        info = self._row_info.get(ach_id)
+        if info is not None:
+            return info
+
+        is_unlocked = self.manager.is_unlocked(ach_id)
+        reward_claimed = self.manager.is_reward_claimed(ach_id)
+        reward_info = self.manager.get_reward_info(ach_id)
+
+        # Check for unclaimed gift (respecting should_show_reward)
+        has_unclaimed_gift = (
+            is_unlocked
+            and reward_info is not None
+            and not reward_claimed
+            and self.manager.should_show_reward(ach_id)
+        )
+
+        progress = None
+        if not is_unlocked:
+            progress = self.manager.get_achievement_progress(achievement)
+            if progress:
+                progress = tuple(progress)
+
+        # Reward name with proper label prefix
+        reward_name = None
+        if reward_info:
+            reward_type = reward_info.get("type", "")
+            if reward_type == "both":
+                reward_name = "Theme + Pokemon"
+            elif reward_type == "pokemon":
+                reward_name = f"Pokemon: {reward_info.get('name', 'Pokemon')}"
+            elif reward_type == "theme":
+                reward_name = f"Theme: {reward_info.get('name', 'Theme')}"
+            elif reward_type == "unlock":
+                reward_name = f"Unlock: {reward_info.get('name', 'Feature')}"
+            else:
+                reward_name = reward_info.get("name", "Reward")
+
+        info = (is_unlocked, reward_claimed, has_unclaimed_gift, progress, reward_name)
+        self._row_info[ach_id] = info
+        return info
+
+    def _get_row_surface(self, achievement, info, is_selected, size):
+        """Pre-rendered achievement row, rendered on first use"""
+        key = (achievement["id"], info, is_selected, self._theme_key())
+        row = self._row_surfaces.get(key)
+        if row is None:
+            if len(self._row_surfaces) >= self.ROW_CACHE_SIZE:
+                self._row_surfaces.clear()
+            row = self._render_row(achievement, info, is_selected, size)
+            self._row_surfaces[key] = row
+        return row
+
+    def _render_row(self, achievement, info, is_selected, size):
+        """Draw one achievement row onto a new surface of the given size"""
+        is_unlocked, reward_claimed, has_unclaimed_gift, progress, reward_name = info
+        row = pygame.Surface(size)
+        box_rect = row.get_rect()
+
+        # Background color
+        if has_unclaimed_gift:
+            # Special background for unclaimed gifts
+            bg_color = (60, 55, 40) if not is_selected else (80, 70, 50)
+        elif is_unlocked:
+            bg_color = (50, 70, 50) if not is_selected else (60, 100, 60)
+        else:
+            bg_color = (35, 35, 45) if not is_selected else (50, 50, 70)
+
+        row.fill(bg_color)
+
+        # Border (unclaimed gifts get a pulsing border drawn each frame)
+        if not has_unclaimed_gift:
+            if is_selected:
+                pygame.draw.rect(row, ui_colors.COLOR_HIGHLIGHT, box_rect, 2)
+            else:
+                pygame.draw.rect(row, ui_colors.COLOR_BORDER, box_rect, 1)
+
+        # Status icon - use game icon
+        icon_rect = pygame.Rect(5, 5, 28, 28)
+        game = achievement.get("game", "Sinew")
+
+        if is_unlocked:
+            pygame.draw.rect(row, (255, 215, 0), icon_rect, border_radius=3)
+        else:
+            pygame.draw.rect(row, (60, 60, 60), icon_rect, border_radius=3)
+
+        # Draw game icon or Sinew "S"
+        icon = self._get_game_icon(game)  # Lazy load icon
+        if icon:
+            # Center the icon
+            icon_x = icon_rect.x + (icon_rect.width - icon.get_width()) // 2
+            icon_y = icon_rect.y + (icon_rect.height - icon.get_height()) // 2
+            # Dim if locked
+            if not is_unlocked:
+                dimmed = icon.copy()
+                dimmed.fill((100, 100, 100, 180), special_flags=pygame.BLEND_RGBA_MULT)
+                row.blit(dimmed, (icon_x, icon_y))
+            else:
+                row.blit(icon, (icon_x, icon_y))
+        else:
+            # Sinew - draw "S"
+            s_color = (50, 50, 0) if is_unlocked else (80, 80, 80)
+            s_text = self.font_sinew.render("S", True, s_color)
+            s_rect = s_text.get_rect(center=icon_rect.center)
+            row.blit(s_text, s_rect)
+
+        pygame.draw.rect(row, ui_colors.COLOR_BORDER, icon_rect, 1)
+
+        # Achievement name (no truncation)
+        name_color = ui_colors.COLOR_TEXT if is_unlocked else (120, 120, 120)
+        name_surf = self.font_text.render(achievement["name"], True, name_color)
+        row.blit(name_surf, (40, 4))
+
+        # Progress or description
+        if progress:
+            current, required, percentage = progress
+            # Progress bar background
+            bar_x = 40
+            bar_y = 22
+            bar_width = 120
+            bar_height = 8
+
+            pygame.draw.rect(
+                row,
+                (40, 40, 50),
+                (bar_x, bar_y, bar_width, bar_height),
+                border_radius=2,
+            )
+
+            # Progress bar fill
+            fill_width = int((bar_width - 2) * (percentage / 100))
+            if fill_width > 0:
+                # Color based on progress: red -> yellow -> green
+                if percentage < 33:
+                    bar_color = (180, 80, 80)
+                elif percentage < 66:
+                    bar_color = (180, 180, 80)
+                else:
+                    bar_color = (80, 180, 80)
+                pygame.draw.rect(
+                    row,
+                    bar_color,
+                    (bar_x + 1, bar_y + 1, fill_width, bar_height - 2),
+                    border_radius=2,
+                )
+
+            # Progress text
+            progress_surf = self.font_small.render(
+                f"{current}/{required}", True, (150, 150, 150)
+            )
+            row.blit(progress_surf, (bar_x + bar_width + 5, bar_y - 2))
+        else:
+            # Unlocked, or no trackable progress - show description (no truncation)
+            desc_color = (150, 150, 150) if is_unlocked else (80, 80, 80)
+            desc_surf = self.font_small.render(
+                achievement.get("desc", ""), True, desc_color
+            )
+            row.blit(desc_surf, (40, 20))
+
+        # Points (top right corner)
+        points = achievement.get("points", 0)
+        pts_color = (255, 215, 0) if is_unlocked else (80, 80, 80)
+        pts_surf = self.font_small.render(f"{points}pts", True, pts_color)
+        row.blit(pts_surf, (box_rect.right - 45, 4))
+
+        # Reward indicator (under points, if has reward)
+        if reward_name:
+            if has_unclaimed_gift:
+                # Unclaimed gift - bright and attention-grabbing
+                gift_color = (255, 200, 100)  # Orange/gold
+            elif is_unlocked and reward_claimed:
+                # Already claimed - bright green (was too dark)
+                gift_color = (100, 255, 100)  # Bright green
+            else:
+                # Locked - show reward preview dimmed
+                gift_color = (100, 100, 100)
+            gift_surf = self.font_small.render(f"[{reward_name}]", True, gift_color)
+            row.blit(gift_surf, (box_rect.right - gift_surf.get_width() - 5, 18))
+
+        return row
+
+    def _get_header_surface(self):
+        """Title, counts and tab bar, re-rendered only when they change"""
+        tab_name = self.tabs[self.selected_tab]
+        game_name = None if tab_name == "All" else tab_name
+        counts = (
+            self.manager.get_unlocked_count(game_name),
+            self.manager.get_total_count(game_name),
+            self.manager.get_points(game_name),
+            self.manager.get_unclaimed_rewards_count(),
         )
+        key = (self.selected_tab, self.tab_focus, counts, self._theme_key())
+        if key == self._header_key:
+            return self._header_surf
+
+        unlocked, total, points, unclaimed_count = counts
+        header = pygame.Surface((self.width, 64))
+        header.fill(ui_colors.COLOR_BG)
 
         # Title
         title = self.font_header.render("Achievements", True, ui_colors.COLOR_TEXT)
-        surf.blit(title, (15, 10))
+        header.blit(title, (15, 10))
 
         # Progress for current tab
-        tab_name = self.tabs[self.selected_tab]
-        if tab_name == "All":
-            unlocked = self.manager.get_unlocked_count()
-            total = self.manager.get_total_count()
-            points = self.manager.get_points()
-        else:
-            unlocked = self.manager.get_unlocked_count(tab_name)
-            total = self.manager.get_total_count(tab_name)
-            points = self.manager.get_points(tab_name)
-
-        progress_text = f"{unlocked}/{total}"
-        progress_surf = self.font_text.render(progress_text, True, (100, 200, 100))
-        surf.blit(progress_surf, (self.width - 80, 12))
+        progress_surf = self.font_text.render(
+            f"{unlocked}/{total}", True, (100, 200, 100)
+        )
+        header.blit(progress_surf, (self.width - 80, 12))
 
         # Points
-        points_text = f"{points}pts"
-        points_surf = self.font_small.render(points_text, True, (255, 215, 0))
-        surf.blit(points_surf, (self.width - 80, 26))
+        points_surf = self.font_small.render(f"{points}pts", True, (255, 215, 0))
+        header.blit(points_surf, (self.width - 80, 26))
 
         # Unclaimed gifts indicator
-        unclaimed_count = self.manager.get_unclaimed_rewards_count()
         if unclaimed_count > 0:
             gift_text = f"{unclaimed_count} REWARD{'S' if unclaimed_count > 1 else ''} TO CLAIM!"
             gift_surf = self.font_small.render(gift_text, True, (255, 180, 100))
             # Center it under the title
             gift_x = 15 + title.get_width() + 20
-            surf.blit(gift_surf, (gift_x, 15))
+            header.blit(gift_surf, (gift_x, 15))
 
         # Draw tabs
         tab_y = 40
@@ -2494,31 +2997,63 @@ class AchievementsScreen:
 
             if is_selected:
                 bg_color = ui_colors.COLOR_HIGHLIGHT if self.tab_focus else (60, 80, 60)
-                pygame.draw.rect(surf, bg_color, tab_rect)
+                pygame.draw.rect(header, bg_color, tab_rect)
                 text_color = (255, 255, 255)
             else:
-                pygame.draw.rect(surf, (40, 40, 50), tab_rect)
+                pygame.draw.rect(header, (40, 40, 50), tab_rect)
                 text_color = (150, 150, 150)
 
-            pygame.draw.rect(surf, ui_colors.COLOR_BORDER, tab_rect, 1)
+            pygame.draw.rect(header, ui_colors.COLOR_BORDER, tab_rect, 1)
 
             # Full tab label
-            label = tab
-            label_surf = self.font_small.render(label, True, text_color)
+            label_surf = self.font_small.render(tab, True, text_color)
             label_rect = label_surf.get_rect(center=tab_rect.center)
-            surf.blit(label_surf, label_rect)
+            header.blit(label_surf, label_rect)
+
+        self._header_key = key
+        self._header_surf = header
+        return header
+
+    def _get_static_surfaces(self):
+        """Text that never changes: hints, scroll arrows, empty-list label"""
+        if self._static_surfs is None:
+            self._static_surfs = {
+                "hints": self.font_small.render(
+                    "L/R:Tab  D-Pad:Nav  A:Details  B:Back", True, (100, 100, 100)
+                ),
+                "up": self.font_text.render("^", True, (100, 200, 100)),
+                "down": self.font_text.render("v", True, (100, 200, 100)),
+                "empty": self.font_text.render(
+                    "No achievements", True, (100, 100, 100)
+                ),
+            }
+        return self._static_surfs
+
+    def draw(self, surf, font):
+        """
+        Render the full achievements screen including tabs, list, progress bars, and detail popup.
+
+        Header and rows are pre-rendered surfaces; only the rows in view are
+        composed, and only the pulsing gift borders are drawn per frame.
+        """
+        static = self._get_static_surfaces()
+
+        # Background, title, counts and tabs
+        surf.fill(ui_colors.COLOR_BG)
+        surf.blit(self._get_header_surface(), (0, 0))
 
         # Draw achievements list
         y_start = 70
         item_height = 42
 
         if not self.achievements:
-            no_ach = self.font_text.render("No achievements", True, (100, 100, 100))
-            surf.blit(no_ach, (self.width // 2 - 60, y_start + 50))
+            surf.blit(static["empty"], (self.width // 2 - 60, y_start + 50))
         else:
             visible_achievements = self.achievements[
                 self.scroll_offset : self.scroll_offset + self.achievements_per_page
             ]
+            row_size = (self.width - 20, item_height - 3)
+            pulse_color = None
 
             for i, achievement in enumerate(visible_achievements):
                 actual_index = self.scroll_offset + i
@@ -2526,229 +3061,36 @@ class AchievementsScreen:
                 is_selected = (
                     actual_index == self.selected_achievement
                 ) and not self.tab_focus
-                is_unlocked = self.manager.is_unlocked(achievement["id"])
-
-                # Check for unclaimed gift (respecting should_show_reward)
-                has_reward = self.manager.has_reward(achievement["id"])
-                reward_claimed = self.manager.is_reward_claimed(achievement["id"])
-                should_show = (
-                    self.manager.should_show_reward(achievement["id"])
-                    if has_reward
-                    else False
-                )
-                has_unclaimed_gift = (
-                    is_unlocked and has_reward and not reward_claimed and should_show
-                )
-
-                # Draw achievement box
-                box_rect = pygame.Rect(10, y, self.width - 20, item_height - 3)
-
-                # Background color
-                if has_unclaimed_gift:
-                    # Special background for unclaimed gifts
-                    bg_color = (60, 55, 40) if not is_selected else (80, 70, 50)
-                elif is_unlocked:
-                    bg_color = (50, 70, 50) if not is_selected else (60, 100, 60)
-                else:
-                    bg_color = (35, 35, 45) if not is_selected else (50, 50, 70)
-
-                pygame.draw.rect(surf, bg_color, box_rect)
-
-                # Border - pulsing for unclaimed gifts
-                if has_unclaimed_gift:
-                    # Pulsing gold border
-                    pulse = (
-                        math.sin(pygame.time.get_ticks() * 0.005) + 1
-                    ) / 2  # 0 to 1
-                    pulse_color = (
-                        int(180 + 75 * pulse),  # 180-255
-                        int(140 + 75 * pulse),  # 140-215
-                        int(50 * pulse),  # 0-50
-                    )
-                    pygame.draw.rect(surf, pulse_color, box_rect, 3)
-                elif is_selected:
-                    pygame.draw.rect(surf, ui_colors.COLOR_HIGHLIGHT, box_rect, 2)
-                else:
-                    pygame.draw.rect(surf, ui_colors.COLOR_BORDER, box_rect, 1)
+                info = self._get_row_info(achievement)
 
-                # Status icon - use game icon
-                icon_rect = pygame.Rect(box_rect.x + 5, box_rect.y + 5, 28, 28)
-                game = achievement.get("game", "Sinew")
-
-                if is_unlocked:
-                    pygame.draw.rect(surf, (255, 215, 0), icon_rect, border_radius=3)
-                else:
-                    pygame.draw.rect(surf, (60, 60, 60), icon_rect, border_radius=3)
-
-                # Draw game icon or Sinew "S"
-                icon = self._get_game_icon(game)  # Lazy load icon
-                if icon:
-                    # Center the icon
-                    icon_x = icon_rect.x + (icon_rect.width - icon.get_width()) // 2
-                    icon_y = icon_rect.y + (icon_rect.height - icon.get_height()) // 2
-                    # Dim if locked
-                    if not is_unlocked:
-                        dimmed = icon.copy()
-                        dimmed.fill(
-                            (100, 100, 100, 180), special_flags=pygame.BLEND_RGBA_MULT
-                        )
-                        surf.blit(dimmed, (icon_x, icon_y))
-                    else:
-                        surf.blit(icon, (icon_x, icon_y))
-                else:
-                    # Sinew - draw "S"
-                    s_color = (50, 50, 0) if is_unlocked else (80, 80, 80)
-                    s_text = self.font_sinew.render("S", True, s_color)
-                    s_rect = s_text.get_rect(center=icon_rect.center)
-                    surf.blit(s_text, s_rect)
-
-                pygame.draw.rect(surf, ui_colors.COLOR_BORDER, icon_rect, 1)
-
-                # Achievement name (no truncation)
-                name_color = ui_colors.COLOR_TEXT if is_unlocked else (120, 120, 120)
-                name_surf = self.font_text.render(achievement["name"], True, name_color)
-                surf.blit(name_surf, (box_rect.x + 40, box_rect.y + 4))
-
-                # Progress or description
-                if is_unlocked:
-                    # Show description for unlocked (no truncation)
-                    desc_color = (150, 150, 150)
-                    desc_text = achievement.get("desc", "")
-                    desc_surf = self.font_small.render(desc_text, True, desc_color)
-                    surf.blit(desc_surf, (box_rect.x + 40, box_rect.y + 20))
-                else:
-                    # Show progress for locked achievements
-                    progress = self.manager.get_achievement_progress(achievement)
-                    if progress:
-                        current, required, percentage = progress
-                        # Progress bar background
-                        bar_x = box_rect.x + 40
-                        bar_y = box_rect.y + 22
-                        bar_width = 120
-                        bar_height = 8
-
-                        pygame.draw.rect(
-                            surf,
-                            (40, 40, 50),
-                            (bar_x, bar_y, bar_width, bar_height),
-                            border_radius=2,
-                        )
-
-                        # Progress bar fill
-                        fill_width = int((bar_width - 2) * (percentage / 100))
-                        if fill_width > 0:
-                            # Color based on progress: red -> yellow -> green
-                            if percentage < 33:
-                                bar_color = (180, 80, 80)
-                            elif percentage < 66:
-                                bar_color = (180, 180, 80)
-                            else:
-                                bar_color = (80, 180, 80)
-                            pygame.draw.rect(
-                                surf,
-                                bar_color,
-                                (bar_x + 1, bar_y + 1, fill_width, bar_height - 2),
-                                border_radius=2,
-                            )
+                surf.blit(
+                    self._get_row_surface(achievement, info, is_selected, row_size),
+                    (10, y),
+                )
 
-                        # Progress text
-                        progress_text = f"{current}/{required}"
-                        progress_surf = self.font_small.render(
-                            progress_text, True, (150, 150, 150)
+                # Pulsing gold border for unclaimed gifts
+                if info[2]:
+                    if pulse_color is None:
+                        pulse = (
+                            math.sin(pygame.time.get_ticks() * 0.005) + 1
+                        ) / 2  # 0 to 1
+                        pulse_color = (
+                            int(180 + 75 * pulse),  # 180-255
+                            int(140 + 75 * pulse),  # 140-215
+                            int(50 * pulse),  # 0-50
                         )
-                        surf.blit(progress_surf, (bar_x + bar_width + 5, bar_y - 2))
-                    else:
-                        # No trackable progress - show description (no truncation)
-                        desc_color = (80, 80, 80)
-                        desc_text = achievement.get("desc", "")
-                        desc_surf = self.font_small.render(desc_text, True, desc_color)
-                        surf.blit(desc_surf, (box_rect.x + 40, box_rect.y + 20))
-
-                # Points (top right corner)
-                points = achievement.get("points", 0)
-                pts_color = (255, 215, 0) if is_unlocked else (80, 80, 80)
-                pts_surf = self.font_small.render(f"{points}pts", True, pts_color)
-                surf.blit(pts_surf, (box_rect.right - 45, box_rect.y + 4))
-
-                # Reward indicator (under points, if has reward)
-                # has_reward and reward_claimed already calculated at top of loop
-                if has_reward:
-                    reward_info = self.manager.get_reward_info(achievement["id"])
-
-                    if reward_info:
-                        # Get reward name with proper label prefix
-                        reward_type = reward_info.get("type", "")
-                        if reward_type == "both":
-                            pokemon_name = reward_info.get("pokemon_name", "Gift")
-                            theme_name = reward_info.get("theme_name", "Theme")
-                            reward_name = "Theme + Pokemon"
-                        elif reward_type == "pokemon":
-                            reward_name = (
-                                f"Pokemon: {reward_info.get('name', 'Pokemon')}"
-                            )
-                        elif reward_type == "theme":
-                            reward_name = f"Theme: {reward_info.get('name', 'Theme')}"
-                        elif reward_type == "unlock":
-                            reward_name = (
-                                f"Unlock: {reward_info.get('name', 'Feature')}"
-                            )
-                        else:
-                            reward_name = reward_info.get("name", "Reward")
-
-                        if has_unclaimed_gift:
-                            # Unclaimed gift - bright and attention-grabbing
-                            gift_text = f"[{reward_name}]"
-                            gift_color = (255, 200, 100)  # Orange/gold
-                            gift_surf = self.font_small.render(
-                                gift_text, True, gift_color
-                            )
-                            surf.blit(
-                                gift_surf,
-                                (
-                                    box_rect.right - gift_surf.get_width() - 5,
-                                    box_rect.y + 18,
-                                ),
-                            )
-                        elif is_unlocked and reward_claimed:
-                            # Already claimed - bright green (was too dark)
-                            gift_text = f"[{reward_name}]"
-                            gift_color = (100, 255, 100)  # Bright green
-                            gift_surf = self.font_small.render(
-                                gift_text, True, gift_color
-                            )
-                            surf.blit(
-                                gift_surf,
-                                (
-                                    box_rect.right - gift_surf.get_width() - 5,
-                                    box_rect.y + 18,
-                                ),
-                            )
-                        else:
-                            # Locked - show reward preview dimmed
-                            gift_text = f"[{reward_name}]"
-                            gift_color = (100, 100, 100)
-                            gift_surf = self.font_small.render(
-                                gift_text, True, gift_color
-                            )
-                            surf.blit(
-                                gift_surf,
-                                (
-                                    box_rect.right - gift_surf.get_width() - 5,
-                                    box_rect.y + 18,
-                                ),
-                            )
+                    box_rect = pygame.Rect((10, y), row_size)
+                    pygame.draw.rect(surf, pulse_color, box_rect, 3)
 
         # Scroll indicators
         if len(self.achievements) > self.achievements_per_page:
             if self.scroll_offset > 0:
-                up_arrow = self.font_text.render("^", True, (100, 200, 100))
-                surf.blit(up_arrow, (self.width - 20, y_start - 5))
+                surf.blit(static["up"], (self.width - 20, y_start - 5))
 
             max_scroll = len(self.achievements) - self.achievements_per_page
             if self.scroll_offset < max_scroll:
-                down_arrow = self.font_text.render("v", True, (100, 200, 100))
                 surf.blit(
-                    down_arrow,
+                    static["down"],
                     (
                         self.width - 20,
                         y_start + self.achievements_per_page * item_height - 15,
@@ -2756,9 +3098,11 @@ class AchievementsScreen:
                 )
 
         # Controller hints
-        hints = "L/R:Tab  D-Pad:Nav  A:Details  B:Back"
-        hint_surf = self.font_small.render(hints, True, (100, 100, 100))
-        surf.blit(hint_surf, (10, self.height - 18))
+        surf.blit(static["hints"], (10, self.height - 18))
+
+        pygame.draw.rect(
+            surf, ui_colors.COLOR_BORDER, (0, 0, self.width, self.height), 2
+        )
 
         # Draw detail popup if active
         if self.detail_popup:
@@ -2777,8 +3121,7 @@ class AchievementsScreen:
         )
 
         # Overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 180))
         surf.blit(overlay, (0, 0))
 
         # Calculate popup height based on content
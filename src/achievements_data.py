@@ -23,9 +23,18 @@ Each achievement is a dict:
 Use get_achievements_for(game) to retrieve the list.
 Use check_achievement_unlocked(achievement,
     save) as a template to implement checks against your parsed save data.
+When checking many achievements, build one SaveStats(save) and pass it as
+stats= (or use evaluate_achievements) - hints are compiled to predicates once.
+get_achievement_index(game).affected(stats.changed_fields(previous)) narrows
+a re-check to the achievements whose inputs changed since a snapshot().
 """
 
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional
+
+from achievement_profiler import get_achievement_profiler
+
+_profiler = get_achievement_profiler()
 
 GAMES = ["Ruby", "Sapphire", "Emerald", "FireRed", "LeafGreen"]
 GAME_PREFIX = {
@@ -1576,197 +1585,125 @@ def get_achievements_for(game_name: str) -> List[Dict]:
     return GAME_ACHIEVEMENTS.get(game_name, []).copy()
 
 
-# --- Check if achievement is unlocked based on save data ---
-def check_achievement_unlocked(
-    ach: Dict, save_data: Dict, all_saves: List[Dict] = None
-) -> bool:
-    """
-    Determine whether an achievement `ach` is unlocked given a parsed save_data dict.
+ACHIEVEMENTS_BY_ID: Dict[str, Dict] = {
+    ach["id"]: ach for achs in GAME_ACHIEVEMENTS.values() for ach in achs
+}
 
-    Args:
-        ach: an achievement dict from the lists above
-        save_data: parsed save structure containing:
-            - dex_caught: int (number of Pokemon caught)
-            - dex_seen: int (number of Pokemon seen)
-            - badges: int (number of badges, 0-8)
-            - money: int
-            - party: list of Pokemon dicts
-            - pc_pokemon: list of PC Pokemon
-            - playtime_hours: float
-            - shiny_count: int
-            - owned_list: list of species IDs owned
-        all_saves: optional list of parsed save dicts across saves (for Sinew global checks)
 
-    Returns:
-        bool: True if achievement condition is met
+def get_achievement_by_id(ach_id: str) -> Optional[Dict]:
+    """Return the achievement dict for an ID, or None if unknown."""
+    return ACHIEVEMENTS_BY_ID.get(ach_id)
+
+
+# --- Precomputed save statistics ---
+class SaveStats:
     """
-    hint = ach.get("hint", "")
-
-    # Helper to parse "field >= N" style hints
-    def parse_threshold(hint_str):
-        """Extract field name and required value from 'field >= N' hint"""
-        if ">=" in hint_str:
-            parts = hint_str.split(">=")
-            field = parts[0].strip()
-            try:
-                required = int(parts[1].strip().split()[0])
-                return field, required
-            except Exception:
-                pass
-        return None, None
-
-    # Get common data
-    dex_caught = save_data.get("dex_caught", 0)
-    dex_seen = save_data.get("dex_seen", 0)
-    badges = save_data.get("badges", 0)
-    money = save_data.get("money", 0)
-    party = save_data.get("party", [])
-    pc_pokemon = save_data.get("pc_pokemon", [])
-    playtime_hours = save_data.get("playtime_hours", 0)
-    owned_list = save_data.get("owned_list", [])
-
-    # Combine party and PC for total Pokemon
-    all_pokemon = []
-    for p in party:
-        if p and not p.get("empty"):
-            all_pokemon.append(p)
-    for p in pc_pokemon:
-        if p and not p.get("empty"):
-            all_pokemon.append(p)
-
-    # Count various stats
-    party_size = len([p for p in party if p and not p.get("empty")])
-    pc_count = len([p for p in pc_pokemon if p and not p.get("empty")])
-    total_pokemon_count = len(all_pokemon)
-
-    # Level stats
-    max_level = 0
-    pokemon_over_30 = 0
-    pokemon_over_50 = 0
-    pokemon_over_70 = 0
-    pokemon_at_100 = 0
-    shiny_count = 0
-
-    for p in all_pokemon:
-        level = p.get("level", 0)
-        max_level = max(max_level, level)
-        if level >= 30:
-            pokemon_over_30 += 1
-        if level >= 50:
-            pokemon_over_50 += 1
-        if level >= 70:
-            pokemon_over_70 += 1
-        if level >= 100:
-            pokemon_at_100 += 1
-        # Check for shiny - try both keys
-        if p.get("is_shiny") or p.get("shiny", False):
-            shiny_count += 1
-
-    # =========================================================================
-    # THRESHOLD-BASED CHECKS (handle most common patterns)
-    # =========================================================================
-
-    # Dex counts
-    if "dex_count >=" in hint:
-        _, required = parse_threshold(hint)
-        return dex_caught >= required if required else False
-
-    if "dex_seen >=" in hint:
-        _, required = parse_threshold(hint)
-        return dex_seen >= required if required else False
-
-    # Badge counts
-    if "badges >=" in hint:
-        _, required = parse_threshold(hint)
-        return badges >= required if required else False
-
-    # Money counts
-    if "money >=" in hint:
-        _, required = parse_threshold(hint)
-        return money >= required if required else False
-
-    # Playtime
-    if "playtime_hours >=" in hint:
-        _, required = parse_threshold(hint)
-        return playtime_hours >= required if required else False
-
-    # Party size
-    if "party_size >=" in hint:
-        _, required = parse_threshold(hint)
-        return party_size >= required if required else False
-
-    # PC Pokemon count
-    if "pc_pokemon >=" in hint:
-        _, required = parse_threshold(hint)
-        return pc_count >= required if required else False
-
-    # Total Pokemon count
-    if "total_pokemon >=" in hint:
-        _, required = parse_threshold(hint)
-        return total_pokemon_count >= required if required else False
-
-    # Level thresholds for any Pokemon
-    if "any_pokemon_level >=" in hint:
-        _, required = parse_threshold(hint)
-        return max_level >= required if required else False
-
-    # Pokemon over level thresholds
-    if "pokemon_over_30 >=" in hint:
-        _, required = parse_threshold(hint)
-        return pokemon_over_30 >= required if required else False
-
-    if "pokemon_over_50 >=" in hint:
-        _, required = parse_threshold(hint)
-        return pokemon_over_50 >= required if required else False
-
-    if "pokemon_over_70 >=" in hint:
-        _, required = parse_threshold(hint)
-        return pokemon_over_70 >= required if required else False
-
-    if "pokemon_at_100 >=" in hint:
-        _, required = parse_threshold(hint)
-        return pokemon_at_100 >= required if required else False
-
-    # Shiny count
-    if "shiny_count >=" in hint:
-        _, required = parse_threshold(hint)
-        return shiny_count >= required if required else False
-
-    # =========================================================================
-    # LEGENDARY OWNERSHIP (check if species ID in owned_list)
-    # =========================================================================
-    if "owns_species_" in hint:
-        try:
-            # Extract species ID from hint like "owns_species_383"
-            species_id = int(hint.split("owns_species_")[1].split()[0])
-            result = species_id in owned_list
-            # Debug output for legendary checks
-            if len(owned_list) > 0:
-                # Show whether found or not
-                print(
-                    f"[Achievements] Legendary check: species {species_id} in owned_list ({len(
-                        owned_list)} species)? {result}"
-                )
-                if not result and species_id in [150, 151, 380, 381, 382, 383, 384]:
-                    # Show what type owned_list contains
-                    sample = owned_list[:5] if len(owned_list) >= 5 else owned_list
-                    print(
-                        f"[Achievements]   owned_list sample: {sample} (types: {[type(
-                            x).__name__ for x in sample]})"
-                    )
-            return result
-        except Exception as e:
-            print(f"[Achievements] Error checking legendary: {e}")
-            import traceback
+    Everything achievement predicates read from one save, computed once.
 
-            traceback.print_exc()
+    Built in a single pass over party + PC, so evaluating every achievement
+    costs O(Pokemon + achievements) instead of O(Pokemon x achievements).
+    """
 
-    # =========================================================================
-    # FRLG SEVII POKEMON RANGER ACHIEVEMENT
-    # =========================================================================
-    # Requires National Dex unlocked AND Rainbow Pass obtained
-    if hint == "has_national_dex AND has_rainbow_pass":
-        # First check if already parsed in save_data
+    __slots__ = (
+        "dex_caught",
+        "dex_seen",
+        "badges",
+        "money",
+        "playtime_hours",
+        "party_size",
+        "pc_count",
+        "total_pokemon",
+        "max_level",
+        "pokemon_over_30",
+        "pokemon_over_50",
+        "pokemon_over_70",
+        "pokemon_at_100",
+        "shiny_count",
+        "owned_set",
+        "owned_count",
+        "events_tracker",
+        "any_save_champion",
+        "_save_data",
+        "_sevii_ready",
+    )
+
+    def __init__(self, save_data: Dict, all_saves: List[Dict] = None):
+        self._save_data = save_data
+        self._sevii_ready = None
+        self.dex_caught = save_data.get("dex_caught", 0)
+        self.dex_seen = save_data.get("dex_seen", 0)
+        self.badges = save_data.get("badges", 0)
+        self.money = save_data.get("money", 0)
+        self.playtime_hours = save_data.get("playtime_hours", 0)
+        owned_list = save_data.get("owned_list", [])
+        self.owned_set = set(owned_list)
+        self.owned_count = len(owned_list)
+        self.events_tracker = save_data.get("events_tracker", {})
+        self.any_save_champion = any(
+            save.get("badges", 0) >= 8 for save in all_saves or []
+        )
+
+        party_size = pc_count = 0
+        max_level = over_30 = over_50 = over_70 = at_100 = shiny = 0
+        for source in ("party", "pc_pokemon"):
+            for p in save_data.get(source, []):
+                if not p or p.get("empty"):
+                    continue
+                if source == "party":
+                    party_size += 1
+                else:
+                    pc_count += 1
+                level = p.get("level", 0)
+                if level > max_level:
+                    max_level = level
+                if level >= 30:
+                    over_30 += 1
+                    if level >= 50:
+                        over_50 += 1
+                        if level >= 70:
+                            over_70 += 1
+                            if level >= 100:
+                                at_100 += 1
+                # Check for shiny - try both keys
+                if p.get("is_shiny") or p.get("shiny", False):
+                    shiny += 1
+
+        self.party_size = party_size
+        self.pc_count = pc_count
+        self.total_pokemon = party_size + pc_count
+        self.max_level = max_level
+        self.pokemon_over_30 = over_30
+        self.pokemon_over_50 = over_50
+        self.pokemon_over_70 = over_70
+        self.pokemon_at_100 = at_100
+        self.shiny_count = shiny
+
+    def snapshot(self) -> Dict:
+        """Current value of every field a predicate can read"""
+        values = {name: getattr(self, name) for name in STAT_FIELDS}
+        values["events_tracker"] = dict(self.events_tracker)
+        return values
+
+    def changed_fields(self, previous: Dict = None):
+        """
+        Fields whose value differs from an earlier snapshot().
+
+        Returns None when there is no previous snapshot (everything changed).
+        """
+        if previous is None:
+            return None
+        return {
+            name
+            for name in STAT_FIELDS
+            if previous.get(name) != getattr(self, name)
+        }
+
+    def sevii_ready(self) -> bool:
+        """National Dex AND Rainbow Pass (FRLG), resolved on first use"""
+        if self._sevii_ready is not None:
+            return self._sevii_ready
+
+        save_data = self._save_data
         has_national_dex = save_data.get("has_national_dex", None)
         has_rainbow_pass = save_data.get("has_rainbow_pass", None)
 
@@ -1789,58 +1726,251 @@ def check_achievement_unlocked(
                 has_national_dex = save_data.get("has_national_dex", False)
                 has_rainbow_pass = save_data.get("has_rainbow_pass", False)
 
-        # Debug output
         print(
             f"[Achievements] Sevii check:"
             f" national_dex={has_national_dex}, rainbow_pass={has_rainbow_pass}"
         )
+        self._sevii_ready = bool(has_national_dex and has_rainbow_pass)
+        return self._sevii_ready
+
+
+# Public SaveStats fields (what hint dependencies refer to)
+STAT_FIELDS = tuple(name for name in SaveStats.__slots__ if not name.startswith("_"))
+
+
+# --- Hint compiler ---
+# "field >= N" hints, in the order they are matched (first substring wins)
+_THRESHOLD_HINTS = [
+    ("dex_count >=", "dex_caught"),
+    ("dex_seen >=", "dex_seen"),
+    ("badges >=", "badges"),
+    ("money >=", "money"),
+    ("playtime_hours >=", "playtime_hours"),
+    ("party_size >=", "party_size"),
+    ("pc_pokemon >=", "pc_count"),
+    ("total_pokemon >=", "total_pokemon"),
+    ("any_pokemon_level >=", "max_level"),
+    ("pokemon_over_30 >=", "pokemon_over_30"),
+    ("pokemon_over_50 >=", "pokemon_over_50"),
+    ("pokemon_over_70 >=", "pokemon_over_70"),
+    ("pokemon_at_100 >=", "pokemon_at_100"),
+    ("shiny_count >=", "shiny_count"),
+]
+
+# Event hints -> events_tracker key
+_EVENT_HINTS = {
+    "event_eon_ticket_claimed": "eon_ticket",
+    "event_aurora_ticket_claimed": "aurora_ticket",
+    "event_mystic_ticket_claimed": "mystic_ticket",
+    "event_old_sea_map_claimed": "old_sea_map",
+}
+
+
+def _parse_threshold(hint_str):
+    """Extract field name and required value from 'field >= N' hint"""
+    if ">=" in hint_str:
+        parts = hint_str.split(">=")
+        field = parts[0].strip()
+        try:
+            required = int(parts[1].strip().split()[0])
+            return field, required
+        except Exception:
+            pass
+    return None, None
+
+
+def _never(stats: SaveStats) -> bool:  # pylint: disable=unused-argument
+    return False
+
+
+def _threshold_predicate(attr, required):
+    def predicate(stats: SaveStats) -> bool:
+        return getattr(stats, attr) >= required
+
+    return predicate
+
 
-        return has_national_dex and has_rainbow_pass
+def compile_hint(hint: str):
+    """
+    Turn an achievement hint into a predicate over SaveStats.
+
+    Matching follows the same order as the original per-call checks, so
+    every hint keeps its meaning. Each branch also names the SaveStats
+    fields its predicate reads, so the dependency index can never drift
+    from what is actually checked.
+
+    Returns:
+        tuple: (fn(stats) -> bool, deps) - deps is a tuple of field names,
+        empty for hints that can never pass, or None for hints that must
+        always be re-checked (their inputs are not captured in fields)
+    """
+    for pattern, attr in _THRESHOLD_HINTS:
+        if pattern in hint:
+            _, required = _parse_threshold(hint)
+            if not required:
+                return _never, ()
+            return _threshold_predicate(attr, required), (attr,)
+
+    # Legendary ownership (species ID in owned_list)
+    if "owns_species_" in hint:
+        try:
+            species_id = int(hint.split("owns_species_")[1].split()[0])
+            return (lambda stats: species_id in stats.owned_set), ("owned_set",)
+        except Exception as e:
+            print(f"[Achievements] Bad legendary hint {hint!r}: {e}")
 
-    # =========================================================================
-    # EVENT ACHIEVEMENTS (Mystery Event Items System)
-    # =========================================================================
+    # FRLG Sevii Pokemon Ranger - National Dex AND Rainbow Pass, resolved
+    # lazily from raw save data
+    if hint == "has_national_dex AND has_rainbow_pass":
+        return (lambda stats: stats.sevii_ready()), None
 
     # Endgame Access - any game with 8 badges (Champion status)
     if hint == "any_game_champion":
-        # Check current save
-        if badges >= 8:
-            return True
-        # Check all saves if provided
-        if all_saves:
-            for save in all_saves:
-                if save.get("badges", 0) >= 8:
-                    return True
-        return False
+        return (
+            lambda stats: stats.badges >= 8 or stats.any_save_champion
+        ), ("badges", "any_save_champion")
 
-    # Event item achievements - check events_tracker in save_data
-    events_tracker = save_data.get("events_tracker", {})
+    # Event item achievements - events_tracker in save_data
+    if hint in _EVENT_HINTS:
+        key = _EVENT_HINTS[hint]
+        return (
+            lambda stats: bool(stats.events_tracker.get(key, False))
+        ), ("events_tracker",)
 
-    if hint == "event_eon_ticket_claimed":
-        return events_tracker.get("eon_ticket", False)
+    if hint == "all_events_claimed":
+        keys = list(_EVENT_HINTS.values())
+        return (
+            lambda stats: all(stats.events_tracker.get(k, False) for k in keys)
+        ), ("events_tracker",)
 
-    if hint == "event_aurora_ticket_claimed":
-        return events_tracker.get("aurora_ticket", False)
+    return _never, ()
 
-    if hint == "event_mystic_ticket_claimed":
-        return events_tracker.get("mystic_ticket", False)
 
-    if hint == "event_old_sea_map_claimed":
-        return events_tracker.get("old_sea_map", False)
+# hint -> (compiled predicate, deps) (many achievements share a hint)
+_COMPILED_HINTS: Dict[str, tuple] = {}
 
-    # All events collector
-    if hint == "all_events_claimed":
-        return all(
-            [
-                events_tracker.get("eon_ticket", False),
-                events_tracker.get("aurora_ticket", False),
-                events_tracker.get("mystic_ticket", False),
-                events_tracker.get("old_sea_map", False),
-            ]
+
+def _compiled(hint: str):
+    """compile_hint(hint), cached"""
+    compiled = _COMPILED_HINTS.get(hint)
+    if compiled is None:
+        compiled = _COMPILED_HINTS[hint] = compile_hint(hint)
+    return compiled
+
+
+def get_achievement_predicate(ach: Dict):
+    """Compiled predicate for an achievement (cached by hint)"""
+    return _compiled(ach.get("hint", ""))[0]
+
+
+def compile_all_achievements():
+    """Compile every hint in GAME_ACHIEVEMENTS up front"""
+    for achievements in GAME_ACHIEVEMENTS.values():
+        for ach in achievements:
+            get_achievement_predicate(ach)
+    return len(_COMPILED_HINTS)
+
+
+def evaluate_achievements(achievements: List[Dict], stats: SaveStats) -> List[Dict]:
+    """Return the achievements in the list whose predicate holds for stats"""
+    return [ach for ach in achievements if get_achievement_predicate(ach)(stats)]
+
+
+# --- Dependency index ---
+def get_hint_dependencies(hint: str):
+    """
+    SaveStats fields the compiled predicate for hint reads (see compile_hint).
+
+    Returns an empty tuple for hints that can never pass and None for hints
+    that must always be re-checked.
+    """
+    return _compiled(hint)[1]
+
+
+class AchievementIndex:
+    """
+    One achievement list grouped by the keys each achievement depends on.
+
+    affected(changed) returns, in catalogue order, only the achievements
+    that read at least one changed key, so a save where only money moved
+    re-checks the money achievements and nothing else.
+    """
+
+    def __init__(self, achievements: List[Dict], get_dependencies=None):
+        get_dependencies = get_dependencies or get_hint_dependencies
+        self.achievements = achievements
+        self.by_key = {}  # key -> [position in achievements]
+        self.always = []  # positions with no known dependencies
+        for pos, ach in enumerate(achievements):
+            keys = get_dependencies(ach.get("hint", ""))
+            if keys is None:
+                self.always.append(pos)
+                continue
+            for key in keys:
+                self.by_key.setdefault(key, []).append(pos)
+
+    def affected(self, changed=None) -> List[Dict]:
+        """Achievements depending on any key in changed (None = all of them)"""
+        if changed is None:
+            return list(self.achievements)
+        positions = set(self.always)
+        for key in changed:
+            positions.update(self.by_key.get(key, ()))
+        return [self.achievements[pos] for pos in sorted(positions)]
+
+
+# game -> AchievementIndex over SaveStats fields
+_ACHIEVEMENT_INDEXES: Dict[str, AchievementIndex] = {}
+
+
+def get_achievement_index(game_name: str) -> AchievementIndex:
+    """AchievementIndex (by SaveStats field) for a game's achievements"""
+    index = _ACHIEVEMENT_INDEXES.get(game_name)
+    if index is None:
+        index = _ACHIEVEMENT_INDEXES[game_name] = AchievementIndex(
+            get_achievements_for(game_name)
         )
+    return index
 
-    # Default - not unlocked
-    return False
+
+# --- Check if achievement is unlocked based on save data ---
+def check_achievement_unlocked(
+    ach: Dict, save_data: Dict, all_saves: List[Dict] = None, stats: SaveStats = None
+) -> bool:
+    """
+    Determine whether an achievement `ach` is unlocked given a parsed save_data dict.
+
+    Args:
+        ach: an achievement dict from the lists above
+        save_data: parsed save structure containing:
+            - dex_caught: int (number of Pokemon caught)
+            - dex_seen: int (number of Pokemon seen)
+            - badges: int (number of badges, 0-8)
+            - money: int
+            - party: list of Pokemon dicts
+            - pc_pokemon: list of PC Pokemon
+            - playtime_hours: float
+            - owned_list: list of species IDs owned
+        all_saves: optional list of parsed save dicts across saves (for Sinew global checks)
+        stats: optional SaveStats already built from save_data; pass one when
+            checking many achievements so the save is only scanned once
+
+    Returns:
+        bool: True if achievement condition is met
+    """
+    if not _profiler.enabled:
+        if stats is None:
+            stats = SaveStats(save_data, all_saves)
+        return get_achievement_predicate(ach)(stats)
+
+    # Timed including any SaveStats build, so callers that don't pass
+    # stats show up in the profile
+    start = time.perf_counter()
+    if stats is None:
+        stats = SaveStats(save_data, all_saves)
+    result = get_achievement_predicate(ach)(stats)
+    _profiler.record_achievement(ach, time.perf_counter() - start)
+    return result
 
 
 # Example quick test (you can remove or adapt)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+"""
+Asset Loader
+A small pool of worker threads that decodes images off the main thread.
+
+Decoding PNGs and GIF frames with Pillow is most of what makes startup and
+screen changes slow on handhelds. Workers do that part and hand back raw
+RGBA bytes; the main thread only wraps them with pygame.image.frombuffer()
+and convert_alpha() (to_surface()), since pygame surfaces that touch the
+display must be made there. The decode helpers read through decoded_cache,
+so after the first launch they're a file read rather than a decode.
+
+Requests are served by need: PRIORITY_NOW for what's on screen (the
+current game's background), PRIORITY_SOON for what's one button press
+away, PRIORITY_LATER for everything else. Asking again for a pending key
+with a more urgent priority moves it up the queue, so the menu can be
+shown and used while the rest is still loading.
+
+Usage:
+    loader = get_asset_loader()
+    req = loader.request(("logo", path), lambda: decode_rgba(path), PRIORITY_NOW)
+
+    if req.ready():                       # each frame, main thread
+        surf = to_surface(req.result)
+"""
+
+import itertools
+import queue
+import threading
+
+import pygame
+
+import decoded_cache
+
+PRIORITY_NOW = 0
+PRIORITY_SOON = 10
+PRIORITY_LATER = 20
+
+# Decoding threads (Pillow releases the GIL while it decodes)
+ASSET_WORKERS = 2
+
+
+def decode_rgba(path, size=None):
+    """
+    Decode an image file to raw RGBA, nearest-neighbour scaled to size
+    (any thread). Served from decoded_cache when it has it.
+
+    Returns:
+        tuple: (bytes, (width, height))
+    """
+    frames = decode_rgba_frames(path, size=size, first_only=True)
+    return frames[0][0], frames[0][1]
+
+
+def decode_rgba_frames(path, default_ms=100, size=None, first_only=False):
+    """
+    Decode the frames of an animated image to raw RGBA, nearest-neighbour
+    scaled to size (any thread). Served from decoded_cache when it has it.
+
+    Returns:
+        list: [(bytes, (width, height), duration_ms)]
+    """
+    variant = "first" if first_only else "frames"
+    cached = decoded_cache.load(path, size, variant)
+    if cached is not None:
+        return [(data, frame_size, ms) for _, frame_size, data, ms, _, _ in cached]
+
+    from PIL import Image, ImageSequence
+
+    frames = []
+    with Image.open(path) as img:
+        for frame in ImageSequence.Iterator(img):
+            rgba = frame.convert("RGBA")
+            if size and rgba.size != tuple(size):
+                rgba = rgba.resize(tuple(size), Image.NEAREST)
+            duration = decoded_cache.frame_duration(frame.info, default_ms)
+            frames.append((rgba.tobytes(), rgba.size, duration))
+            if first_only:
+                break
+    cache_frames = [("RGBA", frame_size, data, ms) for data, frame_size, ms in frames]
+    decoded_cache.store(path, cache_frames, size, variant)
+    return frames
+
+
+def to_surface(raw):
+    """Raw (bytes, size) from decode_rgba() as a display surface (main thread)"""
+    data, size = raw[0], raw[1]
+    return pygame.image.frombuffer(data, size, "RGBA").convert_alpha()
+
+
+class AssetRequest:
+    """One queued decode; result is set once ready() is True"""
+
+    def __init__(self, key, decode, priority):
+        self.key = key
+        self.decode = decode
+        self.priority = priority
+        self.started = False
+        self.result = None
+        self.error = None
+        self._done = threading.Event()
+
+    def ready(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until decoded; True if it finished in time"""
+        return self._done.wait(timeout)
+
+
+class AssetLoader:
+    """Priority queue of decode jobs served by ASSET_WORKERS threads"""
+
+    def __init__(self, workers=ASSET_WORKERS):
+        self.workers = max(1, workers)
+        self._queue = queue.PriorityQueue()
+        self._pending = {}  # key -> AssetRequest not finished yet
+        self._order = itertools.count()  # FIFO within a priority
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def request(self, key, decode, priority=PRIORITY_LATER):
+        """
+        Queue decode() under key, or raise the priority of the pending
+        request for key.
+
+        Returns:
+            AssetRequest
+        """
+        with self._lock:
+            req = self._pending.get(key)
+            if req is None:
+                req = AssetRequest(key, decode, priority)
+                self._pending[key] = req
+            elif req.started or priority >= req.priority:
+                return req
+            req.priority = priority
+            self._queue.put((priority, next(self._order), req))
+            self._start_workers()
+        return req
+
+    def pending(self, key=None):
+        """Pending request for key, or the number pending if key is None"""
+        with self._lock:
+            if key is None:
+                return len(self._pending)
+            return self._pending.get(key)
+
+    def _start_workers(self):
+        # Called with the lock held
+        if len(self._threads) < self.workers:
+            for _ in range(self.workers - len(self._threads)):
+                thread = threading.Thread(target=self._run, daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def _run(self):
+        while True:
+            priority, _, req = self._queue.get()
+            with self._lock:
+                # Skip stale entries left behind by a priority raise
+                if req.started or priority != req.priority:
+                    continue
+                req.started = True
+            try:
+                req.result = req.decode()
+            except Exception as e:
+                req.error = e
+                print(f"[AssetLoader] Could not load {req.key}: {e}")
+            with self._lock:
+                self._pending.pop(req.key, None)
+            req._done.set()
+
+
+_asset_loader = None
+
+
+def get_asset_loader():
+    """Get or create the shared AssetLoader"""
+    global _asset_loader
+    if _asset_loader is None:
+        _asset_loader = AssetLoader()
+    return _asset_loader
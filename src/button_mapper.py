@@ -15,6 +15,7 @@ import os
 
 import pygame
 
+import ui_colors
 from config import FONT_PATH, SETTINGS_FILE
 from ui_colors import COLOR_HIGHLIGHT, COLOR_TEXT ,COLOR_BG, COLOR_BORDER
 
@@ -117,10 +118,10 @@ class ButtonMapper:
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 16)
-            self.font_text = pygame.font.Font(FONT_PATH, 11)
-            self.font_small = pygame.font.Font(FONT_PATH, 9)
-            self.font_tiny = pygame.font.Font(FONT_PATH, 7)
+            self.font_header = ui_colors.get_font(16, FONT_PATH)
+            self.font_text = ui_colors.get_font(11, FONT_PATH)
+            self.font_small = ui_colors.get_font(9, FONT_PATH)
+            self.font_tiny = ui_colors.get_font(7, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 22)
             self.font_text = pygame.font.SysFont(None, 16)
@@ -936,9 +937,7 @@ class ButtonMapper:
     def draw(self, surf):
         """Draw the button mapper screen"""
         # Background with overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill(COLOR_BG)
-        surf.blit(overlay, (0, 0))
+        surf.fill(COLOR_BG, (0, 0, self.width, self.height))
 
         # Border
         pygame.draw.rect(surf, COLOR_BORDER, (0, 0, self.width, self.height), 2)
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+
+"""
+Collection Export
+Streams every party, PC and Sinew storage Pokemon from all detected saves
+to a file, one record at a time.
+
+Formats:
+    jsonl    - one JSON object per line
+    csv      - header row plus one row per Pokemon
+    columnar - JSON Lines of row groups, each {"rows": n, "columns": {...}}
+               with one value list per column (ROW_GROUP_SIZE rows per line)
+
+Saves are parsed one after another and dropped once written, and Sinew
+storage is read with iter_pokemon(), so memory use does not grow with the
+size of the collection. Names are resolved through ID-indexed tables that
+are built once per process.
+
+Usage:
+    job = CollectionExportJob({"Emerald": "/path/emerald.sav"}, fmt="csv")
+    job.start()
+    ...
+    if job.done:
+        print(job.path, job.written, job.error)
+"""
+
+import csv
+import json
+import os
+import threading
+from datetime import datetime
+
+from config import EXPORTS_DIR
+
+try:
+    from save_data_manager import get_species_name
+except ImportError:
+    get_species_name = lambda x: f"Pokemon #{x}"
+
+try:
+    from item_names import ITEM_NAMES, TM_MOVES
+except ImportError:
+    ITEM_NAMES, TM_MOVES = {}, {}
+
+try:
+    from move_data import MOVE_DATA
+except ImportError:
+    MOVE_DATA = {}
+
+try:
+    from location_data import get_location_name
+except ImportError:
+    get_location_name = lambda x, y=None: f"Location #{x}"
+
+from parser.trainer import NATURE_NAMES, is_shiny
+
+EXPORT_FORMATS = ["jsonl", "csv", "columnar"]
+FORMAT_EXTENSIONS = {"jsonl": ".jsonl", "csv": ".csv", "columnar": ".columns.jsonl"}
+
+# Rows per row group in the columnar format
+ROW_GROUP_SIZE = 1024
+
+COLUMNS = [
+    "source",
+    "game",
+    "box",
+    "slot",
+    "species_id",
+    "species",
+    "nickname",
+    "level",
+    "shiny",
+    "egg",
+    "nature",
+    "ot_name",
+    "ot_id",
+    "personality",
+    "held_item",
+    "moves",
+    "met_location",
+    "iv_hp",
+    "iv_attack",
+    "iv_defense",
+    "iv_speed",
+    "iv_sp_attack",
+    "iv_sp_defense",
+]
+
+_IV_KEYS = ("hp", "attack", "defense", "speed", "sp_attack", "sp_defense")
+
+
+# ---------------------------------------------------------------------- #
+#  Name tables                                                             #
+# ---------------------------------------------------------------------- #
+
+
+def _build_table(size, lookup):
+    """List indexed by ID holding lookup(id) for 0..size-1"""
+    return [lookup(i) for i in range(size)]
+
+
+class NameTables:
+    """ID-indexed name lists for species, items, moves and locations"""
+
+    def __init__(self):
+        self.species = _build_table(412, get_species_name)
+        self.items = _build_table(
+            max(list(ITEM_NAMES) + list(TM_MOVES) + [0]) + 1,
+            lambda i: TM_MOVES.get(i) or ITEM_NAMES.get(i, f"Unknown Item #{i}"),
+        )
+        self.moves = _build_table(
+            max(list(MOVE_DATA) + [0]) + 1,
+            lambda i: MOVE_DATA[i][0] if i in MOVE_DATA else f"Move #{i}",
+        )
+        self.locations = _build_table(256, get_location_name)
+
+    @staticmethod
+    def _get(table, idx, fallback):
+        if 0 <= idx < len(table):
+            return table[idx]
+        return fallback
+
+    def species_name(self, species_id):
+        return self._get(self.species, species_id, f"Pokemon #{species_id}")
+
+    def item_name(self, item_id):
+        return self._get(self.items, item_id, f"Unknown Item #{item_id}")
+
+    def move_name(self, move_id):
+        return self._get(self.moves, move_id, f"Move #{move_id}")
+
+    def location_name(self, location_id):
+        return self._get(self.locations, location_id, f"Location #{location_id}")
+
+
+_name_tables = None
+
+
+def get_name_tables():
+    """Get the shared NameTables, building them on first use"""
+    global _name_tables
+    if _name_tables is None:
+        _name_tables = NameTables()
+    return _name_tables
+
+
+# ---------------------------------------------------------------------- #
+#  Records                                                                 #
+# ---------------------------------------------------------------------- #
+
+
+def pokemon_is_shiny(pokemon):
+    """Shiny check on a parsed Pokemon dict (eggs never count)"""
+    personality = pokemon.get("personality", 0)
+    ot_id = pokemon.get("ot_id", 0)
+    if not personality or pokemon.get("egg"):
+        return False
+    return is_shiny(personality, ot_id & 0xFFFF, ot_id >> 16)
+
+
+def _make_row(names, source, game, box, slot, pokemon):
+    """Flatten a Pokemon dict into a row of COLUMNS"""
+    species_id = pokemon.get("species", 0)
+    species = names.species_name(species_id)
+    personality = pokemon.get("personality", 0)
+    held_item = pokemon.get("held_item", 0)
+    ivs = pokemon.get("ivs") or {}
+    moves = [
+        names.move_name(m.get("id", 0) if isinstance(m, dict) else m)
+        for m in pokemon.get("moves") or []
+        if m
+    ]
+    return [
+        source,
+        game,
+        box,
+        slot,
+        species_id,
+        species,
+        pokemon.get("nickname") or species,
+        pokemon.get("level", 0),
+        pokemon_is_shiny(pokemon),
+        bool(pokemon.get("egg")),
+        NATURE_NAMES[personality % 25],
+        pokemon.get("ot_name", ""),
+        pokemon.get("ot_id", 0) & 0xFFFF,
+        personality,
+        names.item_name(held_item) if held_item else "",
+        "/".join(moves),
+        names.location_name(pokemon.get("met_location", 0)),
+    ] + [ivs.get(k, 0) for k in _IV_KEYS]
+
+
+def _load_parser(save_path):
+    from parser.gen3_parser import Gen3SaveParser
+
+    parser = Gen3SaveParser()
+    parser.load(save_path)
+    return parser if parser.loaded else None
+
+
+def iter_collection(
+    saves,
+    include_party=True,
+    include_box=True,
+    include_sinew=True,
+    species=None,
+    shiny_only=False,
+    names=None,
+):
+    """
+    Stream rows for every matching Pokemon.
+
+    Args:
+        saves: {game_name: save_path} of the saves to include
+        include_party / include_box / include_sinew: Sources to include
+        species: Optional national dex number to keep
+        shiny_only: Keep only shiny Pokemon
+        names: NameTables (defaults to the shared one)
+
+    Yields:
+        list: One row per Pokemon, in COLUMNS order
+    """
+    names = names or get_name_tables()
+
+    def keep(pokemon):
+        if not pokemon or pokemon.get("empty") or not pokemon.get("species"):
+            return False
+        if species is not None and pokemon.get("species") != species:
+            return False
+        return not shiny_only or pokemon_is_shiny(pokemon)
+
+    for game, save_path in saves.items():
+        if not (include_party or include_box):
+            break
+        try:
+            parser = _load_parser(save_path)
+        except Exception as e:
+            print(f"[CollectionExport] Could not parse {save_path}: {e}")
+            continue
+        if parser is None:
+            continue
+        if include_party:
+            for slot, pokemon in enumerate(parser.party_pokemon or []):
+                if keep(pokemon):
+                    yield _make_row(names, "party", game, "", slot + 1, pokemon)
+        if include_box:
+            for pokemon in parser.pc_boxes or []:
+                if keep(pokemon):
+                    yield _make_row(
+                        names,
+                        "pc",
+                        game,
+                        pokemon.get("box_number", 0),
+                        pokemon.get("box_slot", 0),
+                        pokemon,
+                    )
+        del parser
+
+    if include_sinew:
+        try:
+            from sinew_storage import get_sinew_storage
+
+            storage = get_sinew_storage()
+        except ImportError:
+            storage = None
+        if storage is not None and storage.is_loaded():
+            for box_number, slot, pokemon in storage.iter_pokemon():
+                if keep(pokemon):
+                    yield _make_row(names, "sinew", "Sinew", box_number, slot + 1, pokemon)
+
+
+# ---------------------------------------------------------------------- #
+#  Writers                                                                 #
+# ---------------------------------------------------------------------- #
+
+
+def _write_jsonl(f, rows, on_row):
+    for row in rows:
+        f.write(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False))
+        f.write("\n")
+        on_row()
+
+
+def _write_csv(f, rows, on_row):
+    writer = csv.writer(f)
+    writer.writerow(COLUMNS)
+    for row in rows:
+        writer.writerow(row)
+        on_row()
+
+
+def _write_columnar(f, rows, on_row):
+    def flush(group):
+        columns = {name: [row[i] for row in group] for i, name in enumerate(COLUMNS)}
+        f.write(json.dumps({"rows": len(group), "columns": columns}, ensure_ascii=False))
+        f.write("\n")
+
+    group = []
+    for row in rows:
+        group.append(row)
+        on_row()
+        if len(group) >= ROW_GROUP_SIZE:
+            flush(group)
+            group = []
+    if group:
+        flush(group)
+
+
+_WRITERS = {"jsonl": _write_jsonl, "csv": _write_csv, "columnar": _write_columnar}
+
+
+def export_collection(path, rows, fmt="jsonl", on_row=None):
+    """
+    Write rows to path in the given format.
+
+    The file is written to a temp path and renamed on success.
+
+    Returns:
+        int: Number of rows written
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    count = 0
+
+    def counted():
+        nonlocal count
+        count += 1
+        if on_row:
+            on_row(count)
+
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            _WRITERS[fmt](f, rows, counted)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return count
+
+
+class CollectionExportJob:
+    """
+    Runs a collection export in a worker thread.
+
+    The UI polls written, done, path and error each frame; no locking is
+    needed because the worker only assigns plain attributes.
+    """
+
+    def __init__(
+        self,
+        saves,
+        fmt="jsonl",
+        include_party=True,
+        include_box=True,
+        include_sinew=True,
+        species=None,
+        shiny_only=False,
+        out_dir=None,
+    ):
+        self.saves = dict(saves)
+        self.fmt = fmt
+        self.filters = {
+            "include_party": include_party,
+            "include_box": include_box,
+            "include_sinew": include_sinew,
+            "species": species,
+            "shiny_only": shiny_only,
+        }
+        self.out_dir = out_dir or EXPORTS_DIR
+        self.path = None
+        self.written = 0
+        self.done = False
+        self.error = None
+        self.thread = None
+
+    def start(self):
+        """Start the export in a background thread"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        label = next(iter(self.saves)) if len(self.saves) == 1 else "collection"
+        self.path = os.path.join(
+            self.out_dir, f"{label}_{timestamp}{FORMAT_EXTENSIONS[self.fmt]}"
+        )
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            rows = iter_collection(self.saves, **self.filters)
+            self.written = export_collection(
+                self.path, rows, self.fmt, on_row=self._on_row
+            )
+            print(f"[CollectionExport] Wrote {self.written} Pokemon to {self.path}")
+        except Exception as e:
+            self.error = str(e)
+            print(f"[CollectionExport] Export failed: {e}")
+        finally:
+            self.done = True
+
+    def _on_row(self, count):
+        self.written = count
+
+    def is_running(self):
+        return self.thread is not None and not self.done
@@ -56,6 +56,7 @@ DATA_DIR = os.path.join(EXT_DIR, "data")
 ROMS_DIR = os.path.join(EXT_DIR, "roms")
 SAVES_DIR = os.path.join(EXT_DIR, "saves")
 SYSTEM_DIR = os.path.join(EXT_DIR, "system")
+EXPORTS_DIR = os.path.join(EXT_DIR, "exports")
 
 # ===== Save File Settings =====
 # Canonical set of GBA save file extensions — used everywhere saves are scanned.
@@ -70,6 +71,7 @@ BACKUPS_DIR = os.path.join(SAVES_DIR, "backups")
 
 # Sinew-specific save paths
 ACH_SAVE_PATH = os.path.join(SAVES_DIR, "sinew", "achievements_progress.json")
+ACH_AGGREGATE_CACHE_PATH = os.path.join(SAVES_DIR, "sinew", "achievement_aggregate_cache.json")
 ACH_REWARDS_PATH = os.path.join(DATA_DIR, "achievements", "rewards", "rewards.json")
 SETTINGS_FILE = os.path.join(SAVES_DIR, "sinew", "sinew_settings.json")
 
@@ -92,6 +94,9 @@ GEN8_ICONS_DIR = os.path.join(SPRITES_DIR, "gen8", "icons")
 
 TITLE_SPRITES_DIR = os.path.join(SPRITES_DIR, "title")
 
+# Pre-decoded image blobs (rebuilt automatically when sources change)
+DECODED_CACHE_DIR = os.path.join(DATA_DIR, "cache", "decoded")
+
 # Database paths
 POKEMON_DB_PATH = os.path.join(DATA_DIR, "pokemon_db.json")
 
@@ -671,6 +676,10 @@ VOLUME_MIN = 0
 VOLUME_MAX = 100
 VOLUME_STEP = 5          # each d-pad press changes by this much
 
+# Sinew storage box counts offered in Settings (sinew_settings.json
+# "sinew_storage_boxes"); storage only ever grows, never drops boxes
+STORAGE_BOX_OPTIONS = [20, 30, 40, 50, 75, 100, 150, 200, 300, 500]
+
 # ===== Animation Settings =====
 SHOWDOWN_FRAME_MS_DEFAULT = 100
 
@@ -1201,6 +1201,12 @@ class ControllerManager:
         """Check if D-pad direction was just pressed this frame"""
         return self.dpad_repeat_ready.get(direction, False)
 
+    def has_input(self):
+        """True if any button or D-pad press (or repeat) is ready this frame"""
+        return any(self.button_repeat_ready.values()) or any(
+            self.dpad_repeat_ready.values()
+        )
+
     def consume_button(self, button_name):
         """Consume a button press (prevent repeat until released)"""
         self.button_repeat_ready[button_name] = False
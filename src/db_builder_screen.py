@@ -17,6 +17,8 @@ import config
 import ui_colors
 from config import BASE_DIR, FONT_PATH
 from controller import get_controller
+from sprite_atlas import build_atlases
+from sprite_service import get_sprite_service
 
 
 class DBBuilderScreen:
@@ -30,9 +32,9 @@ class DBBuilderScreen:
         self.controller = get_controller()
 
         # Fonts
-        self.font_header = pygame.font.Font(FONT_PATH, 16)
-        self.font_terminal = pygame.font.Font(FONT_PATH, 10)
-        self.font_button = pygame.font.Font(FONT_PATH, 10)
+        self.font_header = ui_colors.get_font(16, FONT_PATH)
+        self.font_terminal = ui_colors.get_font(10, FONT_PATH)
+        self.font_button = ui_colors.get_font(10, FONT_PATH)
 
         # Terminal output lines
         self.terminal_lines = []
@@ -46,7 +48,7 @@ class DBBuilderScreen:
 
         # UI state - buttons stacked vertically on the right
         self.selected_button = 0
-        self.buttons = ["Build Pokemon DB", "Build Wallpapers", "Back"]
+        self.buttons = ["Build Pokemon DB", "Build Wallpapers", "Build Atlas", "Back"]
 
         # Debounce for clicks
         self._last_click_time = 0
@@ -64,6 +66,10 @@ class DBBuilderScreen:
         self._add_line("  Generates title wallpapers")
         self._add_line("  for each game.")
         self._add_line("")
+        self._add_line("Build Atlas:")
+        self._add_line("  Packs sprites and icons into")
+        self._add_line("  a few images for fast loading.")
+        self._add_line("")
 
     def _add_line(self, text):
         """Add a line to the terminal output"""
@@ -154,8 +160,25 @@ class DBBuilderScreen:
                     script_path, init_globals=custom_globals, run_name="__main__"
                 )
 
+                if self.cancel_requested:
+                    self._add_line("Build cancelled.")
+                    return
+
                 self._add_line("Build finished successfully!")
 
+                # Repack so newly downloaded sprites are in the atlas; the
+                # database is already written, so a failure here is only
+                # reported - sprites load from disk until the next pack
+                try:
+                    build_atlases(
+                        log=self._add_line, cancel=lambda: self.cancel_requested
+                    )
+                except Exception as e:
+                    self._add_line(f"Atlas Error: {e}")
+
+                # Newly downloaded sprites replace ones that were missing
+                get_sprite_service().invalidate()
+
             except Exception:
                 self._add_line(f"Build Error: {traceback.format_exc()}")
             finally:
@@ -245,6 +268,34 @@ class DBBuilderScreen:
         self.build_thread = threading.Thread(target=execute, daemon=True)
         self.build_thread.start()
 
+    def _start_atlas_build(self):
+        """Pack the sprite atlas in a background thread"""
+        if self.is_building:
+            return
+
+        self.is_building = True
+        self.terminal_lines = []
+        self._add_line("Packing sprite atlas...")
+        self._add_line("")
+        self.cancel_requested = False
+
+        def execute():
+            try:
+                build_atlases(log=self._add_line, cancel=lambda: self.cancel_requested)
+                if self.cancel_requested:
+                    return
+                get_sprite_service().invalidate()
+                self._add_line("=" * 35)
+                self._add_line("Atlas built!")
+            except Exception as e:
+                self._add_line(f"ERROR: {e}")
+            finally:
+                self.is_building = False
+                self.build_thread = None
+
+        self.build_thread = threading.Thread(target=execute, daemon=True)
+        self.build_thread.start()
+
     def _cancel_build(self):
         if self.is_building:
             self._add_line("Cancelling...")
@@ -365,6 +416,12 @@ class DBBuilderScreen:
                 self._cancel_build()
             else:
                 self._start_wallpaper_build()
+        elif self.selected_button == 2:
+            # Build Atlas button
+            if self.is_building:
+                self._cancel_build()
+            else:
+                self._start_atlas_build()
         else:
             # Back button
             if self.is_building:
@@ -486,7 +543,7 @@ class DBBuilderScreen:
 
             # Button text - show Cancel if building
             display_text = btn_text
-            if self.is_building and i < 2:  # First two buttons become Cancel
+            if self.is_building and i < 3:  # Build buttons become Cancel
                 display_text = "Cancel"
 
             text_surf = self.font_button.render(
@@ -521,6 +578,10 @@ class DBBuilder:
         """Delegate controller input to the inner builder screen."""
         self.screen.handle_controller(ctrl)
 
+    def is_busy(self):
+        """True while a build thread is running (keeps the loop at full rate)"""
+        return self.screen.is_building
+
     def draw(self, surface):
         """Delegate the draw call to the inner builder screen."""
         self.screen.draw(surface)
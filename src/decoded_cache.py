@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+"""
+Decoded Cache
+On-disk cache of decoded, already scaled images, so later launches skip
+Pillow (and SDL_image) for assets they've seen before.
+
+Each entry is one file in DECODED_CACHE_DIR holding every frame of an
+image: its pixel format, size, duration and pixels, raw (RGBA straight
+into pygame.image.frombuffer) or zlib-packed for callers that keep frames
+compressed (title_frames). Entries are keyed by the source's path, mtime,
+file size, the target size and a variant name, so editing or replacing a
+sprite simply misses and rebuilds; reading an entry is one read() and no
+decoding.
+
+The directory is kept under a disk budget ("decoded_cache_mb" in
+sinew_settings.json, DECODED_CACHE_MB by default; 0 turns the cache off).
+The oldest entries are removed first when a new one would exceed it.
+
+Usage:
+    frames = decoded_cache.load(path, size=(96, 96))
+    if frames is None:
+        frames = [("RGBA", (96, 96), rgba_bytes, 100)]   # decode as usual
+        decoded_cache.store(path, frames, size=(96, 96))
+    surf = decoded_cache.to_surface(frames[0])
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+
+import pygame
+
+from config import DECODED_CACHE_DIR, SETTINGS_FILE
+
+# Default disk budget
+DECODED_CACHE_MB = 64
+
+_MAGIC = b"SDC1"
+_HEADER = struct.Struct("<4sI")  # magic, frame count
+_FRAME = struct.Struct("<4sHHIBHI")  # mode, w, h, ms, zlib, palette len, data len
+
+_lock = threading.Lock()
+_budget_bytes = None
+_used_bytes = None  # Summed lazily on the first store
+
+
+def _load_budget_setting():
+    """Read the cache budget (in MB) from sinew_settings.json"""
+    try:
+        if os.path.exists(SETTINGS_FILE):
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            return max(0, int(settings.get("decoded_cache_mb", DECODED_CACHE_MB)))
+    except Exception as e:
+        print(f"[DecodedCache] Could not read budget setting: {e}")
+    return DECODED_CACHE_MB
+
+
+def _budget():
+    global _budget_bytes
+    if _budget_bytes is None:
+        _budget_bytes = _load_budget_setting() * 1024 * 1024
+    return _budget_bytes
+
+
+def frame_duration(info, default_ms=100):
+    """
+    A decoded frame's duration in whole milliseconds.
+
+    Pillow reports whatever the file says (missing, float, even negative),
+    so durations are made ints here before anything packs or times them.
+    """
+    try:
+        ms = int(info.get("duration", default_ms))
+    except (TypeError, ValueError, OverflowError):
+        return default_ms
+    return ms if 0 <= ms <= 0xFFFFFFFF else default_ms
+
+
+def _entry_path(path, size, variant):
+    """Cache file for a source, or None if the source can't be stat'ed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    size = tuple(size) if size else None
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{size}|{variant}"
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".bin"
+    return os.path.join(DECODED_CACHE_DIR, name)
+
+
+def load(path, size=None, variant=""):
+    """
+    Cached frames of path, or None on a miss.
+
+    Returns:
+        list: [(mode, (w, h), data, duration_ms, palette, packed)] where
+        data is a memoryview into a single read of the entry
+    """
+    if not _budget():
+        return None
+    entry = _entry_path(path, size, variant)
+    if entry is None or not os.path.exists(entry):
+        return None
+    try:
+        with open(entry, "rb") as f:
+            buf = memoryview(f.read())
+        magic, count = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            return None
+        offset = _HEADER.size
+        frames = []
+        for _ in range(count):
+            mode, w, h, ms, packed, pal_len, data_len = _FRAME.unpack_from(buf, offset)
+            offset += _FRAME.size
+            palette = bytes(buf[offset : offset + pal_len]) if pal_len else None
+            offset += pal_len
+            data = buf[offset : offset + data_len]
+            offset += data_len
+            mode = mode.rstrip(b"\0").decode("ascii")
+            frames.append((mode, (w, h), data, ms, palette, bool(packed)))
+        return frames or None
+    except Exception as e:
+        print(f"[DecodedCache] Dropping unreadable entry for {path}: {e}")
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+        return None
+
+
+def store(path, frames, size=None, variant=""):
+    """
+    Write frames for path (any thread). Never raises: frames that can't
+    be packed (or written) are just not cached.
+
+    Args:
+        frames: [(mode, (w, h), data, duration_ms)] with raw pixels, or
+            [(mode, (w, h), data, duration_ms, palette, packed)]
+    """
+    global _used_bytes
+    budget = _budget()
+    entry = _entry_path(path, size, variant) if budget else None
+    if entry is None or not frames:
+        return
+    try:
+        parts = [_HEADER.pack(_MAGIC, len(frames))]
+        for frame in frames:
+            mode, (w, h), data, ms = frame[:4]
+            palette = frame[4] if len(frame) > 4 else None
+            packed = frame[5] if len(frame) > 5 else False
+            palette = palette or b""
+            header = (mode.encode("ascii"), w, h, int(ms), int(packed))
+            parts.append(_FRAME.pack(*header, len(palette), len(data)))
+            parts.append(palette)
+            parts.append(data)
+        blob = b"".join(parts)
+        if len(blob) > budget:
+            return
+
+        os.makedirs(DECODED_CACHE_DIR, exist_ok=True)
+        _make_room(len(blob))
+        tmp_path = f"{entry}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, entry)
+        with _lock:
+            _used_bytes += len(blob)
+    except Exception as e:
+        print(f"[DecodedCache] Could not write entry for {path}: {e}")
+
+
+def _make_room(needed):
+    """Delete the oldest entries until needed more bytes fit the budget"""
+    global _used_bytes
+    with _lock:
+        if _used_bytes is not None and _used_bytes + needed <= _budget():
+            return
+        entries = []
+        for name in os.listdir(DECODED_CACHE_DIR):
+            if name.endswith(".bin"):
+                st = os.stat(os.path.join(DECODED_CACHE_DIR, name))
+                entries.append((st.st_mtime, st.st_size, name))
+        _used_bytes = sum(size for _, size, _ in entries)
+        if _used_bytes + needed <= _budget():
+            return
+        for _, size, name in sorted(entries):
+            try:
+                os.remove(os.path.join(DECODED_CACHE_DIR, name))
+                _used_bytes -= size
+            except OSError:
+                pass
+            if _used_bytes + needed <= _budget():
+                return
+
+
+def to_surface(frame):
+    """A raw cached frame as a display surface (main thread)"""
+    mode, size, data = frame[0], frame[1], frame[2]
+    surf = pygame.image.frombuffer(data, size, mode)
+    return surf.convert_alpha() if mode == "RGBA" else surf.convert()
+
+
+def clear():
+    """Delete every cached entry"""
+    global _used_bytes
+    with _lock:
+        if os.path.isdir(DECODED_CACHE_DIR):
+            for name in os.listdir(DECODED_CACHE_DIR):
+                try:
+                    os.remove(os.path.join(DECODED_CACHE_DIR, name))
+                except OSError:
+                    pass
+        _used_bytes = 0
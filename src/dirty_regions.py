@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""
+Dirty Regions
+Tracks which parts of the Sinew screen changed since the last frame, so the
+main loop only draws when something did and only flips the rects that did.
+
+Screens and overlays report changes with mark(): a rect, or nothing for the
+whole screen. Input always dirties the whole screen, since every modal
+redraws on a key press. Anything that moves on its own marks itself each
+time it advances (GIF background frames, notification slides, the pulsing
+resume banner). Modals that can sit still say so with an is_animating()
+method returning False; modals without one are redrawn every frame as
+before.
+
+When nothing is dirty the frame is skipped entirely: no draw, no scale, no
+flip. Set "render_on_change": false in sinew_settings.json to redraw every
+frame.
+
+Usage:
+    tracker = get_dirty_tracker()
+    tracker.mark(pygame.Rect(0, 0, 480, 30))
+    tracker.mark()                      # whole screen
+
+    rects = tracker.take()              # [] = nothing to draw
+"""
+
+import json
+import os
+
+import pygame
+
+from config import SETTINGS_FILE
+
+# More separate rects than this are merged into their union
+MAX_RECTS = 8
+
+# Dirty rects covering this much of the screen are flipped as a full frame
+FULL_FRACTION = 0.6
+
+
+def _load_render_on_change_setting():
+    """Read "render_on_change" from sinew_settings.json (default on)"""
+    try:
+        if os.path.exists(SETTINGS_FILE):
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            return bool(settings.get("render_on_change", True))
+    except Exception as e:
+        print(f"[DirtyRegions] Could not read render setting: {e}")
+    return True
+
+
+class DirtyTracker:
+    """Dirty rects collected between frames"""
+
+    def __init__(self, width=480, height=320, enabled=None):
+        if enabled is None:
+            enabled = _load_render_on_change_setting()
+        self.enabled = enabled
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self._rects = []
+        self._full = True  # The first frame is always drawn
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+    def resize(self, width, height):
+        """Follow a change of the virtual surface size (redraws everything)"""
+        if (width, height) != self.screen_rect.size:
+            self.screen_rect = pygame.Rect(0, 0, width, height)
+            self._full = True
+            self._rects = []
+
+    def mark(self, rect=None):
+        """Mark rect (or the whole screen) as needing a redraw"""
+        if self._full:
+            return
+        if rect is None:
+            self._full = True
+            self._rects = []
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width > 0 and rect.height > 0:
+            self._rects.append(rect)
+
+    def take(self):
+        """
+        Rects to redraw this frame, clearing them.
+
+        Returns:
+            list: [] if nothing changed, [screen_rect] for a full frame,
+            otherwise the dirty rects
+        """
+        full, rects = self._full or not self.enabled, self._rects
+        self._full = False
+        self._rects = []
+
+        if not full and not rects:
+            self.frames_skipped += 1
+            return []
+        self.frames_drawn += 1
+        if full:
+            return [self.screen_rect.copy()]
+
+        if len(rects) > MAX_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        area = sum(rect.width * rect.height for rect in rects)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        if area >= screen_area * FULL_FRACTION:
+            return [self.screen_rect.copy()]
+        return rects
+
+    def is_full(self, rects):
+        """True if rects from take() cover the whole screen"""
+        return len(rects) == 1 and rects[0] == self.screen_rect
+
+
+_tracker = None
+
+
+def get_dirty_tracker():
+    """Get or create the shared DirtyTracker"""
+    global _tracker
+    if _tracker is None:
+        _tracker = DirtyTracker()
+    return _tracker
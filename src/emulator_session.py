@@ -29,6 +29,7 @@ from datetime import datetime
 
 import pygame
 
+import ui_colors
 from config import (
     DATA_DIR,
     FONT_PATH,
@@ -59,9 +60,10 @@ class EmulatorSessionMixin:
     Also calls other GameScreen / mixin methods:
         self._stop_menu_music() / self._start_menu_music()
         self._show_notification() / self._get_pause_combo_hint_text()
-        self._check_emulator_pause_combo() / self._check_achievements_for_current_game()
-        self._force_reload_current_save() / self._reload_settings_from_disk()
+        self._check_emulator_pause_combo() / self._queue_return_achievement_check()
+        self._reload_settings_from_disk()
         self._draw_loading_screen() / self.load_game_and_background()
+        self._flush_achievement_progress()
         self.is_on_sinew()
     """
 
@@ -132,6 +134,9 @@ class EmulatorSessionMixin:
         if sav_path:
             print(f"[Sinew] Save: {sav_path}")
 
+        # A subprocess emulator may outlive or replace us; persist first
+        self._flush_achievement_progress(wait=True)
+
         success = self.emulator_manager.launch(
             rom_path, self.controller, sav_path=sav_path, game_screen=self
         )
@@ -288,8 +293,8 @@ class EmulatorSessionMixin:
                     self.controller.set_swap_ab(True)
                     print("[Sinew] Re-applied swap_ab for menu navigation after controller refresh")
 
-                self._force_reload_current_save()
-                self._check_achievements_for_current_game()
+                # Save reload + achievement checks finish in the background
+                self._queue_return_achievement_check()
                 self._start_menu_music()
                 print("[Sinew] Paused - returned to Sinew menu")
 
@@ -420,18 +425,18 @@ class EmulatorSessionMixin:
 
         if self.emulator.paused:
             sw, sh = surf.get_size()
-            overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            surf.blit(overlay, (0, 0))
+            surf.blit(ui_colors.get_tile((sw, sh), (0, 0, 0, 150)), (0, 0))
 
             try:
-                pause_font = pygame.font.Font(FONT_PATH, 8)
+                pause_font = ui_colors.get_font(8, FONT_PATH)
             except Exception:
                 pause_font = self.font
 
-            pause_text = pause_font.render("PAUSED", True, (255, 255, 0))
-            hint_text = pause_font.render(
-                self._get_pause_combo_hint_text(), True, (200, 200, 200)
+            pause_text = ui_colors.render_text(
+                pause_font, "PAUSED", True, (255, 255, 0)
+            )
+            hint_text = ui_colors.render_text(
+                pause_font, self._get_pause_combo_hint_text(), True, (200, 200, 200)
             )
             surf.blit(pause_text, pause_text.get_rect(center=(sw // 2, sh // 2 - 12)))
             surf.blit(hint_text, hint_text.get_rect(center=(sw // 2, sh // 2 + 12)))
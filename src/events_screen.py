@@ -97,9 +97,9 @@ class EventsScreen:
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 14)
-            self.font_text = pygame.font.Font(FONT_PATH, 10)
-            self.font_small = pygame.font.Font(FONT_PATH, 8)
+            self.font_header = ui_colors.get_font(14, FONT_PATH)
+            self.font_text = ui_colors.get_font(10, FONT_PATH)
+            self.font_small = ui_colors.get_font(8, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 20)
             self.font_text = pygame.font.SysFont(None, 16)
@@ -602,8 +602,7 @@ class EventsScreen:
         event_info = EVENT_ITEMS.get(self.confirm_event_key, {})
 
         # Overlay
-        overlay = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = ui_colors.get_tile((self.w, self.h), (0, 0, 0, 180))
         surf.blit(overlay, (0, 0))
 
         # Dialog box
@@ -12,7 +12,7 @@ from datetime import datetime
 import pygame
 
 import ui_colors  # Import module to get dynamic theme colors
-from config import FONT_PATH
+from config import EXPORTS_DIR, FONT_PATH
 
 # Try to import save data manager and name lookups
 try:
@@ -39,6 +39,14 @@ try:
 except ImportError:
     get_location_name = lambda x, y=None: f"Location #{x}"
 
+try:
+    from collection_export import CollectionExportJob, pokemon_is_shiny
+
+    COLLECTION_EXPORT_AVAILABLE = True
+except ImportError:
+    COLLECTION_EXPORT_AVAILABLE = False
+    print("[ExportModal] Collection export not available")
+
 try:
     from pokemon_summary import calculate_hp, get_base_stats
 
@@ -48,6 +56,9 @@ except ImportError:
     get_base_stats = lambda x: {}
     calculate_hp = lambda b, i, e, l: 0
 
+# Species filter covers the whole Gen 3 National Dex
+NATIONAL_DEX_SIZE = 386
+
 
 def sanitize_for_json(obj):
     """
@@ -77,18 +88,21 @@ def sanitize_for_json(obj):
 class ExportModal:
     """Modal for viewing and exporting save data"""
 
-    def __init__(self, width, height, game_name=None, close_callback=None):
+    def __init__(
+        self, width, height, game_name=None, close_callback=None, get_saves_callback=None
+    ):
         self.width = width
         self.height = height
         self.game_name = game_name or "Unknown"
         self.close_callback = close_callback
+        self.get_saves_callback = get_saves_callback
         self.visible = True
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 14)
-            self.font_text = pygame.font.Font(FONT_PATH, 10)
-            self.font_small = pygame.font.Font(FONT_PATH, 8)
+            self.font_header = ui_colors.get_font(14, FONT_PATH)
+            self.font_text = ui_colors.get_font(10, FONT_PATH)
+            self.font_small = ui_colors.get_font(8, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 20)
             self.font_text = pygame.font.SysFont(None, 14)
@@ -110,12 +124,31 @@ class ExportModal:
             {"name": "PC Box Pokemon", "key": "box", "value": True},
             {"name": "Full Pokemon Details", "key": "detailed", "value": False},
         ]
+        if COLLECTION_EXPORT_AVAILABLE:
+            # JSON is the current-game snapshot; the others stream Pokemon only
+            self.export_options[:0] = [
+                {
+                    "name": "Format",
+                    "key": "format",
+                    "choices": ["JSON", "JSONL", "CSV", "Columnar"],
+                    "values": ["json", "jsonl", "csv", "columnar"],
+                    "index": 0,
+                },
+            ]
+            self.export_options += [
+                {"name": "All Games", "key": "all_games", "value": False},
+                {"name": "Sinew Storage", "key": "sinew", "value": False},
+                {"name": "Shiny Only", "key": "shiny", "value": False},
+            ]
         self.selected_option = 0
 
         # Status message
         self.status_message = None
         self.status_timer = 0
 
+        # Background collection export (CollectionExportJob)
+        self.export_job = None
+
         # Determine game type for location lookups
         self.game_type = (
             "FRLG" if "Fire" in self.game_name or "Leaf" in self.game_name else "RSE"
@@ -124,6 +157,12 @@ class ExportModal:
         # Load save data
         self.save_data = self._load_save_data()
 
+        # Species filter goes just above Shiny Only
+        if COLLECTION_EXPORT_AVAILABLE:
+            self.export_options.insert(
+                len(self.export_options) - 1, self._build_species_option()
+            )
+
         # Debug output
         print(
             f"[ExportModal] Loaded data -"
@@ -518,8 +557,71 @@ class ExportModal:
 
         return lines
 
+    # ------------------------------------------------------------------ #
+    #  Export options                                                      #
+    # ------------------------------------------------------------------ #
+
+    def _build_species_option(self):
+        """
+        Species filter choice list: All, then every species in dex order.
+
+        Not limited to the current save, since All Games and Sinew Storage
+        exports include Pokemon it doesn't have.
+        """
+        ordered = list(range(1, NATIONAL_DEX_SIZE + 1))
+        return {
+            "name": "Species",
+            "key": "species",
+            "choices": ["All"] + [get_species_name(s) for s in ordered],
+            "values": [None] + ordered,
+            "index": 0,
+        }
+
+    def _change_option(self, idx, direction):
+        """Toggle a bool option or step a choice option"""
+        opt = self.export_options[idx]
+        if "choices" in opt:
+            opt["index"] = (opt["index"] + direction) % len(opt["choices"])
+        else:
+            opt["value"] = not opt["value"]
+
+    def _get_option(self, key, default=None):
+        """Current value of an export option"""
+        for opt in self.export_options:
+            if opt["key"] == key:
+                if "choices" in opt:
+                    return opt["values"][opt["index"]]
+                return opt["value"]
+        return default
+
+    def _passes_filters(self, pkmn):
+        """Species / shiny filter for the JSON export"""
+        species = self._get_option("species")
+        if species is not None and pkmn.get("species") != species:
+            return False
+        if self._get_option("shiny", False) and not pokemon_is_shiny(pkmn):
+            return False
+        return True
+
+    def _poll_export_job(self):
+        """Update the status line from the background export"""
+        job = self.export_job
+        if job is None:
+            return
+        if not job.done:
+            self.status_message = f"Exporting... {job.written} Pokemon"
+            self.status_timer = 2
+            return
+        if job.error:
+            self.status_message = "Export failed!"
+        else:
+            self.status_message = f"Saved {job.written}: {os.path.basename(job.path)}"
+        self.status_timer = 180
+        self.export_job = None
+
     def handle_controller(self, ctrl):
         """Handle controller input"""
+        self._poll_export_job()
         if self.status_timer > 0:
             self.status_timer -= 1
             if self.status_timer <= 0:
@@ -577,20 +679,17 @@ class ExportModal:
                 if ctrl.is_dpad_just_pressed("left") or ctrl.is_dpad_just_pressed(
                     "right"
                 ):
+                    direction = -1 if ctrl.is_dpad_just_pressed("left") else 1
                     ctrl.consume_dpad("left")
                     ctrl.consume_dpad("right")
                     if self.selected_option < len(self.export_options):
-                        self.export_options[self.selected_option]["value"] = (
-                            not self.export_options[self.selected_option]["value"]
-                        )
+                        self._change_option(self.selected_option, direction)
                     consumed = True
 
                 if ctrl.is_button_just_pressed("A"):
                     ctrl.consume_button("A")
                     if self.selected_option < len(self.export_options):
-                        self.export_options[self.selected_option]["value"] = (
-                            not self.export_options[self.selected_option]["value"]
-                        )
+                        self._change_option(self.selected_option, 1)
                     else:
                         self._do_export()
                     consumed = True
@@ -628,6 +727,45 @@ class ExportModal:
         return consumed
 
     def _do_export(self):
+        """Export with the selected format"""
+        fmt = self._get_option("format", "json")
+        if fmt == "json":
+            self._do_json_export()
+        else:
+            self._start_collection_export(fmt)
+
+    def _start_collection_export(self, fmt):
+        """Start a streaming export of the selected sources in the background"""
+        if self.export_job is not None:
+            return
+
+        saves = {}
+        if self._get_option("all_games", False) and self.get_saves_callback:
+            saves = self.get_saves_callback()
+        elif SAVE_MANAGER_AVAILABLE:
+            manager = get_manager()
+            if manager.parser and manager.current_save_path:
+                saves = {self.game_name: manager.current_save_path}
+
+        include_sinew = bool(self._get_option("sinew", False))
+        if not saves and not include_sinew:
+            self.status_message = "Nothing to export"
+            self.status_timer = 180
+            return
+
+        self.export_job = CollectionExportJob(
+            saves,
+            fmt=fmt,
+            include_party=self._get_option("party", True),
+            include_box=self._get_option("box", True),
+            include_sinew=include_sinew,
+            species=self._get_option("species"),
+            shiny_only=self._get_option("shiny", False),
+        )
+        self.export_job.start()
+        self._poll_export_job()
+
+    def _do_json_export(self):
         """Export selected data to JSON file"""
         export_data = {
             "game": self.game_name,
@@ -672,7 +810,11 @@ class ExportModal:
                 export_data["items"] = sanitize_for_json(items)
 
         if include_party:
-            party = self.save_data.get("party", [])
+            party = [
+                p
+                for p in self.save_data.get("party", [])
+                if isinstance(p, dict) and self._passes_filters(p)
+            ]
             if include_detailed:
                 export_data["party"] = [
                     sanitize_for_json(self._enrich_pokemon_detailed(p))
@@ -687,7 +829,11 @@ class ExportModal:
                 ]
 
         if include_box:
-            box = self.save_data.get("box", [])
+            box = [
+                p
+                for p in self.save_data.get("box", [])
+                if isinstance(p, dict) and self._passes_filters(p)
+            ]
             if include_detailed:
                 export_data["box"] = [
                     sanitize_for_json(self._enrich_pokemon_detailed(p))
@@ -701,16 +847,16 @@ class ExportModal:
                     if isinstance(p, dict) and not p.get("empty")
                 ]
 
-        os.makedirs("exports", exist_ok=True)
+        os.makedirs(EXPORTS_DIR, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"exports/{self.game_name}_{timestamp}.json"
+        filename = os.path.join(EXPORTS_DIR, f"{self.game_name}_{timestamp}.json")
 
         try:
             with open(filename, "w", encoding="utf-8") as f:
                 json.dump(export_data, f, indent=2, ensure_ascii=False)
 
-            self.status_message = f"Saved: {filename}"
+            self.status_message = f"Saved: {os.path.basename(filename)}"
             self.status_timer = 180
             print(f"[ExportModal] Exported to {filename}")
         except Exception as e:
@@ -720,6 +866,7 @@ class ExportModal:
 
     def draw(self, surf):
         """Draw the export modal"""
+        self._poll_export_job()
         # Get theme colors dynamically
         COLOR_BG = ui_colors.COLOR_BG
         COLOR_HEADER = ui_colors.COLOR_HEADER
@@ -858,7 +1005,10 @@ class ExportModal:
         surf.blit(info_surf, (rect.x + 15, y))
         y += 22
 
-        option_height = 26
+        # Shrink rows to fit when the format/filter options are present
+        option_height = max(
+            18, min(26, (rect.bottom - y - 44) // max(1, len(self.export_options)))
+        )
         for i, opt in enumerate(self.export_options):
             is_selected = not self.tab_focus and self.selected_option == i
 
@@ -871,6 +1021,13 @@ class ExportModal:
             label_surf = self.font_text.render(opt["name"], True, text_color)
             surf.blit(label_surf, (rect.x + 15, y + 4))
 
+            if "choices" in opt:
+                choice = f"< {opt['choices'][opt['index']]} >"
+                choice_surf = self.font_text.render(choice, True, text_color)
+                surf.blit(choice_surf, (rect.right - 20 - choice_surf.get_width(), y + 4))
+                y += option_height
+                continue
+
             toggle_x = rect.right - 60
             toggle_rect = pygame.Rect(toggle_x, y + 3, 40, 18)
             pygame.draw.rect(surf, COLOR_HEADER, toggle_rect, border_radius=9)
@@ -903,7 +1060,11 @@ class ExportModal:
             pygame.draw.rect(surf, COLOR_BORDER, btn_rect, 1, border_radius=5)
             btn_color = COLOR_TEXT
 
-        btn_surf = self.font_text.render("Export to JSON", True, btn_color)
+        fmt_opt = next((o for o in self.export_options if o["key"] == "format"), None)
+        fmt_label = fmt_opt["choices"][fmt_opt["index"]] if fmt_opt else "JSON"
+        if self.export_job is not None:
+            fmt_label += " (running)"
+        btn_surf = self.font_text.render(f"Export to {fmt_label}", True, btn_color)
         btn_text_rect = btn_surf.get_rect(center=btn_rect.center)
         surf.blit(btn_surf, btn_text_rect)
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+Frame Governor
+Chooses the main loop's frame rate: ACTIVE_FPS while something on screen
+moves or the user is pressing buttons, IDLE_FPS on a still menu.
+
+Components report whether they need animation frames, by key:
+set_animating(key, active) holds until changed, and touch(key) holds for
+a short while (for things that only know they were drawn this frame, like
+a GIFSprite). A request can ask for less than ACTIVE_FPS - a title GIF with
+100 ms frames only needs 10. Input runs the loop at full rate for
+INPUT_HOLD_MS, so key repeat and the first redraw stay smooth. Running
+background jobs (achievement worker, asset loads, DB builds) are reported
+as "background", so their results are picked up at the full rate too.
+
+Set "idle_fps" in sinew_settings.json (0 keeps the loop at ACTIVE_FPS).
+
+Usage:
+    governor = get_frame_governor()
+    governor.set_animating("resume_banner", banner_visible)
+    governor.touch("gif_sprite", fps=1000 // frame_ms)
+    governor.note_input()
+
+    dt = clock.tick(governor.target_fps())
+"""
+
+import json
+import os
+import time
+
+from config import SETTINGS_FILE
+
+ACTIVE_FPS = 60
+IDLE_FPS = 12
+
+# Full rate kept after the last input
+INPUT_HOLD_MS = 500
+
+# How long touch() keeps a component awake
+TOUCH_HOLD_MS = 250
+
+
+def _load_idle_fps_setting():
+    """Read "idle_fps" from sinew_settings.json"""
+    try:
+        if os.path.exists(SETTINGS_FILE):
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            return max(0, min(ACTIVE_FPS, int(settings.get("idle_fps", IDLE_FPS))))
+    except Exception as e:
+        print(f"[FrameGovernor] Could not read idle_fps setting: {e}")
+    return IDLE_FPS
+
+
+class FrameGovernor:
+    """Registry of components that need animation frames"""
+
+    def __init__(self, idle_fps=None):
+        if idle_fps is None:
+            idle_fps = _load_idle_fps_setting()
+        self.idle_fps = idle_fps or ACTIVE_FPS
+        self._animating = {}  # key -> fps wanted
+        self._touched = {}  # key -> (expires at, fps wanted)
+
+    def set_animating(self, key, active=True, fps=ACTIVE_FPS):
+        """Report whether component key needs frames (until changed)"""
+        if active:
+            self._animating[key] = fps
+        else:
+            self._animating.pop(key, None)
+
+    def touch(self, key, hold_ms=TOUCH_HOLD_MS, fps=ACTIVE_FPS):
+        """Report that key needs frames for the next hold_ms"""
+        self._touched[key] = (time.monotonic() + hold_ms / 1000.0, fps)
+
+    def note_input(self):
+        """Run at full rate for INPUT_HOLD_MS after input"""
+        self.touch("input", INPUT_HOLD_MS)
+
+    def active_keys(self):
+        """Keys currently holding the frame rate up"""
+        now = time.monotonic()
+        touched = [key for key, (expires, _) in self._touched.items() if expires > now]
+        return sorted(set(self._animating) | set(touched))
+
+    def target_fps(self):
+        """Frame rate for the next clock.tick()"""
+        fps = self.idle_fps
+        for wanted in self._animating.values():
+            fps = max(fps, wanted)
+        if self._touched:
+            now = time.monotonic()
+            for key, (expires, wanted) in list(self._touched.items()):
+                if expires <= now:
+                    del self._touched[key]
+                else:
+                    fps = max(fps, wanted)
+        return min(fps, ACTIVE_FPS)
+
+
+_governor = None
+
+
+def get_frame_governor():
+    """Get or create the shared FrameGovernor"""
+    global _governor
+    if _governor is None:
+        _governor = FrameGovernor()
+    return _governor
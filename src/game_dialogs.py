@@ -81,9 +81,9 @@ class DBWarningPopup:
 
         # Fonts
         try:
-            self.font_title = pygame.font.Font(FONT_PATH, 14)
-            self.font_text = pygame.font.Font(FONT_PATH, 10)
-            self.font_button = pygame.font.Font(FONT_PATH, 11)
+            self.font_title = ui_colors.get_font(14, FONT_PATH)
+            self.font_text = ui_colors.get_font(10, FONT_PATH)
+            self.font_button = ui_colors.get_font(11, FONT_PATH)
         except Exception:
             self.font_title = pygame.font.SysFont(None, 20)
             self.font_text = pygame.font.SysFont(None, 16)
@@ -5,7 +5,8 @@ game_nav_mixin.py — game selection, navigation, GIF loading, and menu helpers
 
 Covers:
   - Game init and detection  (_init_games, refresh_games)
-  - GIF pre-caching          (precache_all, _ensure_gif_loaded, _draw_loading_screen)
+  - Background loading       (precache_all, _ensure_gif_loaded, _title_animation,
+                              _sinew_background, _draw_loading_screen)
   - Game navigation          (change_game, load_game_and_background, _change_game_*)
   - Menu helpers             (is_on_sinew, get_menu_items, get_current_game_*)
   - Events gate logic        (_is_events_unlocked_for_current_game, _save_matches_game,
@@ -18,7 +19,6 @@ import os
 import time
 
 import pygame
-from PIL import Image
 
 from config import ROMS_DIR, SAVES_DIR, SPRITES_DIR
 from game_detection import (
@@ -29,29 +29,9 @@ from game_detection import (
     detect_games_with_dirs,
     get_game_availability,
 )
+from asset_loader import PRIORITY_NOW, decode_rgba, get_asset_loader, to_surface
 from save_data_manager import get_manager
-
-
-def _load_gif_frames(path, width, height):
-    """Load GIF frames scaled to specified size (module-level helper)."""
-    from PIL import ImageSequence
-    import pygame as _pg
-
-    frames, durations = [], []
-    if not path or not os.path.exists(path):
-        return frames, durations
-    try:
-        pil_img = Image.open(path)
-        for frame in ImageSequence.Iterator(pil_img):
-            frame = frame.convert("RGBA").resize((width, height), Image.NEAREST)
-            data = frame.tobytes()
-            surf = _pg.image.fromstring(data, frame.size, frame.mode).convert_alpha()
-            frames.append(surf)
-            durations.append(frame.info.get("duration", 100))
-        pil_img.close()
-    except Exception as e:
-        print(f"Failed to open GIF {path}: {e}")
-    return frames, durations
+from title_frames import get_title_store
 
 
 # Menu item lists (referenced by get_menu_items)
@@ -298,11 +278,8 @@ class GameNavMixin:
                 print(f"[GameScreen] Hiding {gname}: no ROM and no save found")
                 continue
 
-            game_data["frames"] = None
-            game_data["durations"] = None
             game_data["frame_index"] = 0
             game_data["time_accum"] = 0
-            game_data["loaded"] = False
 
             self.games[gname] = game_data
 
@@ -324,23 +301,18 @@ class GameNavMixin:
         if not full_games and not save_only:
             print("[GameScreen] No ROMs or saves detected in roms/ and saves/ folders")
 
-        # Load Sinew background image
+        # Sinew background image, decoded on the asset loader
         self.sinew_logo = None
         self.sinew_bg_color = (255, 255, 255)
+        self._sinew_logo_request = None
         sinew_logo_path = os.path.join(SPRITES_DIR, "title", "PKSINEW.png")
         if os.path.exists(sinew_logo_path):
-            try:
-                pil_img = Image.open(sinew_logo_path)
-                pil_img = pil_img.convert("RGBA").resize(
-                    (self.width, self.height), Image.NEAREST
-                )
-                data = pil_img.tobytes()
-                self.sinew_logo = pygame.image.fromstring(
-                    data, pil_img.size, pil_img.mode
-                ).convert_alpha()
-                pil_img.close()
-            except Exception as e:
-                print(f"Failed to load Sinew background: {e}")
+            size = (self.width, self.height)
+            self._sinew_logo_request = get_asset_loader().request(
+                ("sinew_logo", sinew_logo_path, size),
+                lambda: decode_rgba(sinew_logo_path, size),
+                PRIORITY_NOW,
+            )
 
     def refresh_games(self):
         """Re-detect games (call if ROMs were added/removed)"""
@@ -361,62 +333,63 @@ class GameNavMixin:
     # GIF loading / pre-caching                                           #
     # ------------------------------------------------------------------ #
 
-    def _ensure_gif_loaded(self, gname):
-        """Lazy load GIF for a game"""
-        game_data = self.games[gname]
-        if not game_data["loaded"]:
-            gif_path = game_data.get("title_gif")
-            if gif_path and os.path.exists(gif_path):
-                frames, durations = _load_gif_frames(gif_path, self.width, self.height)
-                game_data["frames"] = frames
-                game_data["durations"] = durations
-            else:
-                game_data["frames"] = []
-                game_data["durations"] = []
-            game_data["loaded"] = True
+    def _sinew_background(self):
+        """The Sinew background surface, once decoded (None until then)"""
+        req = self._sinew_logo_request
+        if self.sinew_logo is None and req is not None and req.ready():
+            self._sinew_logo_request = None
+            if req.result is not None:
+                self.sinew_logo = to_surface(req.result)
+        return self.sinew_logo
+
+    def _title_animation(self, gname):
+        """Packed title GIF of a game (None if it has none)"""
+        return get_title_store().get(self.games[gname].get("title_gif"))
+
+    def _ensure_gif_loaded(self, gname, wait=True):
+        """
+        Load a game's title GIF first, and prefetch the games either side
+        of it in the background so switching to them is instant.
+
+        Args:
+            wait: Wait for its first frame (game switches), rather than
+                letting it appear when ready (startup)
+        """
+        store = get_title_store()
+        store.get(self.games[gname].get("title_gif"), wait=wait)
+
+        index = self.game_names.index(gname) if gname in self.game_names else 0
+        count = len(self.game_names)
+        neighbours = []
+        for delta in (1, -1):
+            other = self.game_names[(index + delta) % count] if count else None
+            if other and other != gname:
+                neighbours.append(self.games[other].get("title_gif"))
+        store.prefetch(
+            [path for path in neighbours if path],
+            keep=[self.games[gname].get("title_gif")],
+        )
 
     def precache_all(self, screen=None):
         """
-        Pre-load all GIF backgrounds.
-        Save files are loaded lazily when needed (on-demand by SaveDataManager).
-        Call this during startup to eliminate lag when switching games.
+        Queue the startup backgrounds on the asset loader and return.
+
+        The current game's GIF goes first, then its neighbours; the menu is
+        usable straight away and each background appears once its first
+        frame is decoded. Other games load when first shown, and save
+        files lazily when needed (on-demand by SaveDataManager).
 
         Args:
-            screen: Optional pygame surface to draw loading progress on
+            screen: Unused; kept for callers that pass the loading surface
         """
         if self._precached:
             return
 
-        total_items = sum(
-            1 for _, gd in self.games.items() if gd.get("title_gif")
-        )
-        current_item = 0
-
-        for gname, game_data in self.games.items():
-            gif_path = game_data.get("title_gif")
-            if gif_path and os.path.exists(gif_path):
-                if screen:
-                    self._draw_loading_screen(
-                        screen,
-                        f"Loading {gname} background...",
-                        current_item,
-                        total_items,
-                    )
-                if not game_data.get("loaded"):
-                    frames, durations = _load_gif_frames(
-                        gif_path, self.width, self.height
-                    )
-                    game_data["frames"] = frames
-                    game_data["durations"] = durations
-                    game_data["loaded"] = True
-                current_item += 1
+        if self.game_names and 0 <= self.current_game < len(self.game_names):
+            self._ensure_gif_loaded(self.game_names[self.current_game], wait=False)
 
         self._precached = True
 
-        if screen:
-            self._draw_loading_screen(screen, "Ready!", total_items, total_items)
-            pygame.time.wait(200)
-
     def _draw_loading_screen(self, screen, message, current, total):
         """Draw a loading screen with progress bar"""
         if screen is None:
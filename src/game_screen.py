@@ -13,12 +13,14 @@ from datetime import datetime
 
 import pygame
 from PIL import Image, ImageSequence
-import ui_colors
 from config import (
-    CORES_DIR, DATA_DIR, EXT_DIR, FONT_PATH, IS_HANDHELD,
+    CORES_DIR, DATA_DIR, EXT_DIR, IS_HANDHELD,
     MGBA_CORE_PATH, ROMS_DIR, SAVES_DIR, SAVE_PATHS,
     SPRITES_DIR, SYSTEM_DIR,
 )
+from dirty_regions import get_dirty_tracker
+from asset_loader import get_asset_loader
+from frame_governor import get_frame_governor
 from save_data_manager import get_manager
 from ui_components import Button
 from sinew_logging import init_redirectors
@@ -134,6 +136,11 @@ class GameScreen(
         if not hasattr(builtins, 'SINEW_USE_EMULATOR_PROVIDER'):
             builtins.SINEW_USE_EMULATOR_PROVIDER = self.settings.get('use_emulator_provider', False)
 
+        # Achievement profiling (Dev tab) covers the startup checks too
+        if self.settings.get('profile_achievements', False):
+            from achievement_profiler import get_achievement_profiler
+            get_achievement_profiler().enabled = True
+
         # Emulator manager — always initialized; use_provider controls whether
         # external (subprocess) providers are included alongside built-in mGBA.
         use_provider = self.settings.get('use_emulator_provider', False)
@@ -205,14 +212,18 @@ class GameScreen(
     def _close_modal(self):
         """Close current modal"""
         self.modal_instance = None
+        get_dirty_tracker().mark()
         self._last_input_time = time.time()
         self._modal_just_closed = True
+        self._flush_achievement_progress()
 
     def _resume_game_from_modal(self):
         """Close modal and resume game (called by START+SELECT in modals)"""
         self.modal_instance = None
+        get_dirty_tracker().mark()
         self._last_input_time = time.time()
         self._modal_just_closed = True
+        self._flush_achievement_progress()
 
         if self.emulator and self.emulator.loaded:
             self._stop_menu_music()
@@ -242,29 +253,66 @@ class GameScreen(
         # Update notification animation
         self._update_notification(dt)
 
-        # Update achievement notification
+        # Deliver background achievement results, then animate notifications
+        tracker = get_dirty_tracker()
+        governor = get_frame_governor()
+        self._drain_achievement_worker()
+        toast_active = False
         if self._achievement_notification:
             self._achievement_notification.update()
+            toast_active = self._achievement_notification.is_active()
+            if toast_active:
+                tracker.mark(
+                    pygame.Rect(
+                        0,
+                        0,
+                        self.width,
+                        self._achievement_notification.NOTIFICATION_HEIGHT + 16,
+                    )
+                )
+
+        governor.set_animating("achievement_toast", toast_active)
+
+        # Background jobs keep the full rate so their results show promptly
+        worker = getattr(self, "_achievement_worker", None)
+        modal_busy = getattr(self.modal_instance, "is_busy", None)
+        governor.set_animating(
+            "background",
+            bool(
+                (worker is not None and worker.is_busy())
+                or get_asset_loader().pending()
+                or (modal_busy is not None and modal_busy())
+            ),
+        )
 
         # Handle emulator if active
-        if self.emulator_active and self.emulator:
+        emulating = bool(self.emulator_active and self.emulator)
+        governor.set_animating("emulator", emulating)
+        if emulating:
+            tracker.mark()
             return self._update_emulator(events, dt)
 
         # External emulator closed — reload on the main thread.
         if self._ext_emu_closed_needs_reload:
             self._ext_emu_closed_needs_reload = False
+            tracker.mark()
             if self.scaler:
                 self.scaler.restore_virtual_resolution()
             self._reload_settings_from_disk()
             self.load_game_and_background()
-            self._force_reload_current_save()
-            self._check_achievements_for_current_game()
+            self._queue_return_achievement_check()
             self._start_menu_music()
             print("[Sinew] Returned from external emulator")
 
         # Check for resume combo when emulator is paused but we're in Sinew menu
         self._pause_combo_active = False
-        if self.emulator and self.emulator.loaded and not self.emulator_active:
+        banner_visible = bool(
+            self.emulator and self.emulator.loaded and not self.emulator_active
+        )
+        governor.set_animating("resume_banner", banner_visible)
+        if banner_visible:
+            # The resume banner pulses every frame
+            tracker.mark(pygame.Rect(0, 0, self.width, 30))
             combo_held = self._check_pause_combo_direct()
 
             keys = pygame.key.get_pressed()
@@ -317,24 +365,41 @@ class GameScreen(
             ):
                 self._emulator_pause_combo_released = True
 
+        # Show the Sinew background as soon as the loader has decoded it
+        if self._sinew_logo_request is not None and self._sinew_logo_request.ready():
+            self._sinew_background()
+            tracker.mark()
+
         # Update GIF animation for current game (if we have games)
+        gif_fps = 0
         if self.game_names and 0 <= self.current_game < len(self.game_names):
             gname = self.game_names[self.current_game]
-            self._ensure_gif_loaded(gname)
+            anim = self._title_animation(gname)
             game_data = self.games[gname]
+            count = anim.frame_count() if anim else 0
 
-            if game_data["frames"]:
+            # Redraw once a background that was still loading arrives
+            if bool(count) != game_data.get("title_ready", False):
+                game_data["title_ready"] = bool(count)
+                tracker.mark()
+
+            if count:
                 game_data["time_accum"] += dt
-                dur = (
-                    game_data["durations"][game_data["frame_index"]]
-                    if game_data["durations"]
-                    else 100
-                )
+                dur = anim.duration(game_data["frame_index"])
+                if count > 1 or not anim.done:
+                    gif_fps = max(1, 1000 // max(1, dur))
                 if game_data["time_accum"] >= dur:
-                    game_data["time_accum"] = 0
-                    game_data["frame_index"] = (game_data["frame_index"] + 1) % len(
-                        game_data["frames"]
-                    )
+                    # Frames may still be streaming in: wait for the next
+                    # one rather than looping back early
+                    next_index = game_data["frame_index"] + 1
+                    if next_index >= count and anim.done:
+                        next_index = 0
+                    if next_index < count:
+                        game_data["time_accum"] = 0
+                        game_data["frame_index"] = next_index
+                        tracker.mark()
+
+        governor.set_animating("title_gif", gif_fps > 0, fps=gif_fps)
 
         # Handle events
         for event in events:
@@ -437,144 +502,21 @@ class GameScreen(
                 if not result:
                     self._close_modal()
 
-        return not self.should_close
-
-    def draw(self, surf):
-        """Draw the game screen"""
-        if self.emulator_active and self.emulator:
-            self._draw_emulator(surf)
-            return
-
-        if not self.game_names or self.current_game >= len(self.game_names):
-            surf.fill(ui_colors.COLOR_BG)
-            return
-
-        gname = self.game_names[self.current_game]
-        game_data = self.games[gname]
-
-        if self.is_on_sinew():
-            if self.sinew_logo:
-                surf.blit(self.sinew_logo, (0, 0))
-            else:
-                surf.fill(self.sinew_bg_color)
-        elif game_data["frames"]:
-            bg_surf = game_data["frames"][game_data["frame_index"]]
-            surf.blit(bg_surf, (0, 0))
-        else:
-            surf.fill(ui_colors.COLOR_BG)
-
+        # Modals without is_animating() are assumed to change every frame
+        modal_animating = False
         if self.modal_instance:
-            if hasattr(self.modal_instance, "width") and hasattr(
-                self.modal_instance, "height"
-            ):
-                modal_w = self.modal_instance.width
-                modal_h = self.modal_instance.height
-            else:
-                modal_w = self.width - 30
-                modal_h = self.height - 30
-
-            modal_surf = pygame.Surface((modal_w, modal_h), pygame.SRCALPHA)
-
-            if hasattr(self.modal_instance, "draw"):
-                self.modal_instance.draw(modal_surf)
-
-            pygame.draw.rect(
-                modal_surf, ui_colors.COLOR_BORDER, (0, 0, modal_w, modal_h), 2
-            )
-
-            modal_x = (self.width - modal_w) // 2
-            modal_y = (self.height - modal_h) // 2
-            surf.blit(modal_surf, (modal_x, modal_y))
-
-            if self.emulator and self.emulator.loaded and not self.emulator_active:
-                self._draw_resume_banner(surf)
-        else:
-            menu_items = self.get_menu_items()
-            if self.menu_index >= len(menu_items):
-                self.menu_index = 0
-
-            current_menu_item = menu_items[self.menu_index]
-            is_disabled = current_menu_item == "Save File Only"
+            is_animating = getattr(self.modal_instance, "is_animating", None)
+            modal_animating = is_animating is None or is_animating()
+            if modal_animating:
+                tracker.mark()
+        governor.set_animating("modal", modal_animating)
 
-            menu_button = Button(
-                current_menu_item,
-                rel_rect=(0.25, 0.65, 0.5, 0.12),
-                callback=lambda: None,
-            )
-
-            if is_disabled:
-                bx = int(0.25 * self.width)
-                by = int(0.65 * self.height)
-                bw = int(0.5 * self.width)
-                bh = int(0.12 * self.height)
-                btn_rect = pygame.Rect(bx, by, bw, bh)
-
-                pygame.draw.rect(surf, (50, 50, 55), btn_rect, border_radius=4)
-                pygame.draw.rect(surf, (80, 80, 85), btn_rect, 2, border_radius=4)
-
-                try:
-                    btn_font = pygame.font.Font(FONT_PATH, 14)
-                except Exception:
-                    btn_font = self.font
-                txt_surf = btn_font.render(current_menu_item, True, (100, 100, 105))
-                txt_rect = txt_surf.get_rect(center=btn_rect.center)
-                surf.blit(txt_surf, txt_rect)
-
-                try:
-                    hint2_font = pygame.font.Font(FONT_PATH, 7)
-                except Exception:
-                    hint2_font = pygame.font.SysFont(None, 12)
-                hint2_surf = hint2_font.render(
-                    "No ROM \u2014 place a .gba file in roms/", True, (90, 90, 90)
-                )
-                hint2_rect = hint2_surf.get_rect(
-                    centerx=self.width // 2, top=btn_rect.bottom + 3
-                )
-                surf.blit(hint2_surf, hint2_rect)
-            else:
-                menu_button.draw(surf, self.font)
-
-            hint_text = "< > Change Game    ^ v Scroll Menu"
-            try:
-                hint_font = pygame.font.Font(FONT_PATH, 8)
-            except Exception:
-                hint_font = pygame.font.SysFont(None, 14)
-            hint_surf = hint_font.render(hint_text, True, (150, 150, 150))
-            hint_rect = hint_surf.get_rect(
-                centerx=self.width // 2, bottom=self.height - 5
-            )
-            surf.blit(hint_surf, hint_rect)
-
-            if self.emulator and self.emulator.loaded and not self.emulator_active:
-                self._draw_resume_banner(surf)
-
-        self._draw_notification(surf)
-
-        if self._achievement_notification:
-            self._achievement_notification.draw(surf)
-
-    def dim_screen(self, alpha=128):
-        """
-        Dim the game screen by drawing a semi-transparent black overlay.
-        If alpha is 0 or less, remove the overlay (destroy surface).
-        """
-        if not hasattr(self, '_dim_overlay'):
-            self._dim_overlay = None
-        if alpha > 0:
-            self._dim_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            self._dim_overlay.fill((0, 0, 0, alpha))
-            target_surface = self.scaler.get_surface() if self.scaler else self._loading_screen
-            if target_surface:
-                target_surface.blit(self._dim_overlay, (0, 0))
-                if self.scaler:
-                    self.scaler.blit_scaled()
-                else:
-                    pygame.display.flip()
-        else:
-            self._dim_overlay = None
+        return not self.should_close
 
     def cleanup(self):
         """Cleanup resources when closing the game screen"""
+        self._flush_achievement_progress(wait=True)
+
         if self.emulator:
             try:
                 self.emulator.shutdown()
@@ -3,12 +3,17 @@
 """
 GIF Sprite Handler for Pokemon Showdown Sprites
 Handles loading and animating GIF sprites in Pygame
+
+Decoded (and scaled) frames are kept in decoded_cache, so a sprite seen on
+an earlier launch loads without Pillow.
 """
 
 import os
 
 import pygame
-from PIL import Image, ImageSequence
+
+import decoded_cache
+from frame_governor import get_frame_governor
 
 
 class GIFSprite:
@@ -36,33 +41,39 @@ class GIFSprite:
     def _load_gif(self):
         """Load GIF frames into pygame surfaces"""
         try:
-            pil_img = Image.open(self.gif_path)
+            cached = decoded_cache.load(self.gif_path, self.target_size)
+            if cached is None:
+                cached = self._decode_gif()
+                decoded_cache.store(self.gif_path, cached, self.target_size)
+
+            for frame in cached:
+                self.frames.append(decoded_cache.to_surface(frame))
+                self.durations.append(frame[3])
+
+            self.loaded = len(self.frames) > 0
+
+        except Exception as e:
+            print(f"Error loading GIF {self.gif_path}: {e}")
+            self.loaded = False
+
+    def _decode_gif(self):
+        """Decode the GIF with Pillow: [(mode, size, RGBA bytes, duration)]"""
+        from PIL import Image, ImageSequence
 
+        frames = []
+        with Image.open(self.gif_path) as pil_img:
             for frame in ImageSequence.Iterator(pil_img):
                 # Convert frame to RGBA
-                frame = frame.convert("RGBA")
+                rgba = frame.convert("RGBA")
 
                 # Scale if needed
                 if self.target_size:
-                    frame = frame.resize(self.target_size, Image.NEAREST)
-
-                # Convert to pygame surface
-                data = frame.tobytes()
-                surf = pygame.image.fromstring(
-                    data, frame.size, frame.mode
-                ).convert_alpha()
-
-                self.frames.append(surf)
+                    rgba = rgba.resize(self.target_size, Image.NEAREST)
 
                 # Get frame duration (in milliseconds)
-                duration = frame.info.get("duration", 100)
-                self.durations.append(duration)
-
-            self.loaded = len(self.frames) > 0
-
-        except Exception as e:
-            print(f"Error loading GIF {self.gif_path}: {e}")
-            self.loaded = False
+                duration = decoded_cache.frame_duration(frame.info)
+                frames.append(("RGBA", rgba.size, rgba.tobytes(), duration))
+        return frames
 
     def update(self, dt):
         """
@@ -79,6 +90,11 @@ class GIFSprite:
         # Get duration of current frame
         current_duration = self.durations[self.current_frame] if self.durations else 100
 
+        # Keep the loop fast enough for this GIF while it's being drawn
+        get_frame_governor().touch(
+            "gif_sprite", fps=max(1, 1000 // max(1, current_duration))
+        )
+
         if self.time_accumulator >= current_duration:
             self.time_accumulator = 0
             self.current_frame = (self.current_frame + 1) % len(self.frames)
@@ -154,9 +170,20 @@ class SpriteCache:
         if cache_key not in self.cache:
             if os.path.exists(path):
                 try:
-                    sprite = pygame.image.load(path).convert_alpha()
-                    if size:
-                        sprite = pygame.transform.smoothscale(sprite, size)
+                    cached = decoded_cache.load(path, size, "smooth")
+                    if cached is not None:
+                        sprite = decoded_cache.to_surface(cached[0])
+                    else:
+                        sprite = pygame.image.load(path).convert_alpha()
+                        if size:
+                            sprite = pygame.transform.smoothscale(sprite, size)
+                        frame = (
+                            "RGBA",
+                            sprite.get_size(),
+                            pygame.image.tobytes(sprite, "RGBA"),
+                            0,
+                        )
+                        decoded_cache.store(path, [frame], size, "smooth")
                     self.cache[cache_key] = sprite
                 except Exception:
                     self.cache[cache_key] = None
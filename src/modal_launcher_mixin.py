@@ -137,6 +137,7 @@ class ModalLauncherMixin:
                 is_game_running_callback=self._get_running_game_name,
                 reload_save_callback=self._reload_save_for_game,
                 resume_game_callback=self._resume_game_from_modal,
+                get_save_paths_callback=self._get_all_save_paths,
             )
         elif name == "Trainer Info" and TrainerInfoModal:
             self.modal_instance = TrainerInfoModal(
@@ -175,6 +176,7 @@ class ModalLauncherMixin:
                 modal_h,
                 game_name=current_game,
                 close_callback=self._close_modal,
+                get_saves_callback=self._get_all_saves,
             )
         elif name == "Events" and EventsModal:
             # Events modal - for claiming mystery event items
@@ -27,6 +27,8 @@ import pygame
 
 import ui_colors
 from config import FONT_PATH
+from dirty_regions import get_dirty_tracker
+from frame_governor import get_frame_governor
 
 
 class NotificationsMixin:
@@ -93,7 +95,7 @@ class NotificationsMixin:
         )
 
         try:
-            banner_font = pygame.font.Font(FONT_PATH, 10)
+            banner_font = ui_colors.get_font(10, FONT_PATH)
         except Exception:
             try:
                 banner_font = pygame.font.Font(None, 18)
@@ -138,9 +140,13 @@ class NotificationsMixin:
         self._notification_subtext = subtext
         self._notification_timer = self._notification_duration
         self._notification_y = -80  # Start above the screen
+        get_dirty_tracker().mark()
 
     def _update_notification(self, dt):
         """Advance the notification slide animation each frame."""
+        if self._notification_text is None:
+            return
+        old_y = self._notification_y
         if self._notification_timer <= 0:
             # Slide back up and hide
             self._notification_y -= dt * 0.3
@@ -154,6 +160,13 @@ class NotificationsMixin:
                 self._notification_y += dt * 0.5
                 self._notification_y = min(self._notification_y, self._notification_target_y)
 
+        # Redraw the strip the box moved through (60 = tallest box)
+        if self._notification_y != old_y or self._notification_text is None:
+            top = int(min(old_y, self._notification_y))
+            height = int(abs(self._notification_y - old_y)) + 62
+            get_dirty_tracker().mark(pygame.Rect(0, top, self.width, height))
+            get_frame_governor().touch("notification")
+
     def _draw_notification(self, surf):
         """Draw the slide-down notification box if one is active."""
         if self._notification_text is None:
@@ -181,10 +194,14 @@ class NotificationsMixin:
 
         font = self.font if self.font else pygame.font.Font(None, 24)
 
-        text_surf = font.render(self._notification_text, True, ui_colors.COLOR_TEXT)
+        text_surf = ui_colors.render_text(
+            font, self._notification_text, True, ui_colors.COLOR_TEXT
+        )
         surf.blit(text_surf, text_surf.get_rect(centerx=box_x + box_width // 2, top=box_y + 8))
 
         if self._notification_subtext:
             sub_color = tuple(max(0, c - 40) for c in ui_colors.COLOR_TEXT)
-            sub_surf = font.render(self._notification_subtext, True, sub_color)
+            sub_surf = ui_colors.render_text(
+                font, self._notification_subtext, True, sub_color
+            )
             surf.blit(sub_surf, sub_surf.get_rect(centerx=box_x + box_width // 2, top=box_y + 32))
@@ -38,6 +38,7 @@ from .crypto import (
     encrypt_pokemon_data,
     get_block_order,
     get_block_position,
+    validate_pokemon_batch,
 )
 
 # Main parser class
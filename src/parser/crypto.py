@@ -5,7 +5,19 @@ Handles decryption and text encoding/decoding
 
 import struct
 
-from .constants import PERMUTATIONS
+from .constants import BLOCK_GROWTH, BLOCK_MISC, PERMUTATIONS, is_valid_species
+
+# numpy is optional - batch validation falls back to a pure Python loop
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Size of a boxed (PC) Pokemon record, i.e. a .pk3 file
+PK3_SIZE = 80
 
 
 def decrypt_pokemon_data(encrypted_data, personality, ot_id):
@@ -580,3 +592,91 @@ def calculate_pokemon_checksum(decrypted_data):
         word = struct.unpack("<H", decrypted_data[i : i + 2])[0]
         checksum = (checksum + word) & 0xFFFF
     return checksum
+
+
+# ============================================================
+# BATCH VALIDATION
+# ============================================================
+
+
+def _validate_pokemon_record(record):
+    """
+    Validate one 80-byte PC record.
+
+    Returns:
+        str or None: Failure reason, or None if the record is valid
+    """
+    personality, ot_id = struct.unpack("<II", record[0:8])
+    if personality == 0 or personality == 0xFFFFFFFF:
+        return "empty record"
+
+    decrypted = decrypt_pokemon_data(record[0x20:0x50], personality, ot_id)
+    stored_checksum = struct.unpack("<H", record[0x1C:0x1E])[0]
+    if calculate_pokemon_checksum(decrypted) != stored_checksum:
+        return "checksum mismatch"
+
+    block_order = PERMUTATIONS[personality % 24]
+    growth_start = block_order[BLOCK_GROWTH] * 12
+    misc_start = block_order[BLOCK_MISC] * 12
+    species = struct.unpack("<H", decrypted[growth_start : growth_start + 2])[0]
+    iv_egg_ability = struct.unpack("<I", decrypted[misc_start + 4 : misc_start + 8])[0]
+    if not iv_egg_ability & 0x40000000 and not is_valid_species(species):
+        return f"invalid species {species}"
+    return None
+
+
+def _validate_pokemon_batch_numpy(buffer, count):
+    """Vectorised validate_pokemon_batch over count records"""
+    words = np.frombuffer(buffer, dtype="<u4", count=count * 20).reshape(count, 20)
+    personality = words[:, 0]
+    key = personality ^ words[:, 1]
+    decrypted = words[:, 8:20] ^ key[:, None]
+
+    # Checksum: sum of the 24 decrypted 16-bit halves
+    halves = (decrypted & 0xFFFF) + (decrypted >> 16)
+    checksum = (halves.sum(axis=1, dtype=np.uint64) & 0xFFFF).astype(np.uint32)
+    stored = words[:, 7] & 0xFFFF
+
+    # Species from the first word of the growth block, egg flag from misc
+    order = np.array(PERMUTATIONS, dtype=np.intp)[personality % 24]
+    rows = np.arange(count)
+    species = decrypted[rows, order[:, BLOCK_GROWTH] * 3] & 0xFFFF
+    is_egg = (decrypted[rows, order[:, BLOCK_MISC] * 3 + 1] & 0x40000000) != 0
+
+    results = []
+    for i in range(count):
+        if personality[i] == 0 or personality[i] == 0xFFFFFFFF:
+            results.append("empty record")
+        elif checksum[i] != stored[i]:
+            results.append("checksum mismatch")
+        elif not (is_egg[i] or is_valid_species(int(species[i]))):
+            results.append(f"invalid species {int(species[i])}")
+        else:
+            results.append(None)
+    return results
+
+
+def validate_pokemon_batch(buffer):
+    """
+    Validate many concatenated 80-byte PC records at once.
+
+    Each record is decrypted, its 0x1C checksum verified and its species
+    checked (eggs are allowed through, as in parse_pc_pokemon). Uses numpy
+    when available, otherwise validates record by record.
+
+    Args:
+        buffer: bytes-like object, a multiple of 80 bytes long
+
+    Returns:
+        list: One entry per record - None if valid, else a failure reason
+    """
+    count = len(buffer) // PK3_SIZE
+    if count == 0:
+        return []
+    if NUMPY_AVAILABLE:
+        return _validate_pokemon_batch_numpy(buffer, count)
+    view = memoryview(buffer)
+    return [
+        _validate_pokemon_record(bytes(view[i * PK3_SIZE : (i + 1) * PK3_SIZE]))
+        for i in range(count)
+    ]
@@ -43,8 +43,8 @@ class PartyScreen:
         # ------------------------------------------------------------
         # FONTS
         # ------------------------------------------------------------
-        self.font = pygame.font.Font(FONT_PATH, 16)
-        self.small_font = pygame.font.Font(FONT_PATH, 12)
+        self.font = ui_colors.get_font(16, FONT_PATH)
+        self.small_font = ui_colors.get_font(12, FONT_PATH)
 
         # ============================================================
         # LAYOUT VARIABLES
@@ -64,6 +64,7 @@ class PCBox(  # pylint: disable=too-many-instance-attributes
         is_game_running_callback=None,
         reload_save_callback=None,
         resume_game_callback=None,
+        get_save_paths_callback=None,
     ):
         self.width = width
         self.height = height
@@ -75,10 +76,11 @@ class PCBox(  # pylint: disable=too-many-instance-attributes
         self.is_game_running_callback = is_game_running_callback
         self.reload_save_callback = reload_save_callback
         self.resume_game_callback = resume_game_callback
+        self.get_save_paths_callback = get_save_paths_callback
         self.party_slot_scale = 1.2
         self.party_slot_x_offset = party_slot_x_offset
 
-        self.box_index = 0  # 0-13 for boxes 1-14 (or 0-19 for Sinew)
+        self.box_index = 0  # 0-13 for boxes 1-14 (or 0..N-1 for Sinew)
         self.selected_pokemon = None
         self.sub_modal = None  # For summary screen
         self.current_sprite_image = None
@@ -96,7 +98,7 @@ class PCBox(  # pylint: disable=too-many-instance-attributes
         # Sinew mode has 120 slots per box with scrolling
         self.sinew_scroll_offset = 0  # Scroll offset for Sinew's 120-slot boxes
         self.sinew_visible_rows = 5  # Number of visible rows at a time
-        self.sinew_total_rows = 20  # 120 slots / 6 columns = 20 rows
+        self.sinew_total_rows = self._sinew_slots_per_box() // 6  # 120 / 6 = 20 rows
 
         # Get sprite cache
         self.sprite_cache = get_sprite_cache()
@@ -106,8 +108,8 @@ class PCBox(  # pylint: disable=too-many-instance-attributes
 
         # Box names - use different names for Sinew vs regular games
         if self.sinew_mode:
-            self.box_names = [f"STORAGE {i+1}" for i in range(20)]
-            self.max_boxes = 20
+            self.max_boxes = self._sinew_box_count()
+            self.box_names = [f"STORAGE {i+1}" for i in range(self.max_boxes)]
         else:
             self.box_names = [f"BOX {i+1}" for i in range(14)]
             self.max_boxes = 14
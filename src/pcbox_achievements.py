@@ -53,12 +53,7 @@ class PCBoxAchievementsMixin:
 
             if self.sinew_storage:
                 total_pokemon = self.sinew_storage.get_total_pokemon_count()
-                for box_num in range(1, 21):
-                    box_data = self.sinew_storage.get_box(box_num)
-                    if box_data:
-                        for poke in box_data:
-                            if poke and not poke.get("empty") and poke.get("is_shiny"):
-                                total_shinies += 1
+                total_shinies = self.sinew_storage.get_total_shiny_count()
 
             transfer_count = manager.get_stat("sinew_transfers", 0)
 
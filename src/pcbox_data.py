@@ -12,7 +12,7 @@ import pygame
 
 from config import POKEMON_DB_PATH, SETTINGS_FILE
 from controller import NavigableList
-from ui_components import scale_surface_preserve_aspect
+from sprite_service import get_sprite_service
 
 
 class PCBoxDataMixin:
@@ -125,12 +125,24 @@ class PCBoxDataMixin:
             self.grid_nav = NavigableList(30, columns=6, wrap=False)
 
             if self.sinew_mode:
-                self.box_names = [f"STORAGE {i+1}" for i in range(20)]
-                self.max_boxes = 20
+                self.max_boxes = self._sinew_box_count()
+                self.box_names = [f"STORAGE {i+1}" for i in range(self.max_boxes)]
             else:
                 self.box_names = [f"BOX {i+1}" for i in range(14)]
                 self.max_boxes = 14
 
+    def _sinew_box_count(self):
+        """Number of boxes in Sinew storage (configurable, defaults to 20)"""
+        if self.sinew_storage and self.sinew_storage.is_loaded():
+            return self.sinew_storage.get_box_count()
+        return 20
+
+    def _sinew_slots_per_box(self):
+        """Number of slots in each Sinew storage box"""
+        if self.sinew_storage:
+            return self.sinew_storage.get_slots_per_box()
+        return 120
+
     def get_box_name(self, box_index):
         """Get the name for a specific box"""
         if self.sinew_mode:
@@ -139,9 +151,6 @@ class PCBoxDataMixin:
 
     def refresh_data(self):
         """Refresh Pokemon data from save file or Sinew storage"""
-        if self.sprite_cache:
-            self.sprite_cache.clear()
-
         self._update_sinew_mode()
 
         if self.sinew_mode:
@@ -160,7 +169,7 @@ class PCBoxDataMixin:
                     flush=True,
                 )
             else:
-                self.current_box_data = [None] * 120
+                self.current_box_data = [None] * self._sinew_slots_per_box()
                 self.party_data = []
                 print("[PCBox] Sinew storage not loaded!", file=sys.stderr, flush=True)
         else:
@@ -254,7 +263,7 @@ class PCBoxDataMixin:
 
     def prev_box(self):
         """Navigate to the previous box."""
-        max_boxes = 20 if self.sinew_mode else 14
+        max_boxes = self._sinew_box_count() if self.sinew_mode else 14
         self.box_index = (self.box_index - 1) % max_boxes
         self.box_button.text = self.get_box_name(self.box_index)
         self.sinew_scroll_offset = 0
@@ -263,7 +272,7 @@ class PCBoxDataMixin:
 
     def next_box(self):
         """Navigate to the next box."""
-        max_boxes = 20 if self.sinew_mode else 14
+        max_boxes = self._sinew_box_count() if self.sinew_mode else 14
         self.box_index = (self.box_index + 1) % max_boxes
         self.box_button.text = self.get_box_name(self.box_index)
         self.sinew_scroll_offset = 0
@@ -314,8 +323,8 @@ class PCBoxDataMixin:
             if not was_sinew:
                 self.box_index = 0
                 self.sinew_scroll_offset = 0
-                self.box_names = [f"STORAGE {i+1}" for i in range(20)]
-                self.max_boxes = 20
+                self.max_boxes = self._sinew_box_count()
+                self.box_names = [f"STORAGE {i+1}" for i in range(self.max_boxes)]
         else:
             new_path = getattr(self.manager, "current_save_path", None)
             print(f"[PCBox] Save path: {new_path}", file=sys.stderr, flush=True)
@@ -380,11 +389,9 @@ class PCBoxDataMixin:
         if not path or not os.path.exists(path):
             self.current_sprite_image = None
             return
-        img = pygame.image.load(path).convert_alpha()
-        img = scale_surface_preserve_aspect(
-            img, int(self.sprite_area.width - 4), int(self.sprite_area.height - 4)
+        self.current_sprite_image = get_sprite_service().get_path(
+            path, (int(self.sprite_area.width - 4), int(self.sprite_area.height - 4))
         )
-        self.current_sprite_image = img
 
     # ------------------------------------------------------------------ #
     #  Party panel                                                         #
@@ -273,6 +273,10 @@ class PCBoxEvolutionMixin:
             )
 
         write_save_file(save_path, save_data, create_backup_first=True)
+        evolved_copy = dict(self.evolution_dialog_pokemon)
+        evolved_copy["species"] = evolution_info["evolves_to"]
+        evolved_copy["raw_bytes"] = evolved_bytes
+        self._index_game_slot(save_path, box, slot, evolved_copy)
         print(f"[PCBox] Evolution saved to {save_path}", file=sys.stderr, flush=True)
 
     # ------------------------------------------------------------------ #
@@ -487,8 +491,8 @@ class PCBoxEvolutionMixin:
         result_pokemon = self.altering_cave_spinner_result
 
         try:
-            from pokemon_generator import generate_echo_pokemon
-            result = generate_echo_pokemon(result_pokemon["name"])
+            from reward_factory import get_reward_factory
+            result = get_reward_factory().take_echo(result_pokemon["name"])
             if result is None:
                 print(f"[PCBox] ERROR: Could not generate {result_pokemon['name']}")
                 self.warning_message = (
@@ -540,6 +544,7 @@ class PCBoxEvolutionMixin:
                         )
                         write_pokemon_to_pc(save_data, box + 1, slot, pks_data)
                         write_save_file(save_path, save_data)
+                        self._index_game_slot(save_path, box + 1, slot, pokemon_dict)
                         print(
                             f"[PCBox] SUCCESS: Replaced Zubat with {result_pokemon['name']} "
                             f"in game box {box+1} slot {slot}"
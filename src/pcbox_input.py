@@ -847,6 +847,7 @@ class PCBoxInputMixin:
                     if success:
                         # Save the changes using write_save_file
                         write_save_file(save_path, save_data, create_backup_first=True)
+                        self._index_game_slot(save_path, box_num, slot_idx, None)
                         # Reload the save to refresh cache
                         self.manager.reload()
                         print(
@@ -885,9 +886,6 @@ class PCBoxInputMixin:
             if self.manager:
                 self.current_box_data = self.manager.get_box(self.box_index + 1)
 
-        # Clear sprite cache for this box to force reload
-        self.sprite_cache.clear()
-
     def _execute_undo(self):
         """Undo the last action"""
         if not self.undo_available or not self.undo_action:
@@ -934,6 +932,9 @@ class PCBoxInputMixin:
                             game_type,
                         )
                         write_save_file(save_path, save_data, create_backup_first=True)
+                        self._index_game_slot(
+                            save_path, location["box"], location["slot"], pokemon_data
+                        )
 
                         # Reload manager
                         if self.manager:
@@ -998,6 +999,9 @@ class PCBoxInputMixin:
                             game_type,
                         )
                         write_save_file(save_path, save_data, create_backup_first=True)
+                        self._index_game_slot(
+                            save_path, source["box"], source["slot"], pokemon
+                        )
 
                         # 3. Reload manager
                         if self.manager:
@@ -1022,6 +1026,7 @@ class PCBoxInputMixin:
                         save_data = load_save_file(save_path)
                         clear_pc_slot(save_data, dest["box"], dest["slot"], game_type)
                         write_save_file(save_path, save_data, create_backup_first=True)
+                        self._index_game_slot(save_path, dest["box"], dest["slot"], None)
 
                         # 3. Reload manager
                         if self.manager:
@@ -1062,6 +1067,12 @@ class PCBoxInputMixin:
                             source_save_data,
                             create_backup_first=True,
                         )
+                        self._index_game_slot(
+                            dest["save_path"], dest["box"], dest["slot"], None
+                        )
+                        self._index_game_slot(
+                            source["save_path"], source["box"], source["slot"], pokemon
+                        )
 
                         # 3. Reload manager
                         if self.manager:
@@ -18,10 +18,9 @@ refresh_data, get_current_game, get_pokemon_at_grid_slot).
 import os
 import sys
 
-import pygame
-
 from config import GEN3_NORMAL_DIR, GEN3_SHINY_DIR, get_egg_sprite_path
-from ui_components import scale_surface_preserve_aspect
+from pokemon_index import describe_location, get_pokemon_index, pc_location
+from sprite_service import get_sprite_service
 
 try:
     from save_writer import (
@@ -124,18 +123,7 @@ class PCBoxTransferMixin:
             return
 
         sprite_path = self._get_pokemon_sprite_path(self.moving_pokemon)
-
-        if sprite_path and os.path.exists(sprite_path):
-            try:
-                self.moving_sprite = pygame.image.load(sprite_path).convert_alpha()
-                self.moving_sprite = scale_surface_preserve_aspect(
-                    self.moving_sprite, 40, 40
-                )
-            except Exception as e:
-                print(f"Failed to load moving sprite: {e}")
-                self.moving_sprite = None
-        else:
-            self.moving_sprite = None
+        self.moving_sprite = get_sprite_service().get_path(sprite_path, (40, 40))
 
     def _get_pokemon_sprite_path(self, pokemon):
         """Get sprite path for a Pokemon (works for both game and Sinew storage Pokemon)"""
@@ -188,6 +176,31 @@ class PCBoxTransferMixin:
         self.moving_sprite = None
         print(f"[PCBox] Move mode cleared ({reason})")
 
+    # ------------------------------------------------------------------ #
+    #  Duplicate index                                                     #
+    # ------------------------------------------------------------------ #
+
+    def _get_pokemon_index(self):
+        """Fingerprint index, built on first use and refreshed for changed saves"""
+        index = get_pokemon_index()
+        if self.get_save_paths_callback:
+            save_paths = self.get_save_paths_callback()
+        else:
+            save_paths = [getattr(self.manager, "current_save_path", None)]
+        try:
+            index.ensure_built(save_paths, self.sinew_storage)
+        except Exception as e:
+            print(f"[PCBox] Duplicate index build failed: {e}", file=sys.stderr, flush=True)
+        return index
+
+    def _find_pokemon_copies(self, pokemon, exclude=None):
+        """Locations (other than exclude) that already hold this exact Pokemon"""
+        return self._get_pokemon_index().find_elsewhere(pokemon, exclude)
+
+    def _index_game_slot(self, save_path, box, slot, pokemon):
+        """Keep the duplicate index in step with a game PC slot write"""
+        get_pokemon_index().update_save_slot(save_path, box, slot, pokemon)
+
     # ------------------------------------------------------------------ #
     #  Sinew internal move                                                 #
     # ------------------------------------------------------------------ #
@@ -287,6 +300,22 @@ class PCBoxTransferMixin:
             f"{source_loc}\nto Sinew Storage {dest_box_num}?"
         )
 
+        # O(1) clone check against every save and Sinew storage
+        exclude = None
+        if source["type"] == "box":
+            exclude = pc_location(source.get("save_path"), source["box"], source["slot"])
+        copies = self._find_pokemon_copies(self.moving_pokemon, exclude=exclude)
+        if copies:
+            print(
+                f"[PCBox] Duplicate of {pokemon_name} already at: {copies}",
+                file=sys.stderr,
+                flush=True,
+            )
+            message = (
+                f"Duplicate found!\n{describe_location(copies[0])}\n\n"
+                f"Deposit {pokemon_name} anyway?"
+            )
+
         self.pending_move_dest = {
             "type": "sinew",
             "box": dest_box_num,
@@ -352,6 +381,7 @@ class PCBoxTransferMixin:
                 write_save_file(
                     source_save_path, source_save_data, create_backup_first=True
                 )
+                self._index_game_slot(source_save_path, source["box"], source["slot"], None)
                 print(
                     f"[PCBox] Cleared source slot in {source['game']}",
                     file=sys.stderr,
@@ -581,6 +611,7 @@ class PCBoxTransferMixin:
                 )
 
             write_save_file(dest_save_path, dest_save_data, create_backup_first=True)
+            self._index_game_slot(dest_save_path, dest["box"], dest["slot"], pokemon_copy)
 
             print(f"[PCBox] Written to {dest['game']}", file=sys.stderr, flush=True)
 
@@ -911,6 +942,10 @@ class PCBoxTransferMixin:
                     source_save_path, source_save_data, create_backup_first=True
                 )
 
+            if source["type"] == "box":
+                self._index_game_slot(source_save_path, source["box"], source["slot"], None)
+            self._index_game_slot(dest_save_path, dest["box"], dest["slot"], pokemon_copy)
+
             self.undo_action = {
                 "type": "move",
                 "move_type": "game_to_game",
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+"""
+Bulk .pk3 Import / Export
+Streams raw 80-byte PC Pokemon records between Sinew storage and a
+directory or .zip archive of .pk3 files.
+
+Import reads records in chunks, validates each chunk with the batch
+checksum/decrypt path (parser.crypto.validate_pokemon_batch) and places the
+valid ones into empty Sinew slots inside a single storage batch, so the
+storage index is written once no matter how many files are imported.
+
+Export walks storage with iter_pokemon(), so only one box is decoded at a
+time.
+
+Usage:
+    from pk3_transfer import import_pk3, export_pk3
+
+    result = import_pk3("/path/to/pk3_folder")      # or "collection.zip"
+    print(result.summary())
+
+    export_pk3("/path/to/backup.zip")
+"""
+
+import os
+import re
+import zipfile
+
+from parser.crypto import PK3_SIZE, validate_pokemon_batch
+from parser.pokemon import parse_pc_pokemon
+
+try:
+    from save_data_manager import get_species_name
+except ImportError:
+    get_species_name = lambda x: f"Pokemon #{x}"
+
+# Records validated / placed per chunk
+CHUNK_SIZE = 256
+
+# File extensions accepted on import (.pks is the reward format, same layout)
+PK3_EXTENSIONS = (".pk3", ".pks")
+
+
+class Pk3TransferResult:
+    """Outcome of a bulk import or export"""
+
+    def __init__(self):
+        self.processed = 0
+        self.transferred = 0
+        self.locations = []  # (box_number, slot) for imports, names for exports
+        self.errors = []  # (file_name, reason)
+        self.storage_full = False
+
+    def add_error(self, name, reason):
+        self.errors.append((name, reason))
+        print(f"[Pk3Transfer] {name}: {reason}")
+
+    def summary(self):
+        """Short human-readable summary"""
+        text = f"{self.transferred}/{self.processed} transferred"
+        if self.errors:
+            text += f", {len(self.errors)} failed"
+        if self.storage_full:
+            text += " (storage full)"
+        return text
+
+
+# ---------------------------------------------------------------------- #
+#  Reading records                                                         #
+# ---------------------------------------------------------------------- #
+
+
+def _is_pk3_name(name):
+    return name.lower().endswith(PK3_EXTENSIONS)
+
+
+def _iter_directory(path):
+    """Yield (name, bytes) for each .pk3 file in a directory, one at a time"""
+    with os.scandir(path) as it:
+        names = sorted(e.name for e in it if e.is_file() and _is_pk3_name(e.name))
+    for name in names:
+        try:
+            with open(os.path.join(path, name), "rb") as f:
+                yield name, f.read(PK3_SIZE + 1)
+        except OSError as e:
+            yield name, e
+
+
+def _iter_zip(path):
+    """Yield (name, bytes) for each .pk3 member of a zip, one at a time"""
+    with zipfile.ZipFile(path, "r") as zf:
+        members = sorted(
+            (i for i in zf.infolist() if not i.is_dir() and _is_pk3_name(i.filename)),
+            key=lambda i: i.filename,
+        )
+        for info in members:
+            try:
+                with zf.open(info) as f:
+                    yield info.filename, f.read(PK3_SIZE + 1)
+            except (OSError, zipfile.BadZipFile) as e:
+                yield info.filename, e
+
+
+def iter_pk3_records(source):
+    """
+    Stream (name, data) records from a directory or .zip archive.
+
+    data is the raw file contents (read at most one byte past 80 so wrong
+    sizes can be reported), or the exception raised while reading it.
+    """
+    if os.path.isdir(source):
+        return _iter_directory(source)
+    if zipfile.is_zipfile(source):
+        return _iter_zip(source)
+    raise ValueError(f"Not a directory or zip archive: {source}")
+
+
+def _iter_chunks(records, size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ---------------------------------------------------------------------- #
+#  Import                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+def _validate_chunk(chunk, result):
+    """
+    Validate a chunk of (name, data) records.
+
+    Returns:
+        list: (name, parsed_pokemon) for every record that passed
+    """
+    candidates = []
+    for name, data in chunk:
+        result.processed += 1
+        if isinstance(data, Exception):
+            result.add_error(name, f"read failed: {data}")
+        elif len(data) != PK3_SIZE:
+            result.add_error(name, f"expected {PK3_SIZE} bytes, got {len(data)}")
+        else:
+            candidates.append((name, data))
+
+    if not candidates:
+        return []
+
+    reasons = validate_pokemon_batch(b"".join(data for _, data in candidates))
+    valid = []
+    for (name, data), reason in zip(candidates, reasons):
+        if reason:
+            result.add_error(name, reason)
+            continue
+        pokemon = parse_pc_pokemon(data)
+        if pokemon is None:
+            result.add_error(name, "could not be parsed")
+            continue
+        pokemon["species_name"] = get_species_name(pokemon["species"])
+        valid.append((name, pokemon))
+    return valid
+
+
+def import_pk3(source, storage=None, progress_callback=None):
+    """
+    Import every .pk3 file in a directory or .zip into empty Sinew slots.
+
+    Files are read and validated CHUNK_SIZE at a time and all placements
+    happen inside one storage batch. Invalid files are skipped and
+    reported; once storage is full the remaining files are counted as
+    failed.
+
+    Args:
+        source: Directory or .zip archive path
+        storage: SinewStorage (defaults to the global one)
+        progress_callback: Optional fn(processed, transferred) per chunk
+
+    Returns:
+        Pk3TransferResult: locations holds the (box_number, slot) filled
+    """
+    result = Pk3TransferResult()
+    if storage is None:
+        from sinew_storage import get_sinew_storage
+
+        storage = get_sinew_storage()
+    if storage is None or not storage.is_loaded():
+        result.add_error(source, "Sinew storage not available")
+        return result
+
+    try:
+        records = iter_pk3_records(source)
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        result.add_error(source, str(e))
+        return result
+
+    empty_slots = storage.iter_empty_slots()
+    try:
+        with storage.batch():
+            for chunk in _iter_chunks(records, CHUNK_SIZE):
+                for name, pokemon in _validate_chunk(chunk, result):
+                    location = next(empty_slots, None)
+                    if location is None:
+                        result.storage_full = True
+                        result.add_error(name, "Sinew storage is full")
+                        continue
+                    storage.set_pokemon_at(location[0], location[1], pokemon)
+                    result.transferred += 1
+                    result.locations.append(location)
+                if progress_callback:
+                    progress_callback(result.processed, result.transferred)
+    except (OSError, zipfile.BadZipFile) as e:
+        result.add_error(source, f"read failed: {e}")
+
+    print(f"[Pk3Transfer] Import from {source}: {result.summary()}")
+    return result
+
+
+# ---------------------------------------------------------------------- #
+#  Export                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+def _export_name(box_number, slot, pokemon):
+    """File name for an exported record, e.g. 003-012_025_Pikachu.pk3"""
+    label = pokemon.get("nickname") or pokemon.get("species_name") or "Pokemon"
+    label = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_") or "Pokemon"
+    return f"{box_number:03d}-{slot + 1:03d}_{pokemon.get('species', 0):03d}_{label}.pk3"
+
+
+def export_pk3(dest, storage=None, progress_callback=None):
+    """
+    Export every Pokemon in Sinew storage as .pk3 files.
+
+    Args:
+        dest: Directory path, or a path ending in .zip to write an archive
+        storage: SinewStorage (defaults to the global one)
+        progress_callback: Optional fn(processed, transferred) per chunk
+
+    Returns:
+        Pk3TransferResult: locations holds the written file names
+    """
+    result = Pk3TransferResult()
+    if storage is None:
+        from sinew_storage import get_sinew_storage
+
+        storage = get_sinew_storage()
+    if storage is None or not storage.is_loaded():
+        result.add_error(dest, "Sinew storage not available")
+        return result
+
+    to_zip = dest.lower().endswith(".zip")
+    try:
+        if to_zip:
+            parent = os.path.dirname(dest)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            archive = zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED)
+        else:
+            os.makedirs(dest, exist_ok=True)
+            archive = None
+    except OSError as e:
+        result.add_error(dest, str(e))
+        return result
+
+    try:
+        for box_number, slot, pokemon in storage.iter_pokemon():
+            result.processed += 1
+            name = _export_name(box_number, slot, pokemon)
+            raw = pokemon.get("raw_bytes")
+            if not raw or len(raw) < PK3_SIZE:
+                result.add_error(name, "no raw data stored")
+                continue
+            data = bytes(raw[:PK3_SIZE])
+            try:
+                if archive is not None:
+                    archive.writestr(name, data)
+                else:
+                    with open(os.path.join(dest, name), "wb") as f:
+                        f.write(data)
+            except OSError as e:
+                result.add_error(name, str(e))
+                continue
+            result.transferred += 1
+            result.locations.append(name)
+            if progress_callback and result.processed % CHUNK_SIZE == 0:
+                progress_callback(result.processed, result.transferred)
+    finally:
+        if archive is not None:
+            archive.close()
+
+    if progress_callback:
+        progress_callback(result.processed, result.transferred)
+    print(f"[Pk3Transfer] Export to {dest}: {result.summary()}")
+    return result
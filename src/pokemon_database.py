@@ -3,6 +3,12 @@
 """
 Pokemon Database Manager
 Handles loading and managing Pokemon data and sprites
+
+Sprites aren't decoded in load(): the Gen3 sprites outside the atlas and
+the Showdown GIFs are queued on the asset loader at PRIORITY_LATER, and a
+Pokemon's surfaces are made (cheaply, from the decoded bytes) when it's
+fetched with get_pokemon(). Fetching one that isn't decoded yet moves it
+to the front of the queue.
 """
 
 import json
@@ -11,10 +17,19 @@ import os
 import pygame
 
 import config
+from asset_loader import (
+    PRIORITY_LATER,
+    PRIORITY_NOW,
+    decode_rgba,
+    decode_rgba_frames,
+    get_asset_loader,
+    to_surface,
+)
+from sprite_atlas import get_sprite_atlas, image_exists, load_image
 
 # Try to import PIL for GIF animation support
 try:
-    from PIL import Image, ImageSequence
+    import PIL  # noqa: F401
 
     PIL_AVAILABLE = True
 except ImportError:
@@ -38,13 +53,13 @@ class PokemonDatabase:
         with open(config.POKEMON_DB_PATH, "r", encoding="utf-8") as fh:
             self.pokemon_db = json.load(fh)
 
-        # Preload sprites
+        # Queue sprites on the asset loader
         self._preload_sprites()
 
         return self.pokemon_db
 
     def _preload_sprites(self):
-        """Preload all Pokemon sprites"""
+        """Resolve sprite paths and queue every Pokemon's sprites"""
         for pkey, p in self.pokemon_db.items():
             pid = int(p.get("id", int(pkey)))
             pid_str = f"{pid:03d}"
@@ -73,21 +88,19 @@ class PokemonDatabase:
         )
 
         pokemon_data["gen3_normal_path"] = (
-            gen3_path if os.path.exists(gen3_path) else None
+            gen3_path if image_exists(gen3_path) else None
         )
         pokemon_data["gen3_shiny_path"] = (
-            gen3_shiny_path if os.path.exists(gen3_shiny_path) else None
+            gen3_shiny_path if image_exists(gen3_shiny_path) else None
         )
 
-        if pokemon_data["gen3_normal_path"]:
-            try:
-                pokemon_data["image"] = pygame.image.load(
-                    pokemon_data["gen3_normal_path"]
-                ).convert_alpha()
-            except Exception:
-                pokemon_data["image"] = None
-        else:
-            pokemon_data["image"] = None
+        # Atlas sprites are subsurfaces of a resident page - no decode needed
+        pokemon_data["image"] = None
+        path = pokemon_data["gen3_normal_path"]
+        if path and not get_sprite_atlas().contains(path):
+            self._queue_asset(
+                pokemon_data, "image", ("dex_image", path), lambda: decode_rgba(path)
+            )
 
     def _load_showdown_sprites(self, pokemon_data, pid_str):
         """Load Showdown animated GIF sprites"""
@@ -119,35 +132,61 @@ class PokemonDatabase:
             self._load_gif_frames(pokemon_data, chosen)
 
     def _load_gif_frames(self, pokemon_data, gif_path):
-        """Load frames from a GIF file"""
+        """Queue the frames of a GIF file for decoding"""
         if self.PIL_AVAILABLE:
-            try:
-                pil_img = Image.open(gif_path)
-                frames = []
-                durations = []
-                for frame in ImageSequence.Iterator(pil_img):
-                    frame = frame.convert("RGBA")
-                    size = frame.size
-                    data = frame.tobytes()
-                    surf = pygame.image.frombuffer(data, size, "RGBA").convert_alpha()
-                    frames.append(surf)
-                    dur = frame.info.get("duration", config.SHOWDOWN_FRAME_MS_DEFAULT)
-                    durations.append(
-                        int(dur)
-                        if isinstance(dur, int)
-                        else config.SHOWDOWN_FRAME_MS_DEFAULT
-                    )
-                if frames:
-                    pokemon_data["_showdown_frames"] = frames
-                    pokemon_data["_showdown_frame_durations"] = durations
-                pil_img.close()
-            except Exception:
-                # Fallback to single frame
-                self._load_single_frame(pokemon_data, gif_path)
+            self._queue_asset(
+                pokemon_data,
+                "showdown",
+                ("dex_showdown", gif_path),
+                lambda: decode_rgba_frames(gif_path, config.SHOWDOWN_FRAME_MS_DEFAULT),
+            )
         else:
             # Without PIL, just load first frame
             self._load_single_frame(pokemon_data, gif_path)
 
+    def _queue_asset(self, pokemon_data, field, key, decode):
+        """Queue a decode whose result _finish_assets() stores under field"""
+        req = get_asset_loader().request(key, decode, PRIORITY_LATER)
+        pokemon_data.setdefault("_asset_requests", {})[field] = req
+
+    def _finish_assets(self, pokemon_data):
+        """
+        Turn this Pokemon's decoded sprites into surfaces (main thread);
+        anything still queued is moved to the front.
+        """
+        path = pokemon_data.get("gen3_normal_path")
+        if pokemon_data.get("image") is None and path:
+            if get_sprite_atlas().contains(path):
+                try:
+                    pokemon_data["image"] = load_image(path)
+                except Exception:
+                    pokemon_data["image"] = None
+
+        requests = pokemon_data.get("_asset_requests")
+        if not requests:
+            return
+        loader = get_asset_loader()
+        for field, req in list(requests.items()):
+            if not req.ready():
+                loader.request(req.key, req.decode, PRIORITY_NOW)
+                continue
+            del requests[field]
+            if field == "image":
+                if req.result is not None:
+                    pokemon_data["image"] = to_surface(req.result)
+            elif req.result:
+                pokemon_data["_showdown_frames"] = [
+                    to_surface(frame) for frame in req.result
+                ]
+                pokemon_data["_showdown_frame_durations"] = [
+                    frame[2] for frame in req.result
+                ]
+            else:
+                # Fallback to single frame
+                self._load_single_frame(pokemon_data, req.key[1])
+        if not requests:
+            del pokemon_data["_asset_requests"]
+
     def _load_single_frame(self, pokemon_data, gif_path):
         """Load GIF as a single static frame"""
         try:
@@ -161,8 +200,11 @@ class PokemonDatabase:
             pokemon_data["_showdown_frame_durations"] = None
 
     def get_pokemon(self, pokemon_id):
-        """Get Pokemon data by ID"""
-        return self.pokemon_db.get(str(pokemon_id))
+        """Get Pokemon data by ID (with whichever sprites are decoded)"""
+        pokemon_data = self.pokemon_db.get(str(pokemon_id))
+        if pokemon_data is not None:
+            self._finish_assets(pokemon_data)
+        return pokemon_data
 
     def get_all_pokemon(self):
         """Get all Pokemon data"""
@@ -8,6 +8,7 @@ Replaces the need for pre-made .pks files that cannot be legally distributed.
 Author: Sinew Development Team
 """
 
+import functools
 import json
 import os
 import random
@@ -16,6 +17,15 @@ from typing import Dict, List, Optional, Tuple, Union
 
 from config import ACH_REWARDS_PATH
 
+# numpy is optional - solve_pids() falls back to a pure Python loop
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -1573,6 +1583,25 @@ def encode_gen3_text(text: str, max_length: int = 10) -> bytes:
     return bytes(result)
 
 
+def _lower_index(table: Dict[str, int]) -> Dict[str, int]:
+    """Case-insensitive copy of a name table (first spelling wins)"""
+    index = {}
+    for name, value in table.items():
+        index.setdefault(name.lower(), value)
+    return index
+
+
+# Name -> ID lookups, built once instead of scanning the tables per call
+_SPECIES_BY_LOWER = _lower_index(SPECIES_NAME_TO_ID)
+_MOVES_BY_LOWER = _lower_index(MOVE_NAME_TO_ID)
+_ITEMS_BY_LOWER = _lower_index(ITEM_NAME_TO_ID)
+_LOCATIONS_BY_LOWER = _lower_index(LOCATION_NAME_TO_ID)
+_NATURES_BY_LOWER = {name.lower(): i for i, name in reversed(list(enumerate(NATURE_NAMES)))}
+_INTERNAL_TO_NATIONAL = {}
+for _national, _internal in NATIONAL_TO_INTERNAL.items():
+    _INTERNAL_TO_NATIONAL.setdefault(_internal, _national)
+
+
 def get_species_id(species: Union[str, int]) -> int:
     """Convert species name or ID to internal ID."""
     if isinstance(species, int):
@@ -1581,10 +1610,7 @@ def get_species_id(species: Union[str, int]) -> int:
         national_id = SPECIES_NAME_TO_ID.get(species, 0)
         if national_id == 0:
             # Try case-insensitive lookup
-            for name, sid in SPECIES_NAME_TO_ID.items():
-                if name.lower() == species.lower():
-                    national_id = sid
-                    break
+            national_id = _SPECIES_BY_LOWER.get(species.lower(), 0)
 
     # Convert to internal ID if Hoenn Pokemon
     if national_id >= 252:
@@ -1592,6 +1618,13 @@ def get_species_id(species: Union[str, int]) -> int:
     return national_id
 
 
+def get_national_id(species_id: int) -> int:
+    """Convert an internal species ID back to its National Dex ID."""
+    if species_id >= 277:
+        return _INTERNAL_TO_NATIONAL.get(species_id, species_id)
+    return species_id
+
+
 def get_move_id(move: Union[str, int]) -> int:
     """Convert move name or ID to move ID."""
     if isinstance(move, int):
@@ -1600,9 +1633,7 @@ def get_move_id(move: Union[str, int]) -> int:
     move_id = MOVE_NAME_TO_ID.get(move, 0)
     if move_id == 0:
         # Try case-insensitive lookup
-        for name, mid in MOVE_NAME_TO_ID.items():
-            if name.lower() == move.lower():
-                return mid
+        return _MOVES_BY_LOWER.get(move.lower(), 0)
     return move_id
 
 
@@ -1614,9 +1645,7 @@ def get_item_id(item: Union[str, int]) -> int:
     item_id = ITEM_NAME_TO_ID.get(item, 0)
     if item_id == 0:
         # Try case-insensitive lookup
-        for name, iid in ITEM_NAME_TO_ID.items():
-            if name.lower() == item.lower():
-                return iid
+        return _ITEMS_BY_LOWER.get(item.lower(), 0)
     return item_id
 
 
@@ -1625,13 +1654,10 @@ def get_location_id(location: Union[str, int]) -> int:
     if isinstance(location, int):
         return location
 
-    loc_id = LOCATION_NAME_TO_ID.get(location, 255)
-    if loc_id == 255 and location not in LOCATION_NAME_TO_ID:
-        # Try case-insensitive lookup
-        for name, lid in LOCATION_NAME_TO_ID.items():
-            if name.lower() == location.lower():
-                return lid
-    return loc_id
+    if location in LOCATION_NAME_TO_ID:
+        return LOCATION_NAME_TO_ID[location]
+    # Try case-insensitive lookup
+    return _LOCATIONS_BY_LOWER.get(location.lower(), 255)
 
 
 def get_nature_id(nature: Union[str, int]) -> int:
@@ -1642,22 +1668,13 @@ def get_nature_id(nature: Union[str, int]) -> int:
     if nature.upper() == "RANDOM":
         return random.randint(0, 24)
 
-    for i, name in enumerate(NATURE_NAMES):
-        if name.lower() == nature.lower():
-            return i
-
-    return 0  # Default to Hardy
+    return _NATURES_BY_LOWER.get(nature.lower(), 0)  # Default to Hardy
 
 
 def get_exp_for_level(species_id: int, level: int) -> int:
     """Get the experience needed for a given level."""
-    national_id = species_id
     # Convert internal to national if needed
-    if species_id >= 277:
-        for nat, internal in NATIONAL_TO_INTERNAL.items():
-            if internal == species_id:
-                national_id = nat
-                break
+    national_id = get_national_id(species_id)
 
     # Check growth rate
     if national_id in GROWTH_RATES.get("slow", {}):
@@ -1673,6 +1690,110 @@ def get_exp_for_level(species_id: int, level: int) -> int:
     return table[level - 1] if level <= len(table) else table[-1]
 
 
+# PID arithmetic mod 25: pid = (high << 16) | (upper << 8) | low_byte
+_HIGH_MOD = 65536 % 25  # 11
+_UPPER_MOD = 256 % 25  # 6
+_UPPER_INV = pow(_UPPER_MOD, -1, 25)  # 21
+
+
+def _pid_gender(gender: Optional[str], gender_ratio: int) -> Optional[bool]:
+    """True for female, False for male, None when the PID can't choose"""
+    if gender_ratio in (0, 254, 255) or not gender:
+        return None
+    gender = str(gender).upper()
+    if gender in ("F", "FEMALE"):
+        return True
+    if gender in ("M", "MALE"):
+        return False
+    return None  # RANDOM, GENDERLESS, ...
+
+
+@functools.lru_cache(maxsize=64)
+def _pid_low_bytes(gender_ratio: int, female: Optional[bool], ability: Optional[int]):
+    """
+    PID low bytes giving the requested gender and ability bit.
+
+    Gen 3 gender is female when (PID & 0xFF) < gender ratio; the ability
+    slot is the lowest PID bit.
+    """
+    low_bytes = tuple(
+        b
+        for b in range(256)
+        if (female is None or (b < gender_ratio) == female)
+        and (ability is None or (b & 1) == ability)
+    )
+    if not low_bytes:
+        raise ValueError(
+            f"No PID gives gender ratio {gender_ratio}, female={female}, ability={ability}"
+        )
+    return low_bytes
+
+
+def solve_pid(
+    nature_id: Optional[int],
+    trainer_id: int,
+    secret_id: int,
+    shiny: bool = False,
+    gender_ratio: int = 127,
+    gender: Optional[str] = None,
+    ability: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+) -> int:
+    """
+    Construct a random PID with the given nature, shininess, gender and
+    ability bit.
+
+    The PID is built rather than searched for: the low byte is drawn from
+    those giving the gender and ability, then the rest is solved for:
+
+    - Not shiny: the high half is random and PID % 25 fixes the upper byte
+      of the low half to about ten values, only one of which can be shiny.
+    - Shiny: the high half must be TID ^ SID ^ low ^ k (k < 8), leaving the
+      upper byte and k - 2048 candidates, which always contain every nature.
+
+    Args:
+        nature_id: 0-24, or None for any
+        gender: "M"/"MALE" or "F"/"FEMALE"; anything else leaves it to chance
+            (as do single-gender and genderless species)
+        ability: 0 or 1 for the PID's lowest bit, or None for either
+        rng: random.Random to draw from (the module's shared one if None)
+
+    Raises:
+        ValueError: If the gender and ability bit can't both be met
+    """
+    if rng is None:
+        rng = random
+    if nature_id is None:
+        nature_id = rng.randint(0, 24)
+    nature_id %= 25
+    tsv = (trainer_id ^ secret_id) & 0xFFFF
+    low_byte = rng.choice(
+        _pid_low_bytes(gender_ratio, _pid_gender(gender, gender_ratio), ability)
+    )
+
+    if not shiny:
+        high = rng.randint(0, 0xFFFF)
+        upper = (nature_id - _HIGH_MOD * high - low_byte) * _UPPER_INV % 25
+        uppers = list(range(upper, 256, 25))
+        rng.shuffle(uppers)
+        for upper in uppers:
+            low = (upper << 8) | low_byte
+            if tsv ^ high ^ low >= 8:
+                return (high << 16) | low
+
+    start = rng.randint(0, 2047)
+    for i in range(2048):
+        candidate = (start + i) & 2047
+        low = ((candidate >> 3) << 8) | low_byte
+        high = tsv ^ low ^ (candidate & 7)
+        pid = (high << 16) | low
+        if pid % 25 == nature_id:
+            return pid
+
+    # Unreachable: every (TSV, low byte) pair reaches all 25 natures
+    raise ValueError(f"No PID for nature {nature_id}")
+
+
 def generate_pid_for_nature_shiny(
     nature_id: int,
     trainer_id: int,
@@ -1686,43 +1807,109 @@ def generate_pid_for_nature_shiny(
     For shiny: (TID ^ SID ^ PID_high ^ PID_low) < 8
     For nature: PID % 25 == nature_id
     """
-    max_attempts = 10000
-
-    for _ in range(max_attempts):
-        # Generate random PID
-        pid = random.randint(0, 0xFFFFFFFF)
-
-        # Adjust for nature
-        current_nature = pid % 25
-        if current_nature != nature_id:
-            # Adjust PID to match nature while keeping other properties
-            pid = (pid // 25) * 25 + nature_id
-            if pid > 0xFFFFFFFF:
-                pid -= 25
-
-        # Check shiny status
-        pid_low = pid & 0xFFFF
-        pid_high = (pid >> 16) & 0xFFFF
-        shiny_value = trainer_id ^ secret_id ^ pid_low ^ pid_high
-        is_shiny = shiny_value < 8
-
-        if shiny == is_shiny:
-            return pid
+    return solve_pid(nature_id, trainer_id, secret_id, shiny, gender_ratio)
+
+
+def solve_pids(
+    count: int,
+    nature_id: Optional[int],
+    trainer_id: int,
+    secret_id: int,
+    shiny: bool = False,
+    gender_ratio: int = 127,
+    gender: Optional[str] = None,
+    ability: Optional[int] = None,
+    seed: Optional[int] = None,
+):
+    """
+    Construct count PIDs at once, each meeting the solve_pid() constraints.
 
-        # If we need shiny but got non-shiny, try to make it shiny
-        if shiny and not is_shiny:
-            # Manipulate PID high to make shiny while preserving nature
-            target_xor = random.randint(0, 7)
-            new_pid_high = trainer_id ^ secret_id ^ pid_low ^ target_xor
-            new_pid = (new_pid_high << 16) | pid_low
+    With numpy the whole batch is solved with array operations (shiny
+    requests pick from a table of every (upper byte, k) candidate per low
+    byte and nature), so the time is fixed by count and never retries.
+    Without numpy this falls back to calling solve_pid() count times.
 
-            # Check if nature is still correct
-            if new_pid % 25 == nature_id:
-                return new_pid
+    Args:
+        nature_id: 0-24, or None for a random nature per PID
+        seed: Seed for a reproducible batch (an int, or a numpy SeedSequence);
+            it seeds a private generator and never the shared random module
 
-    # Fallback - just return a PID with correct nature
-    base_pid = random.randint(0, 0xFFFFFFFF)
-    return (base_pid // 25) * 25 + nature_id
+    Returns:
+        numpy uint32 array (list of ints without numpy)
+    """
+    if not NUMPY_AVAILABLE:
+        rng = None if seed is None else random.Random(seed)
+        return [
+            solve_pid(
+                nature_id,
+                trainer_id,
+                secret_id,
+                shiny,
+                gender_ratio,
+                gender,
+                ability,
+                rng,
+            )
+            for _ in range(count)
+        ]
+
+    rng = np.random.default_rng(seed)
+    tsv = (trainer_id ^ secret_id) & 0xFFFF
+    low_bytes = np.array(
+        _pid_low_bytes(gender_ratio, _pid_gender(gender, gender_ratio), ability),
+        dtype=np.int64,
+    )
+    low_byte = rng.choice(low_bytes, size=count)
+    if nature_id is None:
+        nature = rng.integers(0, 25, size=count)
+    else:
+        nature = np.full(count, nature_id % 25, dtype=np.int64)
+
+    if shiny:
+        upper, k = _shiny_candidates(tsv, low_byte, nature, rng)
+        low = (upper << 8) | low_byte
+        high = tsv ^ low ^ k
+    else:
+        high = rng.integers(0, 0x10000, size=count)
+        upper = (nature - _HIGH_MOD * high - low_byte) * _UPPER_INV % 25
+        # Any upper + 25n up to 255 keeps the nature (10 or 11 choices)
+        choices = (255 - upper) // 25 + 1
+        upper += 25 * (rng.random(count) * choices).astype(np.int64)
+        low = (upper << 8) | low_byte
+        # At most one upper byte is shiny for a given high half
+        is_shiny = (tsv ^ high ^ low) < 8
+        upper = np.where(is_shiny, np.where(upper >= 25, upper - 25, upper + 25), upper)
+        low = (upper << 8) | low_byte
+
+    return ((high << 16) | low).astype(np.uint32)
+
+
+@functools.lru_cache(maxsize=8)
+def _shiny_table(tsv: int):
+    """
+    Every shiny (upper byte, k) candidate for each PID low byte, grouped by
+    nature: (order, starts, counts), with order[low][starts[low][n]:][:counts[low][n]]
+    the candidates (upper << 3 | k) of nature n.
+    """
+    candidates = np.arange(2048, dtype=np.int64)
+    lows = ((candidates >> 3) << 8)[None, :] | np.arange(256, dtype=np.int64)[:, None]
+    highs = tsv ^ lows ^ (candidates[None, :] & 7)
+    natures = ((highs << 16) | lows) % 25
+
+    order = np.argsort(natures, axis=1, kind="stable")
+    counts = np.stack([np.bincount(row, minlength=25) for row in natures])
+    starts = np.cumsum(counts, axis=1) - counts
+    return order, starts, counts
+
+
+def _shiny_candidates(tsv: int, low_byte, nature, rng):
+    """Random (upper byte, k) arrays making shiny PIDs of each nature"""
+    order, starts, counts = _shiny_table(tsv)
+    pick = starts[low_byte, nature] + (
+        rng.random(len(low_byte)) * counts[low_byte, nature]
+    ).astype(np.int64)
+    chosen = order[low_byte, pick]
+    return chosen >> 3, chosen & 7
 
 
 def calculate_checksum(data: bytes) -> int:
@@ -1748,66 +1935,133 @@ def encrypt_pokemon_data(decrypted: bytes, pid: int, ot_id: int) -> bytes:
 
 
 # =============================================================================
-# MAIN GENERATOR CLASS
+# COMPILED RECIPES
 # =============================================================================
 
+_LANGUAGE_CODES = {
+    "JPN": 0x0201,
+    "ENG": 0x0202,
+    "FRE": 0x0203,
+    "ITA": 0x0204,
+    "GER": 0x0205,
+    "SPA": 0x0207,
+}
 
-class PokemonGenerator:
+_IV_KEYS = ("hp", "attack", "defense", "speed", "sp_attack", "sp_defense")
+
+
+def assemble_pk3(header: bytes, substructs, pid: int, ot_id: int) -> bytes:
     """
-    Generates valid Gen 3 Pokemon byte data from recipe specifications.
+    Build the 80-byte Pokemon structure from its parts.
+
+    Gen 3 Box Pokemon Structure (80 bytes):
+    - 0-3: Personality Value (PID)
+    - 4-7: Original Trainer ID (OT ID)
+    - 8-17: Nickname (10 bytes)
+    - 18-19: Language
+    - 20-26: OT Name (7 bytes)
+    - 27: Markings
+    - 28-29: Checksum
+    - 30-31: Padding
+    - 32-79: Encrypted data (48 bytes - 4 substructures of 12 bytes each)
+
+    Args:
+        header: Bytes 8-27 (nickname, language, OT name, markings)
+        substructs: [growth, attacks, evs, misc], 12 bytes each
     """
+    data = bytearray(80)
+    pack_pk3_into(data, 0, header, substructs, pid, ot_id)
+    return bytes(data)
 
-    # Default trainer info for "Sinew" Pokemon
-    DEFAULT_TRAINER_ID = 31337
-    DEFAULT_SECRET_ID = 1337
-    DEFAULT_TRAINER_NAME = "Sinew"
 
-    def __init__(self):
-        self.recipes = {}
-        self._load_recipes()
+_WORDS = struct.Struct("<12I")
+_HALFWORDS = struct.Struct("<24H")
 
-    def _load_recipes(self):
-        """Load recipes from rewards.json if available."""
-        try:
-            if os.path.exists(ACH_REWARDS_PATH):
-                with open(ACH_REWARDS_PATH, "r") as f:
-                    data = json.load(f)
-                    # Use achievement ID as key if present, otherwise use species name
-                    # This prevents duplicate species from overwriting each other
-                    self.recipes = {}
-                    for r in data.get("rewards", []):
-                        key = r.get("achievement") or r.get("species", "")
-                        self.recipes[key] = r
-                    print(f"[PokemonGenerator] Loaded {len(
-                        self.recipes)} recipes from {ACH_REWARDS_PATH}")
-                    return
 
-        except Exception as e:
-            print(f"[PokemonGenerator] Could not load recipes: {e}")
-            self.recipes = {}
+def pack_pk3_into(out, offset: int, header: bytes, substructs, pid: int, ot_id: int):
+    """assemble_pk3() writing the 80 bytes into out[offset:offset + 80]"""
+    struct.pack_into("<II", out, offset, pid, ot_id)
+    out[offset + 8 : offset + 28] = header
 
-    def generate_pokemon(self, recipe: Dict) -> Tuple[bytes, Dict]:
-        """
-        Generate a Pokemon from a recipe specification.
+    # Arrange substructures based on PID
+    # Format: order[TYPE] = POSITION
+    order = PERMUTATIONS[pid % 24]
+    arranged = bytearray(48)
+    for type_idx, position in enumerate(order):
+        arranged[position * 12 : (position + 1) * 12] = substructs[type_idx]
 
-        Args:
-            recipe: Dict containing Pokemon specifications
+    # Calculate checksum before encryption
+    checksum = sum(_HALFWORDS.unpack(arranged)) & 0xFFFF
+    struct.pack_into("<HH", out, offset + 28, checksum, 0)
 
-        Returns:
-            Tuple of (80-byte Pokemon data, parsed Pokemon dict)
+    # Encrypt and store
+    key = pid ^ ot_id
+    _WORDS.pack_into(
+        out, offset + 32, *(word ^ key for word in _WORDS.unpack(arranged))
+    )
+
+
+class CompiledRecipe:
+    """
+    A recipe with every name resolved to an ID and the fixed parts of the
+    Pokemon structure prebuilt.
+
+    The nickname/OT header and the growth, attacks and EV substructures are
+    the same for every copy, so generate() only rolls the PID, IVs and (for
+    "RANDOM") the nature, then packs and encrypts.
+    """
+
+    __slots__ = (
+        "recipe",
+        "species_name",
+        "species_id",
+        "national_id",
+        "level",
+        "nature_id",
+        "move_ids",
+        "iv_min",
+        "iv_max",
+        "ot_name",
+        "location_id",
+        "held_item_id",
+        "shiny",
+        "ball_id",
+        "ability_slot",
+        "friendship",
+        "exp",
+        "trainer_id",
+        "secret_id",
+        "ot_id",
+        "gender_ratio",
+        "gender",
+        "warnings",
+        "_header",
+        "_growth",
+        "_attacks",
+        "_evs",
+        "_misc_origins",
+    )
+
+    def __init__(
+        self,
+        recipe: Dict,
+        trainer_id: int = 31337,
+        secret_id: int = 1337,
+        default_ot: str = "Sinew",
+    ):
+        """
+        Raises:
+            ValueError: If the species is unknown
         """
+        self.recipe = recipe
+        self.warnings = []
+
         # Extract recipe fields with defaults
-        species_name = recipe.get("species", "Mew")
-        level = recipe.get("level", 5)
+        species_name = str(recipe.get("species", "Mew"))
         nature_spec = recipe.get("nature", "RANDOM")
-        moves = recipe.get("moves", [])
         iv_spec = recipe.get("ivs", {"min": 0, "max": 31})
-        ot_name = recipe.get("ot", self.DEFAULT_TRAINER_NAME)
-        met_location = recipe.get("met_location", "Fateful Encounter")
-        held_item = recipe.get("held_item", None)
-        shiny = recipe.get("shiny", False)
         ball = recipe.get("ball", "Poke Ball")
-        ability_slot = recipe.get("ability", 0)  # 0 = slot 1, 1 = slot 2
+        held_item = recipe.get("held_item", None)
         friendship = recipe.get("friendship", None)
         language = recipe.get("language", "ENG")
 
@@ -1817,268 +2071,241 @@ class PokemonGenerator:
             raise ValueError(f"Unknown species: {species_name}")
 
         # Get national ID for lookups
-        national_id = species_id
-        if species_id >= 277:
-            for nat, internal in NATIONAL_TO_INTERNAL.items():
-                if internal == species_id:
-                    national_id = nat
-                    break
-
-        nature_id = get_nature_id(nature_spec)
-        location_id = get_location_id(met_location)
-        ball_id = get_item_id(ball)
-        if ball_id == 0:
-            ball_id = 4  # Default to Poke Ball
-
-        # Generate IVs
-        iv_min = iv_spec.get("min", 0)
-        iv_max = iv_spec.get("max", 31)
-        ivs = {
-            "hp": random.randint(iv_min, iv_max),
-            "attack": random.randint(iv_min, iv_max),
-            "defense": random.randint(iv_min, iv_max),
-            "speed": random.randint(iv_min, iv_max),
-            "sp_attack": random.randint(iv_min, iv_max),
-            "sp_defense": random.randint(iv_min, iv_max),
-        }
-
-        # Generate trainer IDs
-        trainer_id = self.DEFAULT_TRAINER_ID
-        secret_id = self.DEFAULT_SECRET_ID
-        ot_id = (secret_id << 16) | trainer_id
-
-        # Generate PID with correct nature and shiny status
-        gender_ratio = SPECIES_GENDER_RATIO.get(national_id, 127)
-        pid = generate_pid_for_nature_shiny(
-            nature_id, trainer_id, secret_id, shiny, gender_ratio
-        )
+        national_id = get_national_id(species_id)
+
+        self.species_name = species_name
+        self.species_id = species_id
+        self.national_id = national_id
+        self.level = recipe.get("level", 5)
+        self.shiny = recipe.get("shiny", False)
+        self.ability_slot = recipe.get("ability", 0)  # 0 = slot 1, 1 = slot 2
+        self.ot_name = recipe.get("ot", default_ot)
+        self.iv_min = iv_spec.get("min", 0)
+        self.iv_max = iv_spec.get("max", 31)
+
+        # None = rolled for every copy
+        if isinstance(nature_spec, str) and nature_spec.upper() == "RANDOM":
+            self.nature_id = None
+        else:
+            self.nature_id = get_nature_id(nature_spec)
 
-        # Calculate experience for level
-        exp = get_exp_for_level(species_id, level)
+        met_location = recipe.get("met_location", "Fateful Encounter")
+        self.location_id = get_location_id(met_location)
+        self.ball_id = get_item_id(ball)
+        if self.ball_id == 0:
+            self.ball_id = 4  # Default to Poke Ball
+        self.held_item_id = get_item_id(held_item) if held_item else 0
+        if held_item and not self.held_item_id:
+            self.warnings.append(f"unknown held item {held_item!r}")
+
+        # Convert move names to IDs, padded to 4 moves
+        move_ids = []
+        for move in recipe.get("moves", [])[:4]:
+            move_id = get_move_id(move)
+            if move_id > 0:
+                move_ids.append(move_id)
+            else:
+                self.warnings.append(f"unknown move {move!r}")
+        self.move_ids = tuple(move_ids + [0] * (4 - len(move_ids)))
 
         # Get base friendship
         if friendship is None:
             friendship = SPECIES_BASE_FRIENDSHIP.get(national_id, 70)
+        self.friendship = friendship
+        self.exp = get_exp_for_level(species_id, self.level)
+        self.gender_ratio = SPECIES_GENDER_RATIO.get(national_id, 127)
+        self.gender = recipe.get("gender")  # "MALE"/"FEMALE" picks the PID
+        fixed_gender = {0: "M", 254: "F"}.get(self.gender_ratio)
+        wanted = str(self.gender).upper()[:1] if self.gender else ""
+        if wanted in ("M", "F") and self.gender_ratio in (0, 254, 255):
+            if wanted != fixed_gender:
+                self.warnings.append(f"{species_name} can't be {self.gender}")
 
-        # Convert move names to IDs
-        move_ids = []
-        for move in moves[:4]:
-            move_id = get_move_id(move)
-            if move_id > 0:
-                move_ids.append(move_id)
+        # Generate trainer IDs
+        self.trainer_id = trainer_id
+        self.secret_id = secret_id
+        self.ot_id = (secret_id << 16) | trainer_id
+
+        # Header: nickname (10), language (2), OT name (7), markings (1)
+        header = bytearray(20)
+        header[0:10] = encode_gen3_text(species_name.upper()[:10], 10)
+        lang_code = _LANGUAGE_CODES.get(str(language).upper(), 0x0202)
+        struct.pack_into("<H", header, 10, lang_code)
+        header[12:19] = encode_gen3_text(self.ot_name, 7)
+        self._header = bytes(header)
+
+        # Growth substructure: species, held item, experience, PP bonuses,
+        # friendship, unknown
+        growth = bytearray(12)
+        struct.pack_into(
+            "<HHI", growth, 0, species_id, self.held_item_id, self.exp
+        )
+        growth[9] = friendship
+        self._growth = bytes(growth)
+
+        # Attacks substructure: 4 moves, then PP (max PP is recalculated
+        # when deposited)
+        attacks = bytearray(12)
+        for i, move_id in enumerate(self.move_ids):
+            struct.pack_into("<H", attacks, i * 2, move_id)
+            attacks[8 + i] = 35 if move_id > 0 else 0
+        self._attacks = bytes(attacks)
+
+        # EVs/Condition substructure - all 0 for newly generated Pokemon
+        self._evs = bytes(12)
+
+        # Misc: Pokerus, met location, then origins info: met level (7 bits),
+        # game (4 bits, 1 = Emerald), ball (4 bits), OT gender (1 bit, male)
+        met_level = min(self.level, 100)
+        game_of_origin = 1
+        self._misc_origins = (
+            (met_level & 0x7F)
+            | ((game_of_origin & 0xF) << 7)
+            | ((self.ball_id & 0xF) << 11)
+        )
+
+    def roll(self) -> Tuple[int, Dict[str, int], int]:
+        """Random nature, IVs and PID for one copy, as (nature_id, ivs, pid)"""
+        nature_id = self.nature_id
+        if nature_id is None:
+            nature_id = random.randint(0, 24)
+        ivs = {key: random.randint(self.iv_min, self.iv_max) for key in _IV_KEYS}
+        pid = solve_pid(
+            nature_id,
+            self.trainer_id,
+            self.secret_id,
+            self.shiny,
+            self.gender_ratio,
+            self.gender,
+            self.ability_slot & 0x1,
+        )
+        return nature_id, ivs, pid
+
+    def build_bytes(self, pid: int, ivs: Dict[str, int]) -> bytes:
+        """80-byte Pokemon structure for a given PID and IVs"""
+        return assemble_pk3(
+            self._header,
+            (self._growth, self._attacks, self._evs, self._build_misc(ivs)),
+            pid,
+            self.ot_id,
+        )
 
-        # Pad to 4 moves
-        while len(move_ids) < 4:
-            move_ids.append(0)
-
-        # Get held item ID
-        held_item_id = get_item_id(held_item) if held_item else 0
-
-        # Build the 80-byte Pokemon structure
-        pokemon_bytes = self._build_pokemon_bytes(
-            pid=pid,
-            ot_id=ot_id,
-            species_id=species_id,
-            held_item_id=held_item_id,
-            exp=exp,
-            friendship=friendship,
-            move_ids=move_ids,
-            ivs=ivs,
-            ability_slot=ability_slot,
-            location_id=location_id,
-            level=level,
-            ball_id=ball_id,
-            ot_name=ot_name,
-            nickname=species_name.upper()[:10],
-            language=language,
+    def pack_into(self, out, offset: int, pid: int, ivs: Dict[str, int]):
+        """build_bytes() writing into out[offset:offset + 80]"""
+        pack_pk3_into(
+            out,
+            offset,
+            self._header,
+            (self._growth, self._attacks, self._evs, self._build_misc(ivs)),
+            pid,
+            self.ot_id,
         )
 
-        # Build parsed Pokemon dict for display (use NATIONAL ID for Sinew)
-        pokemon_dict = {
-            "species": national_id,  # National dex ID for sprite lookup
-            "species_name": species_name,
-            "nickname": species_name.upper()[:10],
-            "level": level,
-            "experience": exp,
+    def _build_misc(self, ivs: Dict[str, int]) -> bytearray:
+        misc = bytearray(12)
+        misc[1] = self.location_id
+        struct.pack_into("<H", misc, 2, self._misc_origins)
+
+        # IV/Egg/Ability (4 bytes), egg flag clear
+        iv_egg = 0
+        for shift, key in enumerate(_IV_KEYS):
+            iv_egg |= (ivs[key] & 0x1F) << (shift * 5)
+        iv_egg |= (self.ability_slot & 0x1) << 31
+        struct.pack_into("<I", misc, 4, iv_egg)
+        return misc
+
+    def make_dict(self, pid: int, nature_id: int, ivs: Dict[str, int], data: bytes) -> Dict:
+        """Parsed Pokemon dict for display (NATIONAL ID for Sinew)"""
+        nickname = self.species_name.upper()[:10]
+        return {
+            "species": self.national_id,  # National dex ID for sprite lookup
+            "species_name": self.species_name,
+            "nickname": nickname,
+            "level": self.level,
+            "experience": self.exp,
             "nature": nature_id,
             "personality": pid,
-            "ot_id": ot_id,
-            "ot_name": ot_name,
-            "ivs": ivs,
-            "evs": {
-                "hp": 0,
-                "attack": 0,
-                "defense": 0,
-                "speed": 0,
-                "sp_attack": 0,
-                "sp_defense": 0,
-            },
-            "moves": [{"id": m, "pp": 0} for m in move_ids if m > 0],
-            "held_item": held_item_id,
-            "met_location": location_id,
-            "is_shiny": shiny,
-            "friendship": friendship,
-            "pokeball": ball_id,
-            "ability_num": ability_slot,
-            "raw_bytes": pokemon_bytes,
+            "ot_id": self.ot_id,
+            "ot_name": self.ot_name,
+            "ivs": dict(ivs),
+            "evs": {key: 0 for key in _IV_KEYS},
+            "moves": [{"id": m, "pp": 0} for m in self.move_ids if m > 0],
+            "held_item": self.held_item_id,
+            "met_location": self.location_id,
+            "is_shiny": self.shiny,
+            "friendship": self.friendship,
+            "pokeball": self.ball_id,
+            "ability_num": self.ability_slot,
+            "raw_bytes": data,
             "empty": False,
         }
 
-        return pokemon_bytes, pokemon_dict
+    def generate(self) -> Tuple[bytes, Dict]:
+        """Generate one copy: (80-byte Pokemon data, parsed Pokemon dict)"""
+        nature_id, ivs, pid = self.roll()
+        data = self.build_bytes(pid, ivs)
+        return data, self.make_dict(pid, nature_id, ivs, data)
 
-    def _build_pokemon_bytes(
-        self,
-        pid: int,
-        ot_id: int,
-        species_id: int,
-        held_item_id: int,
-        exp: int,
-        friendship: int,
-        move_ids: List[int],
-        ivs: Dict[str, int],
-        ability_slot: int,
-        location_id: int,
-        level: int,
-        ball_id: int,
-        ot_name: str,
-        nickname: str,
-        language: str = "ENG",
-    ) -> bytes:
-        """
-        Build the 80-byte Pokemon structure.
-
-        Gen 3 Box Pokemon Structure (80 bytes):
-        - 0-3: Personality Value (PID)
-        - 4-7: Original Trainer ID (OT ID)
-        - 8-17: Nickname (10 bytes)
-        - 18-19: Language
-        - 20-26: OT Name (7 bytes)
-        - 27: Markings
-        - 28-29: Checksum
-        - 30-31: Padding
-        - 32-79: Encrypted data (48 bytes - 4 substructures of 12 bytes each)
-        """
-        data = bytearray(80)
-
-        # Header
-        struct.pack_into("<I", data, 0, pid)  # PID
-        struct.pack_into("<I", data, 4, ot_id)  # OT ID
-
-        # Nickname (10 bytes, Gen 3 encoded)
-        nickname_bytes = encode_gen3_text(nickname, 10)
-        data[8:18] = nickname_bytes
-
-        # Language (2 bytes)
-        lang_codes = {
-            "JPN": 0x0201,
-            "ENG": 0x0202,
-            "FRE": 0x0203,
-            "ITA": 0x0204,
-            "GER": 0x0205,
-            "SPA": 0x0207,
-        }
-        lang_code = lang_codes.get(language.upper(), 0x0202)
-        struct.pack_into("<H", data, 18, lang_code)
-
-        # OT Name (7 bytes)
-        ot_bytes = encode_gen3_text(ot_name, 7)
-        data[20:27] = ot_bytes
 
-        # Markings (1 byte) - none
-        data[27] = 0
+# =============================================================================
+# MAIN GENERATOR CLASS
+# =============================================================================
 
-        # Build substructures (each 12 bytes)
-        # G = Growth, A = Attacks, E = EVs/Condition, M = Misc
 
-        # Growth substructure (12 bytes)
-        growth = bytearray(12)
-        struct.pack_into("<H", growth, 0, species_id)  # Species
-        struct.pack_into("<H", growth, 2, held_item_id)  # Held item
-        struct.pack_into("<I", growth, 4, exp)  # Experience
-        growth[8] = 0  # PP bonuses
-        growth[9] = friendship  # Friendship
-        growth[10] = 0  # Unknown
-        growth[11] = 0  # Unknown
-
-        # Attacks substructure (12 bytes)
-        attacks = bytearray(12)
-        for i, move_id in enumerate(move_ids[:4]):
-            struct.pack_into("<H", attacks, i * 2, move_id)
-        # PP values (4 bytes) - calculate based on moves
-        # For simplicity, use max PP (will be recalculated when deposited)
-        pp_values = [35, 35, 35, 35]  # Default PP
-        for i in range(4):
-            attacks[8 + i] = pp_values[i] if move_ids[i] > 0 else 0
-
-        # EVs/Condition substructure (12 bytes)
-        evs = bytearray(12)
-        # EVs (6 bytes) - all 0 for newly generated Pokemon
-        evs[0] = 0  # HP EV
-        evs[1] = 0  # Attack EV
-        evs[2] = 0  # Defense EV
-        evs[3] = 0  # Speed EV
-        evs[4] = 0  # Sp.Atk EV
-        evs[5] = 0  # Sp.Def EV
-        # Contest stats (6 bytes) - all 0
-        evs[6:12] = bytes(6)
-
-        # Misc substructure (12 bytes)
-        misc = bytearray(12)
-        misc[0] = 0  # Pokerus
-        misc[1] = location_id  # Met location
-
-        # Origins info (2 bytes): met level (7 bits), game (4 bits),
-        # ball (4 bits), OT gender (1 bit)
-        met_level = min(level, 100)
-        game_of_origin = 1  # Emerald
-        ot_gender = 0  # Male trainer
-        origins = (
-            (met_level & 0x7F)
-            | ((game_of_origin & 0xF) << 7)
-            | ((ball_id & 0xF) << 11)
-            | ((ot_gender & 0x1) << 15)
-        )
-        struct.pack_into("<H", misc, 2, origins)
+class PokemonGenerator:
+    """
+    Generates valid Gen 3 Pokemon byte data from recipe specifications.
+    """
 
-        # IV/Egg/Ability (4 bytes)
-        iv_egg = 0
-        iv_egg |= ivs["hp"] & 0x1F
-        iv_egg |= (ivs["attack"] & 0x1F) << 5
-        iv_egg |= (ivs["defense"] & 0x1F) << 10
-        iv_egg |= (ivs["speed"] & 0x1F) << 15
-        iv_egg |= (ivs["sp_attack"] & 0x1F) << 20
-        iv_egg |= (ivs["sp_defense"] & 0x1F) << 25
-        iv_egg |= (0 & 0x1) << 30  # Egg flag
-        iv_egg |= (ability_slot & 0x1) << 31  # Ability slot
-        struct.pack_into("<I", misc, 4, iv_egg)
+    # Default trainer info for "Sinew" Pokemon
+    DEFAULT_TRAINER_ID = 31337
+    DEFAULT_SECRET_ID = 1337
+    DEFAULT_TRAINER_NAME = "Sinew"
 
-        # Ribbons/Obedience (4 bytes)
-        ribbons = 0
-        struct.pack_into("<I", misc, 8, ribbons)
+    def __init__(self):
+        self.recipes = {}
+        self._load_recipes()
 
-        # Arrange substructures based on PID
-        perm_index = pid % 24
-        order = PERMUTATIONS[perm_index]
+    def _load_recipes(self):
+        """Load recipes from rewards.json if available."""
+        try:
+            if os.path.exists(ACH_REWARDS_PATH):
+                with open(ACH_REWARDS_PATH, "r") as f:
+                    data = json.load(f)
+                    # Use achievement ID as key if present, otherwise use species name
+                    # This prevents duplicate species from overwriting each other
+                    self.recipes = {}
+                    for r in data.get("rewards", []):
+                        key = r.get("achievement") or r.get("species", "")
+                        self.recipes[key] = r
+                    print(f"[PokemonGenerator] Loaded {len(
+                        self.recipes)} recipes from {ACH_REWARDS_PATH}")
+                    return
 
-        # Format: order[TYPE] = POSITION
-        # order[0] = position where Growth goes, order[1] = position where Attacks goes, etc.
-        substructs = [growth, attacks, evs, misc]  # indexed by type
-        arranged = bytearray(48)
-        for type_idx, position in enumerate(order):
-            arranged[position * 12 : (position + 1) * 12] = substructs[type_idx]
+        except Exception as e:
+            print(f"[PokemonGenerator] Could not load recipes: {e}")
+            self.recipes = {}
 
-        # Calculate checksum before encryption
-        checksum = calculate_checksum(bytes(arranged))
-        struct.pack_into("<H", data, 28, checksum)
+    def compile(self, recipe: Dict) -> CompiledRecipe:
+        """Resolve a recipe once so copies can be generated cheaply."""
+        return CompiledRecipe(
+            recipe,
+            self.DEFAULT_TRAINER_ID,
+            self.DEFAULT_SECRET_ID,
+            self.DEFAULT_TRAINER_NAME,
+        )
 
-        # Padding
-        struct.pack_into("<H", data, 30, 0)
+    def generate_pokemon(self, recipe: Dict) -> Tuple[bytes, Dict]:
+        """
+        Generate a Pokemon from a recipe specification.
 
-        # Encrypt and store
-        encrypted = encrypt_pokemon_data(bytes(arranged), pid, ot_id)
-        data[32:80] = encrypted
+        Args:
+            recipe: Dict containing Pokemon specifications
 
-        return bytes(data)
+        Returns:
+            Tuple of (80-byte Pokemon data, parsed Pokemon dict)
+        """
+        return self.compile(recipe).generate()
 
     def generate_for_achievement(
         self, achievement_id: str
@@ -2152,6 +2379,16 @@ def get_pokemon_generator() -> PokemonGenerator:
     return _generator_instance
 
 
+def compile_recipe(recipe: Dict) -> CompiledRecipe:
+    """Compile a recipe with the default Sinew trainer (no rewards.json read)."""
+    return CompiledRecipe(
+        recipe,
+        PokemonGenerator.DEFAULT_TRAINER_ID,
+        PokemonGenerator.DEFAULT_SECRET_ID,
+        PokemonGenerator.DEFAULT_TRAINER_NAME,
+    )
+
+
 def generate_pokemon_from_recipe(recipe: Dict) -> Tuple[bytes, Dict]:
     """Generate a Pokemon from a recipe specification."""
     return get_pokemon_generator().generate_pokemon(recipe)
@@ -2167,6 +2404,183 @@ def generate_echo_pokemon(species_name: str) -> Optional[Tuple[bytes, Dict]]:
     return get_pokemon_generator().generate_for_echo(species_name)
 
 
+# =============================================================================
+# BATCH GENERATION
+# =============================================================================
+
+
+class PokemonBatch:
+    """
+    count generated Pokemon packed back to back (80 bytes each) in one
+    buffer. Pokemon dicts are only built when asked for.
+    """
+
+    __slots__ = ("data", "offset", "count", "_recipes", "_records")
+
+    def __init__(self, data, offset: int, count: int, recipes, records):
+        self.data = data  # Buffer holding the records
+        self.offset = offset  # Where the first record starts in data
+        self.count = count
+        self._recipes = recipes  # CompiledRecipe per distinct override
+        self._records = records  # (recipe index, pid, ivs tuple) per record
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, index: int) -> bytes:
+        """80-byte Pokemon data of one record"""
+        start = self.offset + index * 80
+        return bytes(self.data[start : start + 80])
+
+    def pokemon(self, index: int) -> Dict:
+        """Parsed Pokemon dict of one record (as CompiledRecipe.generate)"""
+        recipe_idx, pid, ivs = self._records[index]
+        return self._recipes[recipe_idx].make_dict(
+            pid, pid % 25, dict(zip(_IV_KEYS, ivs)), self.record(index)
+        )
+
+    def pokemon_list(self) -> List[Dict]:
+        """Parsed Pokemon dicts of every record"""
+        return [self.pokemon(i) for i in range(self.count)]
+
+
+def generate_batch(
+    template: Dict,
+    count: int,
+    overrides: Optional[List[Dict]] = None,
+    out=None,
+    offset: int = 0,
+    seed: Optional[int] = None,
+) -> PokemonBatch:
+    """
+    Generate count Pokemon from one recipe template into a single buffer.
+
+    Each distinct override is merged over the template and compiled once;
+    PIDs for all records sharing a recipe are solved together by
+    solve_pids(). Nothing is allocated per record beyond its misc
+    substructure.
+
+    Args:
+        template: Recipe dict shared by every record
+        overrides: Recipe fields per record, e.g. [{"species": "Zigzagoon"}];
+            record i uses overrides[i % len(overrides)]
+        out: Preallocated buffer (bytearray, memoryview, ...) to write into;
+            a new bytearray of count * 80 bytes if None
+        offset: Byte offset of the first record in out
+        seed: Seed for a reproducible batch; PIDs and IVs of each recipe get
+            their own independent streams derived from it
+
+    Returns:
+        PokemonBatch over out
+
+    Raises:
+        ValueError: If out is too small or a recipe can't be compiled
+    """
+    if out is None:
+        out = bytearray(offset + count * 80)
+    elif len(out) < offset + count * 80:
+        raise ValueError(
+            f"Buffer holds {len(out)} bytes, {offset + count * 80} needed"
+        )
+    overrides = overrides or [{}]
+
+    # Compile each distinct override once
+    recipes = []
+    recipe_index = {}
+    override_recipe = []
+    for override in overrides:
+        key = json.dumps(override, sort_keys=True, default=str)
+        if key not in recipe_index:
+            recipe_index[key] = len(recipes)
+            recipes.append(compile_recipe({**template, **override}))
+        override_recipe.append(recipe_index[key])
+
+    # Records of each recipe, in output order
+    groups = [[] for _ in recipes]
+    for i in range(count):
+        groups[override_recipe[i % len(overrides)]].append(i)
+
+    # Two independent streams per recipe: PIDs, then IVs
+    if seed is None:
+        streams = [None] * (2 * len(recipes))
+    elif NUMPY_AVAILABLE:
+        streams = np.random.SeedSequence(seed).spawn(2 * len(recipes))
+    else:
+        seeder = random.Random(seed)
+        streams = [seeder.getrandbits(64) for _ in range(2 * len(recipes))]
+
+    records = [None] * count
+    for group_no, (recipe, indices) in enumerate(zip(recipes, groups)):
+        if not indices:
+            continue
+        pid_stream, iv_stream = streams[2 * group_no : 2 * group_no + 2]
+        pids = solve_pids(
+            len(indices),
+            recipe.nature_id,
+            recipe.trainer_id,
+            recipe.secret_id,
+            recipe.shiny,
+            recipe.gender_ratio,
+            recipe.gender,
+            recipe.ability_slot & 0x1,
+            seed=pid_stream,
+        )
+        if NUMPY_AVAILABLE:
+            rng = np.random.default_rng(iv_stream)
+            iv_rows = rng.integers(
+                recipe.iv_min, recipe.iv_max + 1, size=(len(indices), 6)
+            ).tolist()
+        else:
+            rng = random.Random(iv_stream)
+            iv_rows = [
+                [rng.randint(recipe.iv_min, recipe.iv_max) for _ in _IV_KEYS]
+                for _ in indices
+            ]
+
+        for i, pid, iv_row in zip(indices, pids, iv_rows):
+            pid = int(pid)
+            ivs = tuple(iv_row)
+            recipe.pack_into(out, offset + i * 80, pid, dict(zip(_IV_KEYS, ivs)))
+            records[i] = (override_recipe[i % len(overrides)], pid, ivs)
+
+    return PokemonBatch(out, offset, count, recipes, records)
+
+
+def fill_sinew_box(
+    box_number: int,
+    template: Dict,
+    overrides: Optional[List[Dict]] = None,
+    storage=None,
+    seed: Optional[int] = None,
+) -> int:
+    """
+    Fill the empty slots of a Sinew storage box from one recipe template.
+
+    Occupied slots are left alone; the box is saved once at the end.
+
+    Returns:
+        int: Number of Pokemon placed
+    """
+    if storage is None:
+        from sinew_storage import get_sinew_storage
+
+        storage = get_sinew_storage()
+
+    if not 1 <= box_number <= storage.get_box_count():
+        return 0
+    box = storage.get_box(box_number)
+    empty = [slot for slot, pokemon in enumerate(box) if pokemon is None]
+    if not empty:
+        return 0
+
+    batch = generate_batch(template, len(empty), overrides, seed=seed)
+    with storage.batch():
+        for i, slot in enumerate(empty):
+            storage.set_pokemon_at(box_number, slot, batch.pokemon(i))
+    print(f"[PokemonGenerator] Filled {len(empty)} slots of Sinew box {box_number}")
+    return len(empty)
+
+
 # =============================================================================
 # TEST
 # =============================================================================
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+
+"""
+Pokemon Fingerprint Index
+Cross-collection duplicate / clone detection for game saves and Sinew storage.
+
+Every Pokemon is identified by a fingerprint:
+    (personality, ot_id, species, checksum)
+
+The checksum is the PK3 header checksum at offset 0x1C of the raw 80 bytes,
+so two copies only match when their stored data is byte-identical in
+practice, not merely the same PID/OT.
+
+The index maps fingerprint -> set of locations, and location -> fingerprint,
+so "does this Pokemon already exist elsewhere?" is a single dict lookup.
+It is built once in a single pass over all saves and storage, then kept up
+to date incrementally by SinewStorage and the PC Box transfer paths.
+
+Location tuples:
+    ("sinew", box_number, slot)
+    ("pc", save_path, box_number, slot)     # slot is 0-indexed
+    ("party", save_path, slot)
+"""
+
+import base64
+import os
+import struct
+
+# Offset of the 16-bit checksum in a PK3 record
+PK3_CHECKSUM_OFFSET = 0x1C
+
+
+def sinew_location(box_number, slot):
+    """Location tuple for a Sinew storage slot"""
+    return ("sinew", box_number, slot)
+
+
+def pc_location(save_path, box_number, slot):
+    """Location tuple for a game PC slot (box 1-indexed, slot 0-indexed)"""
+    return ("pc", save_path, box_number, slot)
+
+
+def party_location(save_path, slot):
+    """Location tuple for a game party slot"""
+    return ("party", save_path, slot)
+
+
+def describe_location(location, game_names=None):
+    """
+    Human-readable description of a location.
+
+    Args:
+        location: Location tuple
+        game_names: Optional {save_path: game_name} for nicer labels
+
+    Returns:
+        str: e.g. "Sinew Box 3 Slot 12" or "Emerald Box 2 Slot 5"
+    """
+    kind = location[0]
+    if kind == "sinew":
+        return f"Sinew Box {location[1]} Slot {location[2] + 1}"
+
+    save_path = location[1]
+    game = (game_names or {}).get(save_path) or os.path.splitext(
+        os.path.basename(save_path)
+    )[0]
+    if kind == "pc":
+        return f"{game} Box {location[2]} Slot {location[3] + 1}"
+    return f"{game} Party Slot {location[2] + 1}"
+
+
+def get_fingerprint(pokemon):
+    """
+    Compute the fingerprint for a Pokemon dict.
+
+    Accepts parser dicts (raw_bytes) and stored Sinew dicts (raw_bytes_b64).
+
+    Returns:
+        tuple or None: (personality, ot_id, species, checksum), None if empty
+    """
+    if not pokemon or pokemon.get("empty"):
+        return None
+    species = pokemon.get("species", 0)
+    if not species:
+        return None
+
+    raw = pokemon.get("raw_bytes")
+    if raw is None and pokemon.get("raw_bytes_b64"):
+        try:
+            raw = base64.b64decode(pokemon["raw_bytes_b64"])
+        except Exception:
+            raw = None
+
+    checksum = pokemon.get("checksum", 0)
+    if raw and len(raw) >= PK3_CHECKSUM_OFFSET + 2:
+        checksum = struct.unpack_from("<H", raw, PK3_CHECKSUM_OFFSET)[0]
+
+    return (
+        pokemon.get("personality", 0),
+        pokemon.get("ot_id", 0),
+        species,
+        checksum,
+    )
+
+
+def _save_stamp(save_path):
+    """(size, mtime) of a save file, or None if missing"""
+    try:
+        st = os.stat(save_path)
+        return (st.st_size, st.st_mtime)
+    except OSError:
+        return None
+
+
+class PokemonFingerprintIndex:
+    """
+    Fingerprint -> locations index over every known Pokemon.
+
+    Until build() has run the index is empty and incremental updates are
+    ignored; the first build() does the full single pass.
+    """
+
+    def __init__(self):
+        self._by_fp = {}  # fingerprint -> set(location)
+        self._by_loc = {}  # location -> fingerprint
+        self._by_save = {}  # save_path -> set(location)
+        self._save_stamps = {}  # save_path -> (size, mtime) when indexed
+        self.built = False
+
+    # ------------------------------------------------------------------ #
+    #  Incremental maintenance                                             #
+    # ------------------------------------------------------------------ #
+
+    def _add(self, location, fp):
+        self._by_loc[location] = fp
+        self._by_fp.setdefault(fp, set()).add(location)
+        if location[0] != "sinew":
+            self._by_save.setdefault(location[1], set()).add(location)
+
+    def remove(self, location):
+        """Forget whatever Pokemon was indexed at location"""
+        fp = self._by_loc.pop(location, None)
+        if fp is None:
+            return
+        locs = self._by_fp.get(fp)
+        if locs is not None:
+            locs.discard(location)
+            if not locs:
+                del self._by_fp[fp]
+        if location[0] != "sinew":
+            save_locs = self._by_save.get(location[1])
+            if save_locs is not None:
+                save_locs.discard(location)
+
+    def update(self, location, pokemon):
+        """
+        Record that location now holds pokemon (None to clear it).
+
+        No-op until the index has been built.
+        """
+        if not self.built:
+            return
+        self.remove(location)
+        fp = get_fingerprint(pokemon)
+        if fp is not None:
+            self._add(location, fp)
+
+    def update_save_slot(self, save_path, box_number, slot, pokemon):
+        """
+        Record a change to a game PC slot made by Sinew itself.
+
+        The save's stamp is refreshed so the write is not mistaken for an
+        outside change that needs a re-index.
+        """
+        if not self.built or not save_path:
+            return
+        self.update(pc_location(save_path, box_number, slot), pokemon)
+        if save_path in self._save_stamps:
+            self._save_stamps[save_path] = _save_stamp(save_path)
+
+    def forget_save(self, save_path):
+        """Drop every location belonging to a save"""
+        for location in list(self._by_save.pop(save_path, ())):
+            self.remove(location)
+        self._save_stamps.pop(save_path, None)
+
+    def index_save(self, save_path, parser=None):
+        """
+        (Re)index the party and PC of one save.
+
+        Args:
+            save_path: Path to the save file
+            parser: Optional already-loaded Gen3SaveParser for this save
+        """
+        self.forget_save(save_path)
+        if parser is None:
+            parser = self._load_parser(save_path)
+        if parser is None or not parser.loaded:
+            return
+
+        for slot, pokemon in enumerate(parser.party_pokemon or []):
+            fp = get_fingerprint(pokemon)
+            if fp is not None:
+                self._add(party_location(save_path, slot), fp)
+
+        for pokemon in parser.pc_boxes or []:
+            fp = get_fingerprint(pokemon)
+            if fp is not None:
+                location = pc_location(
+                    save_path, pokemon.get("box_number", 0), pokemon.get("box_slot", 1) - 1
+                )
+                self._add(location, fp)
+
+        self._save_stamps[save_path] = _save_stamp(save_path)
+
+    def index_sinew(self, storage):
+        """(Re)index every Pokemon in Sinew storage"""
+        for location in [loc for loc in self._by_loc if loc[0] == "sinew"]:
+            self.remove(location)
+        if storage is None or not storage.is_loaded():
+            return
+        for box_number, slot, pokemon in storage.iter_pokemon():
+            fp = get_fingerprint(pokemon)
+            if fp is not None:
+                self._add(sinew_location(box_number, slot), fp)
+
+    @staticmethod
+    def _load_parser(save_path):
+        """Parse save_path fresh (the shared save cache may predate a write)"""
+        if not save_path or not os.path.exists(save_path):
+            return None
+        try:
+            from parser.gen3_parser import Gen3SaveParser
+
+            parser = Gen3SaveParser()
+            parser.load(save_path)
+            return parser
+        except Exception as e:
+            print(f"[PokemonIndex] Could not parse {save_path}: {e}")
+            return None
+
+    # ------------------------------------------------------------------ #
+    #  Building                                                            #
+    # ------------------------------------------------------------------ #
+
+    def build(self, save_paths, storage=None):
+        """
+        Build the whole index in one pass over all saves and storage.
+
+        Args:
+            save_paths: Iterable of save file paths
+            storage: SinewStorage instance (defaults to the global one)
+        """
+        self._by_fp.clear()
+        self._by_loc.clear()
+        self._by_save.clear()
+        self._save_stamps.clear()
+        self.built = True
+
+        for save_path in save_paths:
+            self.index_save(save_path)
+
+        if storage is None:
+            storage = _get_storage()
+        self.index_sinew(storage)
+
+        print(
+            f"[PokemonIndex] Indexed {len(self._by_loc)} Pokemon,"
+            f" {self.get_duplicate_group_count()} duplicate groups"
+        )
+
+    def ensure_built(self, save_paths, storage=None):
+        """
+        Build on first use; afterwards only re-index saves changed on disk.
+
+        A save changes outside Sinew when the emulator writes it, so its
+        (size, mtime) stamp is compared before trusting the index.
+        """
+        save_paths = [p for p in save_paths if p]
+        if not self.built:
+            self.build(save_paths, storage)
+            return
+
+        for save_path in save_paths:
+            if self._save_stamps.get(save_path) != _save_stamp(save_path):
+                self.index_save(save_path)
+        for save_path in list(self._save_stamps):
+            if save_path not in save_paths:
+                self.forget_save(save_path)
+
+    # ------------------------------------------------------------------ #
+    #  Queries                                                             #
+    # ------------------------------------------------------------------ #
+
+    def find(self, pokemon):
+        """All locations holding a copy of pokemon"""
+        fp = get_fingerprint(pokemon)
+        if fp is None:
+            return set()
+        return set(self._by_fp.get(fp, ()))
+
+    def find_elsewhere(self, pokemon, exclude=None):
+        """
+        Locations other than exclude that hold a copy of pokemon.
+
+        Args:
+            pokemon: Pokemon dict
+            exclude: Location (or iterable of locations) to ignore
+
+        Returns:
+            list: Sorted location tuples
+        """
+        locations = self.find(pokemon)
+        if exclude is not None:
+            if isinstance(exclude, tuple):
+                exclude = (exclude,)
+            locations.difference_update(exclude)
+        return sorted(locations, key=str)
+
+    def exists_elsewhere(self, pokemon, exclude=None):
+        """True if a copy of pokemon is indexed anywhere except exclude"""
+        return bool(self.find_elsewhere(pokemon, exclude))
+
+    def get_indexed_count(self):
+        """Number of indexed Pokemon locations"""
+        return len(self._by_loc)
+
+    def get_duplicate_group_count(self):
+        """Number of fingerprints present in more than one location"""
+        return sum(1 for locs in self._by_fp.values() if len(locs) > 1)
+
+    def get_duplicates(self):
+        """
+        Every fingerprint that appears in more than one location.
+
+        Returns:
+            list: [{"fingerprint": tuple, "species": int, "locations": [...]}]
+        """
+        report = []
+        for fp, locs in self._by_fp.items():
+            if len(locs) > 1:
+                report.append(
+                    {
+                        "fingerprint": fp,
+                        "species": fp[2],
+                        "locations": sorted(locs, key=str),
+                    }
+                )
+        report.sort(key=lambda entry: (entry["species"], entry["fingerprint"]))
+        return report
+
+
+def _get_storage():
+    """Global SinewStorage if available"""
+    try:
+        from sinew_storage import get_sinew_storage
+
+        return get_sinew_storage()
+    except ImportError:
+        return None
+
+
+def build_duplicate_report(save_paths, storage=None):
+    """
+    Rebuild the global index in a single pass and return its duplicates.
+
+    Args:
+        save_paths: Iterable of save file paths
+        storage: Optional SinewStorage (defaults to the global one)
+
+    Returns:
+        list: See PokemonFingerprintIndex.get_duplicates()
+    """
+    index = get_pokemon_index()
+    index.build(save_paths, storage)
+    return index.get_duplicates()
+
+
+# Global singleton instance
+_pokemon_index = None
+
+
+def get_pokemon_index():
+    """Get the global PokemonFingerprintIndex instance"""
+    global _pokemon_index
+    if _pokemon_index is None:
+        _pokemon_index = PokemonFingerprintIndex()
+    return _pokemon_index
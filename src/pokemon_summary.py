@@ -11,6 +11,8 @@ from config import POKEMON_DB_PATH
 
 import pygame
 
+from sprite_service import get_sprite_service
+
 # Import config for paths
 try:
     import config
@@ -490,9 +492,11 @@ class PokemonSummary:
             try:
                 sprite_path = self.manager.get_gen3_sprite_path(self.pokemon)
                 if sprite_path and os.path.exists(sprite_path):
-                    self.sprite = pygame.image.load(sprite_path).convert_alpha()
-                    self.sprite = pygame.transform.scale(self.sprite, (96, 96))
-                    return
+                    self.sprite = get_sprite_service().get_path(
+                        sprite_path, (96, 96), scale="pixel"
+                    )
+                    if self.sprite:
+                        return
             except Exception as e:
                 print(f"[PokemonSummary] Manager sprite load failed: {e}")
 
@@ -509,12 +513,11 @@ class PokemonSummary:
 
             for path in sprite_paths:
                 if os.path.exists(path):
-                    try:
-                        self.sprite = pygame.image.load(path).convert_alpha()
-                        self.sprite = pygame.transform.scale(self.sprite, (96, 96))
+                    self.sprite = get_sprite_service().get_path(
+                        path, (96, 96), scale="pixel"
+                    )
+                    if self.sprite:
                         return
-                    except Exception:
-                        pass
 
         # Method 3: Check if sprite was passed in pokemon data directly
         if self.pokemon.get("sprite"):
@@ -534,12 +537,11 @@ class PokemonSummary:
                 sprite_paths = [config.get_sprite_path(species, sprite_type="gen3")]
                 for path in sprite_paths:
                     if os.path.exists(path):
-                        try:
-                            self.sprite = pygame.image.load(path).convert_alpha()
-                            self.sprite = pygame.transform.scale(self.sprite, (96, 96))
+                        self.sprite = get_sprite_service().get_path(
+                            path, (96, 96), scale="pixel"
+                        )
+                        if self.sprite:
                             return
-                        except Exception:
-                            pass
 
         # Method 5: If all else fails, print debug info
         print(
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+"""
+Reward Factory
+Ready-made reward Pokemon for achievement claims and Echo exchanges.
+
+rewards.json is read and every recipe compiled and validated once, and
+again only when the file changes on disk. A small background pool keeps
+READY_PER_RECIPE freshly generated copies queued per recipe, so a claim
+pops finished PK3 bytes instead of rolling a PID and encrypting on the UI
+thread. Every copy is handed out once - each claim still gets its own PID.
+
+Usage:
+    factory = get_reward_factory()
+    factory.prefill()                                # at startup
+
+    result = factory.take_achievement("SINEW_030")   # (bytes, dict) or None
+    result = factory.take_echo("Smeargle")
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import ACH_REWARDS_PATH
+from pokemon_generator import SPECIES_NAME_TO_ID, compile_recipe
+
+# Generated copies kept waiting per recipe
+READY_PER_RECIPE = 2
+
+# Threads generating copies in the background
+POOL_WORKERS = 2
+
+
+class RewardFactory:
+    """Compiled reward recipes with a queue of ready copies for each"""
+
+    def __init__(self, path=ACH_REWARDS_PATH):
+        self.path = path
+        self.recipes = {}  # key (achievement ID or species) -> CompiledRecipe
+        self.errors = []  # (key, message) for recipes that failed to compile
+        self._echo_keys = {}  # lower-case species -> recipe key
+        self._ready = {}  # key -> deque of (bytes, dict)
+        self._pending = {}  # key -> copies being generated
+        self._lock = threading.Lock()
+        self._pool = None
+        self._mtime = None
+        self._loaded = False
+        self._generation = 0  # Bumped on reload; stale copies are dropped
+
+    # ------------------------------------------------------------------ #
+    #  Recipes                                                             #
+    # ------------------------------------------------------------------ #
+
+    def refresh(self):
+        """Load rewards.json on first use, or again if it changed"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._loaded and mtime == self._mtime:
+            return
+        self._load(mtime)
+
+    def _load(self, mtime):
+        recipes = {}
+        errors = []
+        echo_keys = {}
+
+        data = {}
+        if mtime is not None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"[RewardFactory] Could not load recipes: {e}")
+
+        # Use achievement ID as key if present, otherwise use species name
+        # This prevents duplicate species from overwriting each other
+        for recipe in data.get("rewards", []):
+            key = recipe.get("achievement") or recipe.get("species", "")
+            try:
+                compiled = compile_recipe(recipe)
+            except Exception as e:
+                errors.append((key, str(e)))
+                print(f"[RewardFactory] Recipe {key!r} rejected: {e}")
+                continue
+            for warning in compiled.warnings:
+                print(f"[RewardFactory] Recipe {key!r}: {warning}")
+            recipes[key] = compiled
+            if recipe.get("delivery") == "echo":
+                echo_keys.setdefault(compiled.species_name.lower(), key)
+
+        with self._lock:
+            self.recipes = recipes
+            self.errors = errors
+            self._echo_keys = echo_keys
+            self._ready = {}
+            self._pending = {}
+            self._generation += 1
+            self._mtime = mtime
+            self._loaded = True
+        print(f"[RewardFactory] Compiled {len(recipes)} recipes from {self.path}")
+
+    # ------------------------------------------------------------------ #
+    #  Ready queues                                                        #
+    # ------------------------------------------------------------------ #
+
+    def prefill(self):
+        """Queue READY_PER_RECIPE copies of every recipe in the background"""
+        self.refresh()
+        for key in list(self.recipes):
+            self._refill(key)
+
+    def _refill(self, key):
+        with self._lock:
+            missing = (
+                READY_PER_RECIPE
+                - len(self._ready.get(key, ()))
+                - self._pending.get(key, 0)
+            )
+            if missing <= 0:
+                return
+            self._pending[key] = self._pending.get(key, 0) + missing
+            generation = self._generation
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=POOL_WORKERS, thread_name_prefix="RewardFactory"
+                )
+        for _ in range(missing):
+            self._pool.submit(self._generate_copy, key, generation)
+
+    def _generate_copy(self, key, generation):
+        result = None
+        try:
+            recipe = self.recipes.get(key)
+            if recipe is not None:
+                result = recipe.generate()
+        except Exception as e:
+            print(f"[RewardFactory] Could not generate {key!r}: {e}")
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._pending[key] = max(0, self._pending.get(key, 0) - 1)
+            if result is not None:
+                self._ready.setdefault(key, deque()).append(result)
+
+    def _take(self, key):
+        """A ready copy of recipe key (generated now if none is waiting)"""
+        recipe = self.recipes.get(key)
+        if recipe is None:
+            return None
+        with self._lock:
+            queue = self._ready.get(key)
+            result = queue.popleft() if queue else None
+        if result is None:
+            result = recipe.generate()
+        self._refill(key)
+        return result
+
+    def ready_count(self, key):
+        """Copies of a recipe waiting to be taken"""
+        with self._lock:
+            return len(self._ready.get(key, ()))
+
+    # ------------------------------------------------------------------ #
+    #  Rewards                                                             #
+    # ------------------------------------------------------------------ #
+
+    def take_achievement(self, achievement_id):
+        """
+        Reward Pokemon for an achievement.
+
+        Returns:
+            (80-byte Pokemon data, parsed Pokemon dict), or None if no
+            recipe exists
+        """
+        self.refresh()
+        if achievement_id in self.recipes:
+            return self._take(achievement_id)
+
+        # Fallback: search through recipes
+        for key, recipe in self.recipes.items():
+            if recipe.recipe.get("achievement") == achievement_id:
+                return self._take(key)
+        return None
+
+    def take_echo(self, species_name):
+        """
+        Pokemon for the Echo (Altering Cave) system.
+
+        Species without an echo recipe get a basic level 30 recipe, compiled
+        once and queued like the others.
+        """
+        self.refresh()
+        key = self._echo_keys.get(species_name.lower())
+        if key is not None:
+            return self._take(key)
+
+        if species_name not in SPECIES_NAME_TO_ID:
+            return None
+
+        key = f"echo:{species_name}"
+        if key not in self.recipes:
+            basic_recipe = {
+                "species": species_name,
+                "level": 30,
+                "nature": "RANDOM",
+                "moves": [],
+                "ivs": {"min": 0, "max": 31},
+                "ot": "Sinew",
+                "met_location": "Altering Cave",
+                "delivery": "echo",
+            }
+            try:
+                self.recipes[key] = compile_recipe(basic_recipe)
+            except Exception as e:
+                print(f"[RewardFactory] Could not compile echo {species_name}: {e}")
+                return None
+        return self._take(key)
+
+
+_factory = None
+
+
+def get_reward_factory():
+    """Get or create the shared RewardFactory"""
+    global _factory
+    if _factory is None:
+        _factory = RewardFactory()
+    return _factory
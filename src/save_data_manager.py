@@ -121,6 +121,16 @@ def get_cached_parser(save_path):
     return _save_cache.get(save_path)
 
 
+def cache_parser(save_path, parser):
+    """
+    Put an already loaded parser into the cache (main thread).
+
+    Used for parsers made off the main thread with load_save(use_cache=False),
+    so the next load_save() of the path is a cache hit.
+    """
+    _save_cache[save_path] = parser
+
+
 def clear_save_cache():
     """Clear the save cache."""
     global _save_cache
@@ -149,7 +159,7 @@ class SaveDataManager:
         self.current_game_hint = None  # Store game hint for reload
         self.loaded = False
 
-    def load_save(self, save_path, game_hint=None):
+    def load_save(self, save_path, game_hint=None, use_cache=True):
         """
         Load a save file. Uses cache if available.
 
@@ -158,6 +168,8 @@ class SaveDataManager:
             game_hint: Game name from ROM header detection (e.g. "Emerald").
                        Bypasses save-based game detection when provided.
                        Pass None only when loading a save with no corresponding ROM.
+            use_cache: False to always parse fresh and leave the shared cache
+                       alone (for worker threads; the cache is main-thread only)
 
         Returns:
             bool: True if successful
@@ -169,7 +181,7 @@ class SaveDataManager:
 
         try:
             # Check cache first
-            cached = get_cached_parser(save_path)
+            cached = get_cached_parser(save_path) if use_cache else None
             if cached:
                 self.parser = cached
                 self.loaded = True
@@ -185,7 +197,8 @@ class SaveDataManager:
                 self.current_save_path = save_path
                 self.current_game_hint = game_hint  # Store for reload
                 # Add to cache for future use
-                _save_cache[save_path] = self.parser
+                if use_cache:
+                    _save_cache[save_path] = self.parser
                 return True
             print(f"Failed to parse: {save_path}")
             return False
@@ -105,3 +105,31 @@ class SaveLoadMixin:
             # changed since the manager last loaded.
             manager.load_save(sav_path, game_hint=gname)
             print(f"[Sinew] Force reloaded save for {gname}: {sav_path}")
+
+    def _adopt_reloaded_save(self, game_name, sav_path, parser):
+        """Point the shared manager at a save the achievement worker just parsed.
+        The worker's parser goes into the save cache here on the main thread,
+        so this is a cheap swap. The manager is left alone if the user has
+        moved to another game in the meantime."""
+        from save_data_manager import cache_parser
+
+        cache_parser(sav_path, parser)
+        if self.get_current_game_name() != game_name:
+            return
+        get_manager().load_save(sav_path, game_hint=game_name)
+        print(f"[Sinew] Force reloaded save for {game_name}: {sav_path}")
+
+    def _get_all_saves(self):
+        """{game_name: save_path} for every detected game with a save (excludes Sinew)"""
+        saves = {}
+        for gname, game_data in self.games.items():
+            if gname == "Sinew":
+                continue
+            sav_path = game_data.get("sav")
+            if sav_path and os.path.exists(sav_path):
+                saves[gname] = sav_path
+        return saves
+
+    def _get_all_save_paths(self):
+        """Save file paths for every detected game that has one (excludes Sinew)"""
+        return list(self._get_all_saves().values())
@@ -4,6 +4,7 @@ Scaler Module for Sinew
 Handles resolution scaling and fullscreen for the game.
 """
 
+import math
 import os
 import platform
 
@@ -522,11 +523,20 @@ class Scaler:
         y = max(0, min(self.virtual_height - 1, y))
         return x, y
 
-    def blit_scaled(self):
-        """Draw virtual surface to window, scaled"""
+    def blit_scaled(self, rects=None):
+        """
+        Draw virtual surface to window, scaled.
+
+        Args:
+            rects: Virtual-surface rects that changed, or None for the
+                whole frame
+        """
         if self.use_hardware_scaling and not self.is_handheld:
             # Hardware scaling - just flip, SDL handles the rest
-            pygame.display.flip()
+            if rects:
+                pygame.display.update(rects)
+            else:
+                pygame.display.flip()
             return
 
         # Software scaling (desktop fallback AND handheld path)
@@ -534,6 +544,10 @@ class Scaler:
         if display_surface is None:
             display_surface = self.window
 
+        if rects:
+            self._blit_scaled_rects(display_surface, rects)
+            return
+
         if self.integer_scaling:
             scaled_surface = pygame.transform.scale(
                 self.virtual_surface, (self.scaled_width, self.scaled_height)
@@ -547,6 +561,31 @@ class Scaler:
         display_surface.blit(scaled_surface, (self.offset_x, self.offset_y))
         pygame.display.flip()
 
+    def _blit_scaled_rects(self, display_surface, rects):
+        """Scale and flip only the given virtual-surface rects"""
+        bounds = self.virtual_surface.get_rect()
+        scale_fn = (
+            pygame.transform.scale if self.integer_scaling else pygame.transform.smoothscale
+        )
+        updated = []
+        for rect in rects:
+            # One pixel of margin hides seams from smoothscale's filtering
+            rect = pygame.Rect(rect).inflate(2, 2).clip(bounds)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            x0 = int(rect.left * self.scale)
+            y0 = int(rect.top * self.scale)
+            x1 = min(self.scaled_width, int(math.ceil(rect.right * self.scale)))
+            y1 = min(self.scaled_height, int(math.ceil(rect.bottom * self.scale)))
+            if x1 <= x0 or y1 <= y0:
+                continue
+            part = scale_fn(self.virtual_surface.subsurface(rect), (x1 - x0, y1 - y0))
+            dest = pygame.Rect(self.offset_x + x0, self.offset_y + y0, x1 - x0, y1 - y0)
+            display_surface.blit(part, dest)
+            updated.append(dest)
+        if updated:
+            pygame.display.update(updated)
+
     def get_surface(self):
         """Get the virtual surface to render to"""
         return self.virtual_surface
@@ -17,7 +17,7 @@ from config import (
     DATA_DIR, EXT_DIR, FONT_PATH, IS_HANDHELD, POKEMON_DB_PATH, SETTINGS_FILE,
     AUDIO_BUFFER_OPTIONS, AUDIO_QUEUE_OPTIONS,
     AUDIO_BUFFER_DEFAULT, AUDIO_BUFFER_DEFAULT_ARM, AUDIO_QUEUE_DEPTH_DEFAULT,
-    VOLUME_DEFAULT, VOLUME_MIN, VOLUME_MAX, VOLUME_STEP,
+    VOLUME_DEFAULT, VOLUME_MIN, VOLUME_MAX, VOLUME_STEP, STORAGE_BOX_OPTIONS,
 )
 
 # Use the same ARM detection as the emulator so slider defaults match
@@ -119,8 +119,8 @@ class ConfirmationPopup:
         self.selected = 1  # Default to No for safety
 
         # Fonts
-        self.font_text = pygame.font.Font(FONT_PATH, 12)
-        self.font_small = pygame.font.Font(FONT_PATH, 10)
+        self.font_text = ui_colors.get_font(12, FONT_PATH)
+        self.font_small = ui_colors.get_font(10, FONT_PATH)
 
     def handle_controller(self, ctrl):
         """Handle controller input"""
@@ -154,8 +154,7 @@ class ConfirmationPopup:
     def draw(self, surf):
         """Draw the confirmation popup"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 180))
         surf.blit(overlay, (0, 0))
 
         # Popup box
@@ -299,9 +298,9 @@ class PauseComboSelector:
         self._find_active_option()
 
         # Fonts
-        self.font_header = pygame.font.Font(FONT_PATH, 16)
-        self.font_text = pygame.font.Font(FONT_PATH, 12)
-        self.font_small = pygame.font.Font(FONT_PATH, 10)
+        self.font_header = ui_colors.get_font(16, FONT_PATH)
+        self.font_text = ui_colors.get_font(12, FONT_PATH)
+        self.font_small = ui_colors.get_font(10, FONT_PATH)
 
     def _find_active_option(self):
         """Find which option matches current setting"""
@@ -574,8 +573,7 @@ class PauseComboSelector:
 
         # Capture mode overlay
         if self.capture_mode:
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
+            overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 180))
             surf.blit(overlay, (0, 0))
 
             box_w, box_h = 280, 100
@@ -681,6 +679,18 @@ class Settings:
         """Delegate the draw call to the inner settings screen."""
         self.screen.draw(surf)
 
+    def is_animating(self):
+        """
+        True while something changes without input: a sub-screen (mappers
+        count down while listening) or the fading cache message.
+        """
+        if self.screen.sub_screen is not None:
+            return True
+        if getattr(self.screen, "_cache_message", None):
+            elapsed = pygame.time.get_ticks() - self.screen._cache_message_time
+            return elapsed < 2500
+        return False
+
 
 # Alias for backwards compatibility
 Modal = Settings
@@ -792,9 +802,9 @@ class KeyboardMapper:
         self._load_bindings()
 
         # Fonts
-        self.font_header = pygame.font.Font(FONT_PATH, 16)
-        self.font_text = pygame.font.Font(FONT_PATH, 11)
-        self.font_small = pygame.font.Font(FONT_PATH, 9)
+        self.font_header = ui_colors.get_font(16, FONT_PATH)
+        self.font_text = ui_colors.get_font(11, FONT_PATH)
+        self.font_small = ui_colors.get_font(9, FONT_PATH)
 
     def _load_bindings(self):
         """Load saved bindings from sinew_settings.json"""
@@ -990,9 +1000,7 @@ class KeyboardMapper:
     def draw(self, surf):
         """Draw the keyboard mapper screen"""
         # Background
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill(ui_colors.COLOR_BG)
-        surf.blit(overlay, (0, 0))
+        surf.fill(ui_colors.COLOR_BG, (0, 0, self.width, self.height))
         pygame.draw.rect(
             surf, ui_colors.COLOR_BORDER, (0, 0, self.width, self.height), 2
         )
@@ -1164,9 +1172,9 @@ class MainSetup:
         self._toggle_debounce_ms = 300  # 300ms debounce
 
         # Fonts
-        self.font_header = pygame.font.Font(FONT_PATH, 18)
-        self.font_text = pygame.font.Font(FONT_PATH, 12)
-        self.font_small = pygame.font.Font(FONT_PATH, 10)
+        self.font_header = ui_colors.get_font(18, FONT_PATH)
+        self.font_text = ui_colors.get_font(12, FONT_PATH)
+        self.font_small = ui_colors.get_font(10, FONT_PATH)
 
         # Tab definitions
         self.tabs = ["General", "Input", "mGBA", "Info"]
@@ -1190,6 +1198,13 @@ class MainSetup:
                     "volume_values": list(range(VOLUME_MIN, VOLUME_MAX + 1, VOLUME_STEP)),
                 },
                 {"name": "Mute Menu Music", "type": "toggle", "value": False},
+                {
+                    "name": "Sinew Storage Boxes",
+                    "type": "slider",
+                    "slider_index": 0,
+                    "labels": [str(v) for v in STORAGE_BOX_OPTIONS],
+                    "box_values": STORAGE_BOX_OPTIONS,
+                },
                 {"name": "Themes", "type": "button"},
                 {"name": "Build/Rebuild Pokemon DB", "type": "button"},
             ],
@@ -1247,6 +1262,8 @@ class MainSetup:
                 {"name": "Reset ALL Achievements", "type": "button"},
                 {"name": "Reset Game Achievements...", "type": "button"},
                 {"name": "Export Achievement Data", "type": "button"},
+                {"name": "Profile Achievements", "type": "toggle", "value": False},
+                {"name": "Dump Achievement Profile", "type": "button"},
             ],
         }
 
@@ -1287,6 +1304,15 @@ class MainSetup:
                 closest_idx = min(range(len(vol_values)),
                     key=lambda i: abs(vol_values[i] - saved_vol))
                 opt["slider_index"] = closest_idx
+            elif opt["name"] == "Sinew Storage Boxes":
+                saved_boxes = settings.get("sinew_storage_boxes", STORAGE_BOX_OPTIONS[0])
+                opt["slider_index"] = min(range(len(STORAGE_BOX_OPTIONS)),
+                    key=lambda i: abs(STORAGE_BOX_OPTIONS[i] - saved_boxes))
+
+        # Load Dev tab settings
+        for opt in self.tab_options["Dev"]:
+            if opt["name"] == "Profile Achievements":
+                opt["value"] = settings.get("profile_achievements", False)
 
         # Load Input tab settings
         for opt in self.tab_options["Input"]:
@@ -1453,6 +1479,8 @@ class MainSetup:
                 self._save_and_apply_audio_settings()
             elif option["name"] == "Volume":
                 self._save_and_apply_volume()
+            elif option["name"] == "Sinew Storage Boxes":
+                self._save_and_apply_storage_boxes(option)
             return True
         return False
 
@@ -1487,6 +1515,19 @@ class MainSetup:
             self._apply_fastforward_to_emulator()
         elif name == "Mute Emulator":
             self._save_and_apply_mgba_mute(value)
+        elif name == "Profile Achievements":
+            try:
+                from achievement_profiler import get_achievement_profiler
+
+                settings = load_sinew_settings()
+                settings["profile_achievements"] = value
+                save_sinew_settings(settings)
+                get_achievement_profiler().enabled = value
+                status = "ON" if value else "OFF"
+                print(f"[Settings] Achievement profiling: {status}")
+                self._status_msg(f"Achievement Profiling: {status}")
+            except Exception as e:
+                print(f"[Settings] Failed to save profiling setting: {e}")
 
     def _save_mgba_fastforward_settings(self):
         """Persist fast-forward toggle + speed index to sinew_settings.json."""
@@ -1572,6 +1613,34 @@ class MainSetup:
         except Exception as e:
             print(f"[Settings] Could not apply volume to emulator: {e}")
 
+    # ---- Sinew Storage Boxes (General tab) ----
+
+    def _save_and_apply_storage_boxes(self, option):
+        """Save the storage box count and grow the live storage to it."""
+        vals = option.get("box_values", STORAGE_BOX_OPTIONS)
+        boxes = vals[min(option.get("slider_index", 0), len(vals) - 1)]
+        try:
+            s = load_sinew_settings()
+            s["sinew_storage_boxes"] = boxes
+            save_sinew_settings(s)
+        except Exception as e:
+            print(f"[Settings] Failed to save storage boxes: {e}")
+            return
+
+        try:
+            from sinew_storage import get_sinew_storage
+
+            storage = get_sinew_storage()
+            storage.apply_capacity_setting()
+            current = storage.get_box_count()
+            if current > boxes:
+                # Boxes are never removed, they may hold Pokemon
+                self._status_msg(f"Storage keeps its {current} boxes")
+            else:
+                self._status_msg(f"Sinew Storage: {current} boxes")
+        except Exception as e:
+            print(f"[Settings] Could not apply storage boxes: {e}")
+
     # ---- Mute Emulator (mGBA tab) ----
 
     def _save_and_apply_mgba_mute(self, muted):
@@ -1761,6 +1830,8 @@ class MainSetup:
             self._open_game_achievement_selector()
         elif name == "Export Achievement Data":
             self._export_achievement_data()
+        elif name == "Dump Achievement Profile":
+            self._dump_achievement_profile()
         else:
             print(f"[Settings] Activated: {name}")
 
@@ -1995,6 +2066,23 @@ class MainSetup:
             self._cache_message = f"Export error: {e}"
             self._cache_message_time = pygame.time.get_ticks()
 
+    def _dump_achievement_profile(self):
+        """Write the achievement evaluation profile report"""
+        try:
+            from achievement_profiler import get_achievement_profiler
+
+            profiler = get_achievement_profiler()
+            if not profiler.enabled and not profiler.sections:
+                self._status_msg("Turn on Profile Achievements first")
+                return
+
+            path = profiler.dump()
+            self._status_msg(f"Profile written to {path}")
+
+        except Exception as e:
+            print(f"[Settings] Error dumping achievement profile: {e}")
+            self._status_msg(f"Profile error: {e}")
+
     def _handle_ach_reset_modal(self, ctrl):
         """Handle input for achievement reset modals"""
         if not self._ach_reset_modal:
@@ -2065,8 +2153,7 @@ class MainSetup:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 180))
         surf.blit(overlay, (0, 0))
 
         # Modal box
@@ -2449,9 +2536,9 @@ class MainSetup:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(230)
-        overlay.fill(ui_colors.COLOR_BG)
+        overlay = ui_colors.get_tile(
+            (self.width, self.height), ui_colors.COLOR_BG, alpha=230
+        )
         surf.blit(overlay, (0, 0))
 
         # Border
@@ -2715,9 +2802,9 @@ class ChangelogScreen:
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 16)
-            self.font_text = pygame.font.Font(FONT_PATH, 11)
-            self.font_small = pygame.font.Font(FONT_PATH, 9)
+            self.font_header = ui_colors.get_font(16, FONT_PATH)
+            self.font_text = ui_colors.get_font(11, FONT_PATH)
+            self.font_small = ui_colors.get_font(9, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 22)
             self.font_text = pygame.font.SysFont(None, 16)
@@ -2811,9 +2898,9 @@ class ChangelogScreen:
     def draw(self, surf):
         """Draw the changelog screen"""
         # Background overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(240)
-        overlay.fill(ui_colors.COLOR_BG)
+        overlay = ui_colors.get_tile(
+            (self.width, self.height), ui_colors.COLOR_BG, alpha=240
+        )
         surf.blit(overlay, (0, 0))
 
         pygame.draw.rect(
@@ -2884,9 +2971,9 @@ class AboutLegalScreen:
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 16)
-            self.font_text = pygame.font.Font(FONT_PATH, 11)
-            self.font_small = pygame.font.Font(FONT_PATH, 9)
+            self.font_header = ui_colors.get_font(16, FONT_PATH)
+            self.font_text = ui_colors.get_font(11, FONT_PATH)
+            self.font_small = ui_colors.get_font(9, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 22)
             self.font_text = pygame.font.SysFont(None, 16)
@@ -3228,9 +3315,9 @@ class AboutLegalScreen:
     def draw(self, surf):
         """Draw the About/Legal screen"""
         # Background overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(240)
-        overlay.fill(ui_colors.COLOR_BG)
+        overlay = ui_colors.get_tile(
+            (self.width, self.height), ui_colors.COLOR_BG, alpha=240
+        )
         surf.blit(overlay, (0, 0))
 
         # Border
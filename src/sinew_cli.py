@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+
+"""
+Sinew Headless CLI
+Batch save processing without a display or pygame.
+
+Subcommands (each writes JSON Lines, one object per save or Pokemon):
+    summarize     trainer, money, badges, dex and Pokemon counts per save
+    validate      file size / section checks per save
+    export        one line per party and PC Pokemon
+    diff          changes between two saves, or saves paired by file name
+                  across two directories
+    achievements  achievements unlocked by each save
+
+Paths may be save files or directories of saves. Saves are fanned out over
+a process pool (--jobs, default: CPU count); --jobs 1 runs in-process.
+
+Sinew storage subcommands (one JSON object with the transfer result):
+    pk3-import    place every .pk3/.pks in a directory or .zip into empty
+                  Sinew storage slots
+    pk3-export    write every Pokemon in Sinew storage as .pk3 files to a
+                  directory, or to an archive if the path ends in .zip
+
+Usage:
+    python -m sinew_cli summarize saves/ -o summary.jsonl
+    python -m sinew_cli validate archive/ --jobs 8
+    python -m sinew_cli diff old/emerald.sav new/emerald.sav
+    python -m sinew_cli pk3-import collection.zip
+    python -m sinew_cli pk3-export backup/pk3/
+    python -m src achievements saves/      # via the main entry point
+
+Diagnostic output from the parser goes to stderr (workers are silent unless
+--verbose), so stdout carries only JSON Lines.
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+COMMANDS = ("summarize", "validate", "export", "diff", "achievements")
+STORAGE_COMMANDS = ("pk3-import", "pk3-export")
+
+# Files accepted when a directory is given (mirrors config.SAVE_EXTENSIONS)
+SAVE_EXTENSIONS = (".sav", ".srm", ".sa1", ".sa2")
+
+
+# ---------------------------------------------------------------------- #
+#  Worker helpers (run in pool processes)                                  #
+# ---------------------------------------------------------------------- #
+
+
+def _init_worker(verbose):
+    """Keep worker chatter off stdout"""
+    sys.stdout = sys.stderr if verbose else open(os.devnull, "w", encoding="utf-8")
+
+
+def _detect_game(save_path, game_hint=None):
+    """Specific game name from the hint, the save's game code, or the file name"""
+    if game_hint:
+        return game_hint
+    from config import identify_save
+
+    game = identify_save(save_path)
+    if game:
+        return game
+    from game_detection import GAME_DEFINITIONS
+
+    name_lower = os.path.basename(save_path).lower()
+    for game_name, game_def in GAME_DEFINITIONS.items():
+        if any(ex.lower() in name_lower for ex in game_def.get("exclude", [])):
+            continue
+        if any(k.lower() in name_lower for k in game_def.get("keywords", [])):
+            return game_name
+    return None
+
+
+def _load_manager(save_path, game_hint=None):
+    """
+    Load a save into a private SaveDataManager.
+
+    The shared parse cache entry is dropped straight away so a worker's
+    memory does not grow with every save it handles.
+
+    Returns:
+        tuple: (manager or None, game_name or None)
+    """
+    from save_data_manager import SaveDataManager, invalidate_save_cache
+
+    game = _detect_game(save_path, game_hint)
+    manager = SaveDataManager()
+    loaded = manager.load_save(save_path, game_hint=game)
+    invalidate_save_cache(save_path)
+    if not loaded or not manager.is_loaded():
+        return None, game
+    return manager, game or manager.get_game_name()
+
+
+def _collect_pokemon(manager):
+    """(party, pc_pokemon) lists without empty slots"""
+    party = [p for p in manager.get_party() if p and not p.get("empty")]
+    pc_pokemon = [p for p in manager.parser.pc_boxes or [] if p and not p.get("empty")]
+    return party, pc_pokemon
+
+
+def _error(save_path, message):
+    return {"file": save_path, "ok": False, "error": message}
+
+
+def _summarize_manager(save_path, manager, game):
+    """Summary record built from an already loaded manager"""
+    from collection_export import pokemon_is_shiny
+
+    trainer = manager.get_trainer_info() or {}
+    party, pc_pokemon = _collect_pokemon(manager)
+    all_pokemon = party + pc_pokemon
+    dex = manager.parser.get_pokedex_count()
+    play = manager.get_play_time()
+    return {
+        "file": save_path,
+        "ok": True,
+        "game": game,
+        "game_type": manager.get_game_type(),
+        "trainer": trainer.get("name"),
+        "trainer_id": trainer.get("id"),
+        "secret_id": trainer.get("secret_id"),
+        "money": manager.get_money(),
+        "badges": manager.get_badge_count(),
+        "playtime": f"{play['hours']}:{play['minutes']:02d}:{play['seconds']:02d}",
+        "dex_caught": dex["caught"],
+        "dex_seen": dex["seen"],
+        "party": len(party),
+        "pc": len(pc_pokemon),
+        "shiny": sum(1 for p in all_pokemon if pokemon_is_shiny(p)),
+        "max_level": max((p.get("level", 0) for p in all_pokemon), default=0),
+    }
+
+
+def summarize_save(save_path, game_hint=None):
+    """Summary record for one save"""
+    try:
+        manager, game = _load_manager(save_path, game_hint)
+        if manager is None:
+            return _error(save_path, "could not load save")
+        return _summarize_manager(save_path, manager, game)
+    except Exception as e:
+        return _error(save_path, str(e))
+
+
+def validate_save(save_path, game_hint=None):  # pylint: disable=unused-argument
+    """Validation record for one save"""
+    from save_writer import validate_save_file
+
+    try:
+        is_valid, game_type, message = validate_save_file(save_path)
+        record = {
+            "file": save_path,
+            "ok": bool(is_valid),
+            "game_type": game_type,
+            "message": message,
+            "errors": [],
+            "warnings": [],
+        }
+        if not is_valid:
+            return record
+
+        from parser.gen3_parser import Gen3SaveParser
+
+        parser = Gen3SaveParser()
+        if not parser.load(save_path):
+            record["ok"] = False
+            record["errors"].append("parser could not load save")
+            return record
+        results = parser.validate()
+        if isinstance(results, dict):
+            record["ok"] = bool(results.get("valid", True))
+            record["errors"].extend(results.get("errors", []))
+            record["warnings"].extend(results.get("warnings", []))
+        return record
+    except Exception as e:
+        return _error(save_path, str(e))
+
+
+def export_save(save_path, game_hint=None):
+    """One record per party / PC Pokemon in a save"""
+    from collection_export import COLUMNS, iter_collection
+    from save_writer import validate_save_file
+
+    try:
+        is_valid, _game_type, message = validate_save_file(save_path)
+        if not is_valid:
+            return [_error(save_path, message)]
+        game = _detect_game(save_path, game_hint) or os.path.basename(save_path)
+        rows = iter_collection({game: save_path}, include_sinew=False)
+        return [dict(zip(COLUMNS, row), file=save_path) for row in rows]
+    except Exception as e:
+        return [_error(save_path, str(e))]
+
+
+def _achievement_save_data(manager, game):
+    """Build the save_data dict check_achievement_unlocked expects"""
+    party, pc_pokemon = _collect_pokemon(manager)
+    dex = manager.parser.get_pokedex_count()
+    play = manager.get_play_time()
+    save_data = {
+        "dex_caught": dex["caught"],
+        "dex_seen": dex["seen"],
+        "badges": manager.get_badge_count(),
+        "money": manager.get_money(),
+        "party": party,
+        "pc_pokemon": pc_pokemon,
+        "owned_list": manager.get_pokedex_data().get("owned_list", []),
+        "playtime_hours": play["hours"] + play["minutes"] / 60.0,
+        "raw_data": manager.parser.data,
+    }
+    if game in ("FireRed", "LeafGreen"):
+        from save_writer import has_national_dex, has_rainbow_pass
+
+        save_data["has_national_dex"] = has_national_dex(
+            manager.parser.data, "FRLG", game
+        )
+        save_data["has_rainbow_pass"] = has_rainbow_pass(manager.parser.data, "FRLG")
+    return save_data
+
+
+def achievements_save(save_path, game_hint=None):
+    """Achievements unlocked by one save"""
+    from achievements_data import SaveStats, evaluate_achievements, get_achievements_for
+
+    try:
+        manager, game = _load_manager(save_path, game_hint)
+        if manager is None:
+            return _error(save_path, "could not load save")
+        achievements = get_achievements_for(game)
+        if not achievements:
+            return _error(save_path, f"no achievements for game {game!r}")
+        stats = SaveStats(_achievement_save_data(manager, game))
+        unlocked = [ach["id"] for ach in evaluate_achievements(achievements, stats)]
+        return {
+            "file": save_path,
+            "ok": True,
+            "game": game,
+            "unlocked": len(unlocked),
+            "total": len(achievements),
+            "points": sum(a.get("points", 0) for a in achievements if a["id"] in unlocked),
+            "ids": unlocked,
+        }
+    except Exception as e:
+        return _error(save_path, str(e))
+
+
+def _pokemon_fingerprints(manager):
+    from pokemon_index import get_fingerprint
+
+    party, pc_pokemon = _collect_pokemon(manager)
+    prints = {}
+    for pokemon in party + pc_pokemon:
+        fp = get_fingerprint(pokemon)
+        if fp is not None:
+            prints[fp] = pokemon.get("species", 0)
+    return prints
+
+
+def _diff_side(save_path, game_hint=None):
+    """(summary record, fingerprints) of one save, parsed once"""
+    try:
+        manager, game = _load_manager(save_path, game_hint)
+        if manager is None:
+            return _error(save_path, "could not load save"), None
+        return (
+            _summarize_manager(save_path, manager, game),
+            _pokemon_fingerprints(manager),
+        )
+    except Exception as e:
+        return _error(save_path, str(e)), None
+
+
+def diff_saves(pair, game_hint=None):
+    """Differences between two saves given as (old_path, new_path)"""
+    old_path, new_path = pair
+    old, old_prints = _diff_side(old_path, game_hint)
+    new, new_prints = _diff_side(new_path, game_hint)
+    record = {"old": old_path, "new": new_path, "ok": old["ok"] and new["ok"]}
+    if not record["ok"]:
+        record["error"] = old.get("error") or new.get("error")
+        return record
+
+    record["changes"] = {
+        key: [old[key], new[key]]
+        for key in old
+        if key not in ("file", "ok") and old[key] != new[key]
+    }
+    record["pokemon_added"] = sorted(
+        new_prints[fp] for fp in new_prints.keys() - old_prints.keys()
+    )
+    record["pokemon_removed"] = sorted(
+        old_prints[fp] for fp in old_prints.keys() - new_prints.keys()
+    )
+    return record
+
+
+_TASKS = {
+    "summarize": summarize_save,
+    "validate": validate_save,
+    "export": export_save,
+    "diff": diff_saves,
+    "achievements": achievements_save,
+}
+
+
+def transfer_pk3(path, game_hint=None, command="pk3-import"):
+    """
+    Run a pk3-import / pk3-export of path against Sinew storage, as one record.
+
+    Sinew storage is shared by every game, so game_hint is only echoed back.
+    """
+    from pk3_transfer import export_pk3, import_pk3
+
+    try:
+        if command == "pk3-import":
+            result = import_pk3(path)
+        else:
+            result = export_pk3(path)
+    except Exception as e:
+        return _error(path, str(e))
+    return {
+        "file": path,
+        "game": game_hint,
+        "ok": not result.errors,
+        "processed": result.processed,
+        "transferred": result.transferred,
+        "storage_full": result.storage_full,
+        "errors": [{"name": name, "reason": reason} for name, reason in result.errors],
+    }
+
+
+# ---------------------------------------------------------------------- #
+#  Driver                                                                  #
+# ---------------------------------------------------------------------- #
+
+
+def find_saves(paths, recursive=False):
+    """Expand files and directories into a sorted list of save paths"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            if recursive:
+                for root, _dirs, files in os.walk(path):
+                    found.extend(
+                        os.path.join(root, f)
+                        for f in files
+                        if f.lower().endswith(SAVE_EXTENSIONS)
+                    )
+            else:
+                with os.scandir(path) as it:
+                    found.extend(
+                        e.path
+                        for e in it
+                        if e.is_file() and e.name.lower().endswith(SAVE_EXTENSIONS)
+                    )
+        elif os.path.isfile(path):
+            found.append(path)
+        else:
+            print(f"[SinewCLI] Not found: {path}", file=sys.stderr)
+    return sorted(found)
+
+
+def _diff_pairs(old, new, recursive=False):
+    """Pair two files, or same-named saves in two directories"""
+    if os.path.isfile(old) and os.path.isfile(new):
+        return [(old, new)]
+    new_by_name = {os.path.relpath(p, new): p for p in find_saves([new], recursive)}
+    pairs = []
+    for old_path in find_saves([old], recursive):
+        new_path = new_by_name.get(os.path.relpath(old_path, old))
+        if new_path:
+            pairs.append((old_path, new_path))
+    return pairs
+
+
+def _run_tasks(task, items, game_hint, jobs, verbose):
+    """Yield task results in input order, in a process pool when jobs > 1"""
+    if jobs <= 1 or len(items) <= 1:
+        if not verbose:
+            saved_stdout = sys.stdout
+            sys.stdout = open(os.devnull, "w", encoding="utf-8")
+        try:
+            for item in items:
+                yield task(item, game_hint)
+        finally:
+            if not verbose:
+                sys.stdout.close()
+                sys.stdout = saved_stdout
+        return
+
+    chunksize = max(1, min(16, len(items) // (jobs * 4)))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(verbose,)
+    ) as pool:
+        yield from pool.map(task, items, [game_hint] * len(items), chunksize=chunksize)
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="sinew", description="Headless batch tools for Gen 3 saves"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in COMMANDS:
+        cmd = sub.add_parser(name)
+        if name == "diff":
+            cmd.add_argument("old", help="Old save file or directory")
+            cmd.add_argument("new", help="New save file or directory")
+        else:
+            cmd.add_argument("paths", nargs="+", help="Save files or directories")
+        cmd.add_argument("-o", "--output", help="Write JSON Lines here (default stdout)")
+        cmd.add_argument(
+            "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes"
+        )
+        cmd.add_argument("-r", "--recursive", action="store_true", help="Recurse into dirs")
+        cmd.add_argument("--game", help="Force the game name (e.g. Emerald)")
+        cmd.add_argument("-v", "--verbose", action="store_true", help="Parser logs to stderr")
+    for name in STORAGE_COMMANDS:
+        cmd = sub.add_parser(name)
+        if name == "pk3-import":
+            cmd.add_argument("path", help="Directory or .zip of .pk3 files")
+        else:
+            cmd.add_argument("path", help="Output directory, or a .zip path")
+        cmd.add_argument("-o", "--output", help="Write the JSON result here (default stdout)")
+        cmd.add_argument("--game", help="Game the boxes came from (informational)")
+        cmd.add_argument("-v", "--verbose", action="store_true", help="Storage logs to stderr")
+    return parser
+
+
+def main(argv=None):
+    """Run a CLI subcommand; returns a process exit code"""
+    args = build_arg_parser().parse_args(argv)
+
+    # JSON Lines own stdout; anything printed while importing/parsing goes to stderr
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    real_stdout = sys.stdout
+    sys.stdout = sys.stderr
+
+    try:
+        if args.command in STORAGE_COMMANDS:
+            print(f"[SinewCLI] {args.command}: {args.path}")
+            task = functools.partial(transfer_pk3, command=args.command)
+            record = list(_run_tasks(task, [args.path], args.game, 1, args.verbose))[0]
+            out.write(json.dumps(record, ensure_ascii=False, default=str))
+            out.write("\n")
+            out.flush()
+            print(f"[SinewCLI] Done, {record.get('transferred', 0)} transferred")
+            return 0 if record["ok"] else 1
+
+        if args.command == "diff":
+            items = _diff_pairs(args.old, args.new, args.recursive)
+        else:
+            items = find_saves(args.paths, args.recursive)
+        print(f"[SinewCLI] {args.command}: {len(items)} item(s)")
+
+        failures = 0
+        for result in _run_tasks(
+            _TASKS[args.command], items, args.game, args.jobs, args.verbose
+        ):
+            for record in result if isinstance(result, list) else [result]:
+                if not record.get("ok", True):
+                    failures += 1
+                out.write(json.dumps(record, ensure_ascii=False, default=str))
+                out.write("\n")
+        out.flush()
+        print(f"[SinewCLI] Done, {failures} failure(s)")
+        return 1 if failures else 0
+    finally:
+        sys.stdout = real_stdout
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    _src_dir = os.path.dirname(os.path.abspath(__file__))
+    if _src_dir not in sys.path:
+        sys.path.insert(0, _src_dir)
+    sys.exit(main())
@@ -92,7 +92,7 @@ class LoggingPrintRedirector:
         "[GameDetect] Using ROM header hint:",
         # Achievement check internals (aggregate summaries are kept)
         "[Achievements] check_sinew_achievements:",
-        "[Achievements] Re-validating all unlocked",
+        "[Achievements] Re-validating unlocked",
         "[Achievements] All unlocked achievements are valid",
         "[Achievements] Legendaries in combined_pokedex",
         # Per-achievement evaluation trace (~30 lines per run; UNLOCKED lines are kept)
@@ -105,6 +105,7 @@ class LoggingPrintRedirector:
         "[Achievements]   dex_caught=",
         "[Achievements]   pc_pokemon=",
         "[Achievements]   owned_list has ",
+        "[Achievements]   Changed since last check:",
         # Per-game intermediate lists (summary lines above them are kept)
         "[Achievements] LeafGreen PC Pokemon:",
         "[Achievements] FireRed PC Pokemon:",
@@ -5,47 +5,150 @@ Sinew Storage System
 Cross-game Pokemon storage that persists outside of individual save files.
 Features:
 - 120 slots per box (vs 30 in game saves)
-- 20 boxes total (2400 Pokemon capacity)
+- Configurable box count (20 by default, up to MAX_BOXES)
+- Boxes stored as separate files, loaded on demand and evicted when idle
+- Pokemon/shiny counters kept in the index so totals never rescan boxes
 - Automatic backups
 - Safe atomic writes
+- Batched bulk writes committed with a single index write
 """
 
 import base64
 import json
 import os
 import shutil
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 
-from config import EXT_DIR
+from config import EXT_DIR, SETTINGS_FILE
+from pokemon_index import get_pokemon_index, sinew_location
 
 # Storage paths
 STORAGE_DIR = os.path.join(EXT_DIR, "saves", "sinew")
 STORAGE_FILE = os.path.join(STORAGE_DIR, "sinew_storage.json")
 BACKUP_FILE = os.path.join(STORAGE_DIR, "sinew_storage_backup.json")
 TEMP_FILE = os.path.join(STORAGE_DIR, "sinew_storage_temp.json")
+BOXES_DIR = os.path.join(STORAGE_DIR, "boxes")
+# Copy of the pre-paging single-file storage, kept after migration
+LEGACY_BACKUP_FILE = os.path.join(STORAGE_DIR, "sinew_storage_v1_backup.json")
 
 # Storage configuration
-NUM_BOXES = 20
+STORAGE_VERSION = 2
+NUM_BOXES = 20  # Default box count (sinew_settings.json "sinew_storage_boxes")
+MAX_BOXES = 500
 SLOTS_PER_BOX = 120
+MAX_RESIDENT_BOXES = 4  # Boxes kept decoded in memory at once
 DEFAULT_BOX_NAMES = [f"Storage {i+1}" for i in range(NUM_BOXES)]
 
 
+def _default_box_name(idx):
+    """Default name for a 0-indexed box"""
+    if idx < len(DEFAULT_BOX_NAMES):
+        return DEFAULT_BOX_NAMES[idx]
+    return f"Storage {idx+1}"
+
+
+def _box_file(idx):
+    """Path of the data file for a 0-indexed box"""
+    return os.path.join(BOXES_DIR, f"box_{idx+1:03d}.json")
+
+
+def _box_backup_file(idx):
+    """Path of the backup data file for a 0-indexed box"""
+    return os.path.join(BOXES_DIR, f"box_{idx+1:03d}_backup.json")
+
+
+def _box_spill_file(idx):
+    """Path a box is spilled to inside batch() until the batch commits"""
+    return os.path.join(BOXES_DIR, f"box_{idx+1:03d}_batch.json")
+
+
+def _box_file_index(name):
+    """0-indexed box for a box data file name, or None for other files"""
+    if name.startswith("box_") and name.endswith(".json") and name[4:-5].isdigit():
+        return int(name[4:-5]) - 1
+    return None
+
+
+def _is_shiny(pokemon):
+    """Shiny check on a stored Pokemon dict (TID ^ SID ^ PID halves < 8)"""
+    if pokemon.get("is_shiny") or pokemon.get("shiny", False):
+        return True
+    if pokemon.get("empty") or pokemon.get("egg"):
+        return False
+    personality = pokemon.get("personality", 0)
+    ot_id = pokemon.get("ot_id", 0)
+    if personality == 0 or ot_id == 0:
+        return False
+    xor = (ot_id & 0xFFFF) ^ ((ot_id >> 16) & 0xFFFF)
+    xor ^= (personality & 0xFFFF) ^ ((personality >> 16) & 0xFFFF)
+    return xor < 8
+
+
+def _decode_pokemon(p):
+    """Return a copy of a stored Pokemon with raw_bytes decoded from base64"""
+    pokemon_copy = p.copy()
+    if "raw_bytes_b64" in pokemon_copy:
+        pokemon_copy["raw_bytes"] = base64.b64decode(pokemon_copy["raw_bytes_b64"])
+        del pokemon_copy["raw_bytes_b64"]
+    return pokemon_copy
+
+
+def _encode_pokemon(pokemon):
+    """Return a JSON-safe copy of a Pokemon with raw_bytes encoded as base64"""
+    pokemon_copy = pokemon.copy()
+    if "raw_bytes" in pokemon_copy and isinstance(pokemon_copy["raw_bytes"], bytes):
+        pokemon_copy["raw_bytes_b64"] = base64.b64encode(
+            pokemon_copy["raw_bytes"]
+        ).decode("ascii")
+        del pokemon_copy["raw_bytes"]
+    return pokemon_copy
+
+
+def _load_capacity_setting():
+    """Read the configured box count from sinew_settings.json"""
+    try:
+        if os.path.exists(SETTINGS_FILE):
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            boxes = int(settings.get("sinew_storage_boxes", NUM_BOXES))
+            return max(1, min(MAX_BOXES, boxes))
+    except Exception as e:
+        print(f"[SinewStorage] Could not read capacity setting: {e}")
+    return NUM_BOXES
+
+
 class SinewStorage:
     """
     Manages Sinew's cross-game Pokemon storage.
 
-    Storage format:
+    Index format (sinew_storage.json):
     {
-        "version": 1,
+        "version": 2,
         "last_modified": "ISO timestamp",
+        "slots_per_box": 120,
         "boxes": [
-            {
-                "name": "Storage 1",
-                "slots": [pokemon_dict or null, ...]  # 120 slots
-            },
+            {"name": "Storage 1", "count": 3, "shiny": 1},
             ...
         ]
     }
+
+    Box format (boxes/box_001.json), only written once a box is used:
+    {
+        "slots": [pokemon_dict or null, ...]  # 120 slots
+    }
+
+    Only the index is read at startup. Box files are read the first time a
+    box is accessed and kept in a small LRU; clean boxes are dropped once
+    more than MAX_RESIDENT_BOXES are resident.
+
+    Inside batch() saves are deferred and dirty boxes are spilled to
+    box_NNN_batch.json when evicted, so bulk imports stay within the
+    residency limit. Spills replace the box files only when the batch
+    commits, just before the index is written; spills left by a crash are
+    discarded on load(), and box files the index doesn't count yet are
+    read back so their Pokemon are never overwritten.
     """
 
     # Class-level version counter - increments when ANY instance modifies data
@@ -55,6 +158,12 @@ class SinewStorage:
     def __init__(self):
         self.data = None
         self.loaded = False
+        self._boxes = OrderedDict()  # box idx -> stored slot list (LRU order)
+        self._dirty_boxes = set()
+        self._spilled = set()  # Boxes with a pending batch spill file
+        self._total_count = 0
+        self._total_shiny = 0
+        self._batch_depth = 0
         self._ensure_storage_dir()
         self.load()
 
@@ -69,39 +178,92 @@ class SinewStorage:
         cls._data_version += 1
 
     def _ensure_storage_dir(self):
-        """Ensure storage directory exists"""
+        """Ensure storage directories exist"""
         os.makedirs(STORAGE_DIR, exist_ok=True)
+        os.makedirs(BOXES_DIR, exist_ok=True)
 
-    def _create_empty_storage(self):
-        """Create empty storage structure"""
+    def _create_empty_storage(self, num_boxes=None):
+        """Create empty storage index"""
+        if num_boxes is None:
+            num_boxes = _load_capacity_setting()
         return {
-            "version": 1,
+            "version": STORAGE_VERSION,
             "last_modified": datetime.now().isoformat(),
+            "slots_per_box": SLOTS_PER_BOX,
             "boxes": [
-                {"name": DEFAULT_BOX_NAMES[i], "slots": [None] * SLOTS_PER_BOX}
-                for i in range(NUM_BOXES)
+                {"name": _default_box_name(i), "count": 0, "shiny": 0}
+                for i in range(num_boxes)
             ],
         }
 
+    def _reset_cache(self):
+        """Drop all resident boxes and recompute totals from the index"""
+        self._boxes.clear()
+        self._dirty_boxes.clear()
+        self._spilled.clear()
+        self._recount_totals()
+
+    def _recover_box_files(self):
+        """
+        Bring the index back in line with the box files after a crash.
+
+        Spill files are from a batch that never committed, so they're
+        dropped. A box file whose box the index counts as empty was written
+        just before a crash (box files go out before the index), so it's
+        read and its counters restored rather than being overwritten later.
+        """
+        try:
+            names = os.listdir(BOXES_DIR)
+        except OSError:
+            return
+        boxes = self.data["boxes"]
+        for name in sorted(names):
+            if name.endswith("_batch.json") or name.endswith(".json.tmp"):
+                print(f"[SinewStorage] Discarding unfinished write {name}")
+                try:
+                    os.remove(os.path.join(BOXES_DIR, name))
+                except OSError as e:
+                    print(f"[SinewStorage] Could not remove {name}: {e}")
+                continue
+            idx = _box_file_index(name)
+            if idx is None or idx >= len(boxes) or boxes[idx].get("count", 0):
+                continue
+            self._reconcile_counts(idx, self._read_box_file(idx))
+
+    def _recount_totals(self):
+        """Sum per-box counters from the index (O(boxes), no box reads)"""
+        boxes = self.data["boxes"] if self.data else []
+        self._total_count = sum(b.get("count", 0) for b in boxes)
+        self._total_shiny = sum(b.get("shiny", 0) for b in boxes)
+
     def load(self):
-        """Load storage from file, create if doesn't exist"""
+        """Load storage index from file, create if doesn't exist"""
         try:
             if os.path.exists(STORAGE_FILE):
                 with open(STORAGE_FILE, "r", encoding="utf-8") as f:
                     self.data = json.load(f)
 
+                if self._is_legacy_format(self.data):
+                    self._migrate_legacy()
+
                 # Validate structure
                 if not self._validate_structure():
                     print("[SinewStorage] Invalid storage structure, creating new")
                     self.data = self._create_empty_storage()
+                    self._reset_cache()
                     self.save()
 
+                self._reset_cache()
+                self._recover_box_files()
                 self.loaded = True
-                pokemon_count = self.get_total_pokemon_count()
-                print(f"[SinewStorage] Loaded: {pokemon_count} Pokemon in storage")
+                print(
+                    f"[SinewStorage] Loaded: {self._total_count} Pokemon in"
+                    f" {len(self.data['boxes'])} boxes"
+                )
             else:
                 # Create new storage
                 self.data = self._create_empty_storage()
+                self._reset_cache()
                 self.save()
                 self.loaded = True
                 print("[SinewStorage] Created new storage file")
@@ -113,21 +275,76 @@ class SinewStorage:
                     print("[SinewStorage] Attempting to load from backup...")
                     with open(BACKUP_FILE, "r", encoding="utf-8") as f:
                         self.data = json.load(f)
+                    if self._is_legacy_format(self.data):
+                        self._migrate_legacy()
+                    if not self._validate_structure():
+                        raise ValueError("invalid backup structure")
+                    self._reset_cache()
+                    self._recover_box_files()
                     self.loaded = True
                     self.save()  # Save to main file
                     print("[SinewStorage] Restored from backup")
                 except Exception as e2:
                     print(f"[SinewStorage] Backup also failed: {e2}")
                     self.data = self._create_empty_storage()
+                    self._reset_cache()
                     self.save()
                     self.loaded = True
             else:
                 self.data = self._create_empty_storage()
+                self._reset_cache()
                 self.save()
                 self.loaded = True
 
+    @staticmethod
+    def _is_legacy_format(data):
+        """True for the version 1 layout that kept every slot in one file"""
+        if not isinstance(data, dict) or not isinstance(data.get("boxes"), list):
+            return False
+        return any(isinstance(b, dict) and "slots" in b for b in data["boxes"])
+
+    def _migrate_legacy(self):
+        """
+        Split a version 1 storage file into per-box files and an index.
+
+        The original file is copied to LEGACY_BACKUP_FILE first so the
+        migration can always be undone by hand.
+        """
+        print("[SinewStorage] Migrating storage to paged format...")
+        try:
+            shutil.copy2(STORAGE_FILE, LEGACY_BACKUP_FILE)
+        except Exception as e:
+            print(f"[SinewStorage] Legacy backup failed: {e}")
+
+        index_boxes = []
+        for idx, box in enumerate(self.data["boxes"]):
+            if not isinstance(box, dict):
+                box = {}
+            slots = box.get("slots") or []
+            slots = (list(slots) + [None] * SLOTS_PER_BOX)[:SLOTS_PER_BOX]
+            count = sum(1 for p in slots if p is not None)
+            shiny = sum(1 for p in slots if p is not None and _is_shiny(p))
+            if count:
+                self._write_json_atomic(_box_file(idx), {"slots": slots})
+            index_boxes.append(
+                {
+                    "name": box.get("name", _default_box_name(idx)),
+                    "count": count,
+                    "shiny": shiny,
+                }
+            )
+
+        self.data = {
+            "version": STORAGE_VERSION,
+            "last_modified": datetime.now().isoformat(),
+            "slots_per_box": SLOTS_PER_BOX,
+            "boxes": index_boxes,
+        }
+        self._write_json_atomic(STORAGE_FILE, self.data, indent=2)
+        print(f"[SinewStorage] Migrated {len(index_boxes)} boxes")
+
     def _validate_structure(self):
-        """Validate storage structure"""
+        """Validate storage index structure"""
         if not isinstance(self.data, dict):
             return False
         if "version" not in self.data:
@@ -137,48 +354,108 @@ class SinewStorage:
         if not isinstance(self.data["boxes"], list):
             return False
 
-        # Ensure we have correct number of boxes
-        while len(self.data["boxes"]) < NUM_BOXES:
-            idx = len(self.data["boxes"])
-            self.data["boxes"].append(
-                {
-                    "name": (
-                        DEFAULT_BOX_NAMES[idx]
-                        if idx < len(DEFAULT_BOX_NAMES)
-                        else f"Storage {idx+1}"
-                    ),
-                    "slots": [None] * SLOTS_PER_BOX,
-                }
-            )
+        self.data["version"] = STORAGE_VERSION
+        self.data["slots_per_box"] = SLOTS_PER_BOX
+
+        self._grow_to_capacity()
 
-        # Validate each box
+        # Validate each box entry
         for box in self.data["boxes"]:
             if not isinstance(box, dict):
                 return False
-            if "slots" not in box:
-                box["slots"] = [None] * SLOTS_PER_BOX
             if "name" not in box:
                 box["name"] = "Unnamed"
-            # Ensure slots list is correct length
-            while len(box["slots"]) < SLOTS_PER_BOX:
-                box["slots"].append(None)
-            if len(box["slots"]) > SLOTS_PER_BOX:
-                box["slots"] = box["slots"][:SLOTS_PER_BOX]
+            box.setdefault("count", 0)
+            box.setdefault("shiny", 0)
 
         return True
 
+    @staticmethod
+    def _write_json_atomic(path, data, indent=None):
+        """Write JSON to path via a temp file and rename"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if indent:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+            else:
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _write_box(self, idx):
+        """Write one resident box to disk (deleting the file if empty)"""
+        slots = self._boxes.get(idx)
+        if slots is None:
+            return
+
+        path = _box_file(idx)
+        if os.path.exists(path):
+            try:
+                shutil.copy2(path, _box_backup_file(idx))
+            except Exception as e:
+                print(f"[SinewStorage] Box {idx + 1} backup failed: {e}")
+
+        if self.data["boxes"][idx].get("count", 0) == 0:
+            if os.path.exists(path):
+                os.remove(path)
+        else:
+            self._write_json_atomic(path, {"slots": slots})
+        self._drop_spill(idx)
+
+    def _spill_box(self, idx):
+        """Write a dirty box to its spill file during batch()"""
+        self._write_json_atomic(_box_spill_file(idx), {"slots": self._boxes[idx]})
+        self._spilled.add(idx)
+
+    def _promote_spill(self, idx):
+        """Make a committed batch's spill file the box's data file"""
+        path = _box_file(idx)
+        if os.path.exists(path):
+            try:
+                shutil.copy2(path, _box_backup_file(idx))
+            except Exception as e:
+                print(f"[SinewStorage] Box {idx + 1} backup failed: {e}")
+
+        if self.data["boxes"][idx].get("count", 0) == 0:
+            if os.path.exists(path):
+                os.remove(path)
+            self._drop_spill(idx)
+            return
+        os.replace(_box_spill_file(idx), path)
+        self._spilled.discard(idx)
+
+    def _drop_spill(self, idx):
+        """Remove a box's spill file once the box itself has been written"""
+        if idx not in self._spilled:
+            return
+        self._spilled.discard(idx)
+        try:
+            os.remove(_box_spill_file(idx))
+        except OSError:
+            pass
+
     def save(self):
-        """Save storage to file with atomic write and backup"""
+        """Save dirty boxes and the index with atomic writes and backup"""
         if not self.data:
             return False
+        if self._batch_depth > 0:
+            # Committed once when the outermost batch() exits
+            return True
 
         try:
             self._ensure_storage_dir()
 
+            # Box files go out before the index that counts them
+            for idx in sorted(self._spilled - self._dirty_boxes):
+                self._promote_spill(idx)
+            for idx in sorted(self._dirty_boxes):
+                self._write_box(idx)
+            self._dirty_boxes.clear()
+            self._evict()
+
             # Update timestamp
             self.data["last_modified"] = datetime.now().isoformat()
 
-            # Create backup of existing file
+            # Create backup of existing index
             if os.path.exists(STORAGE_FILE):
                 try:
                     shutil.copy2(STORAGE_FILE, BACKUP_FILE)
@@ -188,11 +465,7 @@ class SinewStorage:
             # Write to temp file first (atomic write)
             with open(TEMP_FILE, "w", encoding="utf-8") as f:
                 json.dump(self.data, f, indent=2, ensure_ascii=False)
-
-            # Rename temp to actual file
-            if os.path.exists(STORAGE_FILE):
-                os.remove(STORAGE_FILE)
-            os.rename(TEMP_FILE, STORAGE_FILE)
+            os.replace(TEMP_FILE, STORAGE_FILE)
 
             # Increment version counter so PC Box knows to refresh
             self._increment_version()
@@ -212,59 +485,235 @@ class SinewStorage:
         """Check if storage is loaded"""
         return self.loaded and self.data is not None
 
+    @contextmanager
+    def batch(self):
+        """
+        Group many writes into one commit.
+
+        Slot changes made inside the block are not saved individually;
+        the index (with its counters) is written once on exit. Batches nest.
+
+        Usage:
+            with storage.batch():
+                for pokemon in pokemon_list:
+                    storage.deposit_pokemon(pokemon)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.save()
+
+    def in_batch(self):
+        """True while inside batch()"""
+        return self._batch_depth > 0
+
+    # ------------------------------------------------------------------ #
+    #  Box paging                                                          #
+    # ------------------------------------------------------------------ #
+
+    def _read_box_file(self, idx):
+        """Read a box's stored slots from disk (spill, main file, then backup)"""
+        paths = [_box_file(idx), _box_backup_file(idx)]
+        if idx in self._spilled:
+            paths.insert(0, _box_spill_file(idx))
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    slots = json.load(f).get("slots") or []
+                return (list(slots) + [None] * SLOTS_PER_BOX)[:SLOTS_PER_BOX]
+            except Exception as e:
+                print(f"[SinewStorage] Error reading box {idx + 1}: {e}")
+        return [None] * SLOTS_PER_BOX
+
+    def _get_slots(self, idx):
+        """Get the stored slot list for a box, loading it if not resident"""
+        slots = self._boxes.get(idx)
+        if slots is not None:
+            self._boxes.move_to_end(idx)
+            return slots
+
+        if self.data["boxes"][idx].get("count", 0) > 0 or idx in self._spilled:
+            slots = self._read_box_file(idx)
+            self._reconcile_counts(idx, slots)
+        else:
+            slots = [None] * SLOTS_PER_BOX
+        self._boxes[idx] = slots
+        self._evict()
+        return slots
+
+    def _reconcile_counts(self, idx, slots):
+        """
+        Fix a box's index counters if they disagree with its file.
+
+        They can drift if Sinew exits after a box file was written but
+        before the index was committed.
+        """
+        entry = self.data["boxes"][idx]
+        count = sum(1 for p in slots if p is not None)
+        shiny = sum(1 for p in slots if p is not None and _is_shiny(p))
+        if count == entry.get("count", 0) and shiny == entry.get("shiny", 0):
+            return
+        print(
+            f"[SinewStorage] Box {idx + 1} counters out of date"
+            f" ({entry.get('count', 0)} -> {count}), fixing"
+        )
+        self._total_count += count - entry.get("count", 0)
+        self._total_shiny += shiny - entry.get("shiny", 0)
+        entry["count"] = count
+        entry["shiny"] = shiny
+
+    def _evict(self):
+        """
+        Drop least recently used boxes beyond the residency limit.
+
+        Dirty boxes are kept until saved, except inside batch() where
+        they are written to spill files first so memory stays bounded.
+        """
+        if len(self._boxes) <= MAX_RESIDENT_BOXES:
+            return
+        # Never drop the most recently used box - its caller holds the list
+        for idx in list(self._boxes)[:-1]:
+            if len(self._boxes) <= MAX_RESIDENT_BOXES:
+                break
+            if idx in self._dirty_boxes:
+                if not self._batch_depth:
+                    continue
+                self._spill_box(idx)
+                self._dirty_boxes.discard(idx)
+            del self._boxes[idx]
+
+    def get_resident_box_count(self):
+        """Number of boxes currently held in memory"""
+        return len(self._boxes)
+
+    def _valid_box_index(self, box_number):
+        """Convert a 1-indexed box number to a 0-index, or None if out of range"""
+        if not self.is_loaded():
+            return None
+        idx = box_number - 1
+        if 0 <= idx < len(self.data["boxes"]):
+            return idx
+        return None
+
+    def _store_slot(self, idx, slot, stored):
+        """
+        Replace one slot without saving, updating box and global counters.
+
+        Args:
+            idx: 0-indexed box
+            slot: Slot index
+            stored: Already-encoded Pokemon dict or None
+        """
+        slots = self._get_slots(idx)
+        old = slots[slot]
+        entry = self.data["boxes"][idx]
+
+        if old is not None:
+            entry["count"] -= 1
+            self._total_count -= 1
+            if _is_shiny(old):
+                entry["shiny"] -= 1
+                self._total_shiny -= 1
+        if stored is not None:
+            entry["count"] += 1
+            self._total_count += 1
+            if _is_shiny(stored):
+                entry["shiny"] += 1
+                self._total_shiny += 1
+
+        slots[slot] = stored
+        self._dirty_boxes.add(idx)
+        get_pokemon_index().update(sinew_location(idx + 1, slot), stored)
+
+    def iter_pokemon(self):
+        """
+        Iterate every stored Pokemon without keeping boxes resident.
+
+        Boxes that are already in memory are read from the cache; others are
+        read straight from disk and discarded, so memory stays flat no matter
+        how many boxes exist. Empty boxes are skipped using the index counts.
+
+        Yields:
+            tuple: (box_number, slot_index, pokemon_dict)
+        """
+        if not self.is_loaded():
+            return
+
+        for idx, entry in enumerate(self.data["boxes"]):
+            if entry.get("count", 0) == 0:
+                continue
+            slots = self._boxes.get(idx)
+            if slots is None:
+                slots = self._read_box_file(idx)
+            for slot_idx, p in enumerate(slots):
+                if p is not None:
+                    yield idx + 1, slot_idx, _decode_pokemon(p)
+
+    def iter_empty_slots(self):
+        """
+        Iterate empty slots in box order.
+
+        Full boxes are skipped by count and empty boxes yield every slot
+        without being loaded; each partly filled box is scanned once when
+        reached. Filling the yielded slots while iterating is safe.
+
+        Yields:
+            tuple: (box_number, slot_index)
+        """
+        if not self.is_loaded():
+            return
+
+        for idx in range(len(self.data["boxes"])):
+            count = self.data["boxes"][idx].get("count", 0)
+            if count >= SLOTS_PER_BOX:
+                continue
+            if count == 0:
+                free = range(SLOTS_PER_BOX)
+            else:
+                free = [i for i, p in enumerate(self._get_slots(idx)) if p is None]
+            for slot_idx in free:
+                yield idx + 1, slot_idx
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                          #
+    # ------------------------------------------------------------------ #
+
     def get_box(self, box_number):
         """
         Get a specific box (1-indexed).
 
         Args:
-            box_number: Box number (1 to NUM_BOXES)
+            box_number: Box number (1 to get_box_count())
 
         Returns:
             list: 120 slots (Pokemon dicts or None for empty)
         """
-        if not self.is_loaded():
+        idx = self._valid_box_index(box_number)
+        if idx is None:
             return [None] * SLOTS_PER_BOX
 
-        idx = box_number - 1
-        if 0 <= idx < len(self.data["boxes"]):
-            slots = self.data["boxes"][idx]["slots"]
-            # Return copies with raw_bytes decoded
-            result = []
-            for p in slots:
-                if p:
-                    pokemon_copy = p.copy()
-                    # Decode raw_bytes from base64 string
-                    if "raw_bytes_b64" in pokemon_copy:
-                        pokemon_copy["raw_bytes"] = base64.b64decode(
-                            pokemon_copy["raw_bytes_b64"]
-                        )
-                        del pokemon_copy["raw_bytes_b64"]
-                    result.append(pokemon_copy)
-                else:
-                    result.append(None)
-            return result
-        return [None] * SLOTS_PER_BOX
+        # Return copies with raw_bytes decoded
+        return [_decode_pokemon(p) if p else None for p in self._get_slots(idx)]
 
     def get_box_name(self, box_number):
         """Get name of a specific box"""
-        if not self.is_loaded():
+        idx = self._valid_box_index(box_number)
+        if idx is None:
             return f"Storage {box_number}"
-
-        idx = box_number - 1
-        if 0 <= idx < len(self.data["boxes"]):
-            return self.data["boxes"][idx].get("name", f"Storage {box_number}")
-        return f"Storage {box_number}"
+        return self.data["boxes"][idx].get("name", f"Storage {box_number}")
 
     def set_box_name(self, box_number, name):
         """Set name of a specific box"""
-        if not self.is_loaded():
+        idx = self._valid_box_index(box_number)
+        if idx is None:
             return False
-
-        idx = box_number - 1
-        if 0 <= idx < len(self.data["boxes"]):
-            self.data["boxes"][idx]["name"] = name
-            return self.save()
-        return False
+        self.data["boxes"][idx]["name"] = name
+        return self.save()
 
     def get_pokemon_at(self, box_number, slot):
         """
@@ -277,24 +726,14 @@ class SinewStorage:
         Returns:
             dict or None: Pokemon data or None if empty
         """
-        if not self.is_loaded():
+        idx = self._valid_box_index(box_number)
+        if idx is None or not 0 <= slot < SLOTS_PER_BOX:
+            return None
+        if self.data["boxes"][idx].get("count", 0) == 0:
             return None
 
-        idx = box_number - 1
-        if 0 <= idx < len(self.data["boxes"]):
-            slots = self.data["boxes"][idx]["slots"]
-            if 0 <= slot < len(slots):
-                p = slots[slot]
-                if p:
-                    pokemon_copy = p.copy()
-                    # Decode raw_bytes from base64 string
-                    if "raw_bytes_b64" in pokemon_copy:
-                        pokemon_copy["raw_bytes"] = base64.b64decode(
-                            pokemon_copy["raw_bytes_b64"]
-                        )
-                        del pokemon_copy["raw_bytes_b64"]
-                    return pokemon_copy
-        return None
+        p = self._get_slots(idx)[slot]
+        return _decode_pokemon(p) if p else None
 
     def set_pokemon_at(self, box_number, slot, pokemon):
         """
@@ -308,29 +747,13 @@ class SinewStorage:
         Returns:
             bool: Success
         """
-        if not self.is_loaded():
+        idx = self._valid_box_index(box_number)
+        if idx is None or not 0 <= slot < SLOTS_PER_BOX:
             return False
 
-        idx = box_number - 1
-        if 0 <= idx < len(self.data["boxes"]):
-            slots = self.data["boxes"][idx]["slots"]
-            if 0 <= slot < len(slots):
-                # Store a copy with raw_bytes encoded as base64
-                if pokemon:
-                    pokemon_copy = pokemon.copy()
-                    # Encode raw_bytes to base64 string for JSON storage
-                    if "raw_bytes" in pokemon_copy and isinstance(
-                        pokemon_copy["raw_bytes"], bytes
-                    ):
-                        pokemon_copy["raw_bytes_b64"] = base64.b64encode(
-                            pokemon_copy["raw_bytes"]
-                        ).decode("ascii")
-                        del pokemon_copy["raw_bytes"]
-                    self.data["boxes"][idx]["slots"][slot] = pokemon_copy
-                else:
-                    self.data["boxes"][idx]["slots"][slot] = None
-                return self.save()
-        return False
+        # Store a copy with raw_bytes encoded as base64
+        self._store_slot(idx, slot, _encode_pokemon(pokemon) if pokemon else None)
+        return self.save()
 
     def clear_slot(self, box_number, slot):
         """Clear a specific slot"""
@@ -340,6 +763,9 @@ class SinewStorage:
         """
         Find first empty slot.
 
+        Full boxes are skipped using the index counts, so only the box that
+        actually has room is loaded.
+
         Args:
             box_number: If specified, search only this box. Otherwise search all.
 
@@ -350,19 +776,21 @@ class SinewStorage:
             return None
 
         if box_number is not None:
-            idx = box_number - 1
-            if 0 <= idx < len(self.data["boxes"]):
-                slots = self.data["boxes"][idx]["slots"]
-                for i, p in enumerate(slots):
-                    if p is None:
-                        return (box_number, i)
-            return None
-
-        # Search all boxes
-        for box_idx, box in enumerate(self.data["boxes"]):
-            for slot_idx, p in enumerate(box["slots"]):
+            candidates = [box_number - 1]
+        else:
+            candidates = range(len(self.data["boxes"]))
+
+        for idx in candidates:
+            if not 0 <= idx < len(self.data["boxes"]):
+                continue
+            count = self.data["boxes"][idx].get("count", 0)
+            if count >= SLOTS_PER_BOX:
+                continue
+            if count == 0:
+                return (idx + 1, 0)
+            for slot_idx, p in enumerate(self._get_slots(idx)):
                 if p is None:
-                    return (box_idx + 1, slot_idx)
+                    return (idx + 1, slot_idx)
         return None
 
     def deposit_pokemon(self, pokemon, box_number=None):
@@ -411,54 +839,82 @@ class SinewStorage:
         Returns:
             bool: Success
         """
-        pokemon = self.get_pokemon_at(from_box, from_slot)
-        if not pokemon:
+        from_idx = self._valid_box_index(from_box)
+        to_idx = self._valid_box_index(to_box)
+        if from_idx is None or to_idx is None:
+            return False
+        if not (0 <= from_slot < SLOTS_PER_BOX and 0 <= to_slot < SLOTS_PER_BOX):
             return False
 
-        # Get existing Pokemon at destination (for swap)
-        dest_pokemon = self.get_pokemon_at(to_box, to_slot)
-
-        # Set destination
-        if not self.set_pokemon_at(to_box, to_slot, pokemon):
+        pokemon = self._get_slots(from_idx)[from_slot]
+        if not pokemon:
             return False
 
-        # Set source (swap or clear)
-        if dest_pokemon:
-            self.set_pokemon_at(from_box, from_slot, dest_pokemon)
-        else:
-            self.clear_slot(from_box, from_slot)
+        # Existing Pokemon at destination (for swap), then both slots in one save
+        dest_pokemon = self._get_slots(to_idx)[to_slot]
+        self._store_slot(to_idx, to_slot, pokemon)
+        self._store_slot(from_idx, from_slot, dest_pokemon)
+        return self.save()
+
+    def _grow_to_capacity(self):
+        """Append empty boxes up to the configured count; never drops boxes"""
+        capacity = _load_capacity_setting()
+        added = 0
+        while len(self.data["boxes"]) < capacity:
+            idx = len(self.data["boxes"])
+            self.data["boxes"].append(
+                {"name": _default_box_name(idx), "count": 0, "shiny": 0}
+            )
+            added += 1
+        return added
 
-        return True
+    def apply_capacity_setting(self):
+        """
+        Grow storage to a box count just changed in Settings.
+
+        Returns:
+            int: Boxes added (0 if already at or above the setting)
+        """
+        if not self.is_loaded():
+            return 0
+        added = self._grow_to_capacity()
+        if added:
+            print(f"[SinewStorage] Added {added} boxes")
+            self.save()
+        return added
 
     def get_box_count(self):
         """Get number of boxes"""
-        return NUM_BOXES
+        if not self.is_loaded():
+            return NUM_BOXES
+        return len(self.data["boxes"])
 
     def get_slots_per_box(self):
         """Get number of slots per box"""
         return SLOTS_PER_BOX
 
+    def get_capacity(self):
+        """Get total number of slots across all boxes"""
+        return self.get_box_count() * SLOTS_PER_BOX
+
     def get_total_pokemon_count(self):
         """Get total number of Pokemon in storage"""
         if not self.is_loaded():
             return 0
+        return self._total_count
 
-        count = 0
-        for box in self.data["boxes"]:
-            for p in box["slots"]:
-                if p is not None:
-                    count += 1
-        return count
+    def get_total_shiny_count(self):
+        """Get total number of shiny Pokemon in storage"""
+        if not self.is_loaded():
+            return 0
+        return self._total_shiny
 
     def get_box_pokemon_count(self, box_number):
         """Get number of Pokemon in a specific box"""
-        if not self.is_loaded():
+        idx = self._valid_box_index(box_number)
+        if idx is None:
             return 0
-
-        idx = box_number - 1
-        if 0 <= idx < len(self.data["boxes"]):
-            return sum(1 for p in self.data["boxes"][idx]["slots"] if p is not None)
-        return 0
+        return self.data["boxes"][idx].get("count", 0)
 
 
 # Global singleton instance
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+
+"""
+Sprite Atlas
+Packs the gen3 Pokemon sprites, item icons and badge icons into a few atlas
+images, and serves them at runtime as subsurfaces.
+
+Loading 772+ small PNGs one by one means hundreds of file opens at startup,
+which is slow on SD-card handhelds. build_atlases() (run from the database
+builder) shelf-packs every group into pages of at most ATLAS_MAX_SIZE
+pixels and writes data/sprites/atlas/index.json mapping each source file
+(relative to SPRITES_DIR) to its page and rectangle. At runtime a page is
+read once, the first time one of its sprites is asked for.
+
+Files missing from the index (downloaded after the last build, or no atlas
+at all) are loaded from disk as before.
+
+Usage:
+    from sprite_atlas import image_exists, load_image
+    if image_exists(path):
+        surf = load_image(path)   # subsurface of an atlas page - don't draw on it
+
+    build_atlases(log=print)      # build step
+"""
+
+import json
+import os
+import time
+
+import pygame
+
+from config import GEN3_NORMAL_DIR, GEN3_SHINY_DIR, SPRITES_DIR
+
+ATLAS_DIR = os.path.join(SPRITES_DIR, "atlas")
+ATLAS_INDEX_PATH = os.path.join(ATLAS_DIR, "index.json")
+ATLAS_VERSION = 1
+
+# Largest page edge; small enough for every GPU/SDL renderer
+ATLAS_MAX_SIZE = 2048
+
+# Atlas group -> source folders (each scanned for PNGs, subfolders included)
+ATLAS_GROUPS = {
+    "gen3_normal": [GEN3_NORMAL_DIR],
+    "gen3_shiny": [GEN3_SHINY_DIR],
+    "items": [os.path.join(SPRITES_DIR, "items")],
+    "badges": [os.path.join(SPRITES_DIR, "badges")],
+}
+
+
+def _atlas_key(path):
+    """Index key of a sprite file: its path relative to SPRITES_DIR"""
+    rel = os.path.relpath(os.path.abspath(path), SPRITES_DIR)
+    return rel.replace(os.sep, "/")
+
+
+# ---------------------------------------------------------------------- #
+#  Build                                                                   #
+# ---------------------------------------------------------------------- #
+
+
+def _collect_sources(folders):
+    """Sorted PNG paths under the given folders"""
+    paths = []
+    for folder in folders:
+        if not os.path.isdir(folder):
+            continue
+        for root, _, files in os.walk(folder):
+            for name in files:
+                if name.lower().endswith(".png"):
+                    paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def _shelf_pack(sizes, max_size=ATLAS_MAX_SIZE):
+    """
+    Place rectangles on shelves, tallest first.
+
+    Args:
+        sizes: [(key, width, height)]
+
+    Returns:
+        list: pages, each {"size": (w, h), "rects": {key: (x, y, w, h)}}
+    """
+    pages = []
+    page = None
+    x = y = shelf_h = 0
+    for key, w, h in sorted(sizes, key=lambda s: (-s[2], -s[1], s[0])):
+        w = min(w, max_size)
+        h = min(h, max_size)
+        if page is not None and x + w > max_size:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if page is None or y + h > max_size:
+            page = {"size": [0, 0], "rects": {}}
+            pages.append(page)
+            x = y = shelf_h = 0
+        page["rects"][key] = (x, y, w, h)
+        page["size"][0] = max(page["size"][0], x + w)
+        page["size"][1] = max(page["size"][1], y + h)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return pages
+
+
+def build_atlases(log=print, cancel=None):
+    """
+    Pack every ATLAS_GROUPS sprite into atlas pages and write the index.
+
+    Uses Pillow so it can run on a builder thread without a display. Pages
+    are written beside their final names and only moved into place, index
+    last, once every group is packed, so a cancelled or failed build leaves
+    the previous atlas untouched.
+
+    Args:
+        log: Line logger
+        cancel: Optional callable, checked between pages; True stops the build
+
+    Returns:
+        int: Number of sprites packed (0 if cancelled)
+    """
+    from PIL import Image
+
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    start = time.time()
+    index = {"version": ATLAS_VERSION, "built": int(start), "pages": {}, "sprites": {}}
+    written = []  # (tmp path, final path)
+    packed = 0
+
+    def cancelled():
+        if cancel is None or not cancel():
+            return False
+        for tmp_path, _ in written:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        log("[Atlas] Build cancelled, keeping the previous atlas")
+        return True
+
+    for group, folders in ATLAS_GROUPS.items():
+        if cancelled():
+            return 0
+        images = {}
+        for path in _collect_sources(folders):
+            try:
+                with Image.open(path) as img:
+                    images[_atlas_key(path)] = img.convert("RGBA")
+            except Exception as e:
+                log(f"[Atlas] Skipping {path}: {e}")
+        if not images:
+            continue
+
+        sizes = [(key, img.width, img.height) for key, img in images.items()]
+        for page_no, page in enumerate(_shelf_pack(sizes)):
+            if cancelled():
+                return 0
+            page_name = f"{group}_{page_no}.png"
+            sheet = Image.new("RGBA", tuple(page["size"]), (0, 0, 0, 0))
+            for key, (x, y, w, h) in page["rects"].items():
+                sheet.paste(images[key].crop((0, 0, w, h)), (x, y))
+                index["sprites"][key] = [page_name, x, y, w, h]
+
+            page_path = os.path.join(ATLAS_DIR, page_name)
+            tmp_path = page_path + ".tmp"
+            sheet.save(tmp_path, format="PNG")
+            written.append((tmp_path, page_path))
+            index["pages"][page_name] = page["size"]
+            log(
+                f"[Atlas] {page_name}: {len(page['rects'])} sprites,"
+                f" {page['size'][0]}x{page['size'][1]}"
+            )
+        packed += len(images)
+
+    if cancelled():
+        return 0
+    for tmp_path, page_path in written:
+        os.replace(tmp_path, page_path)
+
+    # The index goes last so a half-built atlas is never used
+    tmp_path = ATLAS_INDEX_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, ATLAS_INDEX_PATH)
+
+    log(
+        f"[Atlas] Packed {packed} sprites into {len(index['pages'])} pages"
+        f" in {time.time() - start:.1f}s"
+    )
+    get_sprite_atlas().reload()
+    return packed
+
+
+# ---------------------------------------------------------------------- #
+#  Runtime                                                                 #
+# ---------------------------------------------------------------------- #
+
+
+class _AtlasState:
+    """One index with the pages and subsurfaces cut from it"""
+
+    def __init__(self, sprites):
+        self.sprites = sprites  # key -> [page, x, y, w, h]
+        self.pages = {}  # page name -> Surface (or None if unreadable)
+        self.subsurfaces = {}  # key -> Surface
+
+
+class SpriteAtlas:
+    """
+    Atlas pages loaded on first use, handing out subsurfaces.
+
+    All lookups go through one _AtlasState that reload() replaces in a
+    single assignment, so a rebuild on the builder thread never leaves
+    get()/contains() on another thread looking at a half-cleared atlas.
+    """
+
+    def __init__(self, index_path=ATLAS_INDEX_PATH):
+        self.index_path = index_path
+        self._state = None
+
+    def _read_index(self):
+        """Sprite entries of the index file ({} if missing or unreadable)"""
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == ATLAS_VERSION:
+                sprites = index.get("sprites", {})
+                print(
+                    f"[Atlas] Index lists {len(sprites)} sprites"
+                    f" in {len(index.get('pages', {}))} pages"
+                )
+                return sprites
+        except Exception as e:
+            print(f"[Atlas] Could not read index: {e}")
+        return {}
+
+    def _current(self):
+        state = self._state
+        if state is None:
+            state = _AtlasState(self._read_index())
+            self._state = state
+        return state
+
+    def reload(self):
+        """Switch to the rebuilt index, dropping pages of the old one"""
+        self._state = _AtlasState(self._read_index())
+
+    def contains(self, path):
+        """True if path was packed into the atlas"""
+        return _atlas_key(path) in self._current().sprites
+
+    def _page(self, state, name):
+        if name not in state.pages:
+            try:
+                state.pages[name] = pygame.image.load(
+                    os.path.join(os.path.dirname(self.index_path), name)
+                ).convert_alpha()
+            except Exception as e:
+                print(f"[Atlas] Could not load page {name}: {e}")
+                state.pages[name] = None
+        return state.pages[name]
+
+    def get(self, path):
+        """
+        The sprite at path as a subsurface of its atlas page.
+
+        Returns:
+            pygame.Surface or None if path isn't in the atlas
+        """
+        state = self._current()
+        key = _atlas_key(path)
+        surf = state.subsurfaces.get(key)
+        if surf is not None:
+            return surf
+        entry = state.sprites.get(key)
+        if entry is None:
+            return None
+        page = self._page(state, entry[0])
+        if page is None:
+            return None
+        surf = page.subsurface(pygame.Rect(entry[1], entry[2], entry[3], entry[4]))
+        state.subsurfaces[key] = surf
+        return surf
+
+
+_atlas = None
+
+
+def get_sprite_atlas():
+    """Get or create the shared SpriteAtlas"""
+    global _atlas
+    if _atlas is None:
+        _atlas = SpriteAtlas()
+    return _atlas
+
+
+def image_exists(path):
+    """os.path.exists for sprite files, answered from the atlas when packed"""
+    return bool(path) and (get_sprite_atlas().contains(path) or os.path.exists(path))
+
+
+def load_image(path):
+    """
+    Load a sprite from the atlas, or from disk if it isn't packed.
+
+    Raises:
+        pygame.error / FileNotFoundError: If it's in neither
+    """
+    surf = get_sprite_atlas().get(path)
+    if surf is None:
+        surf = pygame.image.load(path).convert_alpha()
+    return surf
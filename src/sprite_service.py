@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+"""
+Sprite Service
+Prescaled gen3 Pokemon sprites shared by every screen that draws them.
+
+A sprite is looked up by (species, shiny, form, egg, size, scale mode) and
+decoded, converted and scaled once; afterwards drawing it is a dict hit.
+Decoded originals and scaled copies share one LRU with a byte budget
+(sinew_settings.json "sprite_cache_mb", SPRITE_CACHE_MB by default), so
+switching between large and small sizes never grows memory without bound.
+
+Entries only go stale when the files or the look change: the cache is
+cleared on theme changes (theme_manager.apply_theme) and after the
+database builder downloads sprites. Size changes simply miss, and the old
+sizes age out.
+
+The cache is locked, so a loader thread can prescale sprites (e.g. the
+Pokedex warming its list) while the UI thread draws. Decoding and scaling
+happen outside the lock; it is only held to look up and insert entries.
+
+Scale modes:
+    fit      smoothscale to fit the size, keeping aspect ratio, never upscaled
+    zoom     like fit, but small sprites are scaled up too
+    zoom_pixel  like zoom, nearest-neighbour (crisp pixel art)
+    stretch  smoothscale to exactly the size
+    pixel    nearest-neighbour scale to exactly the size
+
+Usage:
+    sprites = get_sprite_service()
+    surf = sprites.get(25, shiny=True, size=(40, 40))
+    surf = sprites.get_for_pokemon(pokemon, (96, 96), scale="pixel")
+    surf = sprites.get_path(path, (48, 48))
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from config import GEN3_NORMAL_DIR, GEN3_SHINY_DIR, SETTINGS_FILE, get_egg_sprite_path
+from sprite_atlas import get_sprite_atlas, image_exists
+
+# Default memory budget for decoded and scaled sprites
+SPRITE_CACHE_MB = 16
+
+
+def _load_budget_setting():
+    """Read the sprite cache budget (in MB) from sinew_settings.json"""
+    try:
+        if os.path.exists(SETTINGS_FILE):
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            return max(1, int(settings.get("sprite_cache_mb", SPRITE_CACHE_MB)))
+    except Exception as e:
+        print(f"[SpriteService] Could not read budget setting: {e}")
+    return SPRITE_CACHE_MB
+
+
+def _surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def is_shiny_pokemon(pokemon):
+    """Shiny check on a Pokemon dict (TID ^ SID ^ PID halves < 8)"""
+    if not pokemon or pokemon.get("empty") or pokemon.get("egg"):
+        return False
+    if pokemon.get("is_shiny"):
+        return True
+    personality = pokemon.get("personality", 0)
+    ot_id = pokemon.get("ot_id", 0)
+    if personality == 0 or ot_id == 0:
+        return False
+    xor = (ot_id & 0xFFFF) ^ ((ot_id >> 16) & 0xFFFF)
+    xor ^= (personality & 0xFFFF) ^ ((personality >> 16) & 0xFFFF)
+    return xor < 8
+
+
+class SpriteService:
+    """LRU of decoded and prescaled sprite surfaces within a byte budget"""
+
+    def __init__(self, budget_bytes=None):
+        if budget_bytes is None:
+            budget_bytes = _load_budget_setting() * 1024 * 1024
+        self.budget_bytes = budget_bytes
+        self._cache = OrderedDict()  # key -> Surface (LRU order)
+        self._bytes = 0
+        self._paths = {}  # (species, shiny, form, egg) -> path or None
+        self._lock = threading.RLock()
+        self._generation = 0  # Bumped by invalidate(); older loads aren't stored
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------ #
+    #  LRU                                                                 #
+    # ------------------------------------------------------------------ #
+
+    def _lookup(self, key):
+        cache = self._cache
+        surf = cache.get(key)
+        if surf is not None:
+            cache.move_to_end(key)
+        return surf
+
+    def _store(self, key, surf):
+        size = _surface_bytes(surf)
+        if size > self.budget_bytes:
+            return  # Never cache something bigger than the whole budget
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= _surface_bytes(old)
+        self._cache[key] = surf
+        self._bytes += size
+        while self._bytes > self.budget_bytes and self._cache:
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= _surface_bytes(evicted)
+
+    def set_budget(self, budget_bytes):
+        """Change the budget, evicting least recently used sprites to fit"""
+        with self._lock:
+            self.budget_bytes = max(0, int(budget_bytes))
+            while self._bytes > self.budget_bytes and self._cache:
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= _surface_bytes(evicted)
+
+    def invalidate(self):
+        """
+        Drop every cached sprite and resolved path.
+
+        The tables are swapped rather than cleared, so a build thread can
+        call this while the UI thread is drawing.
+        """
+        with self._lock:
+            self._cache = OrderedDict()
+            self._paths = {}
+            self._bytes = 0
+            self._generation += 1
+
+    def stats(self):
+        """Cache counters for the debug overlay / logs"""
+        return {
+            "entries": len(self._cache),
+            "bytes": self._bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    # ------------------------------------------------------------------ #
+    #  Loading                                                             #
+    # ------------------------------------------------------------------ #
+
+    def _resolve_path(self, species, shiny, form, egg):
+        """Sprite path for a species (os.path.exists is checked once)"""
+        key = (species, shiny, form, egg)
+        if key in self._paths:
+            return self._paths[key]
+
+        path = None
+        if egg:
+            path = get_egg_sprite_path("gen3")
+        elif species:
+            folder = GEN3_SHINY_DIR if shiny else GEN3_NORMAL_DIR
+            species_str = str(species).zfill(3)
+            if form:
+                path = os.path.join(folder, f"{species_str}-{form}.png")
+                if not image_exists(path):
+                    path = None
+            if path is None:
+                path = os.path.join(folder, f"{species_str}.png")
+        if path and not image_exists(path):
+            path = None
+        self._paths[key] = path
+        return path
+
+    def _store_if_current(self, key, surf, generation):
+        """
+        Insert a surface made outside the lock, unless invalidate() ran
+        meanwhile. Returns the cached surface if another thread got there
+        first.
+        """
+        with self._lock:
+            existing = self._lookup(key)
+            if existing is not None:
+                return existing
+            if generation == self._generation:
+                self._store(key, surf)
+            return surf
+
+    def _load_source(self, path, generation):
+        # Atlas pages are resident anyway; their subsurfaces cost nothing
+        key = ("src", path)
+        with self._lock:
+            surf = get_sprite_atlas().get(path)
+            if surf is None:
+                surf = self._lookup(key)
+        if surf is not None:
+            return surf
+        surf = pygame.image.load(path).convert_alpha()
+        return self._store_if_current(key, surf, generation)
+
+    @staticmethod
+    def _scale(surf, size, scale):
+        w, h = size
+        if scale == "pixel":
+            return pygame.transform.scale(surf, (w, h))
+        if scale == "stretch":
+            return pygame.transform.smoothscale(surf, (w, h))
+
+        sw, sh = surf.get_size()
+        if sw == 0 or sh == 0:
+            return surf
+        factor = min(w / sw, h / sh)
+        if scale not in ("zoom", "zoom_pixel"):
+            factor = min(factor, 1.0)  # Don't upscale
+        new_size = (max(1, int(sw * factor)), max(1, int(sh * factor)))
+        if new_size == (sw, sh):
+            return surf
+        if scale == "zoom_pixel":
+            return pygame.transform.scale(surf, new_size)
+        return pygame.transform.smoothscale(surf, new_size)
+
+    def get_path(self, path, size=None, scale="fit"):
+        """
+        Sprite at path scaled to size.
+
+        Args:
+            path: Image file
+            size: (width, height), or None for the original
+            scale: "fit", "zoom", "zoom_pixel", "stretch" or "pixel"
+
+        Returns:
+            pygame.Surface or None if the file is missing or unreadable
+        """
+        if not path:
+            return None
+        size = (int(size[0]), int(size[1])) if size else None
+        key = (path, size, scale)
+        with self._lock:
+            surf = self._lookup(key)
+            if surf is not None:
+                self.hits += 1
+                return surf
+            self.misses += 1
+            generation = self._generation
+
+        try:
+            source = self._load_source(path, generation)
+            surf = self._scale(source, size, scale) if size else source
+        except Exception as e:
+            print(f"[SpriteService] Could not load {path}: {e}")
+            return None
+        if surf is source:
+            return surf
+        return self._store_if_current(key, surf, generation)
+
+    def get_silhouette(self, path, size=None, scale="fit"):
+        """get_path() blacked out (colour kept only in the alpha channel)"""
+        key = (path, size and (int(size[0]), int(size[1])), scale, "silhouette")
+        with self._lock:
+            surf = self._lookup(key)
+            if surf is not None:
+                return surf
+            generation = self._generation
+
+        sprite = self.get_path(path, size, scale)
+        if sprite is None:
+            return None
+        surf = sprite.copy()
+        surf.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MIN)
+        return self._store_if_current(key, surf, generation)
+
+    def is_cached(self, path, size=None, scale="fit"):
+        """True if get_path() would be a cache hit"""
+        size = (int(size[0]), int(size[1])) if size else None
+        return (path, size, scale) in self._cache
+
+    def has_room(self, fraction=1.0):
+        """True while the cache holds less than fraction of its budget"""
+        return self._bytes < self.budget_bytes * fraction
+
+    def get(self, species, shiny=False, form=None, egg=False, size=None, scale="fit"):
+        """
+        Prescaled gen3 sprite of a species (or the egg).
+
+        Args:
+            species: National dex number
+            form: Form suffix (e.g. Unown letter) used if its file exists
+            size: (width, height), or None for the original
+
+        Returns:
+            pygame.Surface or None
+        """
+        with self._lock:
+            path = self._resolve_path(species, bool(shiny), form, bool(egg))
+        return self.get_path(path, size, scale)
+
+    def get_for_pokemon(self, pokemon, size=None, scale="fit"):
+        """Prescaled sprite for a Pokemon dict (game or Sinew storage)"""
+        if not pokemon or pokemon.get("empty"):
+            return None
+        return self.get(
+            pokemon.get("species", 0),
+            is_shiny_pokemon(pokemon),
+            pokemon.get("form"),
+            pokemon.get("egg", False),
+            size,
+            scale,
+        )
+
+
+_sprite_service = None
+
+
+def get_sprite_service():
+    """Get or create the shared SpriteService"""
+    global _sprite_service
+    if _sprite_service is None:
+        _sprite_service = SpriteService()
+    return _sprite_service
@@ -154,6 +154,15 @@ def apply_theme(theme_name):
             ui_colors.clear_font_cache()
             print(f"[ThemeManager] Cleared font cache for new font: {new_font}")
 
+        # Rendered text and tiles are redrawn in the new colours
+        ui_colors.clear_text_cache()
+        ui_colors.clear_tile_cache()
+
+        # Prescaled sprites are rebuilt for the new look
+        from sprite_service import get_sprite_service
+
+        get_sprite_service().invalidate()
+
         _current_theme_name = theme_name
         print(f"[ThemeManager] Applied theme: {theme_name}")
         return True
@@ -54,9 +54,9 @@ class ThemesScreen:
 
         # Fonts
         try:
-            self.font_header = pygame.font.Font(FONT_PATH, 18)
-            self.font_text = pygame.font.Font(FONT_PATH, 12)
-            self.font_small = pygame.font.Font(FONT_PATH, 10)
+            self.font_header = ui_colors.get_font(18, FONT_PATH)
+            self.font_text = ui_colors.get_font(12, FONT_PATH)
+            self.font_small = ui_colors.get_font(10, FONT_PATH)
         except Exception:
             self.font_header = pygame.font.SysFont(None, 24)
             self.font_text = pygame.font.SysFont(None, 18)
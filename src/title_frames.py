@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+"""
+Title Frames
+Compact storage for the per-game title GIF backgrounds.
+
+Decoding every frame of every title GIF into 480x320 RGBA surfaces costs
+600 KB per frame, tens of MB for five games. Instead each frame is kept at
+the GIF's own size as 8-bit palette indices, zlib-compressed, with the
+palette bytes shared between frames that use the same colours (frames with
+more than 256 colours or real transparency fall back to compressed RGB(A)).
+A frame is only turned into a display surface when it's drawn, scaled up
+with Pillow's nearest-neighbour resize like before (so the pixels match
+the old full-size frames at any scale), and the last RING_SIZE decoded
+frames of each animation are kept around for redraws.
+
+GIFs are decoded with Pillow alone on the asset_loader worker threads:
+the game on screen first, then the games next to it (prefetch()), and
+their frames stream in while the menu is in use. Packed animations
+share a memory budget ("title_cache_mb" in sinew_settings.json,
+TITLE_CACHE_MB by default); the least recently shown ones are dropped when
+it's exceeded, except those marked to keep.
+
+Usage:
+    store = get_title_store()
+    anim = store.get(gif_path)                # current game, loads first
+    store.prefetch([prev_gif, next_gif], keep=[gif_path, prev_gif, next_gif])
+
+    surf = anim.surface(frame_index, (480, 320))
+    duration = anim.duration(frame_index)
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import pygame
+
+import decoded_cache
+from asset_loader import PRIORITY_NOW, PRIORITY_SOON, get_asset_loader
+from config import SETTINGS_FILE
+
+# Default memory budget for packed title frames
+TITLE_CACHE_MB = 6
+
+# Decoded surfaces kept per animation
+RING_SIZE = 2
+
+# How long get(wait=True) waits for the first frame
+FIRST_FRAME_TIMEOUT = 2.0
+
+
+def _load_budget_setting():
+    """Read the title frame budget (in MB) from sinew_settings.json"""
+    try:
+        if os.path.exists(SETTINGS_FILE):
+            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+            return max(1, int(settings.get("title_cache_mb", TITLE_CACHE_MB)))
+    except Exception as e:
+        print(f"[TitleFrames] Could not read budget setting: {e}")
+    return TITLE_CACHE_MB
+
+
+class TitleAnimation:
+    """One title GIF as packed frames, filled in by load()"""
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = []
+        self.frames = []  # (mode, size, zlib data, palette bytes or None)
+        self.nbytes = 0
+        self.done = False
+        self.first_ready = threading.Event()
+        self._palettes = {}  # palette bytes -> the shared copy
+        self._ring = OrderedDict()  # (index, size) -> Surface
+
+    def frame_count(self):
+        return len(self.frames)
+
+    def duration(self, index):
+        if 0 <= index < len(self.durations):
+            return self.durations[index]
+        return 100
+
+    def _pack(self, frame):
+        """Frame -> (mode, size, compressed pixels, palette)"""
+        from PIL import Image
+
+        rgba = frame.convert("RGBA")
+        if rgba.getextrema()[3][0] < 255:
+            return "RGBA", rgba.size, zlib.compress(rgba.tobytes(), 1), None
+
+        rgb = rgba.convert("RGB")
+        if rgb.getcolors(256) is None:
+            return "RGB", rgb.size, zlib.compress(rgb.tobytes(), 1), None
+
+        # Median cut is exact when there are no more than 256 colours
+        indexed = rgb.quantize(
+            256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE
+        )
+        palette = bytes(indexed.getpalette()[:768]).ljust(768, b"\0")
+        palette = self._palettes.setdefault(palette, palette)
+        return "P", indexed.size, zlib.compress(indexed.tobytes(), 1), palette
+
+    def load(self):
+        """
+        Decode the GIF into packed frames (no pygame, so any thread).
+
+        Frames become visible to frame_count() as they're packed. Packed
+        frames are kept in decoded_cache, so later launches skip Pillow.
+        """
+        cached = decoded_cache.load(self.path, variant="title")
+        if cached is not None:
+            for mode, size, data, duration, palette, _ in cached:
+                if palette is not None:
+                    palette = self._palettes.setdefault(palette, palette)
+                self._add((mode, size, bytes(data), palette), duration)
+        elif self._decode():
+            entries = [
+                (mode, size, data, duration, palette, True)
+                for (mode, size, data, palette), duration in zip(
+                    self.frames, self.durations
+                )
+            ]
+            decoded_cache.store(self.path, entries, variant="title")
+        self._palettes = {}
+        self.done = True
+        self.first_ready.set()
+
+    def _decode(self):
+        """Pack every frame with Pillow; False if the GIF couldn't be read"""
+        from PIL import Image, ImageSequence
+
+        try:
+            with Image.open(self.path) as img:
+                for frame in ImageSequence.Iterator(img):
+                    self._add(
+                        self._pack(frame), decoded_cache.frame_duration(frame.info)
+                    )
+        except Exception as e:
+            print(f"[TitleFrames] Failed to open GIF {self.path}: {e}")
+            return False
+        return True
+
+    def _add(self, packed, duration):
+        # Duration first: readers index durations by frame count
+        self.durations.append(duration)
+        self.frames.append(packed)
+        self.nbytes += len(packed[2])
+        self.first_ready.set()
+
+    def surface(self, index, size):
+        """
+        Frame index as a display surface scaled to size (main thread only).
+
+        Returns:
+            pygame.Surface or None if the frame isn't packed yet
+        """
+        key = (index, size)
+        surf = self._ring.get(key)
+        if surf is not None:
+            self._ring.move_to_end(key)
+            return surf
+        if not 0 <= index < len(self.frames):
+            return None
+
+        mode, src_size, data, palette = self.frames[index]
+        pixels = zlib.decompress(data)
+        if src_size != size:
+            # Pillow's NEAREST, as the old per-frame path used; pygame's scale
+            # samples differently at non-integer factors
+            from PIL import Image
+
+            pixels = Image.frombytes(mode, src_size, pixels).resize(
+                size, Image.NEAREST
+            ).tobytes()
+        surf = pygame.image.frombuffer(pixels, size, mode)
+        if palette is not None:
+            surf.set_palette(
+                [tuple(palette[i : i + 3]) for i in range(0, len(palette), 3)]
+            )
+        surf = surf.convert_alpha() if mode == "RGBA" else surf.convert()
+
+        self._ring[key] = surf
+        while len(self._ring) > RING_SIZE:
+            self._ring.popitem(last=False)
+        return surf
+
+    def release_surfaces(self):
+        """Drop the decoded ring (packed frames stay)"""
+        self._ring.clear()
+
+
+class TitleFrameStore:
+    """Packed title animations by path, within a byte budget"""
+
+    def __init__(self, budget_bytes=None):
+        if budget_bytes is None:
+            budget_bytes = _load_budget_setting() * 1024 * 1024
+        self.budget_bytes = budget_bytes
+        self._anims = OrderedDict()  # path -> TitleAnimation (LRU order)
+        self._keep = set()
+        self._missing = set()  # Paths known not to exist
+        self._lock = threading.Lock()
+
+    def get(self, path, wait=False, priority=PRIORITY_NOW):
+        """
+        The animation for path, queueing its load if needed.
+
+        Args:
+            wait: Block until its first frame is packed (or
+                FIRST_FRAME_TIMEOUT passes) instead of returning it empty
+            priority: asset_loader priority for the load
+
+        Returns:
+            TitleAnimation or None if path is missing
+        """
+        if not path:
+            return None
+        with self._lock:
+            anim = self._anims.get(path)
+            if anim is None:
+                if path in self._missing or not os.path.exists(path):
+                    self._missing.add(path)
+                    return None
+                anim = TitleAnimation(path)
+                self._anims[path] = anim
+            else:
+                self._anims.move_to_end(path)
+            if wait:
+                self._keep.add(path)
+
+        if not anim.done:
+            self._request(anim, priority)
+        if wait:
+            anim.first_ready.wait(FIRST_FRAME_TIMEOUT)
+        return anim
+
+    def prefetch(self, paths, keep=()):
+        """
+        Queue paths at PRIORITY_SOON, and protect keep (plus paths) from
+        eviction until the next call.
+        """
+        with self._lock:
+            self._keep = set(keep) | set(paths)
+        for path in paths:
+            self.get(path, priority=PRIORITY_SOON)
+        self._release_unkept()
+
+    def _release_unkept(self):
+        """Free the decoded surfaces of animations no longer on screen"""
+        for path, anim in list(self._anims.items()):
+            if path not in self._keep:
+                anim.release_surfaces()
+
+    def _request(self, anim, priority):
+        # A pending request for the path is only moved up, never duplicated
+        get_asset_loader().request(
+            ("title", anim.path), lambda: self._load(anim), priority
+        )
+
+    def _load(self, anim):
+        """Loader job: pack the GIF, then trim the store to the budget"""
+        start = time.time()
+        anim.load()
+        print(
+            f"[TitleFrames] {os.path.basename(anim.path)}: {anim.frame_count()}"
+            f" frames, {anim.nbytes // 1024} KB in {time.time() - start:.2f}s"
+        )
+        self._enforce_budget()
+
+    def _enforce_budget(self):
+        """Drop least recently used animations outside the keep set"""
+        with self._lock:
+            total = sum(anim.nbytes for anim in self._anims.values())
+            for path in list(self._anims):
+                if total <= self.budget_bytes:
+                    break
+                anim = self._anims[path]
+                if path in self._keep or not anim.done:
+                    continue
+                del self._anims[path]
+                total -= anim.nbytes
+                print(f"[TitleFrames] Evicted {os.path.basename(path)}")
+
+    def stats(self):
+        """Counters for logs"""
+        return {
+            "animations": len(self._anims),
+            "bytes": sum(anim.nbytes for anim in self._anims.values()),
+            "budget_bytes": self.budget_bytes,
+        }
+
+
+_title_store = None
+
+
+def get_title_store():
+    """Get or create the shared TitleFrameStore"""
+    global _title_store
+    if _title_store is None:
+        _title_store = TitleFrameStore()
+    return _title_store
@@ -14,6 +14,7 @@ import ui_colors
 from config import FONT_PATH, SPRITES_DIR
 from controller import NavigableList, get_controller
 from save_data_manager import get_manager
+from sprite_atlas import image_exists, load_image
 from ui_components import Button
 
 # ====================================================================
@@ -54,8 +55,7 @@ class Modal:
     def draw(self, surf):
         """Render the semi-transparent background overlay and the trainer info screen to surf."""
         # Draw background overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((50, 50, 50, 180))
+        overlay = ui_colors.get_tile((self.width, self.height), (50, 50, 50, 180))
         surf.blit(overlay, (0, 0))
 
         # Outer border
@@ -100,9 +100,9 @@ class TrainerInfoScreen:
         )
 
         # --- Load font ---
-        self.font_header = pygame.font.Font(FONT_PATH, 18)
-        self.font_text = pygame.font.Font(FONT_PATH, 14)
-        self.font_small = pygame.font.Font(FONT_PATH, 10)
+        self.font_header = ui_colors.get_font(18, FONT_PATH)
+        self.font_text = ui_colors.get_font(14, FONT_PATH)
+        self.font_small = ui_colors.get_font(10, FONT_PATH)
 
         # Get save data manager
         self.manager = get_manager()
@@ -189,13 +189,13 @@ class TrainerInfoScreen:
             badge_path = None
             for ext in [".png", ".PNG", ".gif", ".GIF"]:
                 test_path = os.path.join(badge_folder, f"{name}{ext}")
-                if os.path.exists(test_path):
+                if image_exists(test_path):
                     badge_path = test_path
                     break
 
             if badge_path:
                 try:
-                    sprite = pygame.image.load(badge_path).convert_alpha()
+                    sprite = load_image(badge_path)
                     # Scale to badge_size
                     sprite = pygame.transform.scale(
                         sprite, (self.badge_size, self.badge_size)
@@ -5,6 +5,8 @@ Sinew Color and Font Definitions
 All color constants and font settings used throughout the UI
 """
 
+from collections import OrderedDict
+
 import pygame
 
 from config import FONT_PATH
@@ -34,35 +36,123 @@ HP_COLOR_GOOD = (0, 200, 0)  # green
 HP_COLOR_WARN = (220, 180, 0)  # yellow/orange
 HP_COLOR_BAD = (200, 0, 0)  # red
 
-# Font cache to avoid recreating fonts constantly
+# Font registry to avoid recreating fonts constantly
 _font_cache = {}
 
+# Rendered text surfaces, least recently used first
+TEXT_CACHE_SIZE = 512
+_text_cache = OrderedDict()
+
+# Translucent backgrounds and overlays, least recently used first
+TILE_CACHE_SIZE = 64
+_tile_cache = OrderedDict()
 
-def get_font(size):
+
+def get_font(size, path=None, bold=False, italic=False):
     """
-    Get a pygame font with the current theme's font path.
-    Caches fonts by (path, size) to avoid recreation.
+    Get a pygame font, loading each (path, size, style) only once.
 
     Args:
         size: Font size in pixels
+        path: TTF file, or None for the current theme's FONT_PATH
+        bold, italic: Synthesized styles
 
     Returns:
-        pygame.font.Font object
+        pygame.font.Font object (shared - don't change its style)
     """
-    cache_key = (FONT_PATH, size)
+    if path is None:
+        path = FONT_PATH
+    cache_key = (path, size, bool(bold), bool(italic))
 
-    if cache_key not in _font_cache:
+    font = _font_cache.get(cache_key)
+    if font is None:
         try:
-            _font_cache[cache_key] = pygame.font.Font(FONT_PATH, size)
+            font = pygame.font.Font(path, size)
         except Exception as e:
-            print(f"[ui_colors] Failed to load font {FONT_PATH}: {e}")
+            print(f"[ui_colors] Failed to load font {path}: {e}")
             # Fallback to system font
-            _font_cache[cache_key] = pygame.font.SysFont(None, size)
+            font = pygame.font.SysFont(None, size)
+        font.set_bold(bool(bold))
+        font.set_italic(bool(italic))
+        _font_cache[cache_key] = font
+
+    return font
 
-    return _font_cache[cache_key]
+
+def render_text(font, text, antialias, color, background=None):
+    """
+    font.render() through an LRU of rendered surfaces.
+
+    For labels drawn every frame; text that changes every frame (counters,
+    pulsing colours) should call font.render() directly. The returned
+    surface is shared - copy it before changing its alpha or pixels.
+    """
+    key = (font, text, antialias, tuple(color), background and tuple(background))
+    cache = _text_cache
+    surf = cache.get(key)
+    if surf is not None:
+        cache.move_to_end(key)
+        return surf
+    surf = font.render(text, antialias, color, background)
+    cache[key] = surf
+    if len(cache) > TEXT_CACHE_SIZE:
+        cache.popitem(last=False)
+    return surf
+
+
+def clear_text_cache():
+    """Drop rendered text (call when the theme changes)"""
+    global _text_cache
+    _text_cache = OrderedDict()
+
+
+def get_tile(size, color, alpha=None, ellipse=False):
+    """
+    A translucent fill of the given size, built once per look.
+
+    Replaces per-frame pygame.Surface allocations for slot backgrounds,
+    dimming overlays and shadows; blitting the tile gives the same pixels.
+
+    Args:
+        size: (width, height)
+        color: RGB or RGBA; an RGBA colour is kept as per-pixel alpha
+        alpha: Surface alpha for an opaque colour (like Surface.set_alpha)
+        ellipse: Fill an ellipse instead of the whole tile
+
+    Returns:
+        pygame.Surface (shared - don't draw on it)
+    """
+    key = (tuple(size), tuple(color), alpha, ellipse)
+    cache = _tile_cache
+    tile = cache.get(key)
+    if tile is not None:
+        cache.move_to_end(key)
+        return tile
+
+    if alpha is None:
+        tile = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        tile = pygame.Surface(size)
+        tile.set_alpha(alpha)
+    if ellipse:
+        pygame.draw.ellipse(tile, color, tile.get_rect())
+    else:
+        tile.fill(color)
+
+    cache[key] = tile
+    if len(cache) > TILE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return tile
+
+
+def clear_tile_cache():
+    """Drop cached tiles (call when the theme changes)"""
+    global _tile_cache
+    _tile_cache = OrderedDict()
 
 
 def clear_font_cache():
-    """Clear the font cache (call when theme changes font)"""
+    """Clear the font registry and rendered text (call when theme changes font)"""
     global _font_cache
     _font_cache = {}
+    clear_text_cache()
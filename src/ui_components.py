@@ -83,7 +83,7 @@ class Button:
         pygame.draw.rect(
             surf, border_color, self.rect, 2 if not is_controller_selected else 3
         )
-        txt_surf = font.render(self.text, True, txt_color)
+        txt_surf = ui_colors.render_text(font, self.text, True, txt_color)
         txt_rect = txt_surf.get_rect(center=self.rect.center)
         surf.blit(txt_surf, txt_rect)
 
@@ -143,7 +143,7 @@ class TextDisplay:
             if y > self.rect.bottom:
                 break
             if y + line_height > self.rect.y:
-                txt = font.render(line, True, ui_colors.COLOR_TEXT)
+                txt = ui_colors.render_text(font, line, True, ui_colors.COLOR_TEXT)
                 surf.blit(txt, (self.rect.x + 5, y))
             y += line_height
         surf.set_clip(None)
@@ -235,7 +235,8 @@ class SaveFileButton:
             col = (150, 80, 80)
 
         surf.blit(
-            self.tiny_font.render(txt, True, col), (self.rect.x + 5, self.rect.y + 3)
+            ui_colors.render_text(self.tiny_font, txt, True, col),
+            (self.rect.x + 5, self.rect.y + 3),
         )
 
     def handle_event(self, event):
@@ -379,12 +380,12 @@ def draw_wrapped_text(surf, text, x, y, max_width, font_obj, color, line_height=
         if w <= max_width:
             line = test
         else:
-            txt_surf = font_obj.render(line, True, color)
+            txt_surf = ui_colors.render_text(font_obj, line, True, color)
             surf.blit(txt_surf, (x, cur_y))
             cur_y += line_height
             line = word
     if line:
-        txt_surf = font_obj.render(line, True, color)
+        txt_surf = ui_colors.render_text(font_obj, line, True, color)
         surf.blit(txt_surf, (x, cur_y))
     return cur_y + line_height
 
@@ -423,9 +424,9 @@ def draw_controller_hint(surf, text, x, y, font=None):
     """
     if font is None:
         try:
-            font = pygame.font.Font(FONT_PATH, 8)
+            font = ui_colors.get_font(8, FONT_PATH)
         except Exception:
             font = pygame.font.SysFont(None, 12)
 
-    hint_surf = font.render(text, True, (120, 120, 120))
+    hint_surf = ui_colors.render_text(font, text, True, (120, 120, 120))
     surf.blit(hint_surf, (x, y))
@@ -12,8 +12,11 @@ Contains the two drawing methods for the Sinew main menu screen:
                         used during modal transitions.
 
 Both methods are pure rendering — they read GameScreen state but do not
-modify it (except the dim_overlay cache and minor animation counters
-handled by sub-mixins).
+modify it (except the dim_overlay, modal surface and menu button caches
+and minor animation counters handled by sub-mixins).
+
+The main loop calls draw() only on frames with dirty regions (see
+dirty_regions.py) and clips surf to them.
 """
 
 import pygame
@@ -64,14 +67,22 @@ class GameScreenDrawMixin:
         game_data = self.games[gname]
 
         if self.is_on_sinew():
-            if self.sinew_logo:
-                surf.blit(self.sinew_logo, (0, 0))
+            logo = self._sinew_background()
+            if logo:
+                surf.blit(logo, (0, 0))
             else:
                 surf.fill(self.sinew_bg_color)
-        elif game_data["frames"]:
-            surf.blit(game_data["frames"][game_data["frame_index"]], (0, 0))
         else:
-            surf.fill(ui_colors.COLOR_BG)
+            anim = self._title_animation(gname)
+            frame = (
+                anim.surface(game_data["frame_index"], (self.width, self.height))
+                if anim
+                else None
+            )
+            if frame is not None:
+                surf.blit(frame, (0, 0))
+            else:
+                surf.fill(ui_colors.COLOR_BG)
 
         # --- Modal or main menu ---
         if self.modal_instance:
@@ -97,7 +108,13 @@ class GameScreenDrawMixin:
             modal_w = self.width - 30
             modal_h = self.height - 30
 
-        modal_surf = pygame.Surface((modal_w, modal_h), pygame.SRCALPHA)
+        # Reuse the modal surface while its size stays the same
+        modal_surf = getattr(self, "_modal_surf", None)
+        if modal_surf is None or modal_surf.get_size() != (modal_w, modal_h):
+            modal_surf = pygame.Surface((modal_w, modal_h), pygame.SRCALPHA)
+            self._modal_surf = modal_surf
+        else:
+            modal_surf.fill((0, 0, 0, 0))
         if hasattr(self.modal_instance, "draw"):
             self.modal_instance.draw(modal_surf)
 
@@ -119,12 +136,6 @@ class GameScreenDrawMixin:
         current_menu_item = menu_items[self.menu_index]
         is_disabled = current_menu_item == "Save File Only"
 
-        menu_button = Button(
-            current_menu_item,
-            rel_rect=(0.25, 0.65, 0.5, 0.12),
-            callback=lambda: None,
-        )
-
         if is_disabled:
             bx = int(0.25 * self.width)
             by = int(0.65 * self.height)
@@ -136,33 +147,44 @@ class GameScreenDrawMixin:
             pygame.draw.rect(surf, (80, 80, 85), btn_rect, 2, border_radius=4)
 
             try:
-                btn_font = pygame.font.Font(FONT_PATH, 14)
+                btn_font = ui_colors.get_font(14, FONT_PATH)
             except Exception:
                 btn_font = self.font
-            txt_surf = btn_font.render(current_menu_item, True, (100, 100, 105))
+            txt_surf = ui_colors.render_text(
+                btn_font, current_menu_item, True, (100, 100, 105)
+            )
             surf.blit(txt_surf, txt_surf.get_rect(center=btn_rect.center))
 
             try:
-                hint2_font = pygame.font.Font(FONT_PATH, 7)
+                hint2_font = ui_colors.get_font(7, FONT_PATH)
             except Exception:
                 hint2_font = pygame.font.SysFont(None, 12)
-            hint2_surf = hint2_font.render(
-                "No ROM — place a .gba file in roms/", True, (90, 90, 90)
+            hint2_surf = ui_colors.render_text(
+                hint2_font, "No ROM — place a .gba file in roms/", True, (90, 90, 90)
             )
             surf.blit(
                 hint2_surf,
                 hint2_surf.get_rect(centerx=self.width // 2, top=btn_rect.bottom + 3),
             )
         else:
+            # The button is rebuilt only when the selected item changes
+            menu_button = getattr(self, "_menu_button", None)
+            if menu_button is None or menu_button.text != current_menu_item:
+                menu_button = Button(
+                    current_menu_item,
+                    rel_rect=(0.25, 0.65, 0.5, 0.12),
+                    callback=lambda: None,
+                )
+                self._menu_button = menu_button
             menu_button.draw(surf, self.font)
 
         # Navigation hints
         try:
-            hint_font = pygame.font.Font(FONT_PATH, 8)
+            hint_font = ui_colors.get_font(8, FONT_PATH)
         except Exception:
             hint_font = pygame.font.SysFont(None, 14)
-        hint_surf = hint_font.render(
-            "< > Change Game    ^ v Scroll Menu", True, (150, 150, 150)
+        hint_surf = ui_colors.render_text(
+            hint_font, "< > Change Game    ^ v Scroll Menu", True, (150, 150, 150)
         )
         surf.blit(
             hint_surf,
@@ -183,8 +205,9 @@ class GameScreenDrawMixin:
             self._dim_overlay = None
 
         if alpha > 0:
-            self._dim_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            self._dim_overlay.fill((0, 0, 0, alpha))
+            self._dim_overlay = ui_colors.get_tile(
+                (self.width, self.height), (0, 0, 0, alpha)
+            )
             target = self.scaler.get_surface() if self.scaler else self._loading_screen
             if target:
                 target.blit(self._dim_overlay, (0, 0))
@@ -23,9 +23,8 @@ from config import (
     FONT_PATH,
     SPRITES_DIR,
     get_egg_sprite_path,
-    get_sprite_path,
 )
-from ui_components import scale_surface_preserve_aspect
+from sprite_service import get_sprite_service
 
 # Optional dependencies — matched exactly to pc_box.py guard pattern
 try:
@@ -108,7 +107,7 @@ class PCBoxDrawMixin:
 
         # Render text using the same font as the rest of the app
         try:
-            banner_font = pygame.font.Font(FONT_PATH, 10)
+            banner_font = ui_colors.get_font(10, FONT_PATH)
         except Exception:
             try:
                 banner_font = pygame.font.Font(None, 18)
@@ -174,22 +173,24 @@ class PCBoxDrawMixin:
         """
         try:
             # Red semi-transparent overlay
-            overlay = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            overlay.fill((180, 0, 0, 100))
-            surf.blit(overlay, rect.topleft)
+            surf.blit(ui_colors.get_tile(rect.size, (180, 0, 0, 100)), rect.topleft)
 
             if size == "small":
                 # "HACK" text for small slots
-                tiny_font = pygame.font.Font(FONT_PATH, 6)
-                hack_text = tiny_font.render("HACK", True, (255, 100, 100))
+                tiny_font = ui_colors.get_font(6, FONT_PATH)
+                hack_text = ui_colors.render_text(
+                    tiny_font, "HACK", True, (255, 100, 100)
+                )
                 hack_rect = hack_text.get_rect(
                     centerx=rect.centerx, bottom=rect.bottom - 2
                 )
                 surf.blit(hack_text, hack_rect)
             else:
                 # "ROM HACK" banner for large display
-                banner_font = pygame.font.Font(FONT_PATH, 10)
-                hack_text = banner_font.render("ROM HACK", True, (255, 80, 80))
+                banner_font = ui_colors.get_font(10, FONT_PATH)
+                hack_text = ui_colors.render_text(
+                    banner_font, "ROM HACK", True, (255, 80, 80)
+                )
                 hack_rect = hack_text.get_rect(centerx=rect.centerx, top=rect.top + 5)
 
                 # Draw background for text
@@ -245,9 +246,7 @@ class PCBoxDrawMixin:
                 base_color = (r, g, b, 180)
 
             # Draw slot background with transparency
-            slot_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(slot_surf, base_color, (0, 0, rect.width, rect.height))
-            surf.blit(slot_surf, rect.topleft)
+            surf.blit(ui_colors.get_tile(rect.size, base_color), rect.topleft)
 
             # Draw border
             pygame.draw.rect(surf, ui_colors.COLOR_BORDER, rect, 1)
@@ -268,24 +267,18 @@ class PCBoxDrawMixin:
                 pygame.draw.rect(surf, pulse_color, rect, 2)
 
             # Draw Pokemon sprite (gen3 PNG) if available
+            # Scale sprite to fit in cell (leave small margin)
+            sprite_size = int(min(rect.width, rect.height) * 0.8)
             if poke and not poke.get("empty") and not poke.get("egg"):
-
-                # Use helper method that works for both game and Sinew Pokemon
-                sprite_path = self._get_pokemon_sprite_path(poke)
-
-                if sprite_path and os.path.exists(sprite_path):
-                    try:
-                        sprite = pygame.image.load(sprite_path).convert_alpha()
-                        # Scale sprite to fit in cell (leave small margin)
-                        cell_size = min(rect.width, rect.height)
-                        sprite_size = int(cell_size * 0.8)
-                        sprite = pygame.transform.smoothscale(
-                            sprite, (sprite_size, sprite_size)
-                        )
-                        sprite_rect = sprite.get_rect(center=rect.center)
-                        surf.blit(sprite, sprite_rect)
-                    except Exception:
-                        pass  # If sprite fails to load, just show colored cell
+                sprite = get_sprite_service().get(
+                    poke.get("species", 0),
+                    self._is_pokemon_shiny(poke),
+                    poke.get("form"),
+                    size=(sprite_size, sprite_size),
+                    scale="stretch",
+                )
+                if sprite:
+                    surf.blit(sprite, sprite.get_rect(center=rect.center))
 
                 # Draw ROM HACK overlay for Pokemon from ROM hacks
                 if poke.get("rom_hack"):
@@ -293,37 +286,19 @@ class PCBoxDrawMixin:
 
             # For eggs, draw egg sprite
             elif poke and poke.get("egg"):
-                # Try to load egg sprite
-                egg_path = get_egg_sprite_path("gen3")
-                if os.path.exists(egg_path):
-                    try:
-                        egg_sprite = pygame.image.load(egg_path).convert_alpha()
-                        # Scale egg sprite to fit in cell
-                        cell_size = min(rect.width, rect.height)
-                        sprite_size = int(cell_size * 0.8)
-                        egg_sprite = pygame.transform.smoothscale(
-                            egg_sprite, (sprite_size, sprite_size)
-                        )
-                        sprite_rect = egg_sprite.get_rect(center=rect.center)
-                        surf.blit(egg_sprite, sprite_rect)
-                    except Exception:
-                        # Fallback to text if sprite fails
-                        try:
-                            tiny_font = pygame.font.Font(FONT_PATH, 8)
-                            text = "EGG"
-                            text_surf = tiny_font.render(
-                                text, True, ui_colors.COLOR_TEXT
-                            )
-                            text_rect = text_surf.get_rect(center=rect.center)
-                            surf.blit(text_surf, text_rect)
-                        except Exception:
-                            pass
+                egg_sprite = get_sprite_service().get(
+                    0, egg=True, size=(sprite_size, sprite_size), scale="stretch"
+                )
+                if egg_sprite:
+                    surf.blit(egg_sprite, egg_sprite.get_rect(center=rect.center))
                 else:
                     # No egg sprite, show text
                     try:
-                        tiny_font = pygame.font.Font(FONT_PATH, 8)
+                        tiny_font = ui_colors.get_font(8, FONT_PATH)
                         text = "EGG"
-                        text_surf = tiny_font.render(text, True, ui_colors.COLOR_TEXT)
+                        text_surf = ui_colors.render_text(
+                            tiny_font, text, True, ui_colors.COLOR_TEXT
+                        )
                         text_rect = text_surf.get_rect(center=rect.center)
                         surf.blit(text_surf, text_rect)
                     except Exception:
@@ -373,14 +348,16 @@ class PCBoxDrawMixin:
 
         # Draw row indicator text below grid
         try:
-            tiny_font = pygame.font.Font(FONT_PATH, 8)
+            tiny_font = ui_colors.get_font(8, FONT_PATH)
             start_row = self.sinew_scroll_offset + 1
             end_row = min(
                 self.sinew_scroll_offset + self.sinew_visible_rows,
                 self.sinew_total_rows,
             )
             indicator_text = f"Rows {start_row}-{end_row}/{self.sinew_total_rows}"
-            text_surf = tiny_font.render(indicator_text, True, ui_colors.COLOR_TEXT)
+            text_surf = ui_colors.render_text(
+                tiny_font, indicator_text, True, ui_colors.COLOR_TEXT
+            )
             text_rect = text_surf.get_rect(
                 right=self.grid_rect.right, top=self.grid_rect.bottom + 3
             )
@@ -402,12 +379,10 @@ class PCBoxDrawMixin:
         """
 
         # Background overlay (darken using theme BG color)
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         r, g, b = (
             ui_colors.COLOR_BG[:3] if len(ui_colors.COLOR_BG) >= 3 else (50, 50, 50)
         )
-        overlay.fill((r, g, b, 180))
-        surf.blit(overlay, (0, 0))
+        surf.blit(ui_colors.get_tile((self.width, self.height), (r, g, b, 180)), (0, 0))
 
         pygame.draw.rect(
             surf, ui_colors.COLOR_BORDER, (0, 0, self.width, self.height), 2
@@ -444,10 +419,6 @@ class PCBoxDrawMixin:
                 pass
 
         # Sprite area - semi-transparent background to match grid
-        sprite_bg = pygame.Surface(
-            (self.sprite_area.width, self.sprite_area.height), pygame.SRCALPHA
-        )
-
         # Determine background color based on selection (using theme colors)
         if self.selected_pokemon and not self.selected_pokemon.get("empty"):
             # Pokemon/egg selected - brighter
@@ -466,9 +437,7 @@ class PCBoxDrawMixin:
             )
             bg_color = (r, g, b, 180)
 
-        pygame.draw.rect(
-            sprite_bg, bg_color, (0, 0, self.sprite_area.width, self.sprite_area.height)
-        )
+        sprite_bg = ui_colors.get_tile(self.sprite_area.size, bg_color)
         surf.blit(sprite_bg, self.sprite_area.topleft)
         pygame.draw.rect(surf, ui_colors.COLOR_BORDER, self.sprite_area, 2)
 
@@ -484,16 +453,17 @@ class PCBoxDrawMixin:
 
                 # Try gen3 PNG first
                 if os.path.exists(egg_png_path):
-                    try:
-                        egg_sprite = pygame.image.load(egg_png_path).convert_alpha()
-                        sprite_width = int(self.sprite_area.width * 0.9)
-                        sprite_height = int(self.sprite_area.height * 0.9)
-                        egg_sprite = scale_surface_preserve_aspect(egg_sprite, sprite_width,
-                            sprite_height)
+                    egg_sprite = get_sprite_service().get(
+                        0,
+                        egg=True,
+                        size=(
+                            int(self.sprite_area.width * 0.9),
+                            int(self.sprite_area.height * 0.9),
+                        ),
+                    )
+                    if egg_sprite:
                         rect = egg_sprite.get_rect(center=self.sprite_area.center)
                         surf.blit(egg_sprite, rect.topleft)
-                    except Exception:
-                        pass
                 # Fallback to showdown GIF
                 elif os.path.exists(egg_gif_path):
                     sprite_width = int(self.sprite_area.width * 0.9)
@@ -509,25 +479,19 @@ class PCBoxDrawMixin:
                         self.current_gif_sprite = gif_sprite
             else:
                 # Regular Pokemon - use GEN3 sprite (PNG) for the big display
-                sprite_path = self._get_pokemon_sprite_path(self.selected_pokemon)
-                if sprite_path and os.path.exists(sprite_path):
-                    try:
-                        # Load PNG sprite
-                        poke_sprite = pygame.image.load(sprite_path).convert_alpha()
-                        # Scale to fit display area, preserving aspect ratio
-                        sprite_width = int(self.sprite_area.width * 0.9)
-                        sprite_height = int(self.sprite_area.height * 0.9)
-                        poke_sprite = scale_surface_preserve_aspect(poke_sprite, sprite_width,
-                            sprite_height)
-                        rect = poke_sprite.get_rect(center=self.sprite_area.center)
-                        surf.blit(poke_sprite, rect.topleft)
-                    except Exception:
-                        # Fallback to cached image if loading fails
-                        if self.current_sprite_image:
-                            rect = self.current_sprite_image.get_rect(
-                                center=self.sprite_area.center
-                            )
-                            surf.blit(self.current_sprite_image, rect.topleft)
+                # Scale to fit display area, preserving aspect ratio
+                poke_sprite = get_sprite_service().get(
+                    self.selected_pokemon.get("species", 0),
+                    self._is_pokemon_shiny(self.selected_pokemon),
+                    self.selected_pokemon.get("form"),
+                    size=(
+                        int(self.sprite_area.width * 0.9),
+                        int(self.sprite_area.height * 0.9),
+                    ),
+                )
+                if poke_sprite:
+                    rect = poke_sprite.get_rect(center=self.sprite_area.center)
+                    surf.blit(poke_sprite, rect.topleft)
                 elif self.current_sprite_image:
                     rect = self.current_sprite_image.get_rect(
                         center=self.sprite_area.center
@@ -539,10 +503,6 @@ class PCBoxDrawMixin:
                     self._draw_rom_hack_overlay(surf, self.sprite_area, size="large")
 
         # Info area - show selected Pokemon info (semi-transparent like grid)
-        info_bg = pygame.Surface(
-            (self.info_area.width, self.info_area.height), pygame.SRCALPHA
-        )
-
         # Use same background color logic as sprite area (using theme colors)
         if self.selected_pokemon and not self.selected_pokemon.get("empty"):
             r, g, b = (
@@ -559,16 +519,14 @@ class PCBoxDrawMixin:
             )
             info_bg_color = (r, g, b, 180)
 
-        pygame.draw.rect(
-            info_bg, info_bg_color, (0, 0, self.info_area.width, self.info_area.height)
-        )
+        info_bg = ui_colors.get_tile(self.info_area.size, info_bg_color)
         surf.blit(info_bg, self.info_area.topleft)
         pygame.draw.rect(surf, ui_colors.COLOR_BORDER, self.info_area, 2)
 
         if self.selected_pokemon and not self.selected_pokemon.get("empty"):
             # Create slightly bigger font for info text
             try:
-                info_font = pygame.font.Font(FONT_PATH, 14)
+                info_font = ui_colors.get_font(14, FONT_PATH)
             except Exception:
                 info_font = self.font
 
@@ -627,15 +585,17 @@ class PCBoxDrawMixin:
                     max_width = self.info_area.width - (padding * 2)
 
                     # Simple text wrapping - truncate if too long
-                    text_surf = info_font.render(line, True, ui_colors.COLOR_TEXT)
+                    text_surf = ui_colors.render_text(
+                        info_font, line, True, ui_colors.COLOR_TEXT
+                    )
 
                     # If text is too wide, try to fit it
                     if text_surf.get_width() > max_width:
                         # Truncate with ellipsis
                         while len(line) > 3 and text_surf.get_width() > max_width:
                             line = line[:-1]
-                            text_surf = info_font.render(
-                                line + "...", True, ui_colors.COLOR_TEXT
+                            text_surf = ui_colors.render_text(
+                                info_font, line + "...", True, ui_colors.COLOR_TEXT
                             )
 
                     # Center horizontally in info area
@@ -655,7 +615,7 @@ class PCBoxDrawMixin:
         elif self.sinew_mode:
             # Show Sinew storage stats when no Pokemon selected
             try:
-                info_font = pygame.font.Font(FONT_PATH, 10)
+                info_font = ui_colors.get_font(10, FONT_PATH)
                 padding = 8
                 y_offset = self.info_area.y + padding
                 line_height = 14
@@ -666,12 +626,13 @@ class PCBoxDrawMixin:
                     box_pokemon = self.sinew_storage.get_box_pokemon_count(
                         self.box_index + 1
                     )
-                    max_capacity = 20 * 120  # 20 boxes * 120 slots
+                    max_capacity = self.sinew_storage.get_capacity()
+                    slots_per_box = self.sinew_storage.get_slots_per_box()
 
                     lines = [
                         "SINEW STORAGE",
                         "",
-                        f"This Box: {box_pokemon}/120",
+                        f"This Box: {box_pokemon}/{slots_per_box}",
                         f"Total: {total_pokemon}",
                         f"Capacity: {max_capacity}",
                     ]
@@ -682,7 +643,9 @@ class PCBoxDrawMixin:
                     if line == "":
                         y_offset += 4
                         continue
-                    text_surf = info_font.render(line, True, ui_colors.COLOR_TEXT)
+                    text_surf = ui_colors.render_text(
+                        info_font, line, True, ui_colors.COLOR_TEXT
+                    )
                     text_x = (
                         self.info_area.x
                         + (self.info_area.width - text_surf.get_width()) // 2
@@ -729,7 +692,7 @@ class PCBoxDrawMixin:
             pygame.draw.rect(surf, (r // 2, g // 2, b // 2), disabled_rect)
             pygame.draw.rect(surf, (r, g, b), disabled_rect, 2)
             try:
-                btn_font = pygame.font.Font(FONT_PATH, 10)
+                btn_font = ui_colors.get_font(10, FONT_PATH)
                 text = "No Party"
                 # Dimmed text color
                 tr, tg, tb = (
@@ -737,7 +700,9 @@ class PCBoxDrawMixin:
                     if len(ui_colors.COLOR_TEXT) >= 3
                     else (80, 80, 90)
                 )
-                text_surf = btn_font.render(text, True, (tr // 2, tg // 2, tb // 2))
+                text_surf = ui_colors.render_text(
+                    btn_font, text, True, (tr // 2, tg // 2, tb // 2)
+                )
                 text_rect = text_surf.get_rect(center=disabled_rect.center)
                 surf.blit(text_surf, text_rect)
             except Exception:
@@ -815,8 +780,10 @@ class PCBoxDrawMixin:
                         surf.blit(self.undo_icon_tinted, icon_rect)
                     else:
                         # Fallback to "U" text if icon not loaded
-                        undo_font = pygame.font.Font(FONT_PATH, 14)
-                        u_surf = undo_font.render("U", True, ui_colors.COLOR_TEXT)
+                        undo_font = ui_colors.get_font(14, FONT_PATH)
+                        u_surf = ui_colors.render_text(
+                            undo_font, "U", True, ui_colors.COLOR_TEXT
+                        )
                         u_rect = u_surf.get_rect(center=undo_rect.center)
                         surf.blit(u_surf, u_rect)
                 except Exception:
@@ -835,7 +802,7 @@ class PCBoxDrawMixin:
         #  Controller hints                                                 #
         # ---------------------------------------------------------------- #
         try:
-            hint_font = pygame.font.Font(FONT_PATH, 8)
+            hint_font = ui_colors.get_font(8, FONT_PATH)
             if self.sinew_mode:
                 hints = "L/R: Scroll  A: Select  B: Back"
             elif self.party_panel_open:
@@ -848,7 +815,9 @@ class PCBoxDrawMixin:
                 if len(ui_colors.COLOR_TEXT) >= 3
                 else (120, 120, 120)
             )
-            hint_surf = hint_font.render(hints, True, (tr // 2, tg // 2, tb // 2))
+            hint_surf = ui_colors.render_text(
+                hint_font, hints, True, (tr // 2, tg // 2, tb // 2)
+            )
             surf.blit(hint_surf, (10, self.height - 15))
         except Exception:
             pass
@@ -936,9 +905,7 @@ class PCBoxDrawMixin:
                     base_color = (r, g, b, 180)
 
                 # Draw slot background with transparency
-                slot_surf = pygame.Surface((slot.width, slot.height), pygame.SRCALPHA)
-                pygame.draw.rect(slot_surf, base_color, (0, 0, slot.width, slot.height))
-                surf.blit(slot_surf, slot.topleft)
+                surf.blit(ui_colors.get_tile(slot.size, base_color), slot.topleft)
 
                 # Draw border
                 pygame.draw.rect(surf, ui_colors.COLOR_BORDER, slot, 2)
@@ -959,22 +926,14 @@ class PCBoxDrawMixin:
                         # Try to draw sprite - use helper that works for both game and Sinew
                         sprite_path = self._get_pokemon_sprite_path(poke)
                         if sprite_path and os.path.exists(sprite_path):
-                            try:
-                                sprite = self.sprite_cache.get_png_sprite(
-                                    sprite_path, size=None
-                                )
-                                if sprite:
-                                    # Scale to fit slot with margin
-                                    sprite_size = int(
-                                        min(slot.width, slot.height) * 0.7
-                                    )
-                                    sprite = scale_surface_preserve_aspect(
-                                        sprite, sprite_size, sprite_size
-                                    )
-                                    sprite_rect = sprite.get_rect(center=slot.center)
-                                    surf.blit(sprite, sprite_rect)
-                            except Exception:
-                                pass  # If sprite fails, fall back to text
+                            # Scale to fit slot with margin
+                            sprite_size = int(min(slot.width, slot.height) * 0.7)
+                            sprite = get_sprite_service().get_path(
+                                sprite_path, (sprite_size, sprite_size)
+                            )
+                            if sprite:
+                                sprite_rect = sprite.get_rect(center=slot.center)
+                                surf.blit(sprite, sprite_rect)
 
                             # Draw ROM HACK overlay for Pokemon from ROM hacks
                             if poke.get("rom_hack"):
@@ -983,9 +942,9 @@ class PCBoxDrawMixin:
                             # No sprite, draw text instead
                             try:
                                 text = self.manager.format_pokemon_display(poke)
-                                tiny_font = pygame.font.Font(FONT_PATH, 10)
-                                text_surf = tiny_font.render(
-                                    text[:8], True, ui_colors.COLOR_TEXT
+                                tiny_font = ui_colors.get_font(10, FONT_PATH)
+                                text_surf = ui_colors.render_text(
+                                    tiny_font, text[:8], True, ui_colors.COLOR_TEXT
                                 )
                                 text_rect = text_surf.get_rect(center=slot.center)
                                 surf.blit(text_surf, text_rect)
@@ -996,17 +955,12 @@ class PCBoxDrawMixin:
                         egg_path = get_egg_sprite_path("gen3")
                         if os.path.exists(egg_path):
                             try:
-                                egg_sprite = self.sprite_cache.get_png_sprite(
-                                    egg_path, size=None
+                                # Scale to fit slot with margin, preserving aspect ratio
+                                sprite_size = int(min(slot.width, slot.height) * 0.7)
+                                egg_sprite = get_sprite_service().get_path(
+                                    egg_path, (sprite_size, sprite_size)
                                 )
                                 if egg_sprite:
-                                    # Scale to fit slot with margin, preserving aspect ratio
-                                    sprite_size = int(
-                                        min(slot.width, slot.height) * 0.7
-                                    )
-                                    egg_sprite = scale_surface_preserve_aspect(
-                                        egg_sprite, sprite_size, sprite_size
-                                    )
                                     sprite_rect = egg_sprite.get_rect(
                                         center=slot.center
                                     )
@@ -1016,9 +970,9 @@ class PCBoxDrawMixin:
                             except Exception:
                                 # Fallback to text if sprite fails
                                 try:
-                                    tiny_font = pygame.font.Font(FONT_PATH, 10)
-                                    text_surf = tiny_font.render(
-                                        "EGG", True, ui_colors.COLOR_TEXT
+                                    tiny_font = ui_colors.get_font(10, FONT_PATH)
+                                    text_surf = ui_colors.render_text(
+                                        tiny_font, "EGG", True, ui_colors.COLOR_TEXT
                                     )
                                     text_rect = text_surf.get_rect(center=slot.center)
                                     surf.blit(text_surf, text_rect)
@@ -1027,9 +981,9 @@ class PCBoxDrawMixin:
                         else:
                             # No egg sprite, show text
                             try:
-                                tiny_font = pygame.font.Font(FONT_PATH, 10)
-                                text_surf = tiny_font.render(
-                                    "EGG", True, ui_colors.COLOR_TEXT
+                                tiny_font = ui_colors.get_font(10, FONT_PATH)
+                                text_surf = ui_colors.render_text(
+                                    tiny_font, "EGG", True, ui_colors.COLOR_TEXT
                                 )
                                 text_rect = text_surf.get_rect(center=slot.center)
                                 surf.blit(text_surf, text_rect)
@@ -1060,9 +1014,9 @@ class PCBoxDrawMixin:
 
         # Draw "MOVE MODE" indicator at bottom
         try:
-            font = pygame.font.Font(FONT_PATH, 12)
-            mode_text = font.render(
-                "MOVE MODE - Select empty slot", True, (255, 255, 100)
+            font = ui_colors.get_font(12, FONT_PATH)
+            mode_text = ui_colors.render_text(
+                font, "MOVE MODE - Select empty slot", True, (255, 255, 100)
             )
             text_rect = mode_text.get_rect(
                 centerx=self.width // 2, bottom=self.height - 10
@@ -1091,8 +1045,7 @@ class PCBoxDrawMixin:
         sprite_rect = self.moving_sprite.get_rect(center=(x, y - 10))
 
         # Draw shadow
-        shadow = pygame.Surface((40, 20), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow, (0, 0, 0, 100), (0, 0, 40, 20))
+        shadow = ui_colors.get_tile((40, 20), (0, 0, 0, 100), ellipse=True)
         surf.blit(shadow, (sprite_rect.centerx - 20, sprite_rect.bottom - 5))
 
         # Draw sprite
@@ -1116,7 +1069,7 @@ class PCBoxDrawMixin:
 
         # Draw menu items
         try:
-            font = pygame.font.Font(FONT_PATH, 14)
+            font = ui_colors.get_font(14, FONT_PATH)
 
             for i, item in enumerate(self.options_menu_items):
                 item_y = menu_y + 15 + i * 30
@@ -1130,11 +1083,13 @@ class PCBoxDrawMixin:
                     pygame.draw.rect(surf, ui_colors.COLOR_HIGHLIGHT, highlight_rect, 2)
 
                     # Draw cursor
-                    cursor = font.render(">", True, ui_colors.COLOR_HIGHLIGHT)
+                    cursor = ui_colors.render_text(
+                        font, ">", True, ui_colors.COLOR_HIGHLIGHT
+                    )
                     surf.blit(cursor, (menu_x + 10, item_y))
 
                 # Draw item text
-                text = font.render(item, True, ui_colors.COLOR_TEXT)
+                text = ui_colors.render_text(font, item, True, ui_colors.COLOR_TEXT)
                 surf.blit(text, (menu_x + 30, item_y))
         except Exception:
             pass
@@ -1145,8 +1100,7 @@ class PCBoxDrawMixin:
             return
 
         # Darken background
-        dark_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        dark_overlay.fill((0, 0, 0, 150))
+        dark_overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 150))
         surf.blit(dark_overlay, (0, 0))
 
         # Dialog dimensions
@@ -1161,13 +1115,13 @@ class PCBoxDrawMixin:
         pygame.draw.rect(surf, ui_colors.COLOR_BORDER, dialog_rect, 3)
 
         try:
-            font = pygame.font.Font(FONT_PATH, 12)
-            small_font = pygame.font.Font(FONT_PATH, 14)
+            font = ui_colors.get_font(12, FONT_PATH)
+            small_font = ui_colors.get_font(14, FONT_PATH)
 
             # Draw message (multiline)
             lines = self.confirmation_dialog_message.split("\n")
             for i, line in enumerate(lines):
-                text = font.render(line, True, ui_colors.COLOR_TEXT)
+                text = ui_colors.render_text(font, line, True, ui_colors.COLOR_TEXT)
                 text_rect = text.get_rect(
                     centerx=dialog_x + dialog_width // 2, top=dialog_y + 15 + i * 20
                 )
@@ -1186,7 +1140,9 @@ class PCBoxDrawMixin:
             else:
                 pygame.draw.rect(surf, ui_colors.COLOR_BUTTON, yes_rect)
                 pygame.draw.rect(surf, ui_colors.COLOR_BORDER, yes_rect, 2)
-            yes_text = small_font.render("YES", True, ui_colors.COLOR_TEXT)
+            yes_text = ui_colors.render_text(
+                small_font, "YES", True, ui_colors.COLOR_TEXT
+            )
             yes_text_rect = yes_text.get_rect(center=yes_rect.center)
             surf.blit(yes_text, yes_text_rect)
 
@@ -1198,7 +1154,9 @@ class PCBoxDrawMixin:
             else:
                 pygame.draw.rect(surf, ui_colors.COLOR_BUTTON, no_rect)
                 pygame.draw.rect(surf, ui_colors.COLOR_BORDER, no_rect, 2)
-            no_text = small_font.render("NO", True, ui_colors.COLOR_TEXT)
+            no_text = ui_colors.render_text(
+                small_font, "NO", True, ui_colors.COLOR_TEXT
+            )
             no_text_rect = no_text.get_rect(center=no_rect.center)
             surf.blit(no_text, no_text_rect)
         except Exception:
@@ -1210,8 +1168,7 @@ class PCBoxDrawMixin:
             return
 
         # Darken background
-        dark_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        dark_overlay.fill((0, 0, 0, 180))
+        dark_overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 180))
         surf.blit(dark_overlay, (0, 0))
 
         # Dialog dimensions
@@ -1226,9 +1183,9 @@ class PCBoxDrawMixin:
         pygame.draw.rect(surf, ui_colors.COLOR_BORDER, dialog_rect, 3)
 
         try:
-            font = pygame.font.Font(FONT_PATH, 12)
-            title_font = pygame.font.Font(FONT_PATH, 14)
-            small_font = pygame.font.Font(FONT_PATH, 14)
+            font = ui_colors.get_font(12, FONT_PATH)
+            title_font = ui_colors.get_font(14, FONT_PATH)
+            small_font = ui_colors.get_font(14, FONT_PATH)
 
             evo_info = self.evolution_dialog_info
             pokemon = self.evolution_dialog_pokemon
@@ -1237,7 +1194,9 @@ class PCBoxDrawMixin:
             pokemon_name = pokemon.get("nickname") or evo_info["from_name"]
 
             # Title
-            title_text = title_font.render("What?", True, ui_colors.COLOR_HOVER_TEXT)
+            title_text = ui_colors.render_text(
+                title_font, "What?", True, ui_colors.COLOR_HOVER_TEXT
+            )
             title_rect = title_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 12
             )
@@ -1245,15 +1204,15 @@ class PCBoxDrawMixin:
 
             # Evolution message
             msg1 = f"{pokemon_name} is evolving!"
-            msg1_text = font.render(msg1, True, ui_colors.COLOR_TEXT)
+            msg1_text = ui_colors.render_text(font, msg1, True, ui_colors.COLOR_TEXT)
             msg1_rect = msg1_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 40
             )
             surf.blit(msg1_text, msg1_rect)
 
             # Arrow and evolution target
-            arrow_text = font.render(
-                f"-> {evo_info['to_name']}", True, ui_colors.COLOR_SUCCESS
+            arrow_text = ui_colors.render_text(
+                font, f"-> {evo_info['to_name']}", True, ui_colors.COLOR_SUCCESS
             )
             arrow_rect = arrow_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 62
@@ -1269,8 +1228,8 @@ class PCBoxDrawMixin:
                     if len(ui_colors.COLOR_TEXT) >= 3
                     else (180, 180, 180)
                 )
-                item_text = font.render(
-                    item_msg, True, (tr * 2 // 3, tg * 2 // 3, tb * 2 // 3)
+                item_text = ui_colors.render_text(
+                    font, item_msg, True, (tr * 2 // 3, tg * 2 // 3, tb * 2 // 3)
                 )
                 item_rect = item_text.get_rect(
                     centerx=dialog_x + dialog_width // 2, top=dialog_y + 84
@@ -1290,7 +1249,9 @@ class PCBoxDrawMixin:
             else:
                 pygame.draw.rect(surf, ui_colors.COLOR_BUTTON, evolve_rect)
                 pygame.draw.rect(surf, ui_colors.COLOR_BORDER, evolve_rect, 2)
-            evolve_text = small_font.render("EVOLVE", True, ui_colors.COLOR_TEXT)
+            evolve_text = ui_colors.render_text(
+                small_font, "EVOLVE", True, ui_colors.COLOR_TEXT
+            )
             evolve_text_rect = evolve_text.get_rect(center=evolve_rect.center)
             surf.blit(evolve_text, evolve_text_rect)
 
@@ -1302,7 +1263,9 @@ class PCBoxDrawMixin:
             else:
                 pygame.draw.rect(surf, ui_colors.COLOR_BUTTON, stop_rect)
                 pygame.draw.rect(surf, ui_colors.COLOR_BORDER, stop_rect, 2)
-            stop_text = small_font.render("STOP", True, ui_colors.COLOR_TEXT)
+            stop_text = ui_colors.render_text(
+                small_font, "STOP", True, ui_colors.COLOR_TEXT
+            )
             stop_text_rect = stop_text.get_rect(center=stop_rect.center)
             surf.blit(stop_text, stop_text_rect)
         except Exception as e:
@@ -1325,8 +1288,7 @@ class PCBoxDrawMixin:
             return
 
         # Darken background
-        dark_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        dark_overlay.fill((0, 0, 0, 180))
+        dark_overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 180))
         surf.blit(dark_overlay, (0, 0))
 
         # Dialog dimensions
@@ -1342,12 +1304,14 @@ class PCBoxDrawMixin:
         pygame.draw.rect(surf, (150, 100, 200), dialog_rect, 3)
 
         try:
-            font = pygame.font.Font(FONT_PATH, 11)
-            title_font = pygame.font.Font(FONT_PATH, 13)
-            small_font = pygame.font.Font(FONT_PATH, 12)
+            font = ui_colors.get_font(11, FONT_PATH)
+            title_font = ui_colors.get_font(13, FONT_PATH)
+            small_font = ui_colors.get_font(12, FONT_PATH)
 
             # Title with wavy effect
-            title_text = title_font.render("~ Echoes ~", True, (200, 150, 255))
+            title_text = ui_colors.render_text(
+                title_font, "~ Echoes ~", True, (200, 150, 255)
+            )
             title_rect = title_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 12
             )
@@ -1358,19 +1322,19 @@ class PCBoxDrawMixin:
             msg2 = "carries echoes of what never was..."
             msg3 = "Care to try your luck?"
 
-            msg1_text = font.render(msg1, True, (220, 220, 255))
+            msg1_text = ui_colors.render_text(font, msg1, True, (220, 220, 255))
             msg1_rect = msg1_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 45
             )
             surf.blit(msg1_text, msg1_rect)
 
-            msg2_text = font.render(msg2, True, (180, 180, 220))
+            msg2_text = ui_colors.render_text(font, msg2, True, (180, 180, 220))
             msg2_rect = msg2_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 65
             )
             surf.blit(msg2_text, msg2_rect)
 
-            msg3_text = font.render(msg3, True, (255, 255, 200))
+            msg3_text = ui_colors.render_text(font, msg3, True, (255, 255, 200))
             msg3_rect = msg3_text.get_rect(
                 centerx=dialog_x + dialog_width // 2, top=dialog_y + 95
             )
@@ -1380,8 +1344,8 @@ class PCBoxDrawMixin:
             if _ACHIEVEMENTS_AVAILABLE and get_achievement_manager:
                 manager = get_achievement_manager()
                 claimed = len(manager.get_altering_cave_claimed())
-                progress_text = font.render(
-                    f"({claimed}/7 discovered)", True, (150, 150, 180)
+                progress_text = ui_colors.render_text(
+                    font, f"({claimed}/7 discovered)", True, (150, 150, 180)
                 )
                 progress_rect = progress_text.get_rect(
                     centerx=dialog_x + dialog_width // 2, top=dialog_y + 115
@@ -1401,7 +1365,7 @@ class PCBoxDrawMixin:
             else:
                 pygame.draw.rect(surf, (50, 40, 80), yes_rect)
                 pygame.draw.rect(surf, (100, 80, 150), yes_rect, 2)
-            yes_text = small_font.render("YES", True, (255, 255, 255))
+            yes_text = ui_colors.render_text(small_font, "YES", True, (255, 255, 255))
             yes_text_rect = yes_text.get_rect(center=yes_rect.center)
             surf.blit(yes_text, yes_text_rect)
 
@@ -1413,7 +1377,7 @@ class PCBoxDrawMixin:
             else:
                 pygame.draw.rect(surf, (50, 40, 50), no_rect)
                 pygame.draw.rect(surf, (100, 80, 100), no_rect, 2)
-            no_text = small_font.render("NO", True, (255, 255, 255))
+            no_text = ui_colors.render_text(small_font, "NO", True, (255, 255, 255))
             no_text_rect = no_text.get_rect(center=no_rect.center)
             surf.blit(no_text, no_text_rect)
         except Exception as e:
@@ -1422,8 +1386,7 @@ class PCBoxDrawMixin:
     def _draw_altering_cave_spinner(self, surf):
         """Draw the slot machine spinner for Altering Cave Pokemon."""
         # Darken background
-        dark_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        dark_overlay.fill((0, 0, 0, 200))
+        dark_overlay = ui_colors.get_tile((self.width, self.height), (0, 0, 0, 200))
         surf.blit(dark_overlay, (0, 0))
 
         # Spinner dimensions - more compact to fit screen
@@ -1441,11 +1404,13 @@ class PCBoxDrawMixin:
         pygame.draw.rect(surf, (150, 100, 200), frame_rect, 3)
 
         try:
-            title_font = pygame.font.Font(FONT_PATH, 10)
-            font = pygame.font.Font(FONT_PATH, 9)
+            title_font = ui_colors.get_font(10, FONT_PATH)
+            font = ui_colors.get_font(9, FONT_PATH)
 
             # Title - inside the frame
-            title = title_font.render("WHAT NEVER WAS", True, (200, 150, 255))
+            title = ui_colors.render_text(
+                title_font, "WHAT NEVER WAS", True, (200, 150, 255)
+            )
             title_rect = title.get_rect(
                 centerx=spinner_x + spinner_width // 2, top=spinner_y + 10
             )
@@ -1501,19 +1466,8 @@ class PCBoxDrawMixin:
 
                     # Get sprite - try multiple paths
                     species_id = poke["species"]
-                    sprite = None
-                    # Build sprite paths
-                    sprite_paths = [get_sprite_path(species_id, sprite_type="gen3")]
-
-                    for sprite_path in sprite_paths:
-                        if os.path.exists(sprite_path):
-                            try:
-                                sprite = pygame.image.load(sprite_path).convert_alpha()
-                                # Scale to 48x48, preserving aspect ratio
-                                sprite = scale_surface_preserve_aspect(sprite, 48, 48)
-                                break
-                            except Exception:
-                                continue
+                    # Scale to 48x48, preserving aspect ratio
+                    sprite = get_sprite_service().get(species_id, size=(48, 48))
 
                     if sprite:
                         sprite_rect = sprite.get_rect(
@@ -1522,7 +1476,9 @@ class PCBoxDrawMixin:
                         clip_surf.blit(sprite, sprite_rect)
                     else:
                         # Fallback: draw Pokemon name
-                        name_text = font.render(poke["name"], True, (200, 200, 255))
+                        name_text = ui_colors.render_text(
+                            font, poke["name"], True, (200, 200, 255)
+                        )
                         name_rect = name_text.get_rect(
                             center=((window_width - 4) // 2, int(y_pos))
                         )
@@ -1583,8 +1539,8 @@ class PCBoxDrawMixin:
                 result_name = result["name"]
 
                 # Draw result Pokemon name
-                result_text = title_font.render(
-                    f"{result_name}!", True, (100, 255, 100)
+                result_text = ui_colors.render_text(
+                    title_font, f"{result_name}!", True, (100, 255, 100)
                 )
                 result_rect = result_text.get_rect(
                     centerx=spinner_x + spinner_width // 2, top=status_y
@@ -1592,19 +1548,23 @@ class PCBoxDrawMixin:
                 surf.blit(result_text, result_rect)
 
                 # Press A prompt
-                prompt_text = font.render("Press A", True, (200, 200, 200))
+                prompt_text = ui_colors.render_text(
+                    font, "Press A", True, (200, 200, 200)
+                )
                 prompt_rect = prompt_text.get_rect(
                     centerx=spinner_x + spinner_width // 2, top=status_y + 20
                 )
                 surf.blit(prompt_text, prompt_rect)
             elif self.altering_cave_spinner_speed > 0:
-                spin_text = font.render("Spinning...", True, (255, 255, 200))
+                spin_text = ui_colors.render_text(
+                    font, "Spinning...", True, (255, 255, 200)
+                )
                 spin_rect = spin_text.get_rect(
                     centerx=spinner_x + spinner_width // 2, top=status_y + 10
                 )
                 surf.blit(spin_text, spin_rect)
             elif not self.altering_cave_spinner_stopped:
-                wait_text = font.render("...", True, (200, 200, 200))
+                wait_text = ui_colors.render_text(font, "...", True, (200, 200, 200))
                 wait_rect = wait_text.get_rect(
                     centerx=spinner_x + spinner_width // 2, top=status_y + 10
                 )
@@ -1672,7 +1632,7 @@ class PCBoxDrawMixin:
         )
 
         try:
-            font = pygame.font.Font(FONT_PATH, 12)
+            font = ui_colors.get_font(12, FONT_PATH)
 
             # Draw warning text
             for i, line in enumerate(lines):